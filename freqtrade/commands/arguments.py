@@ -15,7 +15,7 @@ ARGS_COMMON = ["verbosity", "logfile", "version", "config", "datadir", "user_dat
 ARGS_STRATEGY = ["strategy", "strategy_path", "recursive_strategy_search", "freqaimodel",
                  "freqaimodel_path"]
 
-ARGS_TRADE = ["db_url", "sd_notify", "dry_run", "dry_run_wallet", "fee"]
+ARGS_TRADE = ["db_url", "db_profile", "sd_notify", "dry_run", "dry_run_wallet", "fee"]
 
 ARGS_WEBSERVER: List[str] = []
 
@@ -26,16 +26,20 @@ ARGS_BACKTEST = ARGS_COMMON_OPTIMIZE + ["position_stacking", "use_max_market_pos
                                         "enable_protections", "dry_run_wallet", "timeframe_detail",
                                         "strategy_list", "export", "exportfilename",
                                         "backtest_breakdown", "backtest_cache",
-                                        "freqai_backtest_live_models"]
+                                        "freqai_backtest_live_models", "backtest_engine",
+                                        "backtest_skip_idle_candles", "dataload_workers"]
 
 ARGS_HYPEROPT = ARGS_COMMON_OPTIMIZE + ["hyperopt", "hyperopt_path",
                                         "position_stacking", "use_max_market_positions",
                                         "enable_protections", "dry_run_wallet", "timeframe_detail",
                                         "epochs", "spaces", "print_all",
                                         "print_colorized", "print_json", "hyperopt_jobs",
+                                        "hyperopt_async",
                                         "hyperopt_random_state", "hyperopt_min_trades",
                                         "hyperopt_loss", "disableparamexport",
-                                        "hyperopt_ignore_missing_space", "analyze_per_epoch"]
+                                        "hyperopt_ignore_missing_space", "analyze_per_epoch",
+                                        "backtest_engine", "backtest_skip_idle_candles",
+                                        "dataload_workers"]
 
 ARGS_EDGE = ARGS_COMMON_OPTIMIZE + ["stoploss_range"]
 
@@ -76,20 +80,20 @@ ARGS_LIST_DATA = ["exchange", "dataformat_ohlcv", "pairs", "trading_mode", "show
 ARGS_DOWNLOAD_DATA = ["pairs", "pairs_file", "days", "new_pairs_days", "include_inactive",
                       "timerange", "download_trades", "exchange", "timeframes",
                       "erase", "dataformat_ohlcv", "dataformat_trades", "trading_mode",
-                      "prepend_data"]
+                      "prepend_data", "download_workers"]
 
 ARGS_PLOT_DATAFRAME = ["pairs", "indicators1", "indicators2", "plot_limit",
-                       "db_url", "trade_source", "export", "exportfilename",
+                       "db_url", "db_profile", "trade_source", "export", "exportfilename",
                        "timerange", "timeframe", "no_trades"]
 
-ARGS_PLOT_PROFIT = ["pairs", "timerange", "export", "exportfilename", "db_url",
+ARGS_PLOT_PROFIT = ["pairs", "timerange", "export", "exportfilename", "db_url", "db_profile",
                     "trade_source", "timeframe", "plot_auto_open", ]
 
-ARGS_CONVERT_DB = ["db_url", "db_url_from"]
+ARGS_CONVERT_DB = ["db_url", "db_url_from", "db_profile"]
 
 ARGS_INSTALL_UI = ["erase_ui_only", "ui_version"]
 
-ARGS_SHOW_TRADES = ["db_url", "trade_ids", "print_json"]
+ARGS_SHOW_TRADES = ["db_url", "db_profile", "trade_ids", "print_json"]
 
 ARGS_HYPEROPT_LIST = ["hyperopt_list_best", "hyperopt_list_profitable",
                       "hyperopt_list_min_trades", "hyperopt_list_max_trades",
@@ -106,6 +106,14 @@ AVAILABLE_CLI_OPTIONS = {
         f'`{constants.DEFAULT_DB_DRYRUN_URL}` for Dry Run).',
         metavar='PATH',
     ),
+    "db_profile": Arg(
+        '--db-profile',
+        help='Database durability / performance profile (SQLite only). '
+        '`default` keeps SQLite defaults, `durable` and `balanced` use a WAL journal, '
+        '`performance` additionally groups commits, e.g. of all protection locks of one '
+        'check (default: `default`).',
+        choices=['default', 'durable', 'balanced', 'performance'],
+    ),
     "db_url_from": Arg(
         '--db-url-from',
         help='Source db url to use when migrating a database.',
@@ -150,6 +158,25 @@ AVAILABLE_CLI_OPTIONS = {
         '--timeframe-detail',
         help='Specify detail timeframe for backtesting (`1m`, `5m`, `30m`, `1h`, `1d`).',
     ),
+    "backtest_engine": Arg(
+        '--backtest-engine',
+        help='Select the backtest engine. `columnar` keeps candle data as typed arrays, '
+        'which uses considerably less memory on large pairlists. Defaults to `lists`.',
+        choices=['lists', 'columnar'],
+    ),
+    "backtest_skip_idle_candles": Arg(
+        '--skip-idle-candles',
+        help='Only visit candles where a pair has an entry signal or an open trade. '
+        'Results are identical, but selective strategies backtest considerably faster.',
+        action='store_true',
+    ),
+    "dataload_workers": Arg(
+        '--dataload-workers',
+        help='Number of threads used to load and clean candle data of multiple pairs '
+        'concurrently. Defaults to 1.',
+        type=check_int_positive,
+        metavar='INT',
+    ),
     "position_stacking": Arg(
         '--eps', '--enable-position-stacking',
         help='Allow buying the same pair multiple times (position stacking).',
@@ -289,6 +316,12 @@ AVAILABLE_CLI_OPTIONS = {
         ' Example: --export-csv hyperopt.csv',
         metavar='FILE',
     ),
+    "hyperopt_async": Arg(
+        '--async-epochs',
+        help='Hand a new epoch to each worker as soon as it finishes, instead of evaluating '
+        'epochs in batches of one epoch per worker. Seeded runs stay reproducible.',
+        action='store_true',
+    ),
     "hyperopt_jobs": Arg(
         '-j', '--job-workers',
         help='The number of concurrently running jobs for hyperoptimization '
@@ -415,6 +448,13 @@ AVAILABLE_CLI_OPTIONS = {
         type=check_int_positive,
         metavar='INT',
     ),
+    "download_workers": Arg(
+        '--dl-workers',
+        help='Download this many pairs / timeframes concurrently. All requests share one '
+             'rate limit based on the exchange\'s rateLimit. Default: 1.',
+        type=check_int_positive,
+        metavar='INT',
+    ),
     "download_trades": Arg(
         '--dl-trades',
         help='Download trades instead of OHLCV data. The bot will resample trades to the '
@@ -19,7 +19,7 @@ def start_convert_db(args: Dict[str, Any]) -> None:
 
     config = setup_utils_configuration(args, RunMode.UTIL_NO_EXCHANGE)
 
-    init_db(config['db_url'])
+    init_db(config['db_url'], config.get('db_profile', 'default'))
     session_target = Trade.session
     init_db(config['db_url_from'])
     logger.info("Starting db migration.")
@@ -79,7 +79,7 @@ def _print_objs_tabular(objs: List, print_colorized: bool) -> None:
     objs_to_print = [{
         'name': s['name'] if s['name'] else "--",
         'location': s['location_rel'],
-        'status': (red + "LOAD FAILED" + reset if s['class'] is None
+        'status': (red + "LOAD FAILED" + reset if not s['name']
                    else "OK" if names.count(s['name']) == 1
                    else yellow + "DUPLICATE NAME" + reset)
     } for s in objs]
@@ -87,8 +87,8 @@ def _print_objs_tabular(objs: List, print_colorized: bool) -> None:
         if 'hyperoptable' in s:
             objs_to_print[idx].update({
                 'hyperoptable': "Yes" if s['hyperoptable']['count'] > 0 else "No",
-                'buy-Params': len(s['hyperoptable'].get('buy', [])),
-                'sell-Params': len(s['hyperoptable'].get('sell', [])),
+                'buy-Params': s['hyperoptable'].get('buy', 0),
+                'sell-Params': s['hyperoptable'].get('sell', 0),
             })
     print(tabulate(objs_to_print, headers='keys', tablefmt='psql', stralign='right'))
 
@@ -99,19 +99,19 @@ def start_list_strategies(args: Dict[str, Any]) -> None:
     """
     config = setup_utils_configuration(args, RunMode.UTIL_NO_EXCHANGE)
 
+    # Names and hyperoptable parameter counts are cached - unchanged strategy files
+    # aren't loaded again.
     strategy_objs = StrategyResolver.search_all_objects(
-        config, not args['print_one_column'], config.get('recursive_strategy_search', False))
+        config, not args['print_one_column'], config.get('recursive_strategy_search', False),
+        load=False)
     # Sort alphabetically
     strategy_objs = sorted(strategy_objs, key=lambda x: x['name'])
-    for obj in strategy_objs:
-        if obj['class']:
-            obj['hyperoptable'] = obj['class'].detect_all_parameters()
-        else:
-            obj['hyperoptable'] = {'count': 0}
 
     if args['print_one_column']:
         print('\n'.join([s['name'] for s in strategy_objs]))
     else:
+        for obj in strategy_objs:
+            obj.setdefault('hyperoptable', {'count': 0})
         _print_objs_tabular(strategy_objs, config.get('print_colorized', False))
 
 
@@ -121,7 +121,8 @@ def start_list_freqAI_models(args: Dict[str, Any]) -> None:
     """
     config = setup_utils_configuration(args, RunMode.UTIL_NO_EXCHANGE)
     from freqtrade.resolvers.freqaimodel_resolver import FreqaiModelResolver
-    model_objs = FreqaiModelResolver.search_all_objects(config, not args['print_one_column'])
+    model_objs = FreqaiModelResolver.search_all_objects(
+        config, not args['print_one_column'], load=False)
     # Sort alphabetically
     model_objs = sorted(model_objs, key=lambda x: x['name'])
     if args['print_one_column']:
@@ -249,7 +250,7 @@ def start_show_trades(args: Dict[str, Any]) -> None:
         raise OperationalException("--db-url is required for this command.")
 
     logger.info(f'Using DB: "{parse_db_uri_for_logging(config["db_url"])}"')
-    init_db(config['db_url'])
+    init_db(config['db_url'], config.get('db_profile', 'default'))
     tfilter = []
 
     if config.get('trade_ids'):
@@ -159,6 +159,9 @@ class Configuration:
         self._args_to_config(config, argname='db_url_from',
                              logstring='Parameter --db-url-from detected ...')
 
+        self._args_to_config(config, argname='db_profile',
+                             logstring='Using db profile: {}')
+
         if config.get('force_entry_enable', False):
             logger.warning('`force_entry_enable` RPC message enabled.')
 
@@ -261,6 +264,9 @@ class Configuration:
             ('export', 'Parameter --export detected: {} ...'),
             ('backtest_breakdown', 'Parameter --breakdown detected ...'),
             ('backtest_cache', 'Parameter --cache={} detected ...'),
+            ('backtest_engine', 'Parameter --backtest-engine={} detected ...'),
+            ('backtest_skip_idle_candles', 'Parameter --skip-idle-candles detected ...'),
+            ('dataload_workers', 'Parameter --dataload-workers={} detected ...'),
             ('disableparamexport', 'Parameter --disableparamexport detected: {} ...'),
             ('freqai_backtest_live_models',
              'Parameter --freqai-backtest-live-models detected ...'),
@@ -285,6 +291,7 @@ class Configuration:
             ('epochs', 'Parameter --epochs detected ... Will run Hyperopt with for {} epochs ...'),
             ('spaces', 'Parameter -s/--spaces detected: {}'),
             ('analyze_per_epoch', 'Parameter --analyze-per-epoch detected.'),
+            ('hyperopt_async', 'Parameter --async-epochs detected.'),
             ('print_all', 'Parameter --print-all detected ...'),
         ]
         self._args_to_config_loop(config, configurations)
@@ -339,6 +346,7 @@ class Configuration:
             ('days', 'Detected --days: {}'),
             ('include_inactive', 'Detected --include-inactive-pairs: {}'),
             ('download_trades', 'Detected --dl-trades: {}'),
+            ('download_workers', 'Detected --dl-workers: {}'),
             ('dataformat_ohlcv', 'Using "{}" to store OHLCV data.'),
             ('dataformat_trades', 'Using "{}" to store trades data.'),
             ('show_timerange', 'Detected --show-timerange'),
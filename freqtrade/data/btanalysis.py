@@ -275,9 +275,9 @@ def trade_list_to_dataframe(trades: Union[List[Trade], List[LocalTrade]]) -> pd.
     return df
 
 
-def load_trades_from_db(db_url: str, strategy: Optional[str] = None) -> pd.DataFrame:
+def load_trades_from_db(db_url: str, strategy: Optional[str] = None, db_profile: str = 'default') -> pd.DataFrame:
 
-    init_db(db_url)
+    init_db(db_url, db_profile)
 
     filters = []
     if strategy:
@@ -287,14 +287,14 @@ def load_trades_from_db(db_url: str, strategy: Optional[str] = None) -> pd.DataF
 
 
 
-def load_trades(source: str, db_url: str, exportfilename: Path,no_trades: bool = False, strategy: Optional[str] = None) -> pd.DataFrame:
+def load_trades(source: str, db_url: str, exportfilename: Path,no_trades: bool = False, strategy: Optional[str] = None, db_profile: str = 'default') -> pd.DataFrame:
 
     if no_trades:
         df = pd.DataFrame(columns=BT_DATA_COLUMNS)
         return df
 
     if source == "DB":
-        return load_trades_from_db(db_url)
+        return load_trades_from_db(db_url, db_profile=db_profile)
     elif source == "file":
         return load_backtest_data(exportfilename, strategy)
 
@@ -1,7 +1,7 @@
 import logging
 from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 from pandas import DataFrame, Timedelta, Timestamp, to_timedelta
 
 from freqtrade.configuration import TimeRange
@@ -35,6 +35,8 @@ class DataProvider:
         self.__cached_pairs_backtesting: Dict[PairWithTimeframe, DataFrame] = {}
         self.__producer_pairs_df: Dict[str,Dict[PairWithTimeframe, Tuple[DataFrame, datetime]]] = {}
         self.__producer_pairs: Dict[str, List[str]] = {}
+        # (pair, timeframe, candle_type, cache_key) -> (last candle, computed dataframe)
+        self.__cached_informative: Dict[Tuple[str, str, str, Hashable], Tuple[Hashable, DataFrame]] = {}
         self._msg_queue: deque = deque()
 
         self._default_candle_type = self._config.get('candle_type_def', CandleType.SPOT)
@@ -47,6 +49,26 @@ class DataProvider:
 
 
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Leave out the cached dataframes when pickling (e.g. to hyperopt workers).
+        Analyzed and informative dataframes are rebuilt by the receiver, historic data
+        can be re-attached with _set_historic_data().
+        """
+        state = self.__dict__.copy()
+        state['_DataProvider__cached_pairs'] = {}
+        state['_DataProvider__cached_informative'] = {}
+        state['_DataProvider__cached_pairs_backtesting'] = {}
+        return state
+
+    def _get_historic_data(self) -> Dict[PairWithTimeframe, DataFrame]:
+        return self.__cached_pairs_backtesting
+
+    def _set_historic_data(self, data: Dict[PairWithTimeframe, DataFrame]) -> None:
+        self.__cached_pairs_backtesting = data
+
+
+
     def _set_dataframe_max_index(self, limit_index: int):
         self.__slice_index = limit_index
 
@@ -236,6 +258,34 @@ class DataProvider:
 
 
 
+    def get_informative_dataframe(self,pair: str,timeframe: str,func: Callable[[DataFrame], DataFrame],cache_key: Hashable,candle_type: str = '') -> DataFrame:
+        """
+        Get the pair dataframe with func (e.g. adding indicators) applied.
+        The result is cached until the candles change, so informative dataframes used by
+        many pairs (e.g. BTC/USDT 1h) are computed once per candle.
+        cache_key identifies the result of func - it must change whenever func changes or
+        depends on a different value besides the candles, e.g. ('rsi', self.buy_rsi.value).
+        :param pair: pair to get the data for
+        :param timeframe: timeframe to get data for
+        :param func: function computing the informative dataframe from the candles
+        :param cache_key: hashable key identifying func and the values it depends on
+        :param candle_type: '', mark, index, premiumIndex, or funding_rate
+        :return: Copy of the computed dataframe
+        """
+        data = self.get_pair_dataframe(pair=pair, timeframe=timeframe, candle_type=candle_type)
+        if data.empty:
+            return func(data)
+
+        key = (pair, timeframe, candle_type, cache_key)
+        last_candle = (len(data), *data.iloc[-1].tolist())
+        cached = self.__cached_informative.get(key)
+        if cached is None or cached[0] != last_candle:
+            cached = (last_candle, func(data))
+            self.__cached_informative[key] = cached
+        return cached[1].copy()
+
+
+
     @property
     def runmode(self) -> RunMode:
         return RunMode(self._config.get('runmode', RunMode.OTHER))
@@ -252,6 +302,7 @@ class DataProvider:
 
     def clear_cache(self):
         self.__cached_pairs = {}
+        self.__cached_informative = {}
         self.__slice_index = 0
 
     # Exchange functions
@@ -0,0 +1,173 @@
+"""
+Timerange limited reads of arrow based (feather / parquet) OHLCV files.
+
+Data files are sorted by date, so only the record batches (feather) or row groups (parquet)
+overlapping the requested timerange have to be read and converted.
+"""
+import logging
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.feather as pa_feather
+import pyarrow.parquet as pq
+from pandas import DataFrame, Timestamp
+
+from freqtrade.configuration import TimeRange
+
+
+logger = logging.getLogger(__name__)
+
+_UNIT_NS = {'s': 1_000_000_000, 'ms': 1_000_000, 'us': 1_000, 'ns': 1}
+
+
+def get_timerange_bounds(timerange: Optional[TimeRange]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Start / stop bounds (in ms) to load for this timerange.
+    :return: Tuple of (start, stop) - None if the bound is open
+    """
+    if not timerange:
+        return None, None
+    start = timerange.startts * 1000 if timerange.starttype == 'date' else None
+    stop = timerange.stopts * 1000 if timerange.stoptype == 'date' else None
+    return start, stop
+
+
+def _date_values_ms(column) -> np.ndarray:
+    """
+    Convert a date column (timestamp or integer milliseconds) to int64 milliseconds.
+    """
+    values = column.cast(pa.int64()).to_numpy()
+    if pa.types.is_timestamp(column.type):
+        values = values * _UNIT_NS[column.type.unit] // 1_000_000
+    return values
+
+
+def _stat_to_ms(value) -> int:
+    """
+    Convert a parquet row group statistic of the date column to milliseconds.
+    """
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    ts = Timestamp(value)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize('UTC')
+    return ts.value // 1_000_000
+
+
+def _slice_table(table: pa.Table, start: Optional[int], stop: Optional[int]) -> pa.Table:
+    """
+    Limit a date-sorted table to start <= date <= stop.
+    The last row at or before start is kept (start may not be aligned to the timeframe),
+    so the data starts at the same candle as the trimmed full file - and
+    IDataHandler._validate_pairdata() only warns if data before start is really missing.
+    One additional row after stop is kept (if available), so IDataHandler.ohlcv_load() can
+    still tell if the data was trimmed at the end (required for drop_incomplete).
+    """
+    if (start is None and stop is None) or table.num_rows == 0:
+        return table
+    dates = _date_values_ms(table.column(0))
+    lo = max(int(np.searchsorted(dates, start, side='right')) - 1, 0) if start is not None else 0
+    hi = (min(int(np.searchsorted(dates, stop, side='right')) + 1, len(dates))
+          if stop is not None else len(dates))
+    return table.slice(lo, max(hi - lo, 0))
+
+
+def _to_dataframe(table: pa.Table) -> DataFrame:
+    # Stored pandas metadata (e.g. the RangeIndex) does not match sliced tables.
+    return table.to_pandas(ignore_metadata=True)
+
+
+def read_feather_timerange(filename: Path, timerange: Optional[TimeRange],
+                           memory_map: bool = True) -> DataFrame:
+    """
+    Read a feather (arrow IPC) OHLCV file, limited to timerange.
+    Locates the first record batch with a binary search and stops reading once the end of
+    the timerange is passed.
+    :param filename: File to read. The first column must be the candle date
+    :param timerange: Limit data to this timerange - None to read the whole file
+    :param memory_map: Memory map the file instead of reading it
+    :return: Dataframe with raw file content
+    """
+    start, stop = get_timerange_bounds(timerange)
+    source = pa.memory_map(str(filename), 'r') if memory_map else pa.OSFile(str(filename), 'rb')
+    with source:
+        try:
+            reader = pa.ipc.open_file(source)
+        except pa.ArrowInvalid:
+            # Feather V1 files can't be read batch-wise.
+            table = pa_feather.read_table(str(filename), memory_map=memory_map)
+            return _to_dataframe(_slice_table(table, start, stop))
+
+        num_batches = reader.num_record_batches
+        first = 0
+        if start is not None and num_batches > 1:
+            # First batch starting after start - the range begins in the batch before.
+            lo, hi = 0, num_batches
+            while lo < hi:
+                mid = (lo + hi) // 2
+                batch = reader.get_batch(mid)
+                if batch.num_rows and _date_values_ms(batch.column(0))[0] > start:
+                    hi = mid
+                else:
+                    lo = mid + 1
+            first = max(lo - 1, 0)
+
+        batches: List[pa.RecordBatch] = []
+        for idx in range(first, num_batches):
+            batch = reader.get_batch(idx)
+            batches.append(batch)
+            # Stop once a row after stop was read.
+            if (stop is not None and batch.num_rows
+                    and _date_values_ms(batch.column(0))[-1] > stop):
+                break
+
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+        return _to_dataframe(_slice_table(table, start, stop))
+
+
+def read_parquet_timerange(filename: Path, timerange: Optional[TimeRange],
+                           memory_map: bool = True) -> DataFrame:
+    """
+    Read a parquet OHLCV file, limited to timerange.
+    Row groups outside of the timerange are skipped based on the column statistics
+    of the date column.
+    :param filename: File to read. The first column must be the candle date
+    :param timerange: Limit data to this timerange - None to read the whole file
+    :param memory_map: Memory map the file instead of reading it
+    :return: Dataframe with raw file content
+    """
+    start, stop = get_timerange_bounds(timerange)
+    pfile = pq.ParquetFile(str(filename), memory_map=memory_map)
+    metadata = pfile.metadata
+    row_groups = list(range(metadata.num_row_groups))
+
+    if (start is not None or stop is not None) and metadata.num_row_groups > 1:
+        selected: List[int] = []
+        previous: Optional[int] = None
+        for idx in row_groups:
+            stats = metadata.row_group(idx).column(0).statistics
+            if stats is None or not stats.has_min_max:
+                # No statistics available - read everything.
+                selected = row_groups
+                break
+            if start is not None and _stat_to_ms(stats.max) < start:
+                previous = idx
+                continue
+            if (not selected and previous is not None and start is not None
+                    and _stat_to_ms(stats.min) > start):
+                # The last row before start is in the previous row group.
+                selected.append(previous)
+            selected.append(idx)
+            # Include the first row group with rows after stop, then stop.
+            if stop is not None and _stat_to_ms(stats.max) > stop:
+                break
+        else:
+            if not selected and previous is not None:
+                # All rows are before start - keep the last one, as for feather files.
+                selected.append(previous)
+        row_groups = selected
+
+    table = pfile.read_row_groups(row_groups) if row_groups else pfile.schema_arrow.empty_table()
+    return _to_dataframe(_slice_table(table, start, stop))
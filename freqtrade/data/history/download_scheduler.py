@@ -0,0 +1,111 @@
+"""
+Concurrent download of ohlcv data for multiple pairs / timeframes.
+"""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from freqtrade.configuration import TimeRange
+from freqtrade.data.history.history_utils import _prepare_pair_download, _store_pair_download
+from freqtrade.data.history.idatahandler import IDataHandler
+from freqtrade.enums import CandleType
+from freqtrade.exchange import Exchange
+from freqtrade.exchange.rate_limiter import TokenBucket
+
+
+logger = logging.getLogger(__name__)
+
+
+class DownloadJob(NamedTuple):
+    pair: str
+    timeframe: str
+    candle_type: CandleType
+    process: str = ''
+
+
+class DownloadScheduler:
+    """
+    Downloads multiple pairs / timeframes concurrently on the exchange's event loop.
+
+    All candle requests share one token bucket honouring the exchange's `rateLimit`.
+    The token bucket is the only throttle applied - ccxt's own throttling (`enableRateLimit`)
+    is disabled while the scheduler runs, so requests aren't delayed twice.
+    Every job loads the existing data, downloads the missing candles and stores the result
+    on its own - an interrupted run keeps all finished jobs and resumes from the stored
+    data on the next run, the same as sequential downloads.
+    Loading and storing runs in worker threads, so the network is used while data is
+    written to disk. At most `workers` jobs are in progress at any time.
+    """
+
+    def __init__(self, exchange: Exchange, data_handler: IDataHandler, *, datadir: Path,
+                 workers: int, timerange: Optional[TimeRange] = None, new_pairs_days: int = 30,
+                 erase: bool = False, prepend: bool = False, burst: int = 1) -> None:
+        self._exchange = exchange
+        self._data_handler = data_handler
+        self._datadir = datadir
+        self._workers = max(workers, 1)
+        self._timerange = timerange
+        self._new_pairs_days = new_pairs_days
+        self._erase = erase
+        self._prepend = prepend
+        rate_limit = getattr(exchange._api_async, 'rateLimit', None) or 50
+        self.limiter = TokenBucket.from_rate_limit(rate_limit, capacity=burst)
+
+    def run(self, jobs: List[DownloadJob]) -> List[DownloadJob]:
+        """
+        Run all jobs.
+        :return: List of failed jobs
+        """
+        if not jobs:
+            return []
+        logger.info(f"Downloading {len(jobs)} pair / timeframe combinations using "
+                    f"{self._workers} workers, limited to {self.limiter.rate:.1f} requests/s.")
+        api = self._exchange._api_async
+        enable_rate_limit = getattr(api, 'enableRateLimit', False)
+        api.enableRateLimit = False
+        self._exchange._rate_limiter = self.limiter
+        try:
+            with self._exchange._loop_lock:
+                results = self._exchange.loop.run_until_complete(self._run_all(jobs))
+        finally:
+            self._exchange._rate_limiter = None
+            api.enableRateLimit = enable_rate_limit
+        logger.info(f"Finished downloading with {self.limiter.acquired} requests, "
+                    f"{self.limiter.waited:.1f}s spent waiting for the rate limit.")
+        return [job for job, success in zip(jobs, results) if not success]
+
+    async def _run_all(self, jobs: List[DownloadJob]) -> List[bool]:
+        semaphore = asyncio.Semaphore(self._workers)
+        with ThreadPoolExecutor(max_workers=self._workers) as io_pool:
+            return await asyncio.gather(
+                *(self._run_job(job, semaphore, io_pool) for job in jobs))
+
+    async def _run_job(self, job: DownloadJob, semaphore: asyncio.Semaphore,
+                       io_pool: ThreadPoolExecutor) -> bool:
+        loop = asyncio.get_running_loop()
+        async with semaphore:
+            try:
+                data, since_ms, until_ms = await loop.run_in_executor(io_pool, partial(
+                    _prepare_pair_download, job.pair, datadir=self._datadir,
+                    timeframe=job.timeframe, process=job.process,
+                    new_pairs_days=self._new_pairs_days, data_handler=self._data_handler,
+                    timerange=self._timerange, candle_type=job.candle_type,
+                    erase=self._erase, prepend=self._prepend))
+
+                new_data = await self._exchange.get_historic_ohlcv_async(
+                    pair=job.pair, timeframe=job.timeframe, since_ms=since_ms,
+                    is_new_pair=data.empty, candle_type=job.candle_type,
+                    until_ms=until_ms if until_ms else None)
+
+                await loop.run_in_executor(io_pool, partial(
+                    _store_pair_download, job.pair, timeframe=job.timeframe,
+                    data_handler=self._data_handler, data=data, new_data=new_data,
+                    candle_type=job.candle_type, prepend=self._prepend))
+                return True
+            except Exception:
+                logger.exception(f'Failed to download history data for pair: "{job.pair}", '
+                                 f'timeframe: {job.timeframe}.')
+                return False
@@ -1,4 +1,5 @@
 import logging
+from pathlib import Path
 from typing import Optional
 
 from pandas import DataFrame, read_feather, to_datetime
@@ -7,15 +8,18 @@ from freqtrade.configuration import TimeRange
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
 from freqtrade.enums import CandleType
 
-from .idatahandler import IDataHandler
+from .arrow_utils import read_feather_timerange
+from .partitioneddatahandler import PartitionedDataHandler
 
 
 logger = logging.getLogger(__name__)
 
 
-class FeatherDataHandler(IDataHandler):
+class FeatherDataHandler(PartitionedDataHandler):
 
     _columns = DEFAULT_DATAFRAME_COLUMNS
+    # Memory map data files when loading ohlcv data
+    _memory_map = True
 
     def ohlcv_store(
             self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType) -> None:
@@ -31,7 +35,10 @@ class FeatherDataHandler(IDataHandler):
         """
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
+        self._ohlcv_store_file(filename, data)
+        self._remove_partitions(filename)
 
+    def _ohlcv_store_file(self, filename: Path, data: DataFrame) -> None:
         data.reset_index(drop=True).loc[:, self._columns].to_feather(
             filename, compression_level=9, compression='lz4')
 
@@ -45,8 +52,8 @@ class FeatherDataHandler(IDataHandler):
         :param pair: Pair to load data
         :param timeframe: Timeframe (e.g. "5m")
         :param timerange: Limit data to be loaded to this timerange.
-                        Optionally implemented by subclasses to avoid loading
-                        all data where possible.
+                        Only the record batches overlapping the timerange
+                        are read.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
@@ -59,29 +66,17 @@ class FeatherDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
 
-        pairdata = read_feather(filename)
+        pairdata = self._ohlcv_load_file(filename, timerange)
+        return self._ohlcv_load_partitions(filename, pairdata, timerange)
+
+    def _ohlcv_load_file(self, filename: Path, timerange: Optional[TimeRange]) -> DataFrame:
+        pairdata = read_feather_timerange(filename, timerange, memory_map=self._memory_map)
         pairdata.columns = self._columns
         pairdata = pairdata.astype(dtype={'open': 'float', 'high': 'float',
                                           'low': 'float', 'close': 'float', 'volume': 'float'})
         pairdata['date'] = to_datetime(pairdata['date'], unit='ms', utc=True)
         return pairdata
 
-    def ohlcv_append(
-        self,
-        pair: str,
-        timeframe: str,
-        data: DataFrame,
-        candle_type: CandleType
-    ) -> None:
-        """
-        Append data to existing data structures
-        :param pair: Pair
-        :param timeframe: Timeframe this ohlcv data is for
-        :param data: Data to append.
-        :param candle_type: Any of the enum CandleType (must match trading mode!)
-        """
-        raise NotImplementedError()
-
     def _trades_store(self, pair: str, data: DataFrame) -> None:
         """
         Store trades data (list of Dicts) to file
@@ -91,16 +86,10 @@ class FeatherDataHandler(IDataHandler):
         """
         filename = self._pair_trades_filename(self._datadir, pair)
         self.create_dir_if_needed(filename)
-        data.reset_index(drop=True).to_feather(filename, compression_level=9, compression='lz4')
+        self._trades_store_file(filename, data)
 
-    def trades_append(self, pair: str, data: DataFrame):
-        """
-        Append data to existing files
-        :param pair: Pair - used for filename
-        :param data: Dataframe containing trades
-                     column sequence as in DEFAULT_TRADES_COLUMNS
-        """
-        raise NotImplementedError()
+    def _trades_store_file(self, filename: Path, data: DataFrame) -> None:
+        data.reset_index(drop=True).to_feather(filename, compression_level=9, compression='lz4')
 
     def _trades_load(self, pair: str, timerange: Optional[TimeRange] = None) -> DataFrame:
         """
@@ -114,9 +103,15 @@ class FeatherDataHandler(IDataHandler):
         if not filename.exists():
             return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
 
-        tradesdata = read_feather(filename)
+        tradesdata = self._trades_load_file(filename)
+
+        return self._trades_load_partitions(filename, tradesdata)
 
-        return tradesdata
+    def _trades_load_file(self, filename: Path,
+                          timerange: Optional[TimeRange] = None) -> DataFrame:
+        if timerange is None:
+            return read_feather(filename)
+        return read_feather_timerange(filename, timerange, memory_map=False)
 
     @classmethod
     def _get_file_extension(cls):
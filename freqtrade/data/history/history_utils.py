@@ -1,8 +1,10 @@
 import logging
 import operator
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, Hashable, Iterator, List, Optional, Tuple, TypeVar
 
 from pandas import DataFrame, concat
 
@@ -10,6 +12,7 @@ from freqtrade.configuration import TimeRange
 from freqtrade.constants import (DATETIME_PRINT_FORMAT, DEFAULT_DATAFRAME_COLUMNS,DL_DATA_TIMEFRAMES, DOCS_LINK, Config)
 from freqtrade.data.converter import (clean_ohlcv_dataframe, convert_trades_to_ohlcv,ohlcv_to_dataframe, trades_df_remove_duplicates,trades_list_to_df)
 from freqtrade.data.history.idatahandler import IDataHandler, get_datahandler
+from freqtrade.data.history.partitioneddatahandler import PartitionedDataHandler
 from freqtrade.enums import CandleType
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import Exchange
@@ -20,13 +23,35 @@ from freqtrade.util.migrations import migrate_data
 
 logger = logging.getLogger(__name__)
 
+K = TypeVar('K', bound=Hashable)
+
 def load_pair_history(pair: str,timeframe: str,datadir: Path, *,timerange: Optional[TimeRange] = None,fill_up_missing: bool = True,drop_incomplete: bool = False,startup_candles: int = 0,data_format: Optional[str] = None,data_handler: Optional[IDataHandler] = None,candle_type: CandleType = CandleType.SPOT) -> DataFrame:
 
     data_handler = get_datahandler(datadir, data_format, data_handler)
     return data_handler.ohlcv_load(pair=pair,timeframe=timeframe,timerange=timerange,fill_missing=fill_up_missing,drop_incomplete=drop_incomplete,startup_candles=startup_candles,candle_type=candle_type)
 
 
-def load_data(datadir: Path,timeframe: str,pairs: List[str], *,timerange: Optional[TimeRange] = None,fill_up_missing: bool = True,startup_candles: int = 0,fail_without_data: bool = False,data_format: str = 'json',candle_type: CandleType = CandleType.SPOT,user_futures_funding_rate: Optional[int] = None) -> Dict[str, DataFrame]:
+def _load_pairs(load: Callable[[K], DataFrame], pairs: List[K], workers: int) -> Iterator[Tuple[K, DataFrame]]:
+
+    if workers <= 1 or len(pairs) <= 1:
+        for pair in pairs:
+            yield pair, load(pair)
+        return
+    # Loading, parsing and cleaning happens in worker threads - results are yielded in pair order,
+    # and at most "workers" pairs are submitted ahead, so only that many results are held at once.
+    with ThreadPoolExecutor(max_workers=min(workers, len(pairs))) as executor:
+        pending: Deque[Tuple[str, Future]] = deque()
+        for pair in pairs:
+            if len(pending) >= workers:
+                done_pair, future = pending.popleft()
+                yield done_pair, future.result()
+            pending.append((pair, executor.submit(load, pair)))
+        while pending:
+            done_pair, future = pending.popleft()
+            yield done_pair, future.result()
+
+
+def load_data(datadir: Path,timeframe: str,pairs: List[str], *,timerange: Optional[TimeRange] = None,fill_up_missing: bool = True,startup_candles: int = 0,fail_without_data: bool = False,data_format: str = 'json',candle_type: CandleType = CandleType.SPOT,user_futures_funding_rate: Optional[int] = None,workers: int = 1) -> Dict[str, DataFrame]:
 
     result: Dict[str, DataFrame] = {}
     if startup_candles > 0 and timerange:
@@ -34,8 +59,10 @@ def load_data(datadir: Path,timeframe: str,pairs: List[str], *,timerange: Option
 
     data_handler = get_datahandler(datadir, data_format)
 
-    for pair in pairs:
-        hist = load_pair_history(pair=pair, timeframe=timeframe,datadir=datadir, timerange=timerange,fill_up_missing=fill_up_missing,startup_candles=startup_candles,data_handler=data_handler,candle_type=candle_type)
+    def _load(pair: str) -> DataFrame:
+        return load_pair_history(pair=pair, timeframe=timeframe,datadir=datadir, timerange=timerange,fill_up_missing=fill_up_missing,startup_candles=startup_candles,data_handler=data_handler,candle_type=candle_type)
+
+    for pair, hist in _load_pairs(_load, pairs, workers):
         if not hist.empty:
             result[pair] = hist
 
@@ -68,8 +95,14 @@ def _load_cached_data_for_updating(pair: str,timeframe: str,timerange: Optional[
         if timerange.stoptype == 'date':
             end = timerange.stopdt
 
-    # Intentionally don't pass timerange in - since we need to load the full dataset.
-    data = data_handler.ohlcv_load(pair, timeframe=timeframe,timerange=None, fill_missing=False,drop_incomplete=True, warn_no_data=False,candle_type=candle_type)
+    if not prepend and isinstance(data_handler, PartitionedDataHandler):
+        # New candles are appended - only the first and the last candles are needed.
+        data = data_handler.ohlcv_load_edges(pair, timeframe, candle_type)
+        if not data.empty:
+            data = clean_ohlcv_dataframe(data, timeframe, pair, fill_missing=False, drop_incomplete=True)
+    else:
+        # Intentionally don't pass timerange in - since we need to load the full dataset.
+        data = data_handler.ohlcv_load(pair, timeframe=timeframe,timerange=None, fill_missing=False,drop_incomplete=True, warn_no_data=False,candle_type=candle_type)
     if not data.empty:
         if not prepend and start and start < data.iloc[0]['date']:
             # Earlier data than existing data requested, redownload all
@@ -87,47 +120,72 @@ def _load_cached_data_for_updating(pair: str,timeframe: str,timerange: Optional[
 
 
 
-def _download_pair_history(pair: str, *,datadir: Path,exchange: Exchange,timeframe: str = '5m',process: str = '',new_pairs_days: int = 30,data_handler: Optional[IDataHandler] = None,timerange: Optional[TimeRange] = None,candle_type: CandleType,erase: bool = False,prepend: bool = False) -> bool:
+def _prepare_pair_download(pair: str, *,datadir: Path,timeframe: str,process: str,new_pairs_days: int,data_handler: IDataHandler,timerange: Optional[TimeRange],candle_type: CandleType,erase: bool,prepend: bool) -> Tuple[DataFrame, int, Optional[int]]:
 
-    data_handler = get_datahandler(datadir, data_handler=data_handler)
+    if erase:
+        if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
+            logger.info(f'Deleting existing data for pair {pair}, {timeframe}, {candle_type}.')
 
-    try:
-        if erase:
-            if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
-                logger.info(f'Deleting existing data for pair {pair}, {timeframe}, {candle_type}.')
+    data, since_ms, until_ms = _load_cached_data_for_updating(pair, timeframe, timerange,data_handler=data_handler,candle_type=candle_type,prepend=prepend)
 
-        data, since_ms, until_ms = _load_cached_data_for_updating(pair, timeframe, timerange,data_handler=data_handler,candle_type=candle_type,prepend=prepend)
+    logger.info(f'({process}) - Download history data for "{pair}", {timeframe}, '
+                f'{candle_type} and store in {datadir}. '
+                f'From {format_ms_time(since_ms) if since_ms else "start"} to '
+                f'{format_ms_time(until_ms) if until_ms else "now"}')
 
-        logger.info(f'({process}) - Download history data for "{pair}", {timeframe}, '
-                    f'{candle_type} and store in {datadir}. '
-                    f'From {format_ms_time(since_ms) if since_ms else "start"} to '
-                    f'{format_ms_time(until_ms) if until_ms else "now"}')
+    logger.debug("Current Start: %s",
+                f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}"
+                if not data.empty else 'None')
+    logger.debug("Current End: %s",
+                f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}"
+                if not data.empty else 'None')
 
-        logger.debug("Current Start: %s",
-                    f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}"
-                    if not data.empty else 'None')
-        logger.debug("Current End: %s",
-                    f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}"
-                    if not data.empty else 'None')
+    # Default since_ms to 30 days if nothing is given
+    since_ms = since_ms if since_ms else int((datetime.now() - timedelta(days=new_pairs_days)).timestamp()) * 1000
+    return data, since_ms, until_ms
 
-        # Default since_ms to 30 days if nothing is given
-        new_data = exchange.get_historic_ohlcv(pair=pair,timeframe=timeframe,since_ms=since_ms if since_ms else int((datetime.now() - timedelta(days=new_pairs_days)).timestamp()) * 1000,is_new_pair=data.empty,candle_type=candle_type,until_ms=until_ms if until_ms else None)
-        new_dataframe = ohlcv_to_dataframe(new_data, timeframe, pair,fill_missing=False, drop_incomplete=True)
 
-        if data.empty:
-            data = new_dataframe
 
-        else:
-            data = clean_ohlcv_dataframe(concat([data, new_dataframe], axis=0), timeframe, pair,fill_missing=False, drop_incomplete=False)
+def _store_pair_download(pair: str, *,timeframe: str,data_handler: IDataHandler,data: DataFrame,new_data: List,candle_type: CandleType,prepend: bool) -> None:
+
+    new_dataframe = ohlcv_to_dataframe(new_data, timeframe, pair,fill_missing=False, drop_incomplete=True)
 
-        logger.debug("New Start: %s",
-                    f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}"
-                    if not data.empty else 'None')
+    if not data.empty and not prepend and data_handler.supports_append():
+        # Only write candles after the existing data - duplicates are merged on load.
+        new_dataframe = new_dataframe.loc[new_dataframe['date'] > data.iloc[-1]['date']]
         logger.debug("New End: %s",
-                    f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}"
-                    if not data.empty else 'None')
+                    f"{new_dataframe.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}"
+                    if not new_dataframe.empty else 'unchanged')
+        data_handler.ohlcv_append(pair, timeframe, data=new_dataframe, candle_type=candle_type)
+        return
+
+    if data.empty:
+        data = new_dataframe
+
+    else:
+        data = clean_ohlcv_dataframe(concat([data, new_dataframe], axis=0), timeframe, pair,fill_missing=False, drop_incomplete=False)
+
+    logger.debug("New Start: %s",
+                f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}"
+                if not data.empty else 'None')
+    logger.debug("New End: %s",
+                f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}"
+                if not data.empty else 'None')
+
+    data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
 
-        data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+
+
+def _download_pair_history(pair: str, *,datadir: Path,exchange: Exchange,timeframe: str = '5m',process: str = '',new_pairs_days: int = 30,data_handler: Optional[IDataHandler] = None,timerange: Optional[TimeRange] = None,candle_type: CandleType,erase: bool = False,prepend: bool = False) -> bool:
+
+    data_handler = get_datahandler(datadir, data_handler=data_handler)
+
+    try:
+        data, since_ms, until_ms = _prepare_pair_download(pair, datadir=datadir, timeframe=timeframe, process=process,new_pairs_days=new_pairs_days, data_handler=data_handler,timerange=timerange, candle_type=candle_type, erase=erase, prepend=prepend)
+
+        new_data = exchange.get_historic_ohlcv(pair=pair,timeframe=timeframe,since_ms=since_ms,is_new_pair=data.empty,candle_type=candle_type,until_ms=until_ms if until_ms else None)
+
+        _store_pair_download(pair, timeframe=timeframe, data_handler=data_handler, data=data,new_data=new_data, candle_type=candle_type, prepend=prepend)
         return True
     except Exception:
         logger.exception(f'Failed to download history data for pair: "{pair}", timeframe: {timeframe}.')
@@ -135,22 +193,20 @@ def _download_pair_history(pair: str, *,datadir: Path,exchange: Exchange,timefra
 
 
 
-def refresh_backtest_ohlcv_data(exchange: Exchange, pairs: List[str], timeframes: List[str],datadir: Path, trading_mode: str,timerange: Optional[TimeRange] = None,new_pairs_days: int = 30, erase: bool = False,data_format: Optional[str] = None,prepend: bool = False) -> List[str]:
+def refresh_backtest_ohlcv_data(exchange: Exchange, pairs: List[str], timeframes: List[str],datadir: Path, trading_mode: str,timerange: Optional[TimeRange] = None,new_pairs_days: int = 30, erase: bool = False,data_format: Optional[str] = None,prepend: bool = False,workers: int = 1) -> List[str]:
 
     pairs_not_available = []
     data_handler = get_datahandler(datadir, data_format)
     candle_type = CandleType.get_default(trading_mode)
-    process = ''
+    jobs = []
     for idx, pair in enumerate(pairs, start=1):
         if pair not in exchange.markets:
             pairs_not_available.append(pair)
             logger.info(f"Skipping pair {pair}...")
             continue
+        process = f'{idx}/{len(pairs)}'
         for timeframe in timeframes:
-
-            logger.debug(f'Downloading pair {pair}, {candle_type}, interval {timeframe}.')
-            process = f'{idx}/{len(pairs)}'
-            _download_pair_history(pair=pair, process=process,datadir=datadir, exchange=exchange,timerange=timerange, data_handler=data_handler,timeframe=str(timeframe), new_pairs_days=new_pairs_days,candle_type=candle_type,erase=erase, prepend=prepend)
+            jobs.append((pair, str(timeframe), candle_type, process))
         if trading_mode == 'futures':
             tf_mark = exchange.get_option('mark_ohlcv_timeframe')
             tf_funding_rate = exchange.get_option('funding_fee_timeframe')
@@ -159,8 +215,17 @@ def refresh_backtest_ohlcv_data(exchange: Exchange, pairs: List[str], timeframes
             combs = ((CandleType.FUNDING_RATE, tf_funding_rate), (fr_candle_type, tf_mark))
 
             for candle_type_f, tf in combs:
-                logger.debug(f'Downloading pair {pair}, {candle_type_f}, interval {tf}.')
-                _download_pair_history(pair=pair, process=process,datadir=datadir, exchange=exchange,timerange=timerange, data_handler=data_handler,timeframe=str(tf), new_pairs_days=new_pairs_days,candle_type=candle_type_f,erase=erase, prepend=prepend)
+                jobs.append((pair, str(tf), candle_type_f, process))
+
+    if workers > 1:
+        from freqtrade.data.history.download_scheduler import DownloadJob, DownloadScheduler
+        scheduler = DownloadScheduler(exchange, data_handler, datadir=datadir, workers=workers,timerange=timerange, new_pairs_days=new_pairs_days,erase=erase, prepend=prepend)
+        scheduler.run([DownloadJob(*job) for job in jobs])
+        return pairs_not_available
+
+    for pair, timeframe, candle_type_j, process in jobs:
+        logger.debug(f'Downloading pair {pair}, {candle_type_j}, interval {timeframe}.')
+        _download_pair_history(pair=pair, process=process,datadir=datadir, exchange=exchange,timerange=timerange, data_handler=data_handler,timeframe=timeframe, new_pairs_days=new_pairs_days,candle_type=candle_type_j,erase=erase, prepend=prepend)
 
     return pairs_not_available
 
@@ -177,7 +242,13 @@ def _download_trades_history(exchange: Exchange,pair: str, *,new_pairs_days: int
             if timerange.stoptype == 'date':
                 until = timerange.stopts * 1000
 
-        trades = data_handler.trades_load(pair)
+        partial = isinstance(data_handler, PartitionedDataHandler)
+        if partial:
+            # New trades are appended - only the first trade and the trades overlapping
+            # the download (see since below) are needed.
+            trades = data_handler.trades_load_edges(pair, tail_ms=5 * 1000)
+        else:
+            trades = data_handler.trades_load(pair)
 
         if not trades.empty and since > 0 and since < trades.iloc[0]['timestamp']:
             logger.info(f"Start ({trades.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}) earlier than "
@@ -198,19 +269,28 @@ def _download_trades_history(exchange: Exchange,pair: str, *,new_pairs_days: int
                     f"{trades.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}")
         logger.debug("Current End: %s", 'None' if trades.empty else
                     f"{trades.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}")
-        logger.info(f"Current Amount of trades: {len(trades)}")
+        if not partial:
+            logger.info(f"Current Amount of trades: {len(trades)}")
 
         new_trades = exchange.get_historic_trades(pair=pair,since=since,until=until,from_id=from_id)
         new_trades_df = trades_list_to_df(new_trades[1])
+        existing = len(trades)
         trades = concat([trades, new_trades_df], axis=0)
         trades = trades_df_remove_duplicates(trades)
-        data_handler.trades_store(pair, data=trades)
+        if existing and data_handler.supports_append():
+            # Existing trades are kept first - only write the new ones.
+            data_handler.trades_append(pair, data=trades.iloc[existing:])
+        else:
+            data_handler.trades_store(pair, data=trades)
 
         logger.debug("New Start: %s", 'None' if trades.empty else
                     f"{trades.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}")
         logger.debug("New End: %s", 'None' if trades.empty else
                     f"{trades.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}")
-        logger.info(f"New Amount of trades: {len(trades)}")
+        if partial:
+            logger.info(f"Downloaded {len(trades) - existing} new trades.")
+        else:
+            logger.info(f"New Amount of trades: {len(trades)}")
         return True
 
     except Exception:
@@ -305,7 +385,7 @@ def download_data_main(config: Config) -> None:
                     "Please use `--dl-trades` instead for this exchange "
                     "(will unfortunately take a long time).")
             migrate_data(config, exchange)
-            pairs_not_available = refresh_backtest_ohlcv_data(exchange, pairs=expanded_pairs, timeframes=config['timeframes'],datadir=config['datadir'], timerange=timerange,new_pairs_days=config['new_pairs_days'],erase=bool(config.get('erase')), data_format=config['dataformat_ohlcv'],trading_mode=config.get('trading_mode', 'spot'),prepend=config.get('prepend_data', False))
+            pairs_not_available = refresh_backtest_ohlcv_data(exchange, pairs=expanded_pairs, timeframes=config['timeframes'],datadir=config['datadir'], timerange=timerange,new_pairs_days=config['new_pairs_days'],erase=bool(config.get('erase')), data_format=config['dataformat_ohlcv'],trading_mode=config.get('trading_mode', 'spot'),prepend=config.get('prepend_data', False),workers=config.get('download_workers', 1))
     finally:
         if pairs_not_available:
             logger.info(f"Pairs [{','.join(pairs_not_available)}] not available "
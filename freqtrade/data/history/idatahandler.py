@@ -32,6 +32,12 @@ class IDataHandler(ABC):
 
 
 
+    @classmethod
+    def supports_append(cls) -> bool:
+        return False
+
+
+
     @classmethod
     def ohlcv_get_available_data(cls, datadir: Path, trading_mode: TradingMode) -> ListPairsWithTimeframes:
 
@@ -77,6 +83,7 @@ class IDataHandler(ABC):
     def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
 
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self._remove_partitions(filename)
         if filename.exists():
             filename.unlink()
             return True
@@ -112,12 +119,14 @@ class IDataHandler(ABC):
 
     def trades_store(self, pair: str, data: DataFrame) -> None:
         self._trades_store(pair, data[DEFAULT_TRADES_COLUMNS])
+        self._remove_partitions(self._pair_trades_filename(self._datadir, pair))
 
 
 
     def trades_purge(self, pair: str) -> bool:
 
         filename = self._pair_trades_filename(self._datadir, pair)
+        self._remove_partitions(filename)
         if filename.exists():
             filename.unlink()
             return True
@@ -252,6 +261,7 @@ class IDataHandler(ABC):
             logger.warning(f"{file_new} exists already, can't migrate {pair}.")
             return
         file_old.rename(file_new)
+        self._move_partitions(file_old, file_new)
 
 
 
@@ -274,7 +284,38 @@ class IDataHandler(ABC):
             if Path(new_name).exists():
                 logger.warning(f'{new_name} already exists, Removing.')
                 Path(new_name).unlink()
+            self._remove_partitions(new_name)
             Path(old_name).rename(new_name)
+            self._move_partitions(old_name, new_name)
+
+
+    # Appended data of PartitionedDataHandler subclasses lives in "<datafile>.parts/" -
+    # removed / moved together with the data file.
+
+    @staticmethod
+    def _partition_dir(filename: Path) -> Path:
+        return filename.with_name(f'{filename.name}.parts')
+
+
+
+    @classmethod
+    def _remove_partitions(cls, filename: Path) -> None:
+
+        part_dir = cls._partition_dir(filename)
+        if part_dir.is_dir():
+            for file in part_dir.iterdir():
+                file.unlink()
+            part_dir.rmdir()
+
+
+
+    @classmethod
+    def _move_partitions(cls, file_old: Path, file_new: Path) -> None:
+
+        part_dir = cls._partition_dir(file_old)
+        if part_dir.is_dir():
+            part_dir.rename(cls._partition_dir(file_new))
+
 
 
 
@@ -1,4 +1,5 @@
 import logging
+from pathlib import Path
 from typing import Optional
 import numpy as np
 from pandas import DataFrame, read_json, to_datetime
@@ -8,19 +9,27 @@ from freqtrade.configuration import TimeRange
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
 from freqtrade.data.converter import trades_dict_to_list, trades_list_to_df
 from freqtrade.enums import CandleType
-from .idatahandler import IDataHandler
+from .partitioneddatahandler import PartitionedDataHandler
 
 logger = logging.getLogger(__name__)
 
-class JsonDataHandler(IDataHandler):
+class JsonDataHandler(PartitionedDataHandler):
 
     _use_zip = False
     _columns = DEFAULT_DATAFRAME_COLUMNS
+    # The whole file is parsed, timeranges are applied after loading
+    _timerange_pushdown = False
 
     def ohlcv_store(self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType) -> None:
 
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
+        self._ohlcv_store_file(filename, data)
+        self._remove_partitions(filename)
+
+
+    def _ohlcv_store_file(self, filename: Path, data: DataFrame) -> None:
+
         _data = data.copy()
         _data['date'] = _data['date'].view(np.int64) // 1000 // 1000
 
@@ -38,34 +47,46 @@ class JsonDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
         try:
-            pairdata = read_json(filename, orient='values')
-            pairdata.columns = self._columns
+            pairdata = self._ohlcv_load_file(filename, timerange)
+            return self._ohlcv_load_partitions(filename, pairdata, timerange)
         except ValueError:
             logger.error(f"Could not load data for {pair}.")
             return DataFrame(columns=self._columns)
+
+
+    def _ohlcv_load_file(self, filename: Path, timerange: Optional[TimeRange]) -> DataFrame:
+
+        pairdata = read_json(filename, orient='values')
+        pairdata.columns = self._columns
         pairdata = pairdata.astype(dtype={'open': 'float', 'high': 'float','low': 'float', 'close': 'float', 'volume': 'float'})
         pairdata['date'] = to_datetime(pairdata['date'], unit='ms', utc=True)
         return pairdata
 
 
-    def ohlcv_append(self,pair: str,timeframe: str,data: DataFrame,candle_type: CandleType) -> None:
-        raise NotImplementedError()
-
-
     def _trades_store(self, pair: str, data: DataFrame) -> None:
 
         filename = self._pair_trades_filename(self._datadir, pair)
+        self._trades_store_file(filename, data)
+
+
+    def _trades_store_file(self, filename: Path, data: DataFrame) -> None:
+
         trades = data.values.tolist()
         misc.file_dump_json(filename, trades, is_zip=self._use_zip)
 
 
 
-    def trades_append(self, pair: str, data: DataFrame):
-        raise NotImplementedError()
-
     def _trades_load(self, pair: str, timerange: Optional[TimeRange] = None) -> DataFrame:
 
         filename = self._pair_trades_filename(self._datadir, pair)
+        tradesdata = self._trades_load_file(filename)
+        if tradesdata.empty:
+            return tradesdata
+        return self._trades_load_partitions(filename, tradesdata)
+
+
+    def _trades_load_file(self, filename: Path, timerange: Optional[TimeRange] = None) -> DataFrame:
+
         tradesdata = misc.file_load_json(filename)
 
         if not tradesdata:
@@ -0,0 +1,338 @@
+import logging
+import math
+from abc import abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from pandas import DataFrame, Series, Timestamp, concat, to_datetime
+from pandas.api.types import is_datetime64_any_dtype
+
+from freqtrade import misc
+from freqtrade.configuration import TimeRange
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
+from freqtrade.data.converter import trades_convert_types
+from freqtrade.enums import CandleType
+
+from .idatahandler import IDataHandler
+
+
+logger = logging.getLogger(__name__)
+
+# Reads only the first row of a file (one row after stop=0 is kept).
+_FIRST_ROW = TimeRange(None, 'date', 0, 0)
+# Reads only the last row of a file (the last row at or before start is kept).
+_LAST_ROW = TimeRange('date', None, 2 ** 40, 0)
+
+
+def _values_ms(values: Series) -> np.ndarray:
+    if is_datetime64_any_dtype(values):
+        return values.to_numpy(dtype='datetime64[ms]').astype(np.int64)
+    return values.to_numpy(dtype=np.int64)
+
+
+def _tail_timerange(start: int) -> TimeRange:
+    """Timerange of the rows from start (in ms) - including the row before start."""
+    # Pushdown keeps the last row at or before the start of the timerange.
+    return TimeRange('date', None, (start - 1) // 1000, 0)
+
+
+def _row_values(row: Series) -> List[Any]:
+    """JSON serializable values of one row - dates in milliseconds, NaN as None."""
+    return [int(value.timestamp() * 1000) if isinstance(value, Timestamp)
+            else None if isinstance(value, float) and math.isnan(value) else value
+            for value in row.tolist()]
+
+
+class PartitionedDataHandler(IDataHandler):
+    """
+    Base class for handlers which can't append to their data files in place.
+    Appended data is kept in partition files in "<datafile>.parts/", described by
+    "manifest.json" in the same directory, and merged into the data file once
+    _max_partitions partitions exist.
+    The manifest also records the first row and the date range of the data file, so the
+    edges of the stored data are known without reading the data file.
+    """
+
+    _max_partitions = 100
+    # The format reads only the rows of the requested timerange
+    _timerange_pushdown = True
+
+    @classmethod
+    def supports_append(cls) -> bool:
+        return True
+
+    @abstractmethod
+    def _ohlcv_load_file(self, filename: Path, timerange: Optional[TimeRange]) -> DataFrame:
+        """
+        Load one ohlcv file (data file or partition), with converted column types.
+        :param timerange: Limit data to this timerange - may be ignored by the format
+        """
+
+    @abstractmethod
+    def _ohlcv_store_file(self, filename: Path, data: DataFrame) -> None:
+        """
+        Store ohlcv data to one file (data file or partition).
+        """
+
+    @abstractmethod
+    def _trades_load_file(self, filename: Path,
+                          timerange: Optional[TimeRange] = None) -> DataFrame:
+        """
+        Load one trades file (data file or partition) without type conversion.
+        :param timerange: Limit data to this timerange - may be ignored by the format
+        """
+
+    @abstractmethod
+    def _trades_store_file(self, filename: Path, data: DataFrame) -> None:
+        """
+        Store trades to one file (data file or partition).
+        """
+
+    def ohlcv_append(
+        self,
+        pair: str,
+        timeframe: str,
+        data: DataFrame,
+        candle_type: CandleType
+    ) -> None:
+        """
+        Append data to existing data structures.
+        Data is written to a new partition - the data file is only rewritten once
+        _max_partitions partitions exist.
+        :param pair: Pair
+        :param timeframe: Timeframe this ohlcv data is for
+        :param data: Data to append.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        """
+        if data.empty:
+            return
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists() or len(self._load_manifest(filename)) >= self._max_partitions:
+            # Nothing to append to (or too many partitions) - (re)write the data file.
+            pairdata = self._ohlcv_load(pair, timeframe, None, candle_type)
+            if not pairdata.empty:
+                data = concat([pairdata, data], axis=0, ignore_index=True)
+            self.ohlcv_store(pair, timeframe, data, candle_type)
+            return
+        data = data.reset_index(drop=True).loc[:, DEFAULT_DATAFRAME_COLUMNS]
+        dates = _values_ms(data['date'])
+        self._write_partition(filename, data, int(dates[0]), int(dates[-1]),
+                              self._ohlcv_store_file, self._ohlcv_load_file, 'date')
+
+    def trades_append(self, pair: str, data: DataFrame):
+        """
+        Append data to existing files.
+        Data is written to a new partition - the data file is only rewritten once
+        _max_partitions partitions exist.
+        :param pair: Pair - used for filename
+        :param data: Dataframe containing trades
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        """
+        if data.empty:
+            return
+        filename = self._pair_trades_filename(self._datadir, pair)
+        if not filename.exists() or len(self._load_manifest(filename)) >= self._max_partitions:
+            tradesdata = self._trades_load(pair)
+            if not tradesdata.empty:
+                data = concat([tradesdata, data[DEFAULT_TRADES_COLUMNS]],
+                              axis=0, ignore_index=True)
+            self.trades_store(pair, data)
+            return
+        data = data.reset_index(drop=True)[DEFAULT_TRADES_COLUMNS]
+        self._write_partition(filename, data, int(data.iloc[0]['timestamp']),
+                              int(data.iloc[-1]['timestamp']), self._trades_store_file,
+                              self._trades_load_file, 'timestamp')
+
+    def ohlcv_load_edges(self, pair: str, timeframe: str, candle_type: CandleType) -> DataFrame:
+        """
+        Load the first and the last 2 candles of the stored data, without loading the data
+        in between (formats supporting timerange pushdown only read these rows).
+        Used to continue downloads - see history_utils._load_cached_data_for_updating().
+        :param pair: Pair to load data
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: DataFrame with up to 3 candles, or empty DataFrame
+        """
+        filename = self._pair_data_filename(
+            self._datadir, pair, timeframe, candle_type=candle_type)
+        if not filename.exists():
+            # Fallback mode for 1M files
+            filename = self._pair_data_filename(
+                self._datadir, pair, timeframe, candle_type=candle_type, no_timeframe_modify=True)
+            if not filename.exists():
+                return DataFrame(columns=DEFAULT_DATAFRAME_COLUMNS)
+        # One millisecond before the last candle - the candle before it is kept as well.
+        return self._load_edges(filename, self._ohlcv_load_file, 'date', 1)
+
+    def trades_load_edges(self, pair: str, tail_ms: int) -> DataFrame:
+        """
+        Load the first trade and the trades of the last tail_ms milliseconds of the stored
+        data, without loading the trades in between (formats supporting timerange pushdown
+        only read these rows).
+        Used to continue downloads - see history_utils._download_trades_history().
+        :param pair: Load trades for this pair
+        :param tail_ms: Length of the tail to load, in milliseconds
+        :return: Dataframe containing trades
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        if not filename.exists():
+            return trades_convert_types(DataFrame(columns=DEFAULT_TRADES_COLUMNS))
+        trades = self._load_edges(filename, self._trades_load_file, 'timestamp', tail_ms)
+        return trades_convert_types(trades.drop_duplicates(subset=['timestamp', 'id']))
+
+    def _load_edges(self, filename: Path,
+                    load_file: Callable[[Path, Optional[TimeRange]], DataFrame],
+                    column: str, tail_ms: int) -> DataFrame:
+        """
+        First row of the stored data, plus the rows of the last tail_ms milliseconds
+        (and the row before them).
+        With partitions, the first row and the date range of every file are taken from the
+        manifest - only the files overlapping the tail are read, each of them once.
+        """
+        manifest = self._read_manifest(filename)
+        if not manifest:
+            return self._load_file_edges(filename, load_file, column, tail_ms)
+
+        part_dir = self._partition_dir(filename)
+        files = [(filename, manifest['data'])] + [
+            (part_dir / part['file'], part) for part in manifest['partitions']]
+        start = files[-1][1]['end'] - tail_ms
+        frames: List[DataFrame] = []
+        for file, edges in reversed(files):
+            frames.insert(0, load_file(file, _tail_timerange(start)))
+            if edges['start'] < start:
+                break
+        tail = concat([df for df in frames if not df.empty] or frames, axis=0,
+                      ignore_index=True)
+        lo = max(int(np.searchsorted(_values_ms(tail[column]), start, side='left')) - 1, 0)
+        head = self._manifest_row(manifest['data']['first'], column)
+        return concat([head, tail.iloc[lo:]], axis=0, ignore_index=True)
+
+    def _load_file_edges(self, filename: Path,
+                         load_file: Callable[[Path, Optional[TimeRange]], DataFrame],
+                         column: str, tail_ms: int) -> DataFrame:
+        """
+        _load_edges() for a single file.
+        Formats without timerange pushdown read the file once, others read the first row,
+        the last row and the tail.
+        """
+        if self._timerange_pushdown:
+            head = load_file(filename, _FIRST_ROW).iloc[:1]
+            last = load_file(filename, _LAST_ROW)
+            if last.empty:
+                return head
+            start = int(_values_ms(last[column])[-1]) - tail_ms
+            tail = load_file(filename, _tail_timerange(start))
+        else:
+            tail = load_file(filename, None)
+            if tail.empty:
+                return tail
+            head = tail.iloc[:1]
+            start = int(_values_ms(tail[column])[-1]) - tail_ms
+        lo = max(int(np.searchsorted(_values_ms(tail[column]), start, side='left')) - 1, 0)
+        return concat([head, tail.iloc[lo:]], axis=0, ignore_index=True)
+
+    @staticmethod
+    def _manifest_row(row: List[Any], column: str) -> DataFrame:
+        """
+        Rebuild a row recorded in the manifest, with the types of the loaded files.
+        """
+        if column == 'date':
+            df = DataFrame([row], columns=DEFAULT_DATAFRAME_COLUMNS).astype(
+                dtype={'open': 'float', 'high': 'float', 'low': 'float', 'close': 'float',
+                       'volume': 'float'})
+            df['date'] = to_datetime(df['date'], unit='ms', utc=True)
+            return df
+        return DataFrame([row], columns=DEFAULT_TRADES_COLUMNS)
+
+    @classmethod
+    def _read_manifest(cls, filename: Path) -> Dict[str, Any]:
+        """
+        :return: Manifest with keys "data" (first row, start and end of the data file) and
+                 "partitions", or empty dict if there are no partitions
+        """
+        manifest = cls._partition_dir(filename) / 'manifest.json'
+        if not manifest.exists():
+            return {}
+        return misc.file_load_json(manifest)
+
+    @classmethod
+    def _load_manifest(cls, filename: Path) -> List[Dict[str, Any]]:
+        return cls._read_manifest(filename).get('partitions', [])
+
+    @classmethod
+    def _store_manifest(cls, filename: Path, manifest: Dict[str, Any]) -> None:
+        manifest_file = cls._partition_dir(filename) / 'manifest.json'
+        # Write + rename, so a partition is either fully registered or ignored.
+        tmp_file = manifest_file.with_name('manifest.json.tmp')
+        misc.file_dump_json(tmp_file, manifest, log=False)
+        tmp_file.replace(manifest_file)
+
+    def _write_partition(self, filename: Path, data: DataFrame, start: int, end: int,
+                         store_file: Callable[[Path, DataFrame], None],
+                         load_file: Callable[[Path, Optional[TimeRange]], DataFrame],
+                         column: str) -> None:
+        manifest = self._read_manifest(filename)
+        if not manifest:
+            # First partition - record the edges of the data file, which isn't modified
+            # until the partitions are merged into it.
+            edges = self._load_file_edges(filename, load_file, column, 0)
+            dates = _values_ms(edges[column])
+            manifest = {
+                'data': {'first': _row_values(edges.iloc[0]),
+                         'start': int(dates[0]), 'end': int(dates[-1])},
+                'partitions': [],
+            }
+        partitions = manifest['partitions']
+        part_dir = self._partition_dir(filename)
+        part_dir.mkdir(exist_ok=True)
+        idx = int(partitions[-1]['file'].split('.')[0]) + 1 if partitions else 1
+        part_name = f'{idx:05d}.{self._get_file_extension()}'
+        store_file(part_dir / part_name, data)
+        partitions.append({'file': part_name, 'start': start, 'end': end, 'rows': len(data)})
+        self._store_manifest(filename, manifest)
+
+    def _ohlcv_load_partitions(self, filename: Path, pairdata: DataFrame,
+                               timerange: Optional[TimeRange]) -> DataFrame:
+        """
+        Append the partitions of filename to the loaded data file.
+        Partitions are in chronological order - partitions before the timerange are skipped,
+        and loading stops once data after the end of the timerange was loaded.
+        """
+        partitions = self._load_manifest(filename)
+        if not partitions:
+            return pairdata
+        startts = timerange.startts * 1000 if timerange and timerange.starttype == 'date' else None
+        stopts = timerange.stopts * 1000 if timerange and timerange.stoptype == 'date' else None
+
+        def _past_stop(df: DataFrame) -> bool:
+            return (stopts is not None and not df.empty
+                    and df.iloc[-1]['date'].timestamp() * 1000 > stopts)
+
+        frames = [pairdata]
+        if not _past_stop(pairdata):
+            part_dir = self._partition_dir(filename)
+            for part in partitions:
+                if startts is not None and part['end'] < startts:
+                    continue
+                frames.append(self._ohlcv_load_file(part_dir / part['file'], timerange))
+                if _past_stop(frames[-1]):
+                    break
+        frames = [df for df in frames if not df.empty]
+        if not frames:
+            return pairdata
+        return concat(frames, axis=0, ignore_index=True)
+
+    def _trades_load_partitions(self, filename: Path, tradesdata: DataFrame) -> DataFrame:
+        """
+        Append the partitions of filename to the loaded trades file.
+        """
+        partitions = self._load_manifest(filename)
+        if not partitions:
+            return tradesdata
+        part_dir = self._partition_dir(filename)
+        frames = [tradesdata] + [self._trades_load_file(part_dir / part['file'])
+                                 for part in partitions]
+        return concat([df for df in frames if not df.empty] or [tradesdata],
+                      axis=0, ignore_index=True)
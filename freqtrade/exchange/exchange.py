@@ -2,6 +2,7 @@ import asyncio
 import inspect
 import logging
 import signal
+import time
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from math import floor
@@ -12,14 +13,16 @@ import ccxt.async_support as ccxt_async
 from cachetools import TTLCache
 from ccxt import TICK_SIZE
 from dateutil import parser
-from pandas import DataFrame, concat
+from pandas import DataFrame
 
 from freqtrade.constants import (DEFAULT_AMOUNT_RESERVE_PERCENT, NON_OPEN_EXCHANGE_STATES, BidAsk,BuySell, Config, EntryExit, ExchangeConfig,ListPairsWithTimeframes, MakerTaker, OBLiteral, PairWithTimeframe)
-from freqtrade.data.converter import clean_ohlcv_dataframe, ohlcv_to_dataframe, trades_dict_to_list
+from freqtrade.data.converter import ohlcv_to_dataframe, trades_dict_to_list
 from freqtrade.enums import OPTIMIZE_MODES, CandleType, MarginMode, PriceType, TradingMode
 from freqtrade.exceptions import (DDosProtection, ExchangeError, InsufficientFundsError,InvalidOrderException, OperationalException, PricingError,RetryableOrderError, TemporaryError)
 from freqtrade.exchange.common import (API_FETCH_ORDER_RETRY_COUNT, remove_exchange_credentials,retrier, retrier_async)
 from freqtrade.exchange.exchange_utils import (ROUND, ROUND_DOWN, ROUND_UP, CcxtModuleType,amount_to_contract_precision, amount_to_contracts,amount_to_precision, contracts_to_amount,date_minus_candles, is_exchange_known_ccxt,market_is_active, price_to_precision,timeframe_to_minutes, timeframe_to_msecs,timeframe_to_next_date, timeframe_to_prev_date,timeframe_to_seconds)
+from freqtrade.exchange.kline_buffer import KlineBuffer
+from freqtrade.exchange.rate_limiter import TokenBucket
 from freqtrade.exchange.types import OHLCVResponse, OrderBook, Ticker, Tickers
 from freqtrade.misc import (chunks, deep_merge_dicts, file_dump_json, file_load_json,safe_value_fallback2)
 from freqtrade.plugins.pairlist.pairlist_helpers import expand_pairlist
@@ -78,6 +81,8 @@ class Exchange:
         self._leverage_tiers: Dict[str, List[Dict]] = {}
         self._loop_lock = Lock()
         self.loop = self._init_async_loop()
+        # Shared limiter for candle history requests (set while downloading data concurrently)
+        self._rate_limiter: Optional[TokenBucket] = None
         self._config: Config = {}
 
         self._config.update(config)
@@ -94,7 +99,7 @@ class Exchange:
         self._entry_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=300)
 
         # Holds candles
-        self._klines: Dict[PairWithTimeframe, DataFrame] = {}
+        self._klines: Dict[PairWithTimeframe, KlineBuffer] = {}
 
         # Holds all open sell orders for dry_run
         self._dry_run_open_orders: Dict[str, Any] = {}
@@ -147,6 +152,15 @@ class Exchange:
             self.required_candle_call_count = self.validate_required_startup_candles(self._startup_candle_count, config.get('timeframe', ''))
         # Converts the interval provided in minutes in config to seconds
         self.markets_refresh_interval: int = exchange_conf.get("markets_refresh_interval", 60) * 60 * 1000
+        # Concurrent candle requests and timeout (seconds) per request when refreshing candles
+        self._ohlcv_refresh_concurrency: int = exchange_conf.get('ohlcv_refresh_concurrency', 100)
+        self._ohlcv_request_timeout: Optional[float] = exchange_conf.get('ohlcv_request_timeout', 60)
+        # Statistics of the last refresh_latest_ohlcv() call
+        self.ohlcv_refresh_stats: Dict[str, float] = {}
+        # Order books shared by all dry-run fill checks - cached for a few seconds per pair
+        self._dry_order_book_cache: TTLCache = TTLCache(
+            maxsize=1000, ttl=exchange_conf.get('dry_run_orderbook_ttl', 2))
+        self.dry_order_book_stats: Dict[str, int] = {'hits': 0, 'misses': 0, 'fetched': 0}
 
         if self.trading_mode != TradingMode.SPOT and load_leverage_tiers:
             self.fill_leverage_tiers()
@@ -173,6 +187,12 @@ class Exchange:
     def _init_ccxt(self, exchange_config: Dict[str, Any], ccxt_module: CcxtModuleType = ccxt,ccxt_kwargs: Dict = {}) -> ccxt.Exchange:
 
         name = exchange_config['name']
+        if exchange_config.get('simulator'):
+            # Serve all requests from the in-process exchange simulator
+            from freqtrade.exchange.exchange_simulator import SimulatorBackend, create_simulator_api
+            if getattr(self, '_simulator', None) is None:
+                self._simulator = SimulatorBackend(name, exchange_config['simulator'], exchange_config.get('pair_whitelist', []), self.trading_mode)
+            return create_simulator_api(self._simulator, asynchronous=ccxt_module is ccxt_async)
         if not is_exchange_known_ccxt(name, ccxt_module):
             raise OperationalException(f'Exchange {name} is not supported by ccxt')
         ex_config = {
@@ -233,7 +253,8 @@ class Exchange:
 
     def klines(self, pair_interval: PairWithTimeframe, copy: bool = True) -> DataFrame:
         if pair_interval in self._klines:
-            return self._klines[pair_interval].copy() if copy else self._klines[pair_interval]
+            df = self._klines[pair_interval].to_dataframe()
+            return df.copy() if copy else df
         else:
             return DataFrame()
 
@@ -1110,7 +1131,16 @@ class Exchange:
         :param candle_type: '', mark, index, premiumIndex, or funding_rate
         :return: List with candle (OHLCV) data
         """
-        pair, _, _, data, _ = self.loop.run_until_complete(self._async_get_historic_ohlcv(pair=pair, timeframe=timeframe,since_ms=since_ms, until_ms=until_ms,is_new_pair=is_new_pair, candle_type=candle_type))
+        return self.loop.run_until_complete(self.get_historic_ohlcv_async(pair=pair, timeframe=timeframe,since_ms=since_ms, until_ms=until_ms,is_new_pair=is_new_pair, candle_type=candle_type))
+
+
+
+    async def get_historic_ohlcv_async(self, pair: str, timeframe: str,since_ms: int, candle_type: CandleType,is_new_pair: bool = False,until_ms: Optional[int] = None) -> List:
+        """
+        Coroutine variant of get_historic_ohlcv(), to be awaited on self.loop
+        (e.g. to download multiple pairs concurrently).
+        """
+        pair, _, _, data, _ = await self._async_get_historic_ohlcv(pair=pair, timeframe=timeframe,since_ms=since_ms, until_ms=until_ms,is_new_pair=is_new_pair, candle_type=candle_type)
         logger.info(f"Downloaded data for {pair} with length {len(data)}.")
         return data
 
@@ -1223,17 +1253,14 @@ class Exchange:
                                       drop_incomplete=drop_incomplete)
         if cache:
             if (pair, timeframe, c_type) in self._klines:
-                old = self._klines[(pair, timeframe, c_type)]
-                # Reassign so we return the updated, combined df
-                ohlcv_df = clean_ohlcv_dataframe(concat([old, ohlcv_df], axis=0), timeframe, pair,
-                                                 fill_missing=True, drop_incomplete=False)
+                klines = self._klines[(pair, timeframe, c_type)]
                 candle_limit = self.ohlcv_candle_limit(timeframe, self._config['candle_type_def'])
-                # Age out old candles
-                ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
-                ohlcv_df = ohlcv_df.reset_index(drop=True)
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
+                # Merge new candles and age out old candles
+                klines.merge(ohlcv_df, timeframe, pair, candle_limit + self._startup_candle_count)
+                # Reassign so we return the updated, combined df
+                ohlcv_df = klines.to_dataframe()
             else:
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
+                self._klines[(pair, timeframe, c_type)] = KlineBuffer(ohlcv_df)
         return ohlcv_df
 
     def refresh_latest_ohlcv(self, pair_list: ListPairsWithTimeframes, *,
@@ -1257,13 +1284,9 @@ class Exchange:
         input_coroutines, cached_pairs = self._build_ohlcv_dl_jobs(pair_list, since_ms, cache)
 
         results_df = {}
-        # Chunk requests into batches of 100 to avoid overwelming ccxt Throttling
-        for input_coro in chunks(input_coroutines, 100):
-            async def gather_stuff():
-                return await asyncio.gather(*input_coro, return_exceptions=True)
-
+        if input_coroutines:
             with self._loop_lock:
-                results = self.loop.run_until_complete(gather_stuff())
+                results = self.loop.run_until_complete(self._gather_ohlcv_jobs(input_coroutines))
 
             for res in results:
                 if isinstance(res, Exception):
@@ -1286,6 +1309,47 @@ class Exchange:
 
         return results_df
 
+    async def _gather_ohlcv_jobs(
+            self, input_coroutines: List[Coroutine[Any, Any, OHLCVResponse]]) -> List:
+        """
+        Run candle requests with at most `ohlcv_refresh_concurrency` requests in flight.
+        A new request starts as soon as one finishes - so a slow request only delays itself.
+        Requests exceeding `ohlcv_request_timeout` are cancelled and returned as exception.
+        Updates ohlcv_refresh_stats with latency metrics.
+        :return: Results (or exceptions) in the order of input_coroutines
+        """
+        semaphore = asyncio.Semaphore(max(self._ohlcv_refresh_concurrency, 1))
+        latencies: List[float] = []
+        timeouts = 0
+
+        async def run_job(coro: Coroutine[Any, Any, OHLCVResponse]) -> OHLCVResponse:
+            nonlocal timeouts
+            async with semaphore:
+                start = time.monotonic()
+                try:
+                    return await asyncio.wait_for(coro, self._ohlcv_request_timeout)
+                except asyncio.TimeoutError as e:
+                    timeouts += 1
+                    raise TemporaryError(
+                        f'Candle request timed out after {self._ohlcv_request_timeout}s.') from e
+                finally:
+                    latencies.append(time.monotonic() - start)
+
+        start = time.monotonic()
+        results = await asyncio.gather(*(run_job(coro) for coro in input_coroutines),
+                                       return_exceptions=True)
+        self.ohlcv_refresh_stats = {
+            'requests': len(latencies),
+            'timeouts': timeouts,
+            'duration': time.monotonic() - start,
+            'latency_avg': sum(latencies) / len(latencies) if latencies else 0.0,
+            'latency_max': max(latencies, default=0.0),
+        }
+        logger.debug("Refreshed candles with %(requests)d requests in %(duration).2fs "
+                     "(avg: %(latency_avg).2fs, max: %(latency_max).2fs, "
+                     "timeouts: %(timeouts)d).", self.ohlcv_refresh_stats)
+        return results
+
     def _now_is_time_to_refresh(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
         # Timeframe in seconds
         interval_in_sec = timeframe_to_seconds(timeframe)
@@ -1317,6 +1381,8 @@ class Exchange:
             params = deepcopy(self._ft_has.get('ohlcv_params', {}))
             candle_limit = self.ohlcv_candle_limit(
                 timeframe, candle_type=candle_type, since_ms=since_ms)
+            if self._rate_limiter:
+                await self._rate_limiter.acquire()
 
             if candle_type and candle_type != CandleType.SPOT:
                 params.update({'price': candle_type.value})
@@ -2194,7 +2260,7 @@ class Exchange:
             dry_order["ft_order_type"] = "stoploss"
         orderbook: Optional[OrderBook] = None
         if self.exchange_has('fetchL2OrderBook'):
-            orderbook = self.fetch_l2_order_book(pair, 20)
+            orderbook = self.get_dry_order_book(pair)
         if ordertype == "limit" and orderbook:
             # Allow a 1% price difference
             allowed_diff = 0.01
@@ -2240,6 +2306,79 @@ class Exchange:
         })
         return dry_order
 
+    def get_dry_order_book(self, pair: str) -> OrderBook:
+        """
+        Order book (20 levels) used to simulate dry-run orders.
+        Order books are cached for `dry_run_orderbook_ttl` seconds. On a cache miss, order books
+        of all pairs with open dry-run limit orders are refreshed in one batch.
+        """
+        with self._cache_lock:
+            orderbook = self._dry_order_book_cache.get(pair)
+            self.dry_order_book_stats['hits' if orderbook is not None else 'misses'] += 1
+        if orderbook is not None:
+            return orderbook
+
+        pairs = {pair} | {
+            order['symbol'] for order in self._dry_run_open_orders.values()
+            if order['status'] != 'closed' and order['type'] == 'limit'
+            and not order.get('ft_order_type')
+        }
+        with self._cache_lock:
+            pairs = {p for p in pairs if p not in self._dry_order_book_cache}
+        if len(pairs) > 1:
+            self._refresh_dry_order_books(list(pairs))
+            with self._cache_lock:
+                orderbook = self._dry_order_book_cache.get(pair)
+            if orderbook is not None:
+                return orderbook
+
+        orderbook = self.fetch_l2_order_book(pair, 20)
+        with self._cache_lock:
+            self._dry_order_book_cache[pair] = orderbook
+            self.dry_order_book_stats['fetched'] += 1
+        return orderbook
+
+    def _refresh_dry_order_books(self, pairs: List[str]) -> None:
+        """
+        Fetch order books for all pairs concurrently and store them in the dry-run cache.
+        Failed pairs are skipped - they're fetched individually when needed.
+        """
+        async def gather_order_books():
+            return await asyncio.gather(
+                *(self._async_fetch_l2_order_book(pair, 20) for pair in pairs),
+                return_exceptions=True)
+
+        with self._loop_lock:
+            results = self.loop.run_until_complete(gather_order_books())
+        with self._cache_lock:
+            for pair, res in zip(pairs, results):
+                if isinstance(res, Exception):
+                    logger.debug(f"Could not fetch order book for {pair}: {repr(res)}")
+                    continue
+                self._dry_order_book_cache[pair] = res
+                self.dry_order_book_stats['fetched'] += 1
+
+    @retrier_async
+    async def _async_fetch_l2_order_book(self, pair: str, limit: int = 100) -> OrderBook:
+        """
+        Asynchronously get the order book - same handling as fetch_l2_order_book().
+        """
+        limit1 = self.get_next_limit_in_list(limit, self._ft_has['l2_limit_range'],
+                                             self._ft_has['l2_limit_range_required'])
+        try:
+            return await self._api_async.fetch_l2_order_book(pair, limit1)
+        except ccxt.NotSupported as e:
+            raise OperationalException(
+                f'Exchange {self._api.name} does not support fetching order book.'
+                f'Message: {e}') from e
+        except ccxt.DDoSProtection as e:
+            raise DDosProtection(e) from e
+        except (ccxt.NetworkError, ccxt.ExchangeError) as e:
+            raise TemporaryError(f'Could not get order book due to {e.__class__.__name__}. '
+                                 f'Message: {e}') from e
+        except ccxt.BaseError as e:
+            raise OperationalException(e) from e
+
     def get_dry_market_fill_price(self, pair: str, side: str, amount: float, rate: float,
                                   orderbook: Optional[OrderBook]) -> float:
         """
@@ -2247,7 +2386,7 @@ class Exchange:
         """
         if self.exchange_has('fetchL2OrderBook'):
             if not orderbook:
-                orderbook = self.fetch_l2_order_book(pair, 20)
+                orderbook = self.get_dry_order_book(pair)
             ob_type: OBLiteral = 'asks' if side == 'buy' else 'bids'
             slippage = 0.05
             max_slippage_val = rate * ((1 + slippage) if side == 'buy' else (1 - slippage))
@@ -2288,7 +2427,7 @@ class Exchange:
         if not self.exchange_has('fetchL2OrderBook'):
             return True
         if not orderbook:
-            orderbook = self.fetch_l2_order_book(pair, 1)
+            orderbook = self.get_dry_order_book(pair)
         try:
             if side == 'buy':
                 price = orderbook['asks'][0][0]
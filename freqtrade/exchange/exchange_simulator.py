@@ -0,0 +1,600 @@
+"""
+In-process exchange simulator, implementing the part of the ccxt API used by freqtrade.
+
+Serves markets, OHLCV, tickers, order books, funding rates and order endpoints from recorded
+or synthetic data, with configurable latency, rate limit and error injection - so the bot loop
+can be load-tested and benchmarked without a real exchange.
+
+Enabled by adding a "simulator" section to the exchange configuration:
+
+    "exchange": {
+        "name": "binance",
+        "simulator": {
+            "latency": 0.05,
+            "latency_jitter": 0.02,
+            "rate_limit": 50,
+            "rate_limit_burst": 20,
+            "error_rate": 0.01,
+            "recorded_data_dir": "user_data/data/binance"
+        },
+        ...
+    }
+
+Synthetic prices are deterministic functions of pair and time, so runs are reproducible.
+"""
+import asyncio
+import logging
+import math
+import random
+import threading
+import time
+import uuid
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import ccxt
+import numpy as np
+
+from freqtrade.enums import CandleType, TradingMode
+from freqtrade.exchange.exchange_utils import timeframe_to_msecs
+
+
+logger = logging.getLogger(__name__)
+
+SIMULATOR_DEFAULTS: Dict[str, Any] = {
+    # Seconds added to every request
+    'latency': 0.0,
+    'latency_jitter': 0.0,
+    # Milliseconds between two requests (ccxt rateLimit) and number of requests allowed
+    # in a burst. Requests exceeding the limit fail with DDoSProtection.
+    'rate_limit': 50,
+    'rate_limit_burst': 10,
+    # Probability of a request failing with one of the configured errors
+    'error_rate': 0.0,
+    'errors': ['NetworkError', 'ExchangeNotAvailable', 'RequestTimeout'],
+    'seed': 42,
+    'spread': 0.0005,
+    'fee': 0.001,
+    'funding_rate': 0.0001,
+    'balance': 100000.0,
+    'order_book_depth': 100,
+    # Directory with recorded ohlcv data - synthetic data is used for missing pairs
+    'recorded_data_dir': None,
+    'recorded_data_format': 'feather',
+}
+
+SIMULATOR_TIMEFRAMES = ['1m', '3m', '5m', '15m', '30m', '1h', '2h', '4h', '6h', '8h', '12h',
+                        '1d', '3d', '1w']
+
+_FUNDING_INTERVAL_MS = 8 * 60 * 60 * 1000
+# Price cycles of the synthetic prices - 1 week, 1 day, 1 hour
+_CYCLES_MS = (7 * 24 * 3600 * 1000, 24 * 3600 * 1000, 3600 * 1000)
+_CYCLE_AMPLITUDES = (0.05, 0.02, 0.005)
+
+# Endpoints exempt from rate limit, latency and error injection
+_UNTHROTTLED = {'load_markets', 'calculate_fee'}
+
+
+def _iso(ts_ms: int) -> str:
+    return ccxt.Exchange.iso8601(ts_ms)
+
+
+class SimulatorBackend:
+    """
+    State of one simulated exchange - shared by the sync and async api objects.
+    """
+
+    def __init__(self, name: str, sim_config: Dict[str, Any], pairs: List[str],
+                 trading_mode: TradingMode = TradingMode.SPOT) -> None:
+        self.name = name
+        self.config: Dict[str, Any] = {**SIMULATOR_DEFAULTS, **sim_config}
+        self.trading_mode = trading_mode
+        self._rng = random.Random(self.config['seed'])
+        self._lock = threading.Lock()
+        self._burst = max(float(self.config['rate_limit_burst']), 1.0)
+        self._tokens = self._burst
+        self._last_request = time.monotonic()
+        self._recorded: Dict[Tuple[str, str, str], Any] = {}
+        self.orders: Dict[str, Dict[str, Any]] = {}
+        self.markets = self._build_markets(self.config.get('pairs') or pairs)
+        self.stats: Dict[str, int] = {'requests': 0, 'rate_limited': 0, 'errors': 0}
+
+    # Locks can't be pickled (e.g. when sending Backtesting to hyperopt workers).
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    # ---- Request handling ----
+
+    def before_request(self, endpoint: str) -> Tuple[float, Optional[Exception]]:
+        """
+        Account for one request.
+        :return: Tuple of (latency in seconds, error to raise after the latency)
+        """
+        if endpoint in _UNTHROTTLED:
+            return 0.0, None
+        conf = self.config
+        with self._lock:
+            self.stats['requests'] += 1
+            now = time.monotonic()
+            rate = 1000 / max(conf['rate_limit'], 1)
+            self._tokens = min(self._burst, self._tokens + (now - self._last_request) * rate)
+            self._last_request = now
+            latency = max(conf['latency'] + self._rng.uniform(-conf['latency_jitter'],
+                                                              conf['latency_jitter']), 0.0)
+            if self._tokens < 1:
+                self.stats['rate_limited'] += 1
+                return latency, ccxt.DDoSProtection(
+                    f'{self.name} simulator: rate limit exceeded on {endpoint}.')
+            self._tokens -= 1
+            if conf['error_rate'] and self._rng.random() < conf['error_rate']:
+                self.stats['errors'] += 1
+                error = getattr(ccxt, self._rng.choice(conf['errors']), ccxt.NetworkError)
+                return latency, error(f'{self.name} simulator: injected error on {endpoint}.')
+        return latency, None
+
+    # ---- Markets ----
+
+    def _build_markets(self, pairs: List[str]) -> Dict[str, Dict[str, Any]]:
+        markets = {}
+        futures = self.trading_mode == TradingMode.FUTURES
+        for pair in pairs:
+            symbol = pair.split(':')[0]
+            base, quote = symbol.split('/')
+            settle = pair.split(':')[1] if ':' in pair else quote
+            if futures:
+                symbol = f'{symbol}:{settle}'
+            price = self._mid_prices(symbol, np.array([0]))[0]
+            markets[symbol] = {
+                'id': f'{base}{quote}',
+                'symbol': symbol,
+                'base': base,
+                'quote': quote,
+                'settle': settle if futures else None,
+                'baseId': base,
+                'quoteId': quote,
+                'settleId': settle if futures else None,
+                'type': 'swap' if futures else 'spot',
+                'spot': not futures,
+                'margin': False,
+                'swap': futures,
+                'future': False,
+                'option': False,
+                'active': True,
+                'contract': futures,
+                'linear': True if futures else None,
+                'inverse': False if futures else None,
+                'contractSize': 1.0 if futures else None,
+                'taker': self.config['fee'],
+                'maker': self.config['fee'],
+                'precision': {
+                    'amount': 10 ** -min(max(4 - int(math.log10(price)), 0), 8),
+                    'price': 10 ** (int(math.log10(price)) - 5),
+                },
+                'limits': {
+                    'amount': {'min': 10 ** -min(max(4 - int(math.log10(price)), 0), 8),
+                               'max': None},
+                    'price': {'min': None, 'max': None},
+                    'cost': {'min': 5.0, 'max': None},
+                    'leverage': {'min': 1.0, 'max': 20.0 if futures else None},
+                },
+                'info': {},
+            }
+        return markets
+
+    def load_markets(self, reload: bool = False, params: Dict = {}) -> Dict[str, Dict]:
+        return self.markets
+
+    # ---- Market data ----
+
+    def _mid_prices(self, symbol: str, timestamps: np.ndarray) -> np.ndarray:
+        """
+        Deterministic synthetic mid price of symbol at the given timestamps (ms).
+        """
+        seed = zlib.crc32(symbol.split(':')[0].encode())
+        base_price = 10 ** ((seed % 500) / 100 - 1)
+        phase = (seed % 1000) / 1000 * 2 * math.pi
+        ts = timestamps.astype(np.float64)
+        exponent = sum(amp * np.sin(2 * np.pi * ts / cycle + (idx + 1) * phase)
+                       for idx, (cycle, amp) in enumerate(zip(_CYCLES_MS, _CYCLE_AMPLITUDES)))
+        return base_price * np.exp(exponent)
+
+    def _recorded_ohlcv(self, symbol: str, timeframe: str, candle_type: str):
+        key = (symbol, timeframe, candle_type)
+        if key not in self._recorded:
+            data = None
+            if self.config['recorded_data_dir']:
+                from freqtrade.data.history.idatahandler import get_datahandler
+                handler = get_datahandler(Path(self.config['recorded_data_dir']),
+                                          self.config['recorded_data_format'])
+                df = handler.ohlcv_load(symbol, timeframe, CandleType.from_string(candle_type))
+                if not df.empty:
+                    data = (df['date'].values.astype('datetime64[ms]').view(np.int64),
+                            df[['open', 'high', 'low', 'close', 'volume']].to_numpy())
+            self._recorded[key] = data
+        return self._recorded[key]
+
+    def fetch_ohlcv(self, symbol: str, timeframe: str = '1m', since: Optional[int] = None,
+                    limit: Optional[int] = None, params: Dict = {}) -> List[List]:
+        self._check_symbol(symbol)
+        tf_ms = timeframe_to_msecs(timeframe)
+        limit = limit or 500
+        now = ccxt.Exchange.milliseconds()
+        if since is None:
+            since = (now // tf_ms - limit + 1) * tf_ms
+        candle_type = (CandleType.FUTURES if self.trading_mode == TradingMode.FUTURES
+                       else CandleType.SPOT)
+        if params.get('price'):
+            candle_type = CandleType.from_string(params['price'])
+        recorded = self._recorded_ohlcv(symbol, timeframe, candle_type.value)
+        if recorded is not None:
+            dates, values = recorded
+            start = int(np.searchsorted(dates, since, side='left'))
+            end = min(start + limit, int(np.searchsorted(dates, now, side='right')))
+            return [[int(d), *v] for d, v in zip(dates[start:end], values[start:end].tolist())]
+
+        start = -(-since // tf_ms) * tf_ms
+        dates = np.arange(start, min(start + limit * tf_ms, now + 1), tf_ms, dtype=np.int64)
+        if len(dates) == 0:
+            return []
+        opens = self._mid_prices(symbol, dates)
+        closes = self._mid_prices(symbol, np.minimum(dates + tf_ms, now))
+        wick = 0.001 * (1 + np.abs(np.sin(dates / tf_ms)))
+        highs = np.maximum(opens, closes) * (1 + wick)
+        lows = np.minimum(opens, closes) * (1 - wick)
+        volumes = 1000 * (1.5 + np.sin(dates / tf_ms / 7)) * tf_ms / 60_000
+        values = np.column_stack((opens, highs, lows, closes, volumes)).tolist()
+        return [[date, *row] for date, row in zip(dates.tolist(), values)]
+
+    def fetch_ticker(self, symbol: str, params: Dict = {}) -> Dict[str, Any]:
+        self._check_symbol(symbol)
+        now = ccxt.Exchange.milliseconds()
+        mid, prev = self._mid_prices(symbol, np.array([now, now - 86_400_000]))
+        half_spread = mid * self.config['spread'] / 2
+        return {
+            'symbol': symbol,
+            'timestamp': now,
+            'datetime': _iso(now),
+            'high': max(mid, prev) * 1.01,
+            'low': min(mid, prev) * 0.99,
+            'bid': mid - half_spread,
+            'bidVolume': 10.0,
+            'ask': mid + half_spread,
+            'askVolume': 10.0,
+            'vwap': (mid + prev) / 2,
+            'open': prev,
+            'close': mid,
+            'last': mid,
+            'previousClose': prev,
+            'change': mid - prev,
+            'percentage': (mid - prev) / prev * 100,
+            'average': (mid + prev) / 2,
+            'baseVolume': 1_000_000 / mid,
+            'quoteVolume': 1_000_000.0,
+            'info': {},
+        }
+
+    def fetch_tickers(self, symbols: Optional[List[str]] = None,
+                      params: Dict = {}) -> Dict[str, Dict[str, Any]]:
+        return {symbol: self.fetch_ticker(symbol) for symbol in (symbols or self.markets)}
+
+    def fetch_bids_asks(self, symbols: Optional[List[str]] = None,
+                        params: Dict = {}) -> Dict[str, Dict[str, Any]]:
+        return self.fetch_tickers(symbols)
+
+    def fetch_l2_order_book(self, symbol: str, limit: Optional[int] = None,
+                            params: Dict = {}) -> Dict[str, Any]:
+        self._check_symbol(symbol)
+        now = ccxt.Exchange.milliseconds()
+        mid = self._mid_prices(symbol, np.array([now]))[0]
+        depth = np.arange(min(limit or self.config['order_book_depth'],
+                              self.config['order_book_depth']))
+        offsets = self.config['spread'] / 2 + depth * self.config['spread'] / 4
+        amounts = (1000 / mid) * (1 + depth / 10)
+        return {
+            'symbol': symbol,
+            'bids': np.column_stack((mid * (1 - offsets), amounts)).tolist(),
+            'asks': np.column_stack((mid * (1 + offsets), amounts)).tolist(),
+            'timestamp': now,
+            'datetime': _iso(now),
+            'nonce': None,
+        }
+
+    def fetch_trades(self, symbol: str, since: Optional[int] = None, limit: Optional[int] = None,
+                     params: Dict = {}) -> List[Dict[str, Any]]:
+        self._check_symbol(symbol)
+        now = ccxt.Exchange.milliseconds()
+        since = since if since is not None else now - 60_000
+        dates = np.arange(since, now, 1000, dtype=np.int64)[:limit or 1000]
+        prices = self._mid_prices(symbol, dates)
+        return [{
+            'id': str(ts), 'timestamp': int(ts), 'datetime': _iso(int(ts)), 'symbol': symbol,
+            'order': None, 'type': None, 'side': 'buy' if ts % 2000 else 'sell',
+            'takerOrMaker': None, 'price': price, 'amount': 1.0, 'cost': price,
+            'fee': None, 'info': {},
+        } for ts, price in zip(dates.tolist(), prices.tolist())]
+
+    def fetch_funding_rate_history(self, symbol: Optional[str] = None, since: Optional[int] = None,
+                                   limit: Optional[int] = None,
+                                   params: Dict = {}) -> List[Dict[str, Any]]:
+        self._check_symbol(symbol)
+        now = ccxt.Exchange.milliseconds()
+        limit = limit or 200
+        if since is None:
+            since = (now // _FUNDING_INTERVAL_MS - limit + 1) * _FUNDING_INTERVAL_MS
+        start = -(-since // _FUNDING_INTERVAL_MS) * _FUNDING_INTERVAL_MS
+        dates = range(start, min(start + limit * _FUNDING_INTERVAL_MS, now + 1),
+                      _FUNDING_INTERVAL_MS)
+        return [{'symbol': symbol, 'fundingRate': self.config['funding_rate'],
+                 'timestamp': ts, 'datetime': _iso(ts), 'info': {}} for ts in dates]
+
+    def fetch_funding_history(self, symbol: Optional[str] = None, since: Optional[int] = None,
+                              limit: Optional[int] = None,
+                              params: Dict = {}) -> List[Dict[str, Any]]:
+        return []
+
+    def fetch_market_leverage_tiers(self, symbol: str, params: Dict = {}) -> List[Dict[str, Any]]:
+        self._check_symbol(symbol)
+        return [{'tier': 1, 'currency': self.markets[symbol]['quote'], 'minNotional': 0,
+                 'maxNotional': 10_000_000, 'maintenanceMarginRate': 0.01, 'maxLeverage': 20,
+                 'info': {}}]
+
+    def fetch_leverage_tiers(self, symbols: Optional[List[str]] = None,
+                             params: Dict = {}) -> Dict[str, List[Dict[str, Any]]]:
+        return {symbol: self.fetch_market_leverage_tiers(symbol)
+                for symbol in (symbols or self.markets)}
+
+    # ---- Account ----
+
+    def fetch_balance(self, params: Dict = {}) -> Dict[str, Any]:
+        currencies = {m['quote'] for m in self.markets.values()}
+        balance: Dict[str, Any] = {'free': {}, 'used': {}, 'total': {}, 'info': {}}
+        for currency in currencies:
+            amount = float(self.config['balance'])
+            balance[currency] = {'free': amount, 'used': 0.0, 'total': amount}
+            balance['free'][currency] = amount
+            balance['used'][currency] = 0.0
+            balance['total'][currency] = amount
+        return balance
+
+    def fetch_trading_fees(self, params: Dict = {}) -> Dict[str, Dict[str, Any]]:
+        return {symbol: {'symbol': symbol, 'maker': self.config['fee'],
+                         'taker': self.config['fee'], 'info': {}} for symbol in self.markets}
+
+    def calculate_fee(self, symbol: str, type: str, side: str, amount: float, price: float,
+                      takerOrMaker: str = 'taker', params: Dict = {}) -> Dict[str, Any]:
+        self._check_symbol(symbol)
+        return {'type': takerOrMaker, 'currency': self.markets[symbol]['quote'],
+                'rate': self.config['fee'], 'cost': amount * price * self.config['fee']}
+
+    def fetch_positions(self, symbols: Optional[List[str]] = None,
+                        params: Dict = {}) -> List[Dict[str, Any]]:
+        return []
+
+    def set_leverage(self, leverage: float, symbol: Optional[str] = None,
+                     params: Dict = {}) -> Dict[str, Any]:
+        return {}
+
+    def set_margin_mode(self, marginMode: str, symbol: Optional[str] = None,
+                        params: Dict = {}) -> Dict[str, Any]:
+        return {}
+
+    # ---- Orders ----
+
+    def _check_symbol(self, symbol: Optional[str]) -> None:
+        if symbol is not None and symbol not in self.markets:
+            raise ccxt.BadSymbol(f'{self.name} simulator does not have market symbol {symbol}')
+
+    def _fill(self, order: Dict[str, Any], price: float) -> None:
+        order.update({
+            'status': 'closed', 'filled': order['amount'], 'remaining': 0.0,
+            'average': price, 'cost': order['amount'] * price,
+            'lastTradeTimestamp': ccxt.Exchange.milliseconds(),
+            'fee': {'currency': self.markets[order['symbol']]['quote'],
+                    'cost': order['amount'] * price * self.config['fee'],
+                    'rate': self.config['fee']},
+        })
+
+    def _update_order(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fill open limit orders once the current price crosses the order price.
+        """
+        if order['status'] == 'open' and order['price'] and not order['stopPrice']:
+            ticker = self.fetch_ticker(order['symbol'])
+            if ((order['side'] == 'buy' and ticker['ask'] <= order['price'])
+                    or (order['side'] == 'sell' and ticker['bid'] >= order['price'])):
+                self._fill(order, order['price'])
+        return order
+
+    def create_order(self, symbol: str, type: str, side: str, amount: float,
+                     price: Optional[float] = None, params: Dict = {}) -> Dict[str, Any]:
+        self._check_symbol(symbol)
+        if amount <= 0:
+            raise ccxt.InvalidOrder(f'{self.name} simulator: invalid amount {amount}.')
+        if type == 'limit' and not price:
+            raise ccxt.InvalidOrder(f'{self.name} simulator: limit orders require a price.')
+        now = ccxt.Exchange.milliseconds()
+        stop_price = params.get('stopPrice') or params.get('triggerPrice')
+        order = {
+            'id': uuid.uuid4().hex,
+            'clientOrderId': None,
+            'timestamp': now,
+            'datetime': _iso(now),
+            'lastTradeTimestamp': None,
+            'symbol': symbol,
+            'type': type,
+            'side': side,
+            'price': price,
+            'stopPrice': stop_price,
+            'amount': amount,
+            'filled': 0.0,
+            'remaining': amount,
+            'average': None,
+            'cost': 0.0,
+            'status': 'open',
+            'fee': None,
+            'trades': [],
+            'reduceOnly': params.get('reduceOnly', False),
+            'postOnly': False,
+            'timeInForce': params.get('timeInForce', 'GTC'),
+            'info': {},
+        }
+        if type == 'market' and not stop_price:
+            ticker = self.fetch_ticker(symbol)
+            self._fill(order, ticker['ask'] if side == 'buy' else ticker['bid'])
+        with self._lock:
+            self.orders[order['id']] = order
+        return dict(self._update_order(order))
+
+    def fetch_order(self, id: str, symbol: Optional[str] = None,
+                    params: Dict = {}) -> Dict[str, Any]:
+        if id not in self.orders:
+            raise ccxt.OrderNotFound(f'{self.name} simulator: order {id} not found.')
+        return dict(self._update_order(self.orders[id]))
+
+    def cancel_order(self, id: str, symbol: Optional[str] = None,
+                     params: Dict = {}) -> Dict[str, Any]:
+        order = self.fetch_order(id, symbol)
+        if order['status'] != 'open':
+            raise ccxt.OrderNotFound(f'{self.name} simulator: order {id} is not open.')
+        self.orders[id]['status'] = 'canceled'
+        return dict(self.orders[id])
+
+    def _filter_orders(self, symbol: Optional[str], since: Optional[int],
+                       status: Optional[Callable[[str], bool]] = None) -> List[Dict[str, Any]]:
+        return [dict(self._update_order(order)) for order in list(self.orders.values())
+                if (symbol is None or order['symbol'] == symbol)
+                and (since is None or order['timestamp'] >= since)
+                and (status is None or status(order['status']))]
+
+    def fetch_orders(self, symbol: Optional[str] = None, since: Optional[int] = None,
+                     limit: Optional[int] = None, params: Dict = {}) -> List[Dict[str, Any]]:
+        return self._filter_orders(symbol, since)[-limit if limit else None:]
+
+    def fetch_open_orders(self, symbol: Optional[str] = None, since: Optional[int] = None,
+                          limit: Optional[int] = None,
+                          params: Dict = {}) -> List[Dict[str, Any]]:
+        return self._filter_orders(symbol, since, lambda s: s == 'open')[-limit if limit else None:]
+
+    def fetch_closed_orders(self, symbol: Optional[str] = None, since: Optional[int] = None,
+                            limit: Optional[int] = None,
+                            params: Dict = {}) -> List[Dict[str, Any]]:
+        return self._filter_orders(symbol, since, lambda s: s != 'open')[-limit if limit else None:]
+
+    def fetch_canceled_orders(self, symbol: Optional[str] = None, since: Optional[int] = None,
+                              limit: Optional[int] = None,
+                              params: Dict = {}) -> List[Dict[str, Any]]:
+        return self._filter_orders(symbol, since,
+                                   lambda s: s == 'canceled')[-limit if limit else None:]
+
+    def fetch_my_trades(self, symbol: Optional[str] = None, since: Optional[int] = None,
+                        limit: Optional[int] = None, params: Dict = {}) -> List[Dict[str, Any]]:
+        trades = [{
+            'id': order['id'], 'order': order['id'], 'symbol': order['symbol'],
+            'timestamp': order['lastTradeTimestamp'],
+            'datetime': _iso(order['lastTradeTimestamp']),
+            'type': order['type'], 'side': order['side'], 'takerOrMaker': 'taker',
+            'price': order['average'], 'amount': order['filled'], 'cost': order['cost'],
+            'fee': order['fee'], 'info': {},
+        } for order in self._filter_orders(symbol, None, lambda s: s == 'closed')
+            if since is None or order['lastTradeTimestamp'] >= since]
+        return trades[-limit if limit else None:]
+
+
+_ENDPOINTS = [
+    'load_markets', 'fetch_ohlcv', 'fetch_ticker', 'fetch_tickers', 'fetch_bids_asks',
+    'fetch_l2_order_book', 'fetch_trades', 'fetch_funding_rate_history', 'fetch_funding_history',
+    'fetch_market_leverage_tiers', 'fetch_leverage_tiers', 'fetch_balance', 'fetch_trading_fees',
+    'calculate_fee', 'fetch_positions', 'set_leverage', 'set_margin_mode', 'create_order',
+    'fetch_order', 'cancel_order', 'fetch_orders', 'fetch_open_orders', 'fetch_closed_orders',
+    'fetch_canceled_orders', 'fetch_my_trades',
+]
+
+_HAS = {
+    'CORS': None, 'spot': True, 'margin': False, 'swap': True, 'future': False, 'option': False,
+    'cancelOrder': True, 'createOrder': True, 'createMarketOrder': True,
+    'createLimitOrder': True, 'createStopOrder': False, 'fetchBalance': True,
+    'fetchBidsAsks': True, 'fetchCanceledOrders': True, 'fetchClosedOrders': True,
+    'fetchFundingHistory': True, 'fetchFundingRateHistory': True, 'fetchL2OrderBook': True,
+    'fetchLeverageTiers': True, 'fetchMarketLeverageTiers': True, 'fetchMarkets': True,
+    'fetchMyTrades': True, 'fetchOHLCV': True, 'fetchOpenOrders': True, 'fetchOrder': True,
+    'fetchOrderBook': True, 'fetchOrders': True, 'fetchPositions': True, 'fetchTicker': True,
+    'fetchTickers': True, 'fetchTrades': True, 'fetchTradingFees': True, 'setLeverage': True,
+    'setMarginMode': True,
+}
+
+
+class ExchangeSimulator:
+    """
+    Synchronous ccxt-like api of a SimulatorBackend.
+    Every request blocks for the configured latency.
+    """
+
+    def __init__(self, backend: SimulatorBackend) -> None:
+        self.backend = backend
+        self.id = backend.name.lower()
+        self.name = backend.name
+        self.has = dict(_HAS)
+        self.timeframes = {tf: tf for tf in SIMULATOR_TIMEFRAMES}
+        self.precisionMode = ccxt.TICK_SIZE
+        self.rateLimit = backend.config['rate_limit']
+        self.options: Dict[str, Any] = {}
+        self.session = None
+
+    @property
+    def markets(self) -> Dict[str, Dict[str, Any]]:
+        return self.backend.markets
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in _ENDPOINTS:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        handler = getattr(self.backend, name)
+
+        def request(*args, **kwargs):
+            latency, error = self.backend.before_request(name)
+            if latency:
+                time.sleep(latency)
+            if error:
+                raise error
+            return handler(*args, **kwargs)
+        return request
+
+
+class AsyncExchangeSimulator(ExchangeSimulator):
+    """
+    Asynchronous ccxt-like api of a SimulatorBackend.
+    Latency is simulated with asyncio.sleep, so concurrent requests overlap.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in _ENDPOINTS:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        handler = getattr(self.backend, name)
+
+        async def request(*args, **kwargs):
+            latency, error = self.backend.before_request(name)
+            if latency:
+                await asyncio.sleep(latency)
+            if error:
+                raise error
+            return handler(*args, **kwargs)
+        return request
+
+    async def close(self) -> None:
+        pass
+
+
+def create_simulator_api(backend: SimulatorBackend, asynchronous: bool = False
+                         ) -> ExchangeSimulator:
+    """
+    Create a ccxt-like api object for the simulated exchange.
+    """
+    logger.info(f'Using simulated exchange "{backend.name}" ({"async" if asynchronous else "sync"})'
+                f' with {len(backend.markets)} markets.')
+    return AsyncExchangeSimulator(backend) if asynchronous else ExchangeSimulator(backend)
@@ -0,0 +1,120 @@
+"""
+Incrementally updated candle storage for Exchange._klines.
+"""
+from typing import Optional
+
+import numpy as np
+from pandas import DataFrame, concat, to_datetime
+
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+from freqtrade.data.converter import clean_ohlcv_dataframe, ohlcv_fill_up_missing_data
+
+
+_VALUE_COLUMNS = DEFAULT_DATAFRAME_COLUMNS[1:]
+
+
+class KlineBuffer:
+    """
+    Candles of one pair / timeframe / candle type, kept as numpy arrays.
+
+    New candles are merged in place: only candles overlapping (or following) the new candles
+    are re-aggregated, instead of concatenating and cleaning the whole dataframe on every
+    refresh. The result is identical to
+    clean_ohlcv_dataframe(concat([old, new]), fill_missing=True).tail(max_rows).
+    Dataframes are built on demand and cached until the next update.
+    """
+
+    __slots__ = ('_dates', '_values', '_start', '_end', '_df')
+
+    def __init__(self, df: DataFrame) -> None:
+        """
+        :param df: Cleaned candle dataframe (as returned by ohlcv_to_dataframe)
+        """
+        self._dates: np.ndarray = np.empty(0, dtype=np.int64)
+        self._values: np.ndarray = np.empty((0, len(_VALUE_COLUMNS)), dtype=np.float64)
+        self._start = 0
+        self._end = 0
+        self._append(df)
+        self._df: Optional[DataFrame] = df
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def _append(self, df: DataFrame) -> None:
+        """
+        Append candles after the current end of the buffer.
+        Live rows are moved to the front (or the arrays grown) once the arrays are full.
+        """
+        rows = len(df)
+        if self._end + rows > len(self._dates):
+            live = len(self)
+            size = max(len(self._dates), 2 * (live + rows))
+            dates = np.empty(size, dtype=np.int64)
+            values = np.empty((size, len(_VALUE_COLUMNS)), dtype=np.float64)
+            dates[:live] = self._dates[self._start:self._end]
+            values[:live] = self._values[self._start:self._end]
+            self._dates, self._values = dates, values
+            self._start, self._end = 0, live
+        self._dates[self._end:self._end + rows] = (
+            df['date'].values.astype('datetime64[ns]').view(np.int64))
+        self._values[self._end:self._end + rows] = df[_VALUE_COLUMNS].to_numpy(dtype=np.float64)
+        self._end += rows
+
+    def _frame(self, start: int, end: int) -> DataFrame:
+        """
+        Build a dataframe of the (absolute) rows start to end.
+        """
+        values = self._values[start:end]
+        data = {'date': to_datetime(self._dates[start:end], unit='ns', utc=True)}
+        data.update({col: values[:, idx].copy() for idx, col in enumerate(_VALUE_COLUMNS)})
+        return DataFrame(data)
+
+    def to_dataframe(self) -> DataFrame:
+        """
+        Candles as dataframe. The same object is returned until the buffer changes.
+        """
+        if self._df is None:
+            self._df = self._frame(self._start, self._end)
+        return self._df
+
+    def merge(self, new: DataFrame, timeframe: str, pair: str, max_rows: int) -> None:
+        """
+        Merge new candles into the buffer and age out old candles.
+        :param new: Cleaned candle dataframe (as returned by ohlcv_to_dataframe)
+        :param timeframe: Timeframe of the candles
+        :param pair: Pair - used for logging
+        :param max_rows: Number of candles to keep
+        """
+        if not new.empty:
+            new_start = new['date'].values[:1].astype('datetime64[ns]').view(np.int64)[0]
+            live_dates = self._dates[self._start:self._end]
+            if len(live_dates) == 0 or new_start < live_dates[0]:
+                # New candles start before the buffer - clean everything.
+                merged = clean_ohlcv_dataframe(
+                    concat([self.to_dataframe(), new], axis=0), timeframe, pair,
+                    fill_missing=True, drop_incomplete=False)
+                self._start = self._end = 0
+                self._append(merged)
+            else:
+                split = self._start + int(np.searchsorted(live_dates, new_start, side='left'))
+                # Only candles at or after the first new candle can be affected.
+                region = clean_ohlcv_dataframe(
+                    concat([self._frame(split, self._end), new], axis=0), timeframe, pair,
+                    fill_missing=False, drop_incomplete=False)
+                if split > self._start:
+                    # Include the last untouched candle, so gaps before the region are filled.
+                    region = ohlcv_fill_up_missing_data(
+                        concat([self._frame(split - 1, split), region], axis=0,
+                               ignore_index=True),
+                        timeframe, pair).iloc[1:]
+                else:
+                    region = ohlcv_fill_up_missing_data(region, timeframe, pair)
+                self._end = split
+                self._append(region)
+
+        # Age out old candles
+        if len(self) > max_rows:
+            self._start = self._end - max_rows
+        elif new.empty:
+            return
+        self._df = None
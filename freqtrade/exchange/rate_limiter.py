@@ -0,0 +1,59 @@
+"""
+Asyncio token bucket - limits requests across concurrently running coroutines.
+"""
+import asyncio
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter.
+    Tokens refill continuously at `rate` tokens per second, up to `capacity` tokens.
+    Every request takes one token - waiting coroutines are served in FIFO order.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        :param rate: Tokens added per second
+        :param capacity: Maximum number of tokens (burst size)
+        :param clock: Monotonic clock in seconds - replaceable for tests
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._last = clock()
+        self._lock = asyncio.Lock()
+        # Statistics
+        self.acquired = 0
+        self.waited = 0.0
+
+    @classmethod
+    def from_rate_limit(cls, rate_limit_ms: float, capacity: float = 1.0) -> 'TokenBucket':
+        """
+        Create a bucket honouring ccxt's `rateLimit` (milliseconds between two requests).
+        """
+        return cls(rate=1000 / max(rate_limit_ms, 1), capacity=capacity)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Wait until `tokens` tokens are available and take them.
+        """
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                delay = (tokens - self._tokens) / self.rate
+                self.waited += delay
+                await asyncio.sleep(delay)
+                self._refill()
+            self._tokens -= tokens
+            self.acquired += 1
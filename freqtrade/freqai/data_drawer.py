@@ -19,6 +19,7 @@ from pandas import DataFrame
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import Config
 from freqtrade.data.history import load_pair_history
+from freqtrade.data.history.history_utils import _load_pairs
 from freqtrade.enums import CandleType
 from freqtrade.exceptions import OperationalException
 from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
@@ -654,19 +655,24 @@ class FreqaiDataDrawer:
                           for training according to user defined train_period_days
         """
         history_data = self.historic_data
-
         for pair in dk.all_pairs:
             if pair not in history_data:
                 history_data[pair] = {}
-            for tf in self.freqai_info["feature_parameters"].get("include_timeframes"):
-                history_data[pair][tf] = load_pair_history(
-                    datadir=self.config["datadir"],
-                    timeframe=tf,
-                    pair=pair,
-                    timerange=timerange,
-                    data_format=self.config.get("dataformat_ohlcv", "feather"),
-                    candle_type=self.config.get("candle_type_def", CandleType.SPOT),
-                )
+        jobs = [(pair, tf) for pair in dk.all_pairs
+                for tf in self.freqai_info["feature_parameters"].get("include_timeframes")]
+
+        def _load(job: Tuple[str, str]) -> DataFrame:
+            return load_pair_history(
+                datadir=self.config["datadir"],
+                timeframe=job[1],
+                pair=job[0],
+                timerange=timerange,
+                data_format=self.config.get("dataformat_ohlcv", "feather"),
+                candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+            )
+
+        for (pair, tf), hist in _load_pairs(_load, jobs, self.config.get("dataload_workers", 1)):
+            history_data[pair][tf] = hist
 
     def get_base_and_corr_dataframes(
         self, timerange: TimeRange, pair: str, dk: FreqaiDataKitchen
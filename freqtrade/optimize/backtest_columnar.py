@@ -0,0 +1,211 @@
+"""
+Columnar candle storage for the backtesting engine.
+"""
+from datetime import datetime
+from math import nan
+from typing import Any, List, Tuple
+
+import numpy as np
+from pandas import DataFrame, Timestamp, to_datetime
+
+
+BACKTEST_ENGINES = ['lists', 'columnar']
+
+# Column order must match backtesting.HEADERS[1:9] (open ... exit_short)
+PRICE_SIGNAL_COLUMNS = ['open', 'high', 'low', 'close',
+                        'enter_long', 'exit_long', 'enter_short', 'exit_short']
+# Column order must match backtesting.HEADERS[9:] (enter_tag, exit_tag)
+TAG_COLUMNS = ['enter_tag', 'exit_tag']
+# Rows built at once when accessing a row outside of the current block
+ROW_BLOCK_SIZE = 512
+
+
+class ColumnarPairData:
+    """
+    Backtest data for one pair, kept as contiguous typed numpy arrays.
+
+    Behaves like the list of row-lists created by ``Backtesting._get_ohlcv_as_lists()``
+    (indexing, negative indexing, ``len()``, IndexError past the end) - but rows are
+    only materialized when accessed, so memory usage is bound by the size of the arrays
+    instead of one boxed python object per cell.
+    The backtest loop skips candles without entry signal of pairs without open trade using
+    the arrays only (see get_entry_signals()) - rows are built for the remaining candles.
+    Rows accessed in order (e.g. while a trade is open) are built in blocks of
+    ROW_BLOCK_SIZE rows with vectorized conversions, other rows one at a time.
+    Only the current block is kept.
+    """
+
+    __slots__ = ('dates', 'values', 'tags', '_block_start', '_block')
+
+    def __init__(self, df: DataFrame) -> None:
+        # Candle open dates as int64 nanoseconds since epoch (UTC)
+        self.dates: np.ndarray = df['date'].values.astype('datetime64[ns]').view('int64')
+        # Prices and signals - float64, shape (n, 8)
+        self.values: np.ndarray = np.ascontiguousarray(
+            df[PRICE_SIGNAL_COLUMNS].to_numpy(dtype=np.float64))
+        # Entry / exit tags - object, shape (n, 2)
+        self.tags: np.ndarray = df[TAG_COLUMNS].to_numpy(dtype=object)
+        self._block_start = 0
+        self._block: List[List[Any]] = []
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, idx: int) -> List[Any]:
+        """
+        Get the row at position idx, in the same layout as HEADERS.
+        Raises IndexError if idx is out of bounds.
+        """
+        if idx < 0:
+            idx += len(self.dates)
+        offset = idx - self._block_start
+        if 0 <= offset < len(self._block):
+            return self._block[offset]
+        if not 0 <= idx < len(self.dates):
+            raise IndexError('ColumnarPairData index out of range')
+        # Continuing after the current block - build the next block, otherwise a single row.
+        self._build_block(idx, ROW_BLOCK_SIZE if offset == len(self._block) else 1)
+        return self._block[0]
+
+    def _build_block(self, start: int, size: int) -> None:
+        end = min(start + size, len(self.dates))
+        dates = to_datetime(self.dates[start:end], unit='ns', utc=True)
+        self._block = [[date, *values, *tags] for date, values, tags in zip(
+            dates, self.values[start:end].tolist(), self.tags[start:end].tolist())]
+        self._block_start = start
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory used by the arrays (tag objects themselves are shared and not counted).
+        """
+        return self.dates.nbytes + self.values.nbytes + self.tags.nbytes
+
+
+class DetailPairData:
+    """
+    Detail timeframe candles of one pair, kept as typed numpy arrays.
+    Holds start / end offsets into the detail candles for every backtest candle, so the
+    detail window of a candle is a plain slice instead of a dataframe filter.
+    """
+
+    __slots__ = ('dates', 'ohlc', 'starts', 'ends')
+
+    def __init__(self, df: DataFrame) -> None:
+        self.dates: np.ndarray = df['date'].values.astype('datetime64[ns]').view('int64')
+        self.ohlc: np.ndarray = np.ascontiguousarray(
+            df[['open', 'high', 'low', 'close']].to_numpy(dtype=np.float64))
+        self.starts: np.ndarray = np.empty(0, dtype=np.int64)
+        self.ends: np.ndarray = np.empty(0, dtype=np.int64)
+
+    def build_offsets(self, candle_dates: np.ndarray, timeframe_ns: int) -> None:
+        """
+        Calculate the detail window for each backtest candle.
+        :param candle_dates: Open dates of the backtest candles (int64 ns)
+        :param timeframe_ns: Length of one backtest candle (int64 ns)
+        """
+        self.starts = np.searchsorted(self.dates, candle_dates, side='left')
+        self.ends = np.searchsorted(self.dates, candle_dates + timeframe_ns, side='left')
+
+    def get_rows(self, candle_idx: int, signals: List[Any]) -> List[List[Any]]:
+        """
+        Build detail rows (HEADERS layout) for the backtest candle at position candle_idx.
+        :param signals: Signal and tag values of the backtest candle (HEADERS[5:])
+        """
+        start = self.starts[candle_idx]
+        end = self.ends[candle_idx]
+        return [[Timestamp(date, tz='UTC'), *ohlc, *signals]
+                for date, ohlc in zip(self.dates[start:end].tolist(),
+                                      self.ohlc[start:end].tolist())]
+
+
+def get_row_dates(pair_data) -> np.ndarray:
+    """
+    Candle open dates (int64 ns) of a ColumnarPairData or list of rows.
+    """
+    if isinstance(pair_data, ColumnarPairData):
+        return pair_data.dates
+    return np.array([row[0].value for row in pair_data], dtype=np.int64)
+
+
+def get_entry_signals(pair_data, can_short: bool) -> np.ndarray:
+    """
+    Boolean mask of the rows with an entry signal (long, or short if can_short) - a superset
+    of the rows where Backtesting.check_for_trade_entry() returns a direction.
+    :param pair_data: ColumnarPairData or list of rows (HEADERS layout)
+    """
+    if isinstance(pair_data, ColumnarPairData):
+        entries = pair_data.values[:, 4] == 1
+        if can_short:
+            entries |= pair_data.values[:, 6] == 1
+        return entries
+    return np.array([row[5] == 1 or (can_short and row[7] == 1) for row in pair_data],
+                    dtype=bool)
+
+
+def get_candle_steps(pair_data, first_candle_ns: int, timeframe_ns: int,
+                     can_short: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate at which step of the backtest loop every row of a pair is processed.
+    The backtest loop processes at most one row per pair per step - and only rows with
+    a date at or before the current step - so row i is processed at
+    max(ceil((date_i - first_candle) / timeframe), step_(i-1) + 1).
+    :param pair_data: ColumnarPairData or list of rows (HEADERS layout)
+    :param first_candle_ns: Date of the first backtest step (int64 ns)
+    :param timeframe_ns: Length of one step (int64 ns)
+    :param can_short: Whether short entry signals are considered
+    :return: Tuple of (step per row, boolean mask of rows with an entry signal)
+    """
+    dates = get_row_dates(pair_data)
+    entries = get_entry_signals(pair_data, can_short)
+    if len(dates) == 0:
+        return np.empty(0, dtype=np.int64), entries
+    # Ceil division, rows before the first step count as step 0.
+    raw_steps = np.maximum(-((first_candle_ns - dates) // timeframe_ns), 0)
+    positions = np.arange(len(dates), dtype=np.int64)
+    steps = positions + np.maximum.accumulate(raw_steps - positions)
+    return steps, entries
+
+
+class FundingFeeIndex:
+    """
+    Cumulative funding index for one pair, built from the combined funding / mark rate
+    dataframe (see Exchange.combine_funding_and_mark()).
+    Funding fees over any [open_date, close_date] window are a difference of two prefix sums
+    instead of a filter and sum over the whole dataframe.
+    """
+
+    __slots__ = ('dates', 'cum_funding', 'cum_nan')
+
+    def __init__(self, df: DataFrame) -> None:
+        if not df.empty:
+            df = df.sort_values('date', kind='stable')
+        self.dates: np.ndarray = df['date'].values.astype('datetime64[ns]').view('int64')
+        funding = (df['open_fund'] * df['open_mark']).to_numpy(dtype=np.float64)
+        nans = np.isnan(funding)
+        # Leading 0 so window sums are cum[end] - cum[start]
+        self.cum_funding: np.ndarray = np.concatenate(
+            ([0.0], np.cumsum(np.where(nans, 0.0, funding))))
+        # Missing rates make the fee NaN - same as summing the dataframe directly.
+        self.cum_nan: np.ndarray = np.concatenate(([0], np.cumsum(nans)))
+
+    def calculate_funding_fees(self, amount: float, is_short: bool,
+                               open_date: datetime, close_date: datetime) -> float:
+        """
+        Equivalent of Exchange.calculate_funding_fees() for this pair.
+        :param amount: The quantity of the trade
+        :param is_short: trade direction
+        :param open_date: The date and time that the trade started
+        :param close_date: The date and time that the trade ended
+        """
+        start = np.searchsorted(self.dates, Timestamp(open_date).value, side='left')
+        end = np.searchsorted(self.dates, Timestamp(close_date).value, side='right')
+        if end <= start:
+            fees = 0.0
+        elif self.cum_nan[end] != self.cum_nan[start]:
+            fees = nan
+        else:
+            fees = float(self.cum_funding[end] - self.cum_funding[start]) * amount
+
+        # Negate fees for longs as funding_fees expects it this way based on live endpoints.
+        return fees if is_short else -fees
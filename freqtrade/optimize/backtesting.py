@@ -7,10 +7,11 @@ import logging
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
+import numpy as np
 from numpy import nan
-from pandas import DataFrame
+from pandas import DataFrame, Timestamp
 
 from freqtrade import constants
 from freqtrade.configuration import TimeRange, validate_config_consistency
@@ -27,6 +28,10 @@ from freqtrade.exchange import (amount_to_contract_precision, price_to_precision
 from freqtrade.exchange.exchange import Exchange
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.backtest_columnar import (BACKTEST_ENGINES, ColumnarPairData,
+                                                  DetailPairData, FundingFeeIndex,
+                                                  get_candle_steps, get_entry_signals,
+                                                  get_row_dates)
 from freqtrade.optimize.bt_progress import BTProgress
 from freqtrade.optimize.optimize_reports import (generate_backtest_stats, generate_rejected_signals,
                                                  generate_trade_signal_candles,
@@ -160,6 +165,11 @@ class Backtesting:
         self._can_short = self.trading_mode != TradingMode.SPOT
         self._position_stacking: bool = self.config.get('position_stacking', False)
         self.enable_protections: bool = self.config.get('enable_protections', False)
+        self.backtest_engine: str = self.config.get('backtest_engine', 'lists')
+        if self.backtest_engine not in BACKTEST_ENGINES:
+            raise OperationalException(
+                f"Invalid backtest engine {self.backtest_engine}, "
+                f"choose one of {', '.join(BACKTEST_ENGINES)}.")
         migrate_data(config, self.exchange)
 
         self.init_backtest()
@@ -192,8 +202,9 @@ class Backtesting:
 
         else:
             self.timeframe_detail_min = 0
-        self.detail_data: Dict[str, DataFrame] = {}
+        self.detail_data: Dict[str, DetailPairData] = {}
         self.futures_data: Dict[str, DataFrame] = {}
+        self.funding_fee_index: Dict[str, FundingFeeIndex] = {}
 
     def init_backtest(self):
 
@@ -244,7 +255,8 @@ class Backtesting:
             startup_candles=self.required_startup,
             fail_without_data=True,
             data_format=self.config['dataformat_ohlcv'],
-            candle_type=self.config.get('candle_type_def', CandleType.SPOT)
+            candle_type=self.config.get('candle_type_def', CandleType.SPOT),
+            workers=self.config.get('dataload_workers', 1),
         )
 
         min_date, max_date = history.get_timerange(data)
@@ -265,7 +277,7 @@ class Backtesting:
         Loads backtest detail data (smaller timeframe) if necessary.
         """
         if self.timeframe_detail:
-            self.detail_data = history.load_data(
+            detail_data = history.load_data(
                 datadir=self.config['datadir'],
                 pairs=self.pairlists.whitelist,
                 timeframe=self.timeframe_detail,
@@ -273,8 +285,13 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config['dataformat_ohlcv'],
-                candle_type=self.config.get('candle_type_def', CandleType.SPOT)
+                candle_type=self.config.get('candle_type_def', CandleType.SPOT),
+                workers=self.config.get('dataload_workers', 1),
             )
+            # Keep detail candles as arrays - windows per candle are sliced from these.
+            self.detail_data = {
+                pair: DetailPairData(df) for pair, df in detail_data.items() if not df.empty
+            }
         else:
             self.detail_data = {}
         if self.trading_mode == TradingMode.FUTURES:
@@ -291,7 +308,8 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config['dataformat_ohlcv'],
-                candle_type=CandleType.FUNDING_RATE
+                candle_type=CandleType.FUNDING_RATE,
+                workers=self.config.get('dataload_workers', 1),
             )
 
             # For simplicity, assign to CandleType.Mark (might contian index candles!)
@@ -303,7 +321,8 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config['dataformat_ohlcv'],
-                candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price"))
+                candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price")),
+                workers=self.config.get('dataload_workers', 1),
             )
             # Combine data to avoid combining the data per trade.
             unavailable_pairs = []
@@ -322,8 +341,15 @@ class Backtesting:
                 raise OperationalException(
                     f"Pairs {', '.join(unavailable_pairs)} got no leverage tiers available. "
                     "It is therefore impossible to backtest with this pair at the moment.")
+
+            # Exchanges with custom funding fee calculations can't use the precomputed index.
+            if type(self.exchange).calculate_funding_fees is Exchange.calculate_funding_fees:
+                self.funding_fee_index = {
+                    pair: FundingFeeIndex(df) for pair, df in self.futures_data.items()
+                }
         else:
             self.futures_data = {}
+            self.funding_fee_index = {}
 
     def disable_database_use(self):
         disable_database_use(self.timeframe)
@@ -341,6 +367,7 @@ class Backtesting:
         self.canceled_trade_entries = 0
         self.canceled_entry_orders = 0
         self.replaced_entry_orders = 0
+        self.skipped_candles = 0
         self.dataprovider.clear_cache()
         if enable_protections:
             self._load_protections(self.strategy)
@@ -354,17 +381,16 @@ class Backtesting:
             self.abort = False
             raise DependencyException("Stop requested")
 
-    def _get_ohlcv_as_lists(self, processed: Dict[str, DataFrame]) -> Dict[str, Tuple]:
+    def _get_analyzed_dataframes(
+            self, processed: Dict[str, DataFrame]) -> Iterator[Tuple[str, DataFrame]]:
         """
-        Helper function to convert a processed dataframes into lists for performance reasons.
-
-        Used by backtest() - so keep this optimized for performance.
+        Populate entry/exit signals for each pair, trim the startup period and shift
+        signals by one candle.
+        Yields (pair, dataframe) tuples.
 
         :param processed: a processed dictionary with format {pair, data}, which gets cleared to
         optimize memory usage!
         """
-
-        data: Dict = {}
         self.progress.init_step(BacktestState.CONVERT, len(processed))
 
         # Create dict with data
@@ -400,12 +426,45 @@ class Backtesting:
                     df_analyzed[col] = 0 if not tag_col else None
 
             df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
+            yield pair, df_analyzed
+
+    def _get_ohlcv_as_lists(self, processed: Dict[str, DataFrame]) -> Dict[str, Tuple]:
+        """
+        Helper function to convert a processed dataframes into lists for performance reasons.
+
+        Used by backtest() - so keep this optimized for performance.
 
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        """
+        data: Dict = {}
+        for pair, df_analyzed in self._get_analyzed_dataframes(processed):
             # Convert from Pandas to list for performance reasons
             # (Looping Pandas is slow.)
             data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
         return data
 
+    def _get_ohlcv_as_columns(self, processed: Dict[str, DataFrame]) -> Dict:
+        """
+        Columnar counterpart of _get_ohlcv_as_lists().
+        Keeps prices and signals as typed numpy arrays, rows are built when accessed.
+
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        """
+        data: Dict = {}
+        for pair, df_analyzed in self._get_analyzed_dataframes(processed):
+            data[pair] = ColumnarPairData(df_analyzed) if not df_analyzed.empty else []
+        return data
+
+    def _get_backtest_data(self, processed: Dict[str, DataFrame]) -> Dict:
+        """
+        Convert processed dataframes into the format used by the configured backtest engine.
+        """
+        if self.backtest_engine == 'columnar':
+            return self._get_ohlcv_as_columns(processed)
+        return self._get_ohlcv_as_lists(processed)
+
     def _get_close_rate(self, row: Tuple, trade: LocalTrade, exit: ExitCheckTuple,
                         trade_dur: int) -> float:
         """
@@ -751,15 +810,22 @@ class Backtesting:
                 or (current_time.timestamp() % self.funding_fee_timeframe_secs) == 0
             ):
                 # Funding fee interval.
-                trade.set_funding_fees(
-                    self.exchange.calculate_funding_fees(
+                if trade.pair in self.funding_fee_index:
+                    funding_fees = self.funding_fee_index[trade.pair].calculate_funding_fees(
+                        amount=trade.amount,
+                        is_short=trade.is_short,
+                        open_date=trade.date_last_filled_utc,
+                        close_date=current_time
+                    )
+                else:
+                    funding_fees = self.exchange.calculate_funding_fees(
                         self.futures_data[trade.pair],
                         amount=trade.amount,
                         is_short=trade.is_short,
                         open_date=trade.date_last_filled_utc,
                         close_date=current_time
                     )
-                )
+                trade.set_funding_fees(funding_fees)
 
     def get_valid_price_and_stake(
         self, pair: str, row: Tuple, propose_rate: float, stake_amount: float,
@@ -1182,31 +1248,84 @@ class Backtesting:
                 self.run_protections(pair, current_time, trade.trade_direction)
         return open_trade_count_start
 
-    def backtest(self, processed: Dict,
-                 start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+    def backtest_pair_row(self, row: Tuple, pair: str, row_index: int, current_time: datetime,
+                          end_date: datetime, open_trade_count_start: int) -> int:
         """
-        Implement backtesting functionality
-
         NOTE: This method is used by Hyperopt at each iteration. Please keep it optimized.
-        Of course try to not have ugly code. By some accessor are sometime slower than functions.
-        Avoid extensive logging in this method and functions it calls.
 
-        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
-        optimize memory usage!
-        :param start_date: backtesting timerange start datetime
-        :param end_date: backtesting timerange end datetime
-        :return: DataFrame with trades (results of backtesting)
+        Process one candle of one pair, spreading out into the detail timeframe if necessary.
+        :param row_index: Number of rows processed for this pair, including this one.
+        :return: Updated open trade count
         """
-        self.prepare_backtest(self.enable_protections)
-        # Ensure wallets are uptodate (important for --strategy-list)
-        self.wallets.update()
-        # Use dict of lists with data for performance
-        # (looping lists is a lot faster than pandas DataFrames)
-        data: Dict = self._get_ohlcv_as_lists(processed)
+        self.dataprovider._set_dataframe_max_index(self.required_startup + row_index)
+        self.dataprovider._set_dataframe_max_date(current_time)
+        trade_dir: Optional[LongShort] = self.check_for_trade_entry(row)
 
+        if (
+            (trade_dir is not None or len(LocalTrade.bt_trades_open_pp[pair]) > 0)
+            and self.timeframe_detail and pair in self.detail_data
+        ):
+            # Spread out into detail timeframe.
+            # Should only happen when we are either in a trade for this pair
+            # or when we got the signal for a new trade.
+            # Detail rows carry the signals of the main candle.
+            detail_rows = self.detail_data[pair].get_rows(row_index - 1, row[LONG_IDX:])
+            if len(detail_rows) == 0:
+                # Fall back to "regular" data if no detail data was found for this candle
+                return self.backtest_loop(
+                    row, pair, current_time, end_date,
+                    open_trade_count_start, trade_dir)
+            is_first = True
+            current_time_det = current_time
+            for det_row in detail_rows:
+                self.dataprovider._set_dataframe_max_date(current_time_det)
+                open_trade_count_start = self.backtest_loop(
+                    det_row, pair, current_time_det, end_date,
+                    open_trade_count_start, trade_dir, is_first)
+                current_time_det += timedelta(minutes=self.timeframe_detail_min)
+                is_first = False
+            return open_trade_count_start
+        else:
+            self.dataprovider._set_dataframe_max_date(current_time)
+            return self.backtest_loop(
+                row, pair, current_time, end_date,
+                open_trade_count_start, trade_dir)
+
+    def _build_detail_offsets(self, data: Dict) -> None:
+        """
+        Index the detail candles of each pair by backtest candle.
+        """
+        timeframe_ns = int(self.timeframe_td.total_seconds()) * 10 ** 9
+        for pair, detail in self.detail_data.items():
+            if pair in data:
+                detail.build_offsets(get_row_dates(data[pair]), timeframe_ns)
+
+    def _can_skip_idle_candles(self) -> bool:
+        """
+        Idle candles can only be skipped if no strategy callback runs on every candle.
+        """
+        if not self.config.get('backtest_skip_idle_candles', False):
+            return False
+        if type(self.strategy).bot_loop_start is not IStrategy.bot_loop_start:
+            logger.info("Strategy implements bot_loop_start, not skipping idle candles.")
+            return False
+        return True
+
+    def _backtest_dense(self, data: Dict, start_date: datetime, end_date: datetime) -> None:
+        """
+        Loop the whole timerange candle by candle, visiting every pair at every candle.
+        """
         # Indexes per pair, so some pairs are allowed to have a missing start.
         indexes: Dict = defaultdict(int)
         current_time = start_date + self.timeframe_td
+        current_ns = Timestamp(current_time).value
+        timeframe_ns = int(self.timeframe_td.total_seconds()) * 10 ** 9
+        # Columnar data: candles without entry signal of pairs without open trade are no-ops -
+        # they are passed using the arrays only, without building the row.
+        entry_signals: Dict[str, np.ndarray] = {
+            pair: get_entry_signals(pair_data, self._can_short)
+            for pair, pair_data in data.items() if isinstance(pair_data, ColumnarPairData)
+        }
 
         self.progress.init_step(BacktestState.BACKTEST, int(
             (end_date - start_date) / self.timeframe_td))
@@ -1218,61 +1337,115 @@ class Backtesting:
                 current_time=current_time)
             for i, pair in enumerate(data):
                 row_index = indexes[pair]
+                entries = entry_signals.get(pair)
+                if (entries is not None and row_index < len(entries)
+                        and not entries[row_index] and not LocalTrade.bt_trades_open_pp[pair]):
+                    if data[pair].dates[row_index] > current_ns:
+                        continue
+                    # Same state as backtest_pair_row() leaves behind for this candle
+                    indexes[pair] = row_index + 1
+                    self.dataprovider._set_dataframe_max_index(
+                        self.required_startup + row_index + 1)
+                    self.dataprovider._set_dataframe_max_date(current_time)
+                    continue
                 row = self.validate_row(data, pair, row_index, current_time)
                 if not row:
                     continue
 
                 row_index += 1
                 indexes[pair] = row_index
-                self.dataprovider._set_dataframe_max_index(self.required_startup + row_index)
-                self.dataprovider._set_dataframe_max_date(current_time)
-                current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
-                trade_dir: Optional[LongShort] = self.check_for_trade_entry(row)
-
-                if (
-                    (trade_dir is not None or len(LocalTrade.bt_trades_open_pp[pair]) > 0)
-                    and self.timeframe_detail and pair in self.detail_data
-                ):
-                    # Spread out into detail timeframe.
-                    # Should only happen when we are either in a trade for this pair
-                    # or when we got the signal for a new trade.
-                    exit_candle_end = current_detail_time + self.timeframe_td
-
-                    detail_data = self.detail_data[pair]
-                    detail_data = detail_data.loc[
-                        (detail_data['date'] >= current_detail_time) &
-                        (detail_data['date'] < exit_candle_end)
-                    ].copy()
-                    if len(detail_data) == 0:
-                        # Fall back to "regular" data if no detail data was found for this candle
-                        open_trade_count_start = self.backtest_loop(
-                            row, pair, current_time, end_date,
-                            open_trade_count_start, trade_dir)
-                        continue
-                    detail_data.loc[:, 'enter_long'] = row[LONG_IDX]
-                    detail_data.loc[:, 'exit_long'] = row[ELONG_IDX]
-                    detail_data.loc[:, 'enter_short'] = row[SHORT_IDX]
-                    detail_data.loc[:, 'exit_short'] = row[ESHORT_IDX]
-                    detail_data.loc[:, 'enter_tag'] = row[ENTER_TAG_IDX]
-                    detail_data.loc[:, 'exit_tag'] = row[EXIT_TAG_IDX]
-                    is_first = True
-                    current_time_det = current_time
-                    for det_row in detail_data[HEADERS].values.tolist():
-                        self.dataprovider._set_dataframe_max_date(current_time_det)
-                        open_trade_count_start = self.backtest_loop(
-                            det_row, pair, current_time_det, end_date,
-                            open_trade_count_start, trade_dir, is_first)
-                        current_time_det += timedelta(minutes=self.timeframe_detail_min)
-                        is_first = False
-                else:
-                    self.dataprovider._set_dataframe_max_date(current_time)
-                    open_trade_count_start = self.backtest_loop(
-                        row, pair, current_time, end_date,
-                        open_trade_count_start, trade_dir)
+                open_trade_count_start = self.backtest_pair_row(
+                    row, pair, row_index, current_time, end_date, open_trade_count_start)
 
             # Move time one configured time_interval ahead.
             self.progress.increment()
             current_time += self.timeframe_td
+            current_ns += timeframe_ns
+
+    def _backtest_events(self, data: Dict, start_date: datetime, end_date: datetime) -> None:
+        """
+        Event driven variant of _backtest_dense().
+        Only visits candles where a pair has an entry signal or an open trade (open orders
+        always belong to an open trade). Candles where neither is the case are no-ops in
+        the dense loop - skipping them therefore gives identical results.
+        """
+        first_time = start_date + self.timeframe_td
+        # Same number of candles as the dense loop (none if end_date is before the first candle)
+        total_steps = (int((end_date - first_time) / self.timeframe_td) + 1
+                       if end_date >= first_time else 0)
+        first_ns = Timestamp(first_time).value
+        timeframe_ns = int(self.timeframe_td.total_seconds()) * 10 ** 9
+
+        pair_steps: Dict[str, np.ndarray] = {}
+        signal_pairs: Dict[int, Set[str]] = defaultdict(set)
+        for pair in data:
+            steps, entries = get_candle_steps(data[pair], first_ns, timeframe_ns, self._can_short)
+            pair_steps[pair] = steps
+            for step in steps[entries & (steps < total_steps)].tolist():
+                signal_pairs[step].add(pair)
+        signal_steps = np.array(sorted(signal_pairs), dtype=np.int64)
+
+        self.progress.init_step(BacktestState.BACKTEST, total_steps)
+        step = 0
+        while step < total_steps:
+            if LocalTrade.bt_open_open_trade_count == 0 and step not in signal_pairs:
+                # Nothing to do until the next entry signal.
+                next_idx = int(np.searchsorted(signal_steps, step))
+                next_step = (int(signal_steps[next_idx]) if next_idx < len(signal_steps)
+                             else total_steps)
+                self.skipped_candles += next_step - step
+                step = next_step
+                self.progress.set_new_value(step)
+                continue
+
+            current_time = first_time + step * self.timeframe_td
+            open_trade_count_start = LocalTrade.bt_open_open_trade_count
+            self.check_abort()
+            strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
+                current_time=current_time)
+            active = signal_pairs.get(step, set())
+            for pair in data:
+                if pair not in active and not LocalTrade.bt_trades_open_pp[pair]:
+                    continue
+                steps = pair_steps[pair]
+                row_index = int(np.searchsorted(steps, step))
+                if row_index >= len(steps) or steps[row_index] != step:
+                    # No candle for this pair at this point in time
+                    continue
+                row = data[pair][row_index]
+                open_trade_count_start = self.backtest_pair_row(
+                    row, pair, row_index + 1, current_time, end_date, open_trade_count_start)
+
+            self.progress.increment()
+            step += 1
+
+    def backtest(self, processed: Dict,
+                 start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+        """
+        Implement backtesting functionality
+
+        NOTE: This method is used by Hyperopt at each iteration. Please keep it optimized.
+        Of course try to not have ugly code. By some accessor are sometime slower than functions.
+        Avoid extensive logging in this method and functions it calls.
+
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        :param start_date: backtesting timerange start datetime
+        :param end_date: backtesting timerange end datetime
+        :return: DataFrame with trades (results of backtesting)
+        """
+        self.prepare_backtest(self.enable_protections)
+        # Ensure wallets are uptodate (important for --strategy-list)
+        self.wallets.update()
+        # Use dict of lists (or typed arrays) with data for performance
+        # (looping lists is a lot faster than pandas DataFrames)
+        data: Dict = self._get_backtest_data(processed)
+        self._build_detail_offsets(data)
+
+        if self._can_skip_idle_candles():
+            self._backtest_events(data, start_date, end_date)
+        else:
+            self._backtest_dense(data, start_date, end_date)
 
         self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
         self.wallets.update()
@@ -1288,6 +1461,7 @@ class Backtesting:
             'canceled_trade_entries': self.canceled_trade_entries,
             'canceled_entry_orders': self.canceled_entry_orders,
             'replaced_entry_orders': self.replaced_entry_orders,
+            'skipped_candles': self.skipped_candles,
             'final_balance': self.wallets.get_total(self.strategy.config['stake_currency']),
         }
 
@@ -7,7 +7,10 @@ This module contains the hyperopt logic
 import logging
 import random
 import sys
+import time
 import warnings
+from concurrent.futures import Future
+from copy import copy
 from datetime import datetime, timezone
 from math import ceil
 from pathlib import Path
@@ -15,8 +18,10 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import rapidjson
 from colorama import init as colorama_init
-from joblib import Parallel, cpu_count, delayed, dump, load, wrap_non_picklable_objects
+from joblib import (Parallel, cpu_count, delayed, dump, effective_n_jobs, load,
+                    wrap_non_picklable_objects)
 from joblib.externals import cloudpickle
+from joblib.externals.loky import get_reusable_executor
 from pandas import DataFrame
 from rich.progress import (BarColumn, MofNCompleteColumn, Progress, TaskProgressColumn, TextColumn,
                            TimeElapsedColumn, TimeRemainingColumn)
@@ -55,6 +60,18 @@ SKOPT_MODEL_QUEUE_SIZE = 10
 
 MAX_LOSS = 100000  # just a big enough number to be bad result in loss optimization
 
+# Asynchronous mode schedules up to ASYNC_EPOCH_LAG_FACTOR * jobs epochs ahead of the
+# last epoch told to the optimizer.
+ASYNC_EPOCH_LAG_FACTOR = 2
+
+# Processed candle data, memory-mapped once per worker process and reused for every epoch
+# this worker evaluates. Keyed by data file and modification time.
+_worker_data: Dict[str, Any] = {}
+
+# Backtesting data stores - stored with the processed data instead of being pickled with
+# every epoch.
+BACKTESTING_DATA_ATTRS = ('detail_data', 'futures_data', 'funding_fee_index')
+
 
 class Hyperopt:
     """
@@ -130,6 +147,22 @@ class Hyperopt:
         self.print_colorized = self.config.get('print_colorized', False)
         self.print_json = self.config.get('print_json', False)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        The Hyperopt object is sent to the workers with every epoch.
+        Leave out the optimizer (including its models) - workers don't need it.
+        Backtesting data stores are left out too (the dataprovider drops its caches) -
+        workers re-attach them from the data file, see _attach_backtesting_data().
+        """
+        state = self.__dict__.copy()
+        state.pop('opt', None)
+        if 'backtesting' in state:
+            backtesting = copy(state['backtesting'])
+            for attr in BACKTESTING_DATA_ATTRS:
+                setattr(backtesting, attr, {})
+            state['backtesting'] = backtesting
+        return state
+
     @staticmethod
     def get_lock_filename(config: Config) -> str:
 
@@ -351,11 +384,11 @@ class Hyperopt:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open('rb') as f:
-            processed = load(f, mmap_mode='r')
-            if self.analyze_per_epoch:
-                # Data is not yet analyzed, rerun populate_indicators.
-                processed = self.advise_and_trim(processed)
+        self._attach_backtesting_data()
+        processed = self._load_processed_data()
+        if self.analyze_per_epoch:
+            # Data is not yet analyzed, rerun populate_indicators.
+            processed = self.advise_and_trim(processed)
 
         bt_results = self.backtesting.backtest(
             processed=processed,
@@ -372,6 +405,38 @@ class Hyperopt:
                                       params_dict,
                                       processed=processed)
 
+    def _load_worker_data(self) -> Dict[str, Any]:
+        """
+        Load the data stored by prepare_hyperopt_data().
+        The file is memory-mapped once per worker process (so pages are shared between
+        workers) and kept for all following epochs of this worker.
+        """
+        key = f"{self.data_pickle_file}:{self.data_pickle_file.stat().st_mtime_ns}"
+        if _worker_data.get('key') != key:
+            _worker_data.clear()
+            _worker_data['data'] = load(str(self.data_pickle_file), mmap_mode='r')
+            _worker_data['key'] = key
+        return _worker_data['data']
+
+    def _load_processed_data(self) -> Dict[str, DataFrame]:
+        """
+        Every epoch gets shallow copies of the stored dataframes - columns added while
+        backtesting don't leak into the next epoch.
+        """
+        return {pair: df.copy(deep=False)
+                for pair, df in self._load_worker_data()['processed'].items()}
+
+    def _attach_backtesting_data(self) -> None:
+        """
+        Re-attach the backtesting data stores left out when pickling (see __getstate__).
+        The historic data cache is shared with the worker, so informative pairs loaded
+        in one epoch are kept for the following epochs.
+        """
+        data = self._load_worker_data()
+        for attr, value in data['backtesting'].items():
+            setattr(self.backtesting, attr, value)
+        self.backtesting.dataprovider._set_historic_data(data['historic'])
+
     def _get_results_dict(self, backtesting_results, min_date, max_date,
                           params_dict, processed: Dict[str, DataFrame]
                           ) -> Dict[str, Any]:
@@ -472,13 +537,27 @@ class Hyperopt:
                         f'up to {self.max_date.strftime(DATETIME_PRINT_FORMAT)} '
                         f'({(self.max_date - self.min_date).days} days)..')
             # Store non-trimmed data - will be trimmed after signal generation.
-            dump(preprocessed, self.data_pickle_file)
+            self._dump_hyperopt_data(preprocessed)
         else:
-            dump(data, self.data_pickle_file)
+            self._dump_hyperopt_data(data)
 
-    def get_asked_points(self, n_points: int) -> Tuple[List[List[Any]], List[bool]]:
+    def _dump_hyperopt_data(self, processed: Dict[str, DataFrame]) -> None:
+        """
+        Store the candle data together with the backtesting data stores and the
+        dataprovider's historic data - workers load all of them from this file.
+        """
+        dump({
+            'processed': processed,
+            'backtesting': {attr: getattr(self.backtesting, attr)
+                            for attr in BACKTESTING_DATA_ATTRS},
+            'historic': self.backtesting.dataprovider._get_historic_data(),
+        }, self.data_pickle_file)
+
+    def get_asked_points(self, n_points: int, pending: Optional[List[List[Any]]] = None
+                         ) -> Tuple[List[List[Any]], List[bool]]:
         """
         Enforce points returned from `self.opt.ask` have not been already evaluated
+        (and are not pending evaluation)
 
         Steps:
         1. Try to get points using `self.opt.ask` first
@@ -494,6 +573,7 @@ class Hyperopt:
                 if item not in new_list:
                     new_list.append(item)
             return new_list
+        pending = pending or []
         i = 0
         asked_non_tried: List[List[Any]] = []
         is_random_non_tried: List[bool] = []
@@ -507,9 +587,11 @@ class Hyperopt:
                 is_random = [True for _ in range(len(asked))]
             is_random_non_tried += [rand for x, rand in zip(asked, is_random)
                                     if x not in self.opt.Xi
+                                    and x not in pending
                                     and x not in asked_non_tried]
             asked_non_tried += [x for x in asked
                                 if x not in self.opt.Xi
+                                and x not in pending
                                 and x not in asked_non_tried]
             i += 1
 
@@ -545,6 +627,140 @@ class Hyperopt:
 
         self._save_result(val)
 
+    def _get_progressbar(self) -> Progress:
+        return Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(bar_width=None),
+            MofNCompleteColumn(),
+            TaskProgressColumn(),
+            "•",
+            TimeElapsedColumn(),
+            "•",
+            TimeRemainingColumn(),
+            expand=True,
+        )
+
+    def _run_first_epoch(self, pbar: Progress, task) -> int:
+        """
+        First analysis not in parallel mode when using --analyze-per-epoch.
+        This allows dataprovider to load it's informative cache.
+        :return: Number of epochs evaluated
+        """
+        if not self.analyze_per_epoch:
+            return 0
+        asked, is_random = self.get_asked_points(n_points=1)
+        f_val0 = self.generate_optimizer(asked[0])
+        self.opt.tell(asked, [f_val0['loss']])
+        self.evaluate_result(f_val0, 1, is_random[0])
+        pbar.update(task, advance=1)
+        return 1
+
+    def _run_epochs_batched(self, config_jobs: int) -> None:
+        """
+        Ask the optimizer for one point per worker, evaluate them and tell all results.
+        """
+        with Parallel(n_jobs=config_jobs) as parallel:
+            jobs = parallel._effective_n_jobs()
+            logger.info(f'Effective number of parallel workers used: {jobs}')
+
+            # Define progressbar
+            with self._get_progressbar() as pbar:
+                task = pbar.add_task("Epochs", total=self.total_epochs)
+
+                start = self._run_first_epoch(pbar, task)
+
+                evals = ceil((self.total_epochs - start) / jobs)
+                for i in range(evals):
+                    # Correct the number of epochs to be processed for the last
+                    # iteration (should not exceed self.total_epochs in total)
+                    n_rest = (i + 1) * jobs - (self.total_epochs - start)
+                    current_jobs = jobs - n_rest if n_rest > 0 else jobs
+
+                    asked, is_random = self.get_asked_points(n_points=current_jobs)
+                    f_val = self.run_optimizer_parallel(parallel, asked)
+                    self.opt.tell(asked, [v['loss'] for v in f_val])
+
+                    for j, val in enumerate(f_val):
+                        # Use human-friendly indexes here (starting from 1)
+                        current = i * jobs + j + 1 + start
+
+                        self.evaluate_result(val, current, is_random[j])
+                        pbar.update(task, advance=1)
+
+    def _run_epoch_timed(self, raw_params: List[Any]) -> Tuple[Dict[str, Any], float]:
+        """
+        Run generate_optimizer() and measure the time spent in the worker.
+        """
+        start = time.perf_counter()
+        val = self.generate_optimizer(raw_params)
+        return val, time.perf_counter() - start
+
+    def _run_epochs_async(self, config_jobs: int) -> None:
+        """
+        Rolling ask / tell scheduling.
+        Epochs are queued up to ASYNC_EPOCH_LAG_FACTOR * jobs ahead, so a slow epoch doesn't
+        leave the other workers idle.
+        To keep seeded runs reproducible, results are told strictly in epoch order, and the
+        point for epoch n is asked right after telling epoch n - lag - so the optimizer
+        state at every ask doesn't depend on which worker finished first.
+        """
+        jobs = effective_n_jobs(config_jobs)
+        lag = ASYNC_EPOCH_LAG_FACTOR * jobs
+        logger.info(f'Effective number of parallel workers used: {jobs}, '
+                    f'scheduling up to {lag} epochs ahead.')
+        executor = get_reusable_executor(max_workers=jobs)
+        run_epoch = wrap_non_picklable_objects(self._run_epoch_timed)
+
+        with self._get_progressbar() as pbar:
+            task = pbar.add_task("Epochs", total=self.total_epochs)
+            start = self._run_first_epoch(pbar, task)
+            start_time = time.perf_counter()
+            busy_time = 0.0
+
+            # epoch -> (future, point, is_random)
+            pending: Dict[int, Tuple[Future, List[Any], bool]] = {}
+
+            def submit(first_epoch: int, n_points: int) -> int:
+                in_flight = [point for _, point, _ in pending.values()]
+                asked, is_random = self.get_asked_points(n_points=n_points, pending=in_flight)
+                for epoch, point, rand in zip(range(first_epoch, first_epoch + len(asked)),
+                                              asked, is_random):
+                    pending[epoch] = (executor.submit(run_epoch, point), point, rand)
+                return len(asked)
+
+            def finish(epoch: int) -> None:
+                nonlocal busy_time
+                future, point, is_random = pending.pop(epoch)
+                val, runtime = future.result()
+                busy_time += runtime
+                self.opt.tell([point], [val['loss']])
+                self.evaluate_result(val, epoch, is_random)
+                pbar.update(task, advance=1)
+
+            next_ask = start + 1
+            next_ask += submit(next_ask, min(lag, self.total_epochs - start))
+
+            evaluated = start
+            for current in range(start + 1, self.total_epochs + 1):
+                if current not in pending:
+                    # Optimizer returned fewer points than requested - epochs are numbered
+                    # contiguously, so no epoch is running anymore.
+                    break
+                finish(current)
+                evaluated += 1
+
+                if next_ask <= self.total_epochs:
+                    next_ask += submit(next_ask, 1)
+
+            if (skipped := self.total_epochs - evaluated) > 0:
+                logger.info(f"Optimizer returned no more points, skipped {skipped} epochs.")
+                pbar.update(task, total=evaluated)
+
+            elapsed = time.perf_counter() - start_time
+            if elapsed > 0:
+                logger.info(f"Worker utilization: {busy_time / (elapsed * jobs):.1%} "
+                            f"({busy_time:.1f}s busy in {elapsed:.1f}s with {jobs} workers).")
+
     def start(self) -> None:
         self.random_state = self._set_random_state(self.config.get('hyperopt_random_state'))
         logger.info(f"Using optimizer random state: {self.random_state}")
@@ -575,54 +791,10 @@ class Hyperopt:
             colorama_init(autoreset=True)
 
         try:
-            with Parallel(n_jobs=config_jobs) as parallel:
-                jobs = parallel._effective_n_jobs()
-                logger.info(f'Effective number of parallel workers used: {jobs}')
-
-                # Define progressbar
-                with Progress(
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(bar_width=None),
-                    MofNCompleteColumn(),
-                    TaskProgressColumn(),
-                    "•",
-                    TimeElapsedColumn(),
-                    "•",
-                    TimeRemainingColumn(),
-                    expand=True,
-                ) as pbar:
-                    task = pbar.add_task("Epochs", total=self.total_epochs)
-
-                    start = 0
-
-                    if self.analyze_per_epoch:
-                        # First analysis not in parallel mode when using --analyze-per-epoch.
-                        # This allows dataprovider to load it's informative cache.
-                        asked, is_random = self.get_asked_points(n_points=1)
-                        f_val0 = self.generate_optimizer(asked[0])
-                        self.opt.tell(asked, [f_val0['loss']])
-                        self.evaluate_result(f_val0, 1, is_random[0])
-                        pbar.update(task, advance=1)
-                        start += 1
-
-                    evals = ceil((self.total_epochs - start) / jobs)
-                    for i in range(evals):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - (self.total_epochs - start)
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked, is_random = self.get_asked_points(n_points=current_jobs)
-                        f_val = self.run_optimizer_parallel(parallel, asked)
-                        self.opt.tell(asked, [v['loss'] for v in f_val])
-
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1 + start
-
-                            self.evaluate_result(val, current, is_random[j])
-                            pbar.update(task, advance=1)
-
+            if self.config.get('hyperopt_async', False):
+                self._run_epochs_async(config_jobs)
+            else:
+                self._run_epochs_batched(config_jobs)
         except KeyboardInterrupt:
             print('User interrupted..')
 
@@ -54,7 +54,7 @@ class HyperoptTools:
         """
         from freqtrade.resolvers.strategy_resolver import StrategyResolver
         strategy_objs = StrategyResolver.search_all_objects(
-            config, False, config.get('recursive_strategy_search', False))
+            config, False, config.get('recursive_strategy_search', False), load=False)
         strategies = [s for s in strategy_objs if s['name'] == strategy_name]
         if strategies:
             strategy = strategies[0]
@@ -219,6 +219,10 @@ def text_table_add_metrics(strat_results: Dict) -> str:
             ('Replaced Entry Orders', strat_results.get('replaced_entry_orders', 'N/A')),
         ] if strat_results.get('canceled_entry_orders', 0) > 0 else []
 
+        skipped_candle_metrics = [
+            ('Skipped idle candles', strat_results['skipped_candles']),
+        ] if strat_results.get('skipped_candles', 0) > 0 else []
+
         # Newly added fields should be ignored if they are missing in strat_results. hyperopt-show
         # command stores these results and newer version of freqtrade must be able to handle old
         # results with missing new fields.
@@ -279,6 +283,7 @@ def text_table_add_metrics(strat_results: Dict) -> str:
              f"{strat_results.get('timedout_entry_orders', 'N/A')} / "
              f"{strat_results.get('timedout_exit_orders', 'N/A')}"),
             *entry_adjustment_metrics,
+            *skipped_candle_metrics,
             ('', ''),  # Empty line to improve readability
 
             ('Min balance', fmt_coin(strat_results['csum_min'], strat_results['stake_currency'])),
@@ -461,6 +461,7 @@ def generate_strategy_stats(pairlist: List[str],
         'canceled_trade_entries': content['canceled_trade_entries'],
         'canceled_entry_orders': content['canceled_entry_orders'],
         'replaced_entry_orders': content['replaced_entry_orders'],
+        'skipped_candles': content.get('skipped_candles', 0),
         'max_open_trades': max_open_trades,
         'max_open_trades_setting': (config['max_open_trades']
                                     if config['max_open_trades'] != float('inf') else -1),
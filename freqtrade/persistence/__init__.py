@@ -1,7 +1,8 @@
 # flake8: noqa: F401
 
+from freqtrade.persistence.commit_scope import grouped_commits
 from freqtrade.persistence.key_value_store import KeyStoreKeys, KeyValueStore
-from freqtrade.persistence.models import init_db
+from freqtrade.persistence.models import DB_PROFILES, init_db
 from freqtrade.persistence.pairlock_middleware import PairLocks
 from freqtrade.persistence.trade_model import LocalTrade, Order, Trade
 from freqtrade.persistence.usedb_context import (FtNoDBContext, disable_database_use,
@@ -0,0 +1,100 @@
+"""
+Grouping of database commits - e.g. one commit per bot iteration instead of one per change.
+"""
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from sqlalchemy.orm import Session
+
+
+_state = threading.local()
+# Set by init_db() based on the database profile
+_grouping_enabled = False
+# Session.info key of the SAVEPOINT started by the last commit_session() call
+_SAVEPOINT = 'commit_scope_savepoint'
+
+
+def set_commit_grouping(enabled: bool) -> None:
+    global _grouping_enabled
+    _grouping_enabled = enabled
+
+
+def _begin_savepoint(session: Session) -> None:
+    """
+    Start the commit point of the session - changes made since can be rolled back.
+    """
+    connection = session.connection()
+    if (connection.dialect.name == 'sqlite'
+            and not connection.connection.dbapi_connection.in_transaction):
+        # pysqlite only begins transactions before DML statements - a SAVEPOINT outside of a
+        # transaction would start the transaction itself, and releasing it would commit.
+        connection.exec_driver_sql('BEGIN')
+    session.info[_SAVEPOINT] = session.begin_nested()
+
+
+def commit_session(session: Session) -> None:
+    """
+    Commit the session - or only flush it while commits are grouped in this thread.
+    Flushed changes are visible to queries in the same session, and are committed at the end
+    of the grouped_commits() block.
+    """
+    pending: Optional[List[Session]] = getattr(_state, 'pending', None)
+    if pending is None:
+        session.commit()
+        return
+    savepoint = session.info.get(_SAVEPOINT)
+    if savepoint is not None and savepoint.is_active:
+        # Release the savepoint - its changes become part of the block.
+        savepoint.commit()
+    else:
+        session.flush()
+    _begin_savepoint(session)
+    if not any(s is session for s in pending):
+        pending.append(session)
+
+
+def rollback_session(session: Session) -> None:
+    """
+    Roll back the session to the last commit_session() call.
+    While commits are grouped, earlier changes of the block are kept - each commit_session()
+    call starts a SAVEPOINT, and only the changes made since (inserts, updates and deletes)
+    are rolled back to it.
+    """
+    pending: Optional[List[Session]] = getattr(_state, 'pending', None)
+    savepoint = session.info.pop(_SAVEPOINT, None)
+    if pending is None or savepoint is None or not any(s is session for s in pending):
+        session.rollback()
+        return
+    savepoint.rollback()
+    _begin_savepoint(session)
+
+
+@contextmanager
+def grouped_commits(enabled: Optional[bool] = None) -> Iterator[None]:
+    """
+    Group all commits of this thread into one commit at the end of the block.
+    Crash safety: a crash within the block loses all changes made in the block - the database
+    always holds the state of the end of the previous block, never a partial block.
+    Changes are committed at the end of the block even if it raises, as they would have been
+    with individual commits.
+    Nested blocks join the outermost block.
+    :param enabled: Group commits - defaults to the setting of the database profile.
+    """
+    enabled = _grouping_enabled if enabled is None else enabled
+    if not enabled or getattr(_state, 'pending', None) is not None:
+        yield
+        return
+
+    _state.pending = []
+    try:
+        yield
+    finally:
+        pending, _state.pending = _state.pending, None
+        for session in pending:
+            session.info.pop(_SAVEPOINT, None)
+            try:
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
@@ -6,6 +6,7 @@ from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from freqtrade.persistence.base import ModelBase, SessionType
+from freqtrade.persistence.commit_scope import commit_session
 
 
 ValueTypes = Union[str, datetime, float, int]
@@ -75,7 +76,7 @@ class KeyValueStore:
         else:
             raise ValueError(f'Unknown value type {kv.value_type}')
         _KeyValueStoreModel.session.add(kv)
-        _KeyValueStoreModel.session.commit()
+        commit_session(_KeyValueStoreModel.session)
 
     @staticmethod
     def delete_value(key: KeyStoreKeys) -> None:
@@ -87,7 +88,7 @@ class KeyValueStore:
             _KeyValueStoreModel.key == key).first()
         if kv is not None:
             _KeyValueStoreModel.session.delete(kv)
-            _KeyValueStoreModel.session.commit()
+            commit_session(_KeyValueStoreModel.session)
 
     @staticmethod
     def get_value(key: KeyStoreKeys) -> Optional[ValueTypes]:
@@ -0,0 +1,49 @@
+from bisect import bisect_right
+from datetime import datetime
+from typing import Any, List
+
+
+class ClosedTradeIndex:
+    """
+    Closed backtest trades, ordered by close date.
+    Used by LocalTrade.get_trades_proxy() to answer "closed after" queries (as used by
+    protections) with a binary search instead of a scan over all closed trades.
+    Results are returned in insertion order - identical to filtering LocalTrade.trades.
+    """
+
+    __slots__ = ('_dates', '_seqs', '_trades')
+
+    def __init__(self) -> None:
+        self._dates: List[datetime] = []
+        self._seqs: List[int] = []
+        self._trades: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._trades)
+
+    def add(self, trade: Any, seq: int) -> None:
+        """
+        Add a closed trade.
+        Trades usually close in chronological order, so this is an append in most cases.
+        :param trade: LocalTrade object, close_date must be set
+        :param seq: Position of the trade in LocalTrade.trades
+        """
+        idx = bisect_right(self._dates, trade.close_date)
+        if idx == len(self._dates):
+            self._dates.append(trade.close_date)
+            self._seqs.append(seq)
+            self._trades.append(trade)
+        else:
+            self._dates.insert(idx, trade.close_date)
+            self._seqs.insert(idx, seq)
+            self._trades.insert(idx, trade)
+
+    def closed_after(self, close_date: datetime) -> List[Any]:
+        """
+        Trades with close_date > close_date, in insertion order.
+        """
+        idx = bisect_right(self._dates, close_date)
+        if idx == len(self._dates):
+            return []
+        return [trade for _, trade in sorted(zip(self._seqs[idx:], self._trades[idx:]),
+                                             key=lambda x: x[0])]
@@ -6,13 +6,14 @@ import threading
 from contextvars import ContextVar
 from typing import Any, Dict, Final, Optional
 
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from freqtrade.exceptions import OperationalException
 from freqtrade.persistence.base import ModelBase
+from freqtrade.persistence.commit_scope import set_commit_grouping
 from freqtrade.persistence.key_value_store import _KeyValueStoreModel
 from freqtrade.persistence.migrations import check_migrate
 from freqtrade.persistence.pairlock import PairLock
@@ -40,17 +41,63 @@ def get_request_or_thread_id() -> Optional[str]:
 
 _SQL_DOCS_URL = 'http://docs.sqlalchemy.org/en/latest/core/engines.html#database-urls'
 
+# Database durability / performance profiles.
+# pragmas are only applied to SQLite databases, group_commits enables grouped_commits().
+DB_PROFILES: Dict[str, Dict[str, Any]] = {
+    # SQLite defaults (rollback journal, synchronous=FULL) - every commit is durable,
+    # readers block the writer.
+    'default': {'pragmas': {}, 'group_commits': False},
+    # WAL journal - readers (e.g. the API) no longer block the writer.
+    # Every commit is still synced to disk, and survives power loss.
+    'durable': {
+        'pragmas': {'journal_mode': 'WAL', 'synchronous': 'FULL', 'busy_timeout': 5000},
+        'group_commits': False,
+    },
+    # WAL journal without a sync on every commit. Commits survive application crashes, and
+    # the database can't be corrupted - the last commits may be lost on power loss / OS crash.
+    'balanced': {
+        'pragmas': {'journal_mode': 'WAL', 'synchronous': 'NORMAL', 'busy_timeout': 5000,
+                    'cache_size': -64000, 'temp_store': 'MEMORY'},
+        'group_commits': False,
+    },
+    # As balanced, committing once per grouped_commits() block (e.g. one bot iteration).
+    # A crash loses the changes of the running block only - never a partial block.
+    'performance': {
+        'pragmas': {'journal_mode': 'WAL', 'synchronous': 'NORMAL', 'busy_timeout': 5000,
+                    'cache_size': -64000, 'temp_store': 'MEMORY'},
+        'group_commits': True,
+    },
+}
+
+
+def _sqlite_pragma_listener(pragmas: Dict[str, Any]):
+    """
+    Connection listener applying pragmas to every new SQLite connection.
+    """
+    def set_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
+    return set_pragmas
 
-def init_db(db_url: str) -> None:
+
+def init_db(db_url: str, db_profile: str = 'default') -> None:
     """
     Initializes this module with the given config,
     registers all known command handlers
     and starts polling for message updates
     :param db_url: Database to use
+    :param db_profile: Durability / performance profile - one of DB_PROFILES
     :return: None
     """
     kwargs: Dict[str, Any] = {}
 
+    if db_profile not in DB_PROFILES:
+        raise OperationalException(
+            f'Invalid db profile {db_profile}. Available profiles: {", ".join(DB_PROFILES)}.')
+    profile = DB_PROFILES[db_profile]
+
     if db_url == 'sqlite:///':
         raise OperationalException(
             f'Bad db-url {db_url}. For in-memory database, please use `sqlite://`.')
@@ -70,11 +117,24 @@ def init_db(db_url: str) -> None:
         raise OperationalException(f"Given value for db_url: '{db_url}' "
                                    f"is no valid database URL! (See {_SQL_DOCS_URL})")
 
+    pragmas = dict(profile['pragmas'])
+    if db_url == 'sqlite://':
+        # In-memory databases have no journal file.
+        pragmas.pop('journal_mode', None)
+    if db_url.startswith('sqlite://') and pragmas:
+        logger.info(f'Using db profile "{db_profile}": {pragmas}')
+        event.listen(engine, 'connect', _sqlite_pragma_listener(pragmas))
+    set_commit_grouping(profile['group_commits'])
+
     # https://docs.sqlalchemy.org/en/13/orm/contextual.html#thread-local-scope
     # Scoped sessions proxy requests to the appropriate thread-local session.
     # Since we also use fastAPI, we need to make it aware of the request id, too
-    Trade.session = scoped_session(sessionmaker(
-        bind=engine, autoflush=False), scopefunc=get_request_or_thread_id)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    # Changes to trades only become visible to queries once committed.
+    event.listen(session_factory, 'after_commit', Trade.performance_cache.transaction_end)
+    event.listen(session_factory, 'after_rollback', Trade.performance_cache.transaction_end)
+    Trade.performance_cache.invalidate()
+    Trade.session = scoped_session(session_factory, scopefunc=get_request_or_thread_id)
     Order.session = Trade.session
     PairLock.session = Trade.session
     _KeyValueStoreModel.session = Trade.session
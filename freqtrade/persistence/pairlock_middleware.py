@@ -1,16 +1,54 @@
 import logging
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence
 
 from sqlalchemy import select
 
 from freqtrade.exchange import timeframe_to_next_date
+from freqtrade.persistence.commit_scope import commit_session
 from freqtrade.persistence.models import PairLock
 
 
 logger = logging.getLogger(__name__)
 
 
+class PairLockIndex:
+    """
+    Backtesting lock index for one pair (or all pairs), ordered by lock end time.
+    Expired locks are skipped with a binary search, so lookups only touch locks that
+    are still running. Results are returned in creation order - identical to filtering
+    PairLocks.locks.
+    """
+
+    __slots__ = ('_ends', '_seqs', '_locks')
+
+    def __init__(self) -> None:
+        self._ends: List[datetime] = []
+        self._seqs: List[int] = []
+        self._locks: List[PairLock] = []
+
+    def add(self, lock: PairLock, seq: int) -> None:
+        """
+        :param lock: PairLock to add
+        :param seq: Position of the lock in PairLocks.locks
+        """
+        idx = bisect_right(self._ends, lock.lock_end_time)
+        self._ends.insert(idx, lock.lock_end_time)
+        self._seqs.insert(idx, seq)
+        self._locks.insert(idx, lock)
+
+    def get_locks(self, now: datetime, side: str) -> List[PairLock]:
+        """
+        Active locks with lock_end_time >= now, matching side.
+        """
+        idx = bisect_left(self._ends, now)
+        locks = [(seq, lock) for seq, lock in zip(self._seqs[idx:], self._locks[idx:])
+                 if lock.active is True and (lock.side == '*' or lock.side == side)]
+        return [lock for _, lock in sorted(locks, key=lambda x: x[0])]
+
+
 class PairLocks:
     """
     Pairlocks middleware class
@@ -20,6 +58,9 @@ class PairLocks:
 
     use_db = True
     locks: List[PairLock] = []
+    # Backtesting indexes of locks - overall and per pair (including '*')
+    locks_index: PairLockIndex = PairLockIndex()
+    locks_index_pp: Dict[str, PairLockIndex] = defaultdict(PairLockIndex)
 
     timeframe: str = ''
 
@@ -30,6 +71,8 @@ class PairLocks:
         """
         if not PairLocks.use_db:
             PairLocks.locks = []
+            PairLocks.locks_index = PairLockIndex()
+            PairLocks.locks_index_pp = defaultdict(PairLockIndex)
 
     @staticmethod
     def lock_pair(pair: str, until: datetime, reason: Optional[str] = None, *,
@@ -54,9 +97,12 @@ class PairLocks:
         )
         if PairLocks.use_db:
             PairLock.session.add(lock)
-            PairLock.session.commit()
+            commit_session(PairLock.session)
         else:
+            seq = len(PairLocks.locks)
             PairLocks.locks.append(lock)
+            PairLocks.locks_index.add(lock, seq)
+            PairLocks.locks_index_pp[pair].add(lock, seq)
         return lock
 
     @staticmethod
@@ -74,13 +120,10 @@ class PairLocks:
         if PairLocks.use_db:
             return PairLock.query_pair_locks(pair, now, side).all()
         else:
-            locks = [lock for lock in PairLocks.locks if (
-                lock.lock_end_time >= now
-                and lock.active is True
-                and (pair is None or lock.pair == pair)
-                and (lock.side == '*' or lock.side == side)
-            )]
-            return locks
+            if pair is None:
+                return PairLocks.locks_index.get_locks(now, side)
+            index = PairLocks.locks_index_pp.get(pair)
+            return index.get_locks(now, side) if index else []
 
     @staticmethod
     def get_pair_longest_lock(
@@ -108,7 +151,7 @@ class PairLocks:
         for lock in locks:
             lock.active = False
         if PairLocks.use_db:
-            PairLock.session.commit()
+            commit_session(PairLock.session)
 
     @staticmethod
     def unlock_reason(reason: str, now: Optional[datetime] = None) -> None:
@@ -132,7 +175,7 @@ class PairLocks:
             for lock in locks:
                 logger.info(f"Releasing lock for {lock.pair} with reason '{reason}'.")
                 lock.active = False
-            PairLock.session.commit()
+            commit_session(PairLock.session)
         else:
             # used in backtesting mode; don't show log messages for speed
             locksb = PairLocks.get_pair_locks(None)
@@ -0,0 +1,85 @@
+from copy import deepcopy
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, List
+
+from sqlalchemy.orm import Session, object_session
+
+
+class PerformanceCache:
+    """
+    Results of the grouped performance queries of Trade (per pair, enter tag, exit reason, ...).
+    Results are kept until a trade changes in a way affecting closed trade statistics.
+    Changes are tracked per session while modifying the objects, and applied again at the end
+    of the transaction of that session - so results queried before a pending change is
+    committed are not kept.
+    """
+
+    __slots__ = ('_results', '_generation', '_lock', '_maxsize')
+
+    _DIRTY_KEY = 'perf_dirty'
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._results: Dict[Hashable, List[Dict[str, Any]]] = {}
+        # Increased on every invalidation - results computed across a change are not stored.
+        self._generation = 0
+        self._lock = Lock()
+        self._maxsize = maxsize
+
+    def get(self, key: Hashable,
+            compute: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Get the cached result for key, computing (and storing) it if necessary.
+        Returns a copy - callers may modify the result.
+        """
+        with self._lock:
+            result = self._results.get(key)
+            generation = self._generation
+        if result is None:
+            result = compute()
+            with self._lock:
+                if generation == self._generation:
+                    if len(self._results) >= self._maxsize:
+                        self._results.clear()
+                    self._results[key] = result
+        return deepcopy(result)
+
+    def _clear(self) -> None:
+        self._generation += 1
+        self._results.clear()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._clear()
+
+    def mark_dirty(self, target: Any) -> None:
+        """
+        A trade changed. The session holding the trade is invalidated again at the end
+        of its transaction.
+        :param target: The changed object
+        """
+        session = object_session(target)
+        if session is not None:
+            session.info[self._DIRTY_KEY] = True
+        with self._lock:
+            self._clear()
+
+    def attribute_set(self, target: Any, *args, **kwargs) -> None:
+        """
+        sqlalchemy attribute 'set' event listener.
+        """
+        self.mark_dirty(target)
+
+    def mapper_event(self, mapper, connection, target: Any) -> None:
+        """
+        sqlalchemy mapper event listener (after_insert, after_delete).
+        """
+        self.mark_dirty(target)
+
+    def transaction_end(self, session: Session, *args, **kwargs) -> None:
+        """
+        Session commit / rollback - sqlalchemy session event listener.
+        Only sessions which changed a trade invalidate the cache.
+        """
+        if session.info.pop(self._DIRTY_KEY, False):
+            with self._lock:
+                self._clear()
@@ -3,9 +3,9 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from math import isclose
-from typing import Any, ClassVar, Dict, List, Optional, Sequence, cast
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Sequence, Tuple, cast
 
-from sqlalchemy import (Enum, Float, ForeignKey, Integer, ScalarResult, Select, String,UniqueConstraint, desc, func, select)
+from sqlalchemy import (Enum, Float, ForeignKey, Integer, ScalarResult, Select, String,UniqueConstraint, desc, event, func, select)
 from sqlalchemy.orm import Mapped, lazyload, mapped_column, relationship, validates
 from typing_extensions import Self
 
@@ -17,6 +17,9 @@ from freqtrade.exchange import (ROUND_DOWN, ROUND_UP, amount_to_contract_precisi
 from freqtrade.leverage import interest
 from freqtrade.misc import safe_value_fallback
 from freqtrade.persistence.base import ModelBase, SessionType
+from freqtrade.persistence.commit_scope import commit_session, rollback_session
+from freqtrade.persistence.local_trade_index import ClosedTradeIndex
+from freqtrade.persistence.performance_cache import PerformanceCache
 from freqtrade.util import FtPrecise, dt_from_ts, dt_now, dt_ts
 
 
@@ -322,6 +325,9 @@ class LocalTrade:
     # Copy of trades_open - but indexed by pair
     bt_trades_open_pp: Dict[str, List['LocalTrade']] = defaultdict(list)
     bt_open_open_trade_count: int = 0
+    # Closed trades - ordered by close_date, overall and per pair
+    bt_trades_closed: ClosedTradeIndex = ClosedTradeIndex()
+    bt_trades_closed_pp: Dict[str, ClosedTradeIndex] = defaultdict(ClosedTradeIndex)
     total_profit: float = 0
     realized_profit: float = 0
 
@@ -646,6 +652,8 @@ class LocalTrade:
         LocalTrade.trades_open = []
         LocalTrade.bt_trades_open_pp = defaultdict(list)
         LocalTrade.bt_open_open_trade_count = 0
+        LocalTrade.bt_trades_closed = ClosedTradeIndex()
+        LocalTrade.bt_trades_closed_pp = defaultdict(ClosedTradeIndex)
         LocalTrade.total_profit = 0
 
     def adjust_min_max_rates(self, current_price: float, current_price_low: float) -> None:
@@ -1223,6 +1231,17 @@ class LocalTrade:
         """
 
         # Offline mode - without database
+        if is_open is False and close_date:
+            # Closed trades are indexed by close date
+            if pair:
+                index = LocalTrade.bt_trades_closed_pp.get(pair)
+                sel_trades = index.closed_after(close_date) if index else []
+            else:
+                sel_trades = LocalTrade.bt_trades_closed.closed_after(close_date)
+            if open_date:
+                sel_trades = [trade for trade in sel_trades if trade.open_date > open_date]
+            return sel_trades
+
         if is_open is not None:
             if is_open:
                 sel_trades = LocalTrade.trades_open
@@ -1248,7 +1267,7 @@ class LocalTrade:
         LocalTrade.trades_open.remove(trade)
         LocalTrade.bt_trades_open_pp[trade.pair].remove(trade)
         LocalTrade.bt_open_open_trade_count -= 1
-        LocalTrade.trades.append(trade)
+        LocalTrade._append_closed_bt_trade(trade)
         LocalTrade.total_profit += trade.close_profit_abs
 
     @staticmethod
@@ -1258,7 +1277,18 @@ class LocalTrade:
             LocalTrade.bt_trades_open_pp[trade.pair].append(trade)
             LocalTrade.bt_open_open_trade_count += 1
         else:
-            LocalTrade.trades.append(trade)
+            LocalTrade._append_closed_bt_trade(trade)
+
+    @staticmethod
+    def _append_closed_bt_trade(trade):
+        """
+        Add a closed trade to LocalTrade.trades and the close-date indexes.
+        """
+        if trade.close_date:
+            seq = len(LocalTrade.trades)
+            LocalTrade.bt_trades_closed.add(trade, seq)
+            LocalTrade.bt_trades_closed_pp[trade.pair].add(trade, seq)
+        LocalTrade.trades.append(trade)
 
     @staticmethod
     def remove_bt_trade(trade):
@@ -1505,6 +1535,9 @@ class Trade(ModelBase, LocalTrade):
     funding_fee_running: Mapped[Optional[float]] = mapped_column(
         Float(), nullable=True, default=None)  # type: ignore
 
+    # Grouped performance results - invalidated when closed trades change
+    performance_cache: ClassVar[PerformanceCache] = PerformanceCache()
+
     def __init__(self, **kwargs):
         from_json = kwargs.pop('__FROM_JSON', None)
         super().__init__(**kwargs)
@@ -1530,11 +1563,11 @@ class Trade(ModelBase, LocalTrade):
 
     @staticmethod
     def commit():
-        Trade.session.commit()
+        commit_session(Trade.session)
 
     @staticmethod
     def rollback():
-        Trade.session.rollback()
+        rollback_session(Trade.session)
 
     @staticmethod
     def get_trades_proxy(*, pair: Optional[str] = None, is_open: Optional[bool] = None,
@@ -1659,15 +1692,35 @@ class Trade(ModelBase, LocalTrade):
                 t.stake_amount for t in LocalTrade.get_trades_proxy(is_open=True))
         return total_open_stake_amount or 0
 
+    @staticmethod
+    def _cached_performance(key: Tuple, compute: Callable[[], List[Dict[str, Any]]]
+                            ) -> List[Dict[str, Any]]:
+        """
+        Cache results of the grouped performance queries until closed trades change.
+        Falls through to compute() if the database is not used (e.g. in backtesting).
+        """
+        if not Trade.use_db:
+            return compute()
+        return Trade.performance_cache.get(key, compute)
+
     @staticmethod
     def get_overall_performance(minutes=None) -> List[Dict[str, Any]]:
         """
         Returns List of dicts containing all Trades, including profit and trade count
         NOTE: Not supported in Backtesting.
         """
-        filters: List = [Trade.is_open.is_(False)]
+        start_date = None
         if minutes:
-            start_date = datetime.now(timezone.utc) - timedelta(minutes=minutes)
+            # Truncated to the minute, so results can be reused within the same minute.
+            start_date = (datetime.now(timezone.utc) - timedelta(minutes=minutes)
+                          ).replace(second=0, microsecond=0)
+        return Trade._cached_performance(
+            ('pair', start_date), lambda: Trade._get_overall_performance(start_date))
+
+    @staticmethod
+    def _get_overall_performance(start_date: Optional[datetime]) -> List[Dict[str, Any]]:
+        filters: List = [Trade.is_open.is_(False)]
+        if start_date:
             filters.append(Trade.close_date >= start_date)
 
         pair_rates = Trade.session.execute(
@@ -1694,29 +1747,35 @@ class Trade(ModelBase, LocalTrade):
         ]
 
     @staticmethod
-    def get_enter_tag_performance(pair: Optional[str]) -> List[Dict[str, Any]]:
+    def _get_tag_performance(columns: List, pair: Optional[str]) -> List[Tuple]:
         """
-        Returns List of dicts containing all Trades, based on buy tag performance
-        Can either be average for all pairs or a specific pair provided
-        NOTE: Not supported in Backtesting.
+        Closed trade profit, grouped by columns.
+        :return: List of tuples (*columns, profit_sum, profit_sum_abs, count),
+                 sorted by profit_sum_abs
         """
-
         filters: List = [Trade.is_open.is_(False)]
         if (pair is not None):
             filters.append(Trade.pair == pair)
 
-        enter_tag_perf = Trade.session.execute(
+        return Trade.session.execute(
             select(
-                Trade.enter_tag,
+                *columns,
                 func.sum(Trade.close_profit).label('profit_sum'),
                 func.sum(Trade.close_profit_abs).label('profit_sum_abs'),
                 func.count(Trade.pair).label('count')
             ).filter(*filters)
-            .group_by(Trade.enter_tag)
+            .group_by(*columns)
             .order_by(desc('profit_sum_abs'))
         ).all()
 
-        return [
+    @staticmethod
+    def get_enter_tag_performance(pair: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Returns List of dicts containing all Trades, based on buy tag performance
+        Can either be average for all pairs or a specific pair provided
+        NOTE: Not supported in Backtesting.
+        """
+        return Trade._cached_performance(('enter_tag', pair), lambda: [
             {
                 'enter_tag': enter_tag if enter_tag is not None else "Other",
                 'profit_ratio': profit,
@@ -1724,8 +1783,9 @@ class Trade(ModelBase, LocalTrade):
                 'profit_abs': profit_abs,
                 'count': count
             }
-            for enter_tag, profit, profit_abs, count in enter_tag_perf
-        ]
+            for enter_tag, profit, profit_abs, count
+            in Trade._get_tag_performance([Trade.enter_tag], pair)
+        ])
 
     @staticmethod
     def get_exit_reason_performance(pair: Optional[str]) -> List[Dict[str, Any]]:
@@ -1734,22 +1794,7 @@ class Trade(ModelBase, LocalTrade):
         Can either be average for all pairs or a specific pair provided
         NOTE: Not supported in Backtesting.
         """
-
-        filters: List = [Trade.is_open.is_(False)]
-        if (pair is not None):
-            filters.append(Trade.pair == pair)
-        sell_tag_perf = Trade.session.execute(
-            select(
-                Trade.exit_reason,
-                func.sum(Trade.close_profit).label('profit_sum'),
-                func.sum(Trade.close_profit_abs).label('profit_sum_abs'),
-                func.count(Trade.pair).label('count')
-            ).filter(*filters)
-            .group_by(Trade.exit_reason)
-            .order_by(desc('profit_sum_abs'))
-        ).all()
-
-        return [
+        return Trade._cached_performance(('exit_reason', pair), lambda: [
             {
                 'exit_reason': exit_reason if exit_reason is not None else "Other",
                 'profit_ratio': profit,
@@ -1757,8 +1802,9 @@ class Trade(ModelBase, LocalTrade):
                 'profit_abs': profit_abs,
                 'count': count
             }
-            for exit_reason, profit, profit_abs, count in sell_tag_perf
-        ]
+            for exit_reason, profit, profit_abs, count
+            in Trade._get_tag_performance([Trade.exit_reason], pair)
+        ])
 
     @staticmethod
     def get_mix_tag_performance(pair: Optional[str]) -> List[Dict[str, Any]]:
@@ -1767,50 +1813,36 @@ class Trade(ModelBase, LocalTrade):
         Can either be average for all pairs or a specific pair provided
         NOTE: Not supported in Backtesting.
         """
+        return Trade._cached_performance(('mix_tag', pair),
+                                         lambda: Trade._get_mix_tag_performance(pair))
 
-        filters: List = [Trade.is_open.is_(False)]
-        if (pair is not None):
-            filters.append(Trade.pair == pair)
-        mix_tag_perf = Trade.session.execute(
-            select(
-                Trade.id,
-                Trade.enter_tag,
-                Trade.exit_reason,
-                func.sum(Trade.close_profit).label('profit_sum'),
-                func.sum(Trade.close_profit_abs).label('profit_sum_abs'),
-                func.count(Trade.pair).label('count')
-            ).filter(*filters)
-            .group_by(Trade.id)
-            .order_by(desc('profit_sum_abs'))
-        ).all()
-
-        resp: List[Dict] = []
-        for id, enter_tag, exit_reason, profit, profit_abs, count in mix_tag_perf:
+    @staticmethod
+    def _get_mix_tag_performance(pair: Optional[str]) -> List[Dict[str, Any]]:
+        # Grouped in the database - only combinations mapping to the same mix_tag
+        # (missing tags become "Other") are merged here.
+        resp: Dict[str, Dict[str, Any]] = {}
+        for enter_tag, exit_reason, profit, profit_abs, count in Trade._get_tag_performance(
+                [Trade.enter_tag, Trade.exit_reason], pair):
             enter_tag = enter_tag if enter_tag is not None else "Other"
             exit_reason = exit_reason if exit_reason is not None else "Other"
+            mix_tag = enter_tag + " " + exit_reason
+            if mix_tag not in resp:
+                resp[mix_tag] = {'mix_tag': mix_tag, 'profit_ratio': 0.0,
+                                 'profit_abs': 0.0, 'count': 0}
+            resp[mix_tag]['profit_ratio'] += profit
+            resp[mix_tag]['profit_abs'] += profit_abs
+            resp[mix_tag]['count'] += count
 
-            if (exit_reason is not None and enter_tag is not None):
-                mix_tag = enter_tag + " " + exit_reason
-                i = 0
-                if not any(item["mix_tag"] == mix_tag for item in resp):
-                    resp.append({'mix_tag': mix_tag,
-                                 'profit_ratio': profit,
-                                 'profit_pct': round(profit * 100, 2),
-                                 'profit_abs': profit_abs,
-                                 'count': count})
-                else:
-                    while i < len(resp):
-                        if resp[i]["mix_tag"] == mix_tag:
-                            resp[i] = {
-                                'mix_tag': mix_tag,
-                                'profit_ratio': profit + resp[i]["profit_ratio"],
-                                'profit_pct': round(profit + resp[i]["profit_ratio"] * 100, 2),
-                                'profit_abs': profit_abs + resp[i]["profit_abs"],
-                                'count': 1 + resp[i]["count"]
-                            }
-                        i += 1
-
-        return resp
+        return [
+            {
+                'mix_tag': item['mix_tag'],
+                'profit_ratio': item['profit_ratio'],
+                'profit_pct': round(item['profit_ratio'] * 100, 2),
+                'profit_abs': item['profit_abs'],
+                'count': item['count']
+            }
+            for item in sorted(resp.values(), key=lambda x: x['profit_abs'], reverse=True)
+        ]
 
     @staticmethod
     def get_best_pair(start_date: datetime = datetime.fromtimestamp(0)):
@@ -1845,3 +1877,11 @@ class Trade(ModelBase, LocalTrade):
                 Order.status == 'closed'
             )).scalar_one()
         return trading_volume or 0.0
+
+
+# Invalidate cached performance results whenever closed trade statistics may change.
+for _attribute in (Trade.pair, Trade.is_open, Trade.close_date, Trade.close_profit,
+                   Trade.close_profit_abs, Trade.enter_tag, Trade.exit_reason):
+    event.listen(_attribute, 'set', Trade.performance_cache.attribute_set)
+event.listen(Trade, 'after_insert', Trade.performance_cache.mapper_event)
+event.listen(Trade, 'after_delete', Trade.performance_cache.mapper_event)
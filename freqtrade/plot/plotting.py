@@ -78,6 +78,7 @@ def init_plotscript(config, markets: List, startup_candles: int = 0):
         trades = load_trades(
             config['trade_source'],
             db_url=config.get('db_url'),
+            db_profile=config.get('db_profile', 'default'),
             exportfilename=filename,
             no_trades=no_trades,
             strategy=config.get('strategy'),
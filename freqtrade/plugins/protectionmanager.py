@@ -6,7 +6,7 @@ from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 from freqtrade.constants import Config, LongShort
-from freqtrade.persistence import PairLocks
+from freqtrade.persistence import PairLocks, grouped_commits
 from freqtrade.persistence.models import PairLock
 from freqtrade.plugins.protections import IProtection
 from freqtrade.resolvers import ProtectionResolver
@@ -50,13 +50,15 @@ class ProtectionManager:
         if not now:
             now = datetime.now(timezone.utc)
         result = None
-        for protection_handler in self._protection_handlers:
-            if protection_handler.has_global_stop:
-                lock = protection_handler.global_stop(date_now=now, side=side)
-                if lock and lock.until:
-                    if not PairLocks.is_global_lock(lock.until, side=lock.lock_side):
-                        result = PairLocks.lock_pair(
-                            '*', lock.until, lock.reason, now=now, side=lock.lock_side)
+        # Locks of all protections are committed together (if commits are grouped).
+        with grouped_commits():
+            for protection_handler in self._protection_handlers:
+                if protection_handler.has_global_stop:
+                    lock = protection_handler.global_stop(date_now=now, side=side)
+                    if lock and lock.until:
+                        if not PairLocks.is_global_lock(lock.until, side=lock.lock_side):
+                            result = PairLocks.lock_pair(
+                                '*', lock.until, lock.reason, now=now, side=lock.lock_side)
         return result
 
     def stop_per_pair(self, pair, now: Optional[datetime] = None,
@@ -64,12 +66,13 @@ class ProtectionManager:
         if not now:
             now = datetime.now(timezone.utc)
         result = None
-        for protection_handler in self._protection_handlers:
-            if protection_handler.has_local_stop:
-                lock = protection_handler.stop_per_pair(
-                    pair=pair, date_now=now, side=side)
-                if lock and lock.until:
-                    if not PairLocks.is_pair_locked(pair, lock.until, lock.lock_side):
-                        result = PairLocks.lock_pair(
-                            pair, lock.until, lock.reason, now=now, side=lock.lock_side)
+        with grouped_commits():
+            for protection_handler in self._protection_handlers:
+                if protection_handler.has_local_stop:
+                    lock = protection_handler.stop_per_pair(
+                        pair=pair, date_now=now, side=side)
+                    if lock and lock.until:
+                        if not PairLocks.is_pair_locked(pair, lock.until, lock.lock_side):
+                            result = PairLocks.lock_pair(
+                                pair, lock.until, lock.reason, now=now, side=lock.lock_side)
         return result
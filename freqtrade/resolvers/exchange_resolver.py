@@ -76,7 +76,7 @@ class ExchangeResolver(IResolver):
 
     @classmethod
     def search_all_objects(cls, config: Config, enum_failed: bool,
-                           recursive: bool = False) -> List[Dict[str, Any]]:
+                           recursive: bool = False, load: bool = True) -> List[Dict[str, Any]]:
         """
         Searches for valid objects
         :param config: Config object
@@ -12,6 +12,7 @@ from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 from freqtrade.constants import Config
 from freqtrade.exceptions import OperationalException
+from freqtrade.resolvers.resolver_cache import resolver_cache
 
 
 logger = logging.getLogger(__name__)
@@ -87,6 +88,7 @@ class IResolver:
                 return iter([None])
 
             module = importlib.util.module_from_spec(spec)
+            import_failed = False
             try:
                 spec.loader.exec_module(module)  # type: ignore # importlib does not use typehints
             except (AttributeError, ModuleNotFoundError, SyntaxError,
@@ -95,19 +97,44 @@ class IResolver:
                 logger.warning(f"Could not import {module_path} due to '{err}'")
                 if enum_failed:
                     return iter([None])
+                import_failed = True
+
+            # The __module__ check ensures we only use strategies that are defined in this folder.
+            valid_objects = [
+                (name, obj) for name, obj in inspect.getmembers(module, inspect.isclass)
+                if (issubclass(obj, cls.object_type)
+                    and obj is not cls.object_type
+                    and obj.__module__ == module_name)
+            ]
+            if not import_failed:
+                resolver_cache.set(module_path, cls.object_type.__name__,
+                                   {name: cls._object_details(obj) for name, obj in valid_objects})
 
             valid_objects_gen = (
-                (obj, inspect.getsource(module)) for
-                name, obj in inspect.getmembers(
-                    module, inspect.isclass) if ((object_name is None or object_name == name)
-                                                 and issubclass(obj, cls.object_type)
-                                                 and obj is not cls.object_type
-                                                 and obj.__module__ == module_name
-                                                 )
+                (obj, inspect.getsource(module)) for name, obj in valid_objects
+                if object_name is None or object_name == name
             )
-            # The __module__ check ensures we only use strategies that are defined in this folder.
             return valid_objects_gen
 
+    @classmethod
+    def _object_details(cls, obj: Any) -> Dict[str, Any]:
+        """
+        Details about a valid object, added to its search_all_objects() entry.
+        Cached with the object's name, so they must be json serializable.
+        :param obj: class of the object
+        """
+        return {}
+
+    @classmethod
+    def _cached_objects(cls, module_path: Path) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Valid objects in the module - without executing it, if it's unchanged
+        since it was last executed.
+        :param module_path: absolute path to the module
+        :return: dict of object name -> object details, None if unknown
+        """
+        return resolver_cache.get(module_path, cls.object_type.__name__)
+
     @classmethod
     def _search_object(cls, directory: Path, *, object_name: str, add_source: bool = False
                        ) -> Union[Tuple[Any, Path], Tuple[None, None]]:
@@ -127,6 +154,10 @@ class IResolver:
                 logger.debug('Ignoring broken symlink %s', entry)
                 continue
             module_path = entry.resolve()
+            cached_objects = cls._cached_objects(module_path)
+            if cached_objects is not None and object_name not in cached_objects:
+                # Don't execute modules not containing the object
+                continue
 
             obj = next(cls._get_valid_object(module_path, object_name), None)
 
@@ -190,20 +221,23 @@ class IResolver:
 
     @classmethod
     def search_all_objects(cls, config: Config, enum_failed: bool,
-                           recursive: bool = False) -> List[Dict[str, Any]]:
+                           recursive: bool = False, load: bool = True) -> List[Dict[str, Any]]:
         """
         Searches for valid objects
         :param config: Config object
         :param enum_failed: If True, will return None for modules which fail.
             Otherwise, failing modules are skipped.
         :param recursive: Recursively walk directory tree searching for strategies
-        :return: List of dicts containing 'name', 'class' and 'location' entries
+        :param load: Load the classes. If False, modules unchanged since they were last
+            executed are not executed again, and 'class' is None for their objects.
+        :return: List of dicts containing 'name', 'class' and 'location' entries,
+            and the object details (see _object_details())
         """
         result = []
 
         abs_paths = cls.build_search_paths(config, user_subdir=cls.user_subdir)
         for path in abs_paths:
-            result.extend(cls._search_all_objects(path, enum_failed, recursive))
+            result.extend(cls._search_all_objects(path, enum_failed, recursive, load=load))
         return result
 
     @classmethod
@@ -216,13 +250,14 @@ class IResolver:
     @classmethod
     def _search_all_objects(
             cls, directory: Path, enum_failed: bool, recursive: bool = False,
-            basedir: Optional[Path] = None) -> List[Dict[str, Any]]:
+            basedir: Optional[Path] = None, load: bool = True) -> List[Dict[str, Any]]:
         """
         Searches a directory for valid objects
         :param directory: Path to search
         :param enum_failed: If True, will return None for modules which fail.
             Otherwise, failing modules are skipped.
         :param recursive: Recursively walk directory tree searching for strategies
+        :param load: Load the classes - see search_all_objects()
         :return: List of dicts containing 'name', 'class' and 'location' entries
         """
         logger.debug(f"Searching for {cls.object_type.__name__} '{directory}'")
@@ -237,13 +272,22 @@ class IResolver:
                 and not entry.name.startswith('.')
             ):
                 objects.extend(cls._search_all_objects(
-                    entry, enum_failed, recursive, basedir or directory))
+                    entry, enum_failed, recursive, basedir or directory, load))
             # Only consider python files
             if entry.suffix != '.py':
                 logger.debug('Ignoring %s', entry)
                 continue
             module_path = entry.resolve()
             logger.debug(f"Path {module_path}")
+            if not load and (cached_objects := cls._cached_objects(module_path)) is not None:
+                objects.extend(
+                    {'name': name,
+                     'class': None,
+                     'location': entry,
+                     'location_rel': cls._build_rel_location(basedir or directory, entry),
+                     **details,
+                     } for name, details in cached_objects.items())
+                continue
             for obj in cls._get_valid_object(module_path, object_name=None,
                                              enum_failed=enum_failed):
                 objects.append(
@@ -251,5 +295,6 @@ class IResolver:
                      'class': obj[0] if obj is not None else None,
                      'location': entry,
                      'location_rel': cls._build_rel_location(basedir or directory, entry),
+                     **(cls._object_details(obj[0]) if obj is not None else {}),
                      })
         return objects
@@ -0,0 +1,118 @@
+"""
+Cache of the objects found in resolvable modules - so modules are only executed when needed.
+"""
+import hashlib
+import logging
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Optional
+
+import rapidjson
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = 'freqtrade_resolver.json'
+CACHE_VERSION = 2
+
+
+class ResolverCache:
+    """
+    Names of the valid objects (per object type) defined in each module, with details about
+    each object (see IResolver._object_details()).
+    Stored next to the bytecode python caches for the module (<directory>/__pycache__), and
+    keyed by the content hash of the module - changed modules are executed again.
+    Modification time and size of the module are used to avoid hashing unchanged modules.
+    Directories which are not writable are only cached in memory.
+    """
+
+    def __init__(self) -> None:
+        self._directories: Dict[Path, Dict[str, Any]] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def _cache_file(directory: Path) -> Path:
+        return directory / '__pycache__' / CACHE_FILENAME
+
+    def _modules(self, directory: Path) -> Dict[str, Any]:
+        if directory not in self._directories:
+            modules: Dict[str, Any] = {}
+            try:
+                with self._cache_file(directory).open('r') as fp:
+                    data = rapidjson.load(fp)
+                if data.get('version') == CACHE_VERSION:
+                    modules = data['modules']
+            except (OSError, ValueError, KeyError, AttributeError):
+                pass
+            self._directories[directory] = modules
+        return self._directories[directory]
+
+    def _save(self, directory: Path) -> None:
+        cache_file = self._cache_file(directory)
+        tmp_file = cache_file.with_name(f'{CACHE_FILENAME}.{os.getpid()}.tmp')
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            with tmp_file.open('w') as fp:
+                rapidjson.dump({'version': CACHE_VERSION,
+                                'modules': self._directories[directory]}, fp)
+            # Atomic replace - other processes read either the old or the new cache
+            tmp_file.replace(cache_file)
+        except OSError as e:
+            logger.debug(f"Could not write resolver cache {cache_file}: {e}")
+
+    @staticmethod
+    def _hash(module_path: Path) -> str:
+        return hashlib.sha256(module_path.read_bytes()).hexdigest()
+
+    def get(self, module_path: Path, object_type: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Valid objects in the module, if the module is unchanged since they were set.
+        :param module_path: absolute path to the module
+        :param object_type: name of the object type (e.g. IStrategy)
+        :return: dict of object name -> object details, None if unknown
+        """
+        with self._lock:
+            entry = self._modules(module_path.parent).get(module_path.name)
+            if entry is None or object_type not in entry['objects']:
+                return None
+            try:
+                stat = module_path.stat()
+                if (stat.st_mtime_ns, stat.st_size) != (entry['mtime_ns'], entry['size']):
+                    # Touched (e.g. by git checkout) - check the content
+                    if self._hash(module_path) != entry['sha256']:
+                        return None
+                    entry['mtime_ns'], entry['size'] = stat.st_mtime_ns, stat.st_size
+                    self._save(module_path.parent)
+            except OSError:
+                return None
+            return entry['objects'][object_type]
+
+    def set(self, module_path: Path, object_type: str,
+            objects: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Store the valid objects in the (just executed) module.
+        :param module_path: absolute path to the module
+        :param object_type: name of the object type (e.g. IStrategy)
+        :param objects: dict of object name -> object details (json serializable)
+        """
+        with self._lock:
+            try:
+                stat = module_path.stat()
+                sha256 = self._hash(module_path)
+            except OSError:
+                return
+            modules = self._modules(module_path.parent)
+            entry = modules.get(module_path.name)
+            if entry is None or entry['sha256'] != sha256:
+                entry = {'sha256': sha256, 'objects': {}}
+                modules[module_path.name] = entry
+            if entry['objects'].get(object_type) == objects and (
+                    entry.get('mtime_ns'), entry.get('size')) == (stat.st_mtime_ns, stat.st_size):
+                return
+            entry.update({'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size})
+            entry['objects'][object_type] = objects
+            self._save(module_path.parent)
+
+
+resolver_cache = ResolverCache()
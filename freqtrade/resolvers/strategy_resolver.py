@@ -9,7 +9,7 @@ from base64 import urlsafe_b64decode
 from inspect import getfullargspec
 from os import walk
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from freqtrade.configuration.config_validation import validate_migrated_strategy_settings
 from freqtrade.constants import REQUIRED_ORDERTIF, REQUIRED_ORDERTYPES, USERPATH_STRATEGIES, Config
@@ -32,6 +32,16 @@ class StrategyResolver(IResolver):
     initial_search_path = None
     extra_path = "strategy_path"
 
+    @classmethod
+    def _object_details(cls, obj: Any) -> Dict[str, Any]:
+        """
+        Number of hyperoptable parameters per space - so list-strategies doesn't need to
+        load unchanged strategies.
+        """
+        params = obj.detect_all_parameters()
+        return {'hyperoptable': {space: len(value) if isinstance(value, list) else value
+                                 for space, value in params.items()}}
+
     @staticmethod
     def load_strategy(config: Optional[Config] = None) -> IStrategy:
         """
@@ -327,7 +327,7 @@ def plot_config(strategy: Optional[str] = None, config=Depends(get_config),
 def list_strategies(config=Depends(get_config)):
     from freqtrade.resolvers.strategy_resolver import StrategyResolver
     strategies = StrategyResolver.search_all_objects(
-        config, False, config.get('recursive_strategy_search', False))
+        config, False, config.get('recursive_strategy_search', False), load=False)
     strategies = sorted(strategies, key=lambda x: x['name'])
 
     return {'strategies': [x['name'] for x in strategies]}
@@ -367,7 +367,7 @@ def list_exchanges(config=Depends(get_config)):
 def list_freqaimodels(config=Depends(get_config)):
     from freqtrade.resolvers.freqaimodel_resolver import FreqaiModelResolver
     models = FreqaiModelResolver.search_all_objects(
-        config, False)
+        config, False, load=False)
     models = sorted(models, key=lambda x: x['name'])
 
     return {'freqaimodels': [x['name'] for x in models]}
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark DataProvider.refresh() against the in-process exchange simulator.
+
+Refreshes the candles of N synthetic pairs for a number of rounds - the first round
+downloads the initial candles, later rounds only the latest candles (the bot loop hot path).
+
+Usage:
+    python scripts/simulator_benchmark.py --pairs 300 --rounds 10 --latency 0.05
+"""
+import argparse
+import statistics
+import time
+from typing import Any, Dict, List
+
+from freqtrade.data.dataprovider import DataProvider
+from freqtrade.enums import CandleType, RunMode
+from freqtrade.exchange import Exchange
+
+
+def benchmark_refresh(pairs: int, rounds: int, timeframe: str = '5m',
+                      simulator: Dict[str, Any] = {}) -> Dict[str, Any]:
+    """
+    :param pairs: Number of pairs to refresh
+    :param rounds: Number of refresh rounds
+    :param simulator: Exchange simulator configuration (latency, rate_limit, ...)
+    :return: Dict with the duration of every round and the simulator request stats
+    """
+    pair_list = [f'SIM{idx}/USDT' for idx in range(pairs)]
+    config = {
+        'runmode': RunMode.DRY_RUN,
+        'dry_run': True,
+        'trading_mode': 'spot',
+        'margin_mode': '',
+        'candle_type_def': CandleType.SPOT,
+        'stake_currency': 'USDT',
+        'timeframe': timeframe,
+        'exchange': {'name': 'binance', 'pair_whitelist': pair_list,
+                     'simulator': {'seed': 1, **simulator}},
+    }
+    exchange = Exchange(config, validate=False)
+    dataprovider = DataProvider(config, exchange)
+    jobs = [(pair, timeframe, CandleType.SPOT) for pair in pair_list]
+
+    durations: List[float] = []
+    try:
+        for _ in range(rounds):
+            # Refresh every round, as if a new candle was available.
+            exchange._pairs_last_refresh_time.clear()
+            start = time.perf_counter()
+            dataprovider.refresh(jobs)
+            durations.append(time.perf_counter() - start)
+    finally:
+        exchange.close()
+    return {'durations': durations, 'stats': dict(exchange._api.backend.stats)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--pairs', type=int, default=100, help='Number of pairs (default: 100).')
+    parser.add_argument('--rounds', type=int, default=5, help='Refresh rounds (default: 5).')
+    parser.add_argument('--timeframe', default='5m', help='Timeframe (default: 5m).')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='Simulated latency per request in seconds (default: 0).')
+    parser.add_argument('--rate-limit', type=int, default=50,
+                        help='Milliseconds between two requests (default: 50).')
+    parser.add_argument('--rate-limit-burst', type=int, default=10,
+                        help='Requests allowed in a burst (default: 10).')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='Probability of a request failing (default: 0).')
+    args = parser.parse_args()
+
+    result = benchmark_refresh(args.pairs, args.rounds, args.timeframe, simulator={
+        'latency': args.latency,
+        'rate_limit': args.rate_limit,
+        'rate_limit_burst': args.rate_limit_burst,
+        'error_rate': args.error_rate,
+    })
+    durations = result['durations']
+    print(f'Refreshed {args.pairs} pairs ({args.timeframe}) in {args.rounds} rounds.')
+    print(f'First round: {durations[0]:.3f}s')
+    if len(durations) > 1:
+        later = durations[1:]
+        print(f'Later rounds: mean {statistics.mean(later):.3f}s, '
+              f'median {statistics.median(later):.3f}s, max {max(later):.3f}s')
+    print('Requests: {requests}, rate limited: {rate_limited}, errors: {errors}'.format(
+        **result['stats']))
+
+
+if __name__ == '__main__':
+    main()
@@ -207,4 +207,4 @@ def doji(dataframe, exact=False):
             (dataframe["high"] - dataframe["close"]) * 0.1
         )
 
-    return result.apply(lambda x: 1 if x else 0)
+    return result.astype("int64")
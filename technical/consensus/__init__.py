@@ -1,3 +1,3 @@
-from technical.consensus.consensus import Consensus  # noqa: F401
+from technical.consensus.consensus import Consensus, evaluate_pairs  # noqa: F401
 from technical.consensus.movingaverage import MovingAverageConsensus  # noqa: F401
 from technical.consensus.oscillator import OscillatorConsensus  # noqa: F401
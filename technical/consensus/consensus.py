@@ -1,3 +1,5 @@
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import talib.abstract as ta
 
@@ -45,17 +47,46 @@ class Consensus:
 
     for example.
 
+    Indicators are computed once per consensus object - evaluating the same indicator with
+    different thresholds or prefixes (or in evaluate_rsi and evaluate_stoch_rsi) reuses the
+    result. Consensus objects evaluated on the same candles can share their results by passing
+    the same cache (see SummaryConsensus).
 
+    To evaluate many pairs in parallel, use evaluate_pairs().
     """
 
-    def __init__(self, dataframe: pd.DataFrame):
+    def __init__(self, dataframe: pd.DataFrame, cache: dict = None):
         """
         initializes the consensus object.
         :param dataframe: dataframe to evaluate
+        :param cache: indicator results of other consensus objects evaluated on the same
+            dataframe
         """
         self.dataframe = dataframe.copy()
         self.buy_weights = 0
         self.sell_weights = 0
+        self._cache = {} if cache is None else cache
+
+    def _indicator(self, key, compute):
+        """
+        helper method to compute an indicator only once for all consensus objects sharing
+        the cache
+        :param key: hashable identification of the indicator and its parameters
+        :param compute: function computing the indicator from the dataframe
+        :return:
+        """
+        if key not in self._cache:
+            self._cache[key] = compute(self.dataframe)
+        return self._cache[key]
+
+    def _ema(self, period):
+        """
+        helper method to compute the EMA of the close column, shared by all evaluations
+        using it (talib ignores a field argument - EMA is always computed on close)
+        :param period:
+        :return:
+        """
+        return self._indicator(("EMA", period, "close"), lambda df: ta.EMA(df, timeperiod=period))
 
     def _weights(self, impact_buy, impact_sell):
         """
@@ -76,14 +107,14 @@ class Consensus:
         """
         dataframe = self.dataframe
         scores = dataframe.filter(regex="^(buy|sell)_.*").fillna(0)
+        buy_scores = scores.filter(regex="^(buy)_.*")
+        sell_scores = scores.filter(regex="^(sell)_.*")
+        buy_agreement = buy_scores.sum(axis=1)
+        sell_agreement = sell_scores.sum(axis=1)
 
         # computes a score between 0 and 100. The closer to 100 the more aggrement
-        dataframe.loc[:, f"{prefix}_score_sell"] = (
-            scores.filter(regex="^(sell)_.*").sum(axis=1) / self.sell_weights * 100
-        )
-        dataframe.loc[:, f"{prefix}_score_buy"] = (
-            scores.filter(regex="^(buy)_.*").sum(axis=1) / self.buy_weights * 100
-        )
+        dataframe.loc[:, f"{prefix}_score_sell"] = sell_agreement / self.sell_weights * 100
+        dataframe.loc[:, f"{prefix}_score_buy"] = buy_agreement / self.buy_weights * 100
 
         if smooth is not None:
             dataframe[f"{prefix}_score_buy"] = (
@@ -96,12 +127,10 @@ class Consensus:
         return {
             "sell": dataframe[f"{prefix}_score_sell"],
             "buy": dataframe[f"{prefix}_score_buy"],
-            "buy_agreement": scores.filter(regex="^(buy)_.*").sum(axis=1),
-            "sell_agreement": scores.filter(regex="^(sell)_.*").sum(axis=1),
-            "buy_disagreement": scores.filter(regex="^(buy)_.*").count(axis=1)
-            - scores.filter(regex="^(buy)_.*").sum(axis=1),
-            "sell_disagreement": scores.filter(regex="^(sell)_.*").count(axis=1)
-            - scores.filter(regex="^(sell)_.*").sum(axis=1),
+            "buy_agreement": buy_agreement,
+            "sell_agreement": sell_agreement,
+            "buy_disagreement": buy_scores.count(axis=1) - buy_agreement,
+            "sell_disagreement": sell_scores.count(axis=1) - sell_agreement,
         }
 
     def evaluate_rsi(self, period=14, prefix="rsi", impact_buy=1, impact_sell=1):
@@ -116,7 +145,7 @@ class Consensus:
 
         name = f"{prefix}_{period}"
         dataframe = self.dataframe
-        dataframe[name] = ta.RSI(dataframe, timeperiod=period)
+        dataframe[name] = self._indicator(("RSI", period), lambda df: ta.RSI(df, timeperiod=period))
 
         dataframe.loc[((dataframe[name] < 30)), f"buy_{name}"] = 1 * impact_buy
 
@@ -132,7 +161,9 @@ class Consensus:
         name = f"{prefix}"
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
-        stoch_fast = ta.STOCHF(dataframe, 5, 3, 0, 3, 0)
+        stoch_fast = self._indicator(
+            ("STOCHF", 5, 3, 0, 3, 0), lambda df: ta.STOCHF(df, 5, 3, 0, 3, 0)
+        )
 
         dataframe[f"{name}_fastd"] = stoch_fast["fastd"]
         dataframe[f"{name}_fastk"] = stoch_fast["fastk"]
@@ -158,12 +189,12 @@ class Consensus:
 
         # We don't use the talib.STOCHRSI library because it seems
         # like the results are not identical to Trading View's version
-        dataframe[f"rsi_{period}"] = ta.RSI(dataframe, timeperiod=period)
-        stochrsi = (
-            dataframe[f"rsi_{period}"] - dataframe[f"rsi_{period}"].rolling(period).min()
-        ) / (
-            dataframe[f"rsi_{period}"].rolling(period).max()
-            - dataframe[f"rsi_{period}"].rolling(period).min()
+        dataframe[f"rsi_{period}"] = self._indicator(
+            ("RSI", period), lambda df: ta.RSI(df, timeperiod=period)
+        )
+        rsi_min = dataframe[f"rsi_{period}"].rolling(period).min()
+        stochrsi = (dataframe[f"rsi_{period}"] - rsi_min) / (
+            dataframe[f"rsi_{period}"].rolling(period).max() - rsi_min
         )
 
         dataframe[f"{name}_fastk"] = stochrsi.rolling(smoothk).mean() * 100
@@ -184,7 +215,7 @@ class Consensus:
 
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
-        macd = ta.MACD(dataframe)
+        macd = self._indicator(("MACD",), ta.MACD)
         dataframe["macd"] = macd["macd"]
         dataframe["macdsignal"] = macd["macdsignal"]
         dataframe["macdhist"] = macd["macdhist"]
@@ -209,7 +240,7 @@ class Consensus:
 
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
-        macd = ta.MACD(dataframe)
+        macd = self._indicator(("MACD",), ta.MACD)
         dataframe["macd"] = macd["macd"]
         dataframe["macdsignal"] = macd["macdsignal"]
         dataframe["macdhist"] = macd["macdhist"]
@@ -241,7 +272,9 @@ class Consensus:
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
         name = f"{prefix}_{field}_{period}"
-        dataframe[name] = hull_moving_average(dataframe, period, field)
+        dataframe[name] = self._indicator(
+            ("HMA", period, field), lambda df: hull_moving_average(df, period, field)
+        )
 
         dataframe.loc[((dataframe[name] > dataframe[field])), f"buy_{name}"] = 1 * impact_buy
 
@@ -260,7 +293,7 @@ class Consensus:
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
         name = f"{prefix}_{period}"
-        dataframe[name] = vwma(dataframe, period)
+        dataframe[name] = self._indicator(("VWMA", period), lambda df: vwma(df, period))
 
         dataframe.loc[((dataframe[name] > dataframe["close"])), f"buy_{name}"] = 1 * impact_buy
 
@@ -277,7 +310,9 @@ class Consensus:
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
         name = f"{prefix}_{field}_{period}"
-        dataframe[name] = ta.TEMA(dataframe, timeperiod=period, field=field)
+        dataframe[name] = self._indicator(
+            ("TEMA", period, field), lambda df: ta.TEMA(df, timeperiod=period, field=field)
+        )
 
         dataframe.loc[((dataframe[name] < dataframe[field])), f"buy_{name}"] = 1 * impact_buy
 
@@ -294,7 +329,7 @@ class Consensus:
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
         name = f"{prefix}_{field}_{period}"
-        dataframe[name] = ta.EMA(dataframe, timeperiod=period, field=field)
+        dataframe[name] = self._ema(period)
 
         dataframe.loc[((dataframe[name] < dataframe[field])), f"buy_{name}"] = 1 * impact_buy
 
@@ -311,7 +346,9 @@ class Consensus:
         self._weights(impact_buy, impact_sell)
         name = f"{prefix}_{field}_{period}"
         dataframe = self.dataframe
-        dataframe[name] = ta.SMA(dataframe, timeperiod=period, field=field)
+        dataframe[name] = self._indicator(
+            ("SMA", period, field), lambda df: ta.SMA(df, timeperiod=period, field=field)
+        )
 
         dataframe.loc[((dataframe[name] < dataframe[field])), f"buy_{name}"] = 1 * impact_buy
 
@@ -330,7 +367,7 @@ class Consensus:
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
         name = f"{prefix}"
-        dataframe[name] = laguerre(dataframe)
+        dataframe[name] = self._indicator(("LAGUERRE",), laguerre)
 
         dataframe.loc[((dataframe[name] < 0.1)), f"buy_{name}"] = 1 * impact_buy
 
@@ -349,7 +386,7 @@ class Consensus:
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
         name = f"{prefix}_{period}"
-        dataframe[name] = osc(dataframe, period)
+        dataframe[name] = self._indicator(("OSC", period), lambda df: osc(df, period))
 
         dataframe.loc[((dataframe[name] < 0.3)), f"buy_{name}"] = 1 * impact_buy
 
@@ -368,7 +405,7 @@ class Consensus:
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
         name = f"{prefix}_{period}"
-        dataframe[name] = cmf(dataframe, period)
+        dataframe[name] = self._indicator(("CMF", period), lambda df: cmf(df, period))
 
         dataframe.loc[((dataframe[name] > 0.5)), f"buy_{name}"] = 1 * impact_buy
 
@@ -388,7 +425,7 @@ class Consensus:
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
         name = f"{prefix}_{period}"
-        dataframe[name] = ta.CCI(dataframe, timeperiod=period)
+        dataframe[name] = self._indicator(("CCI", period), lambda df: ta.CCI(df, timeperiod=period))
 
         dataframe.loc[((dataframe[name] < buy_signal)), f"buy_{name}"] = 1 * impact_buy
 
@@ -458,7 +495,7 @@ class Consensus:
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
         name = f"{prefix}_{period}"
-        dataframe[name] = ta.CMO(dataframe, timeperiod=period)
+        dataframe[name] = self._indicator(("CMO", period), lambda df: ta.CMO(df, timeperiod=period))
 
         dataframe.loc[((dataframe[name] < -50)), f"buy_{name}"] = 1 * impact_buy
 
@@ -477,7 +514,7 @@ class Consensus:
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
         name = f"{prefix}"
-        ichimoku = ichimoku(dataframe)
+        ichimoku = self._indicator(("ICHIMOKU",), ichimoku)
 
         dataframe[f"{name}_tenkan_sen"] = ichimoku["tenkan_sen"]
         dataframe[f"{name}_kijun_sen"] = ichimoku["kijun_sen"]
@@ -514,7 +551,7 @@ class Consensus:
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
         name = f"{prefix}"
-        dataframe[name] = ta.ULTOSC(dataframe)
+        dataframe[name] = self._indicator(("ULTOSC",), ta.ULTOSC)
 
         dataframe.loc[((dataframe[name] < 30)), f"buy_{name}"] = 1 * impact_buy
 
@@ -533,7 +570,7 @@ class Consensus:
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
         name = f"{prefix}"
-        dataframe[name] = williams_percent(dataframe)
+        dataframe[name] = self._indicator(("WILLIAMS_R",), williams_percent)
 
         dataframe.loc[((dataframe[name] < -80)), f"buy_{name}"] = 1 * impact_buy
 
@@ -551,7 +588,7 @@ class Consensus:
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
         name = f"{prefix}_{period}"
-        dataframe[name] = ta.MOM(dataframe, timeperiod=period)
+        dataframe[name] = self._indicator(("MOM", period), lambda df: ta.MOM(df, timeperiod=period))
 
         dataframe.loc[((dataframe[name] > 100)), f"buy_{name}"] = 1 * impact_buy
 
@@ -573,13 +610,17 @@ class Consensus:
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
         name = f"{prefix}_{period}"
-        dataframe[name] = ta.ADX(dataframe, timeperiod=period)
+        dataframe[name] = self._indicator(("ADX", period), lambda df: ta.ADX(df, timeperiod=period))
 
         # We can use PLUS_DI and MINUS_DI to be able to detect if we should buy or sell
         # See https://www.investopedia.com/articles/trading/07/adx-trend-indicator.asp
         if use_di:
-            dataframe[f"{name}_plus_di"] = ta.PLUS_DI(dataframe, timeperiod=period)
-            dataframe[f"{name}_minus_di"] = ta.MINUS_DI(dataframe, timeperiod=period)
+            dataframe[f"{name}_plus_di"] = self._indicator(
+                ("PLUS_DI", period), lambda df: ta.PLUS_DI(df, timeperiod=period)
+            )
+            dataframe[f"{name}_minus_di"] = self._indicator(
+                ("MINUS_DI", period), lambda df: ta.MINUS_DI(df, timeperiod=period)
+            )
 
             dataframe.loc[
                 (
@@ -617,7 +658,7 @@ class Consensus:
         self._weights(impact_buy, impact_sell)
         dataframe = self.dataframe
         name = f"{prefix}"
-        dataframe[name] = awesome_oscillator(dataframe)
+        dataframe[name] = self._indicator(("AO",), awesome_oscillator)
 
         dataframe.loc[((dataframe[name] > (dataframe[name].shift(1) + 0.05))), f"buy_{name}"] = (
             1 * impact_buy
@@ -641,7 +682,7 @@ class Consensus:
         name = f"{prefix}_{period}"
 
         # Bears/Bulls Power is using EMA
-        dataframe[f"{name}_ema"] = ta.EMA(dataframe, timeperiod=period)
+        dataframe[f"{name}_ema"] = self._ema(period)
         dataframe[f"{name}_bulls"] = dataframe["high"] - dataframe[f"{name}_ema"]
         dataframe[f"{name}_bears"] = dataframe["low"] - dataframe[f"{name}_ema"]
 
@@ -664,3 +705,40 @@ class Consensus:
         ] = (
             1 * impact_sell
         )
+
+
+def _evaluate_pair(consensus, dataframe, score_kwargs):
+    return consensus(dataframe).score(**score_kwargs)
+
+
+def evaluate_pairs(dataframes, consensus, workers=None, **score_kwargs):
+    """
+    evaluates a consensus on the dataframes of many pairs in parallel
+    the scores are identical to calling consensus(dataframe).score() for each pair
+
+    Usage:
+
+    from technical.consensus import evaluate_pairs
+    from technical.consensus.summary import SummaryConsensus
+
+    scores = evaluate_pairs(dataframes, SummaryConsensus, smooth=3)
+
+    :param dataframes: dict of pair -> dataframe to evaluate
+    :param consensus: consensus class (or function) creating and evaluating the consensus
+        for a dataframe - must be defined on module level to be used in worker processes
+    :param workers: number of worker processes - defaults to the number of cpus,
+        1 evaluates in this process
+    :param score_kwargs: parameters for score(), like prefix and smooth
+    :return: dict of pair -> result of score()
+    """
+    if workers == 1 or len(dataframes) <= 1:
+        return {
+            pair: _evaluate_pair(consensus, dataframe, score_kwargs)
+            for pair, dataframe in dataframes.items()
+        }
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            pair: executor.submit(_evaluate_pair, consensus, dataframe, score_kwargs)
+            for pair, dataframe in dataframes.items()
+        }
+        return {pair: future.result() for pair, future in futures.items()}
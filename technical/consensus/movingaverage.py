@@ -9,8 +9,8 @@ class MovingAverageConsensus(Consensus):
     https://www.tradingview.com/symbols/BTCUSD/technicals/
     """
 
-    def __init__(self, dataframe):
-        super().__init__(dataframe)
+    def __init__(self, dataframe, cache=None):
+        super().__init__(dataframe, cache)
 
         self.evaluate_sma(period=10)
         self.evaluate_sma(period=20)
@@ -7,8 +7,8 @@ class OscillatorConsensus(Consensus):
     that buy is larger than sell line.
     """
 
-    def __init__(self, dataframe):
-        super().__init__(dataframe)
+    def __init__(self, dataframe, cache=None):
+        super().__init__(dataframe, cache)
         self.evaluate_rsi(period=14)
         self.evaluate_stoch()
         self.evaluate_cci(period=20)
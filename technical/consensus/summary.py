@@ -9,11 +9,14 @@ class SummaryConsensus(Consensus):
     and it's basically a binary operation (on/off switch), meaning it needs
     to be combined with a couple of other indicators to avoid false buys.
 
+    The nested consensus objects share their indicator results.
     """
 
-    def __init__(self, dataframe):
-        super().__init__(dataframe)
-        self.evaluate_consensus(OscillatorConsensus(dataframe), "osc", average=False)
+    def __init__(self, dataframe, cache=None):
+        super().__init__(dataframe, cache)
+        self.evaluate_consensus(OscillatorConsensus(dataframe, self._cache), "osc", average=False)
         self.evaluate_consensus(
-            MovingAverageConsensus(dataframe), "moving_average_consensus", average=False
+            MovingAverageConsensus(dataframe, self._cache),
+            "moving_average_consensus",
+            average=False,
         )
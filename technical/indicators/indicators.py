@@ -126,13 +126,13 @@ def laguerre(dataframe, gamma=0.75, smooth=1, debug=bool):
         set_option("display.max_columns", 8)
 
     """
-    Vectorised pandas or numpy calculations are not used
-    in Laguerre as L0 is self referencing.
-    Therefore we use an intertuples loop as next best option.
+    L0 to L3 are self referencing, so they are calculated in a loop over plain floats.
+    The remaining calculations are vectorised.
     """
-    lrsi_l = []
+    close = df["close"].tolist()
+    l0, l1, l2, l3 = ([0.0] * len(close) for _ in range(4))
     L0, L1, L2, L3 = 0.0, 0.0, 0.0, 0.0
-    for row in df.itertuples(index=True, name="lrsi"):
+    for i, price in enumerate(close):
         """
         Original Pine Logic  Block1
         p = close
@@ -144,41 +144,34 @@ def laguerre(dataframe, gamma=0.75, smooth=1, debug=bool):
         # Feed back loop
         L0_1, L1_1, L2_1, L3_1 = L0, L1, L2, L3
 
-        L0 = (1 - g) * row.close + g * L0_1
+        L0 = (1 - g) * price + g * L0_1
         L1 = -g * L0 + L0_1 + g * L1_1
         L2 = -g * L1 + L1_1 + g * L2_1
         L3 = -g * L2 + L2_1 + g * L3_1
+        l0[i], l1[i], l2[i], l3[i] = L0, L1, L2, L3
 
-        """ Original Pinescript Block 2
-        cu=(L0 > L1? L0 - L1: 0) + (L1 > L2? L1 - L2: 0) + (L2 > L3? L2 - L3: 0)
-        cd=(L0 < L1? L1 - L0: 0) + (L1 < L2? L2 - L1: 0) + (L2 < L3? L3 - L2: 0)
-        """
-        cu = 0.0
-        cd = 0.0
-        if L0 >= L1:
-            cu = L0 - L1
-        else:
-            cd = L1 - L0
-
-        if L1 >= L2:
-            cu = cu + L1 - L2
-        else:
-            cd = cd + L2 - L1
-
-        if L2 >= L3:
-            cu = cu + L2 - L3
-        else:
-            cd = cd + L3 - L2
-
-        """Original Pinescript  Block 3
-        lrsi=ema((cu+cd==0? -1: cu+cd)==-1? 0: (cu/(cu+cd==0? -1: cu+cd)), smooth)
-        """
-        if (cu + cd) != 0:
-            lrsi_l.append(cu / (cu + cd))
-        else:
-            lrsi_l.append(0)
+    L0, L1, L2, L3 = np.array(l0), np.array(l1), np.array(l2), np.array(l3)
+
+    """ Original Pinescript Block 2
+    cu=(L0 > L1? L0 - L1: 0) + (L1 > L2? L1 - L2: 0) + (L2 > L3? L2 - L3: 0)
+    cd=(L0 < L1? L1 - L0: 0) + (L1 < L2? L2 - L1: 0) + (L2 < L3? L3 - L2: 0)
+    """
+    cu = np.where(L0 >= L1, L0 - L1, 0.0)
+    cd = np.where(L0 >= L1, 0.0, L1 - L0)
 
-    return lrsi_l
+    cu = np.where(L1 >= L2, cu + L1 - L2, cu)
+    cd = np.where(L1 >= L2, cd, cd + L2 - L1)
+
+    cu = np.where(L2 >= L3, cu + L2 - L3, cu)
+    cd = np.where(L2 >= L3, cd, cd + L3 - L2)
+
+    """Original Pinescript  Block 3
+    lrsi=ema((cu+cd==0? -1: cu+cd)==-1? 0: (cu/(cu+cd==0? -1: cu+cd)), smooth)
+    """
+    total = cu + cd
+    lrsi_l = np.where(total != 0, cu / np.where(total != 0, total, 1.0), 0.0)
+
+    return lrsi_l.tolist()
 
 
 ########################################
@@ -320,29 +313,25 @@ def mmar(dataframe, matype="EMA", src="close", debug=False):  # noqa: C901
     : gray
     """
 
-    def leadMAc(x):
-        if (x["ma05"] - x["ma05l"]) >= 0 and (x["ma05"] > x["ma100"]):
-            # Lime: Uptrend.Long trading
-            x["leadMA"] = "lime"
-            return x["leadMA"]
-        elif (x["ma05"] - x["ma05l"]) < 0 and (x["ma05"] > x["ma100"]):
-            # Maroon : Short Reentry (sell the peak) or uptrend reversal warning
-            x["leadMA"] = "maroon"
-            return x["leadMA"]
-        elif (x["ma05"] - x["ma05l"]) <= 0 and (x["ma05"] < x["ma100"]):
-            # Red : Downtrend. Short trading
-            x["leadMA"] = "red"
-            return x["leadMA"]
-        elif (x["ma05"] - x["ma05l"]) >= 0 and (x["ma05"] < x["ma100"]):
-            # Green: Reentry(buy the dip) or downtrend reversal warning
-            x["leadMA"] = "green"
-            return x["leadMA"]
-        else:
-            # If its great it means not enough ticker data for lookback
-            x["leadMA"] = "grey"
-            return x["leadMA"]
-
-    df["leadMA"] = df.apply(leadMAc, axis=1)
+    def maColor(col):
+        change = df[col] - df[col + "l"]
+        return np.select(
+            [
+                # Lime: Uptrend.Long trading
+                (change >= 0) & (df[col] > df["ma100"]),
+                # Maroon : Short Reentry (sell the peak) or uptrend reversal warning
+                (change < 0) & (df[col] > df["ma100"]),
+                # Red : Downtrend. Short trading
+                (change <= 0) & (df[col] < df["ma100"]),
+                # Green: Reentry(buy the dip) or downtrend reversal warning
+                (change >= 0) & (df[col] < df["ma100"]),
+            ],
+            ["lime", "maroon", "red", "green"],
+            # If its grey it means not enough ticker data for lookback
+            default="grey",
+        )
+
+    df["leadMA"] = maColor("ma05")
 
     """   Logic for MAs
     : change(ma)>=0 and ma05>ma100 ? lime
@@ -351,44 +340,9 @@ def mmar(dataframe, matype="EMA", src="close", debug=False):  # noqa: C901
     : change(ma)>=0 and ma05<ma100 ? green
     : gray
     """
-
-    def maColor(x, ma):
-        col_label = "_".join([ma, "c"])
-        col_lable_l = "".join([ma, "l"])
-
-        if (x[ma] - x[col_lable_l]) >= 0 and (x[ma] > x["ma100"]):
-            # Lime: Uptrend.Long trading
-            x[col_label] = "lime"
-            return x[col_label]
-        elif (x[ma] - x[col_lable_l]) < 0 and (x[ma] > x["ma100"]):
-            # Maroon : Short Reentry (sell the peak) or uptrend reversal warning
-            x[col_label] = "maroon"
-            return x[col_label]
-
-        elif (x[ma] - x[col_lable_l]) <= 0 and (x[ma] < x["ma100"]):
-            # Red : Downtrend. Short trading
-            x[col_label] = "red"
-            return x[col_label]
-
-        elif (x[ma] - x[col_lable_l]) >= 0 and (x[ma] < x["ma100"]):
-            # Green: Reentry(buy the dip) or downtrend reversal warning
-            x[col_label] = "green"
-            return x[col_label]
-        else:
-            # If its great it means not enough ticker data for lookback
-            x[col_label] = "grey"
-            return x[col_label]
-
-    df["ma05_c"] = df.apply(maColor, ma="ma05", axis=1)
-    df["ma10_c"] = df.apply(maColor, ma="ma10", axis=1)
-    df["ma20_c"] = df.apply(maColor, ma="ma20", axis=1)
-    df["ma30_c"] = df.apply(maColor, ma="ma30", axis=1)
-    df["ma40_c"] = df.apply(maColor, ma="ma40", axis=1)
-    df["ma50_c"] = df.apply(maColor, ma="ma50", axis=1)
-    df["ma60_c"] = df.apply(maColor, ma="ma60", axis=1)
-    df["ma70_c"] = df.apply(maColor, ma="ma70", axis=1)
-    df["ma80_c"] = df.apply(maColor, ma="ma80", axis=1)
-    df["ma90_c"] = df.apply(maColor, ma="ma90", axis=1)
+    for ma_col in ("ma05", "ma10", "ma20", "ma30", "ma40", "ma50", "ma60", "ma70", "ma80",
+                   "ma90"):
+        df[ma_col + "_c"] = maColor(ma_col)
 
     if debug:
         from pandas import set_option
@@ -531,41 +485,17 @@ def madrid_sqz(datafame, length=34, src="close", ref=13, sqzLen=5):
 
     # print(df[['sqz_cma', 'sqz_rma', 'sqz_sma']])
 
-    def sqz_cma_c(x):
-        if x["sqz_cma"] >= 0:
-            x["sqz_cma_c"] = "aqua"
-            return x["sqz_cma_c"]
-        else:
-            x["sqz_cma_c"] = "fuchsia"
-            return x["sqz_cma_c"]
-
-    df["sqz_cma_c"] = df.apply(sqz_cma_c, axis=1)
-
-    def sqz_sma_c(x):
-        if x["sqz_sma"] >= 0:
-            x["sqz_sma_c"] = "lime"
-            return x["sqz_sma_c"]
-        else:
-            x["sqz_sma_c"] = "red"
-            return x["sqz_sma_c"]
-
-    df["sqz_sma_c"] = df.apply(sqz_sma_c, axis=1)
-
-    def sqz_rma_c(x):
-        if x["sqz_rma"] >= 0 and x["sqz_cma"] < x["sqz_rma"]:
-            x["sqz_rma_c"] = "yellow"
-            return x["sqz_rma_c"]
-        elif x["sqz_rma"] < 0 and x["sqz_cma"] > x["sqz_rma"]:
-            x["sqz_rma_c"] = "yellow"
-            return x["sqz_rma_c"]
-        elif x["sqz_rma"] >= 0:
-            x["sqz_rma_c"] = "green"
-            return x["sqz_rma_c"]
-        else:
-            x["sqz_rma_c"] = "maroon"
-            return x["sqz_rma_c"]
-
-    df["sqz_rma_c"] = df.apply(sqz_rma_c, axis=1)
+    df["sqz_cma_c"] = np.where(df["sqz_cma"] >= 0, "aqua", "fuchsia")
+    df["sqz_sma_c"] = np.where(df["sqz_sma"] >= 0, "lime", "red")
+    df["sqz_rma_c"] = np.select(
+        [
+            (df["sqz_rma"] >= 0) & (df["sqz_cma"] < df["sqz_rma"]),
+            (df["sqz_rma"] < 0) & (df["sqz_cma"] > df["sqz_rma"]),
+            df["sqz_rma"] >= 0,
+        ],
+        ["yellow", "yellow", "green"],
+        default="maroon",
+    )
 
     # print(df[['sqz_cma_c', 'sqz_rma_c', 'sqz_sma_c']])
     return df["sqz_cma_c"], df["sqz_rma_c"], df["sqz_sma_c"]
@@ -686,16 +616,9 @@ def vfi(dataframe, length=130, coef=0.2, vcoef=2.5, signalLength=5, smoothVFI=Fa
     df["vc"] = where((df["volume"] < df["vmax"]), df["volume"], df["vmax"])
     df["mf"] = df["hlc"] - df["hlc"].shift(+1)
 
-    # more logic for vcp, so create a def and df.apply it
-    def vcp(x):
-        if x["mf"] > x["cutoff"]:
-            return x["vc"]
-        elif x["mf"] < -(x["cutoff"]):
-            return -(x["vc"])
-        else:
-            return 0
-
-    df["vcp"] = df.apply(vcp, axis=1)
+    df["vcp"] = np.select(
+        [df["mf"] > df["cutoff"], df["mf"] < -(df["cutoff"])], [df["vc"], -(df["vc"])], default=0
+    )
     # vfi has a smooth option passed over def call, sma if set
     df["vfi"] = (df["vcp"].rolling(length).sum()) / df["vave"]
     if smoothVFI is True:
@@ -860,8 +783,8 @@ def td_sequential(dataframe):
     df["tds_b"] = df.groupby(df["cond_tds_b"]).cumcount()
 
     df["tdc"] = df["tds_a"] - df["tdb_a"]
-    df["tdc"] = df.apply((lambda x: x["tdb_b"] % 9 if x["tdb_b"] > 9 else x["tdc"]), axis=1)
-    df["tdc"] = df.apply((lambda x: (x["tds_b"] % 9) * -1 if x["tds_b"] > 9 else x["tdc"]), axis=1)
+    df["tdc"] = np.where(df["tdb_b"] > 9, df["tdb_b"] % 9, df["tdc"])
+    df["tdc"] = np.where(df["tds_b"] > 9, (df["tds_b"] % 9) * -1, df["tdc"])
 
     return DataFrame(index=df.index, data={"TD_count": df["tdc"]})
 
@@ -1006,12 +929,13 @@ def VIDYA(dataframe, length=9, select=True):
     cols = ["momm", "m1", "m2", "sm1", "sm2", "chandeMO", "k"]
     df.loc[:, cols] = df.loc[:, cols].fillna(0.0)
 
-    df["VIDYA"] = 0.0
+    # Recursive with a varying factor - loop over plain floats.
+    k = df["k"].tolist()
+    close = df["close"].tolist()
+    vidya = [0.0] * len(df)
     for i in range(length, len(df)):
-        df["VIDYA"].iat[i] = (
-            alpha * df["k"].iat[i] * df["close"].iat[i]
-            + (1 - alpha * df["k"].iat[i]) * df["VIDYA"].iat[i - 1]
-        )
+        vidya[i] = alpha * k[i] * close[i] + (1 - alpha * k[i]) * vidya[i - 1]
+    df["VIDYA"] = vidya
 
     return df["VIDYA"]
 
@@ -1088,7 +1012,7 @@ def SSLChannels(dataframe, length=10, mode="sma"):
         df["smaLow"] = df["low"].rolling(length).mean()
 
     df["hlv"] = np.where(
-        df["close"] > df["smaHigh"], 1, np.where(df["close"] < df["smaLow"], -1, np.NAN)
+        df["close"] > df["smaHigh"], 1, np.where(df["close"] < df["smaLow"], -1, np.nan)
     )
     df["hlv"] = df["hlv"].ffill()
 
@@ -1156,60 +1080,41 @@ def PMAX(dataframe, period=10, multiplier=3, length=12, MAtype=1, src=1):  # noq
     elif MAtype == 8:
         df[mavalue] = vwma(df, length)
     # Compute basic upper and lower bands
-    df["basic_ub"] = df[mavalue] + (multiplier * df[atr])
-    df["basic_lb"] = df[mavalue] - (multiplier * df[atr])
-    # Compute final upper and lower bands
-    df["final_ub"] = 0.00
-    df["final_lb"] = 0.00
+    basic_ub = (df[mavalue] + (multiplier * df[atr])).tolist()
+    basic_lb = (df[mavalue] - (multiplier * df[atr])).tolist()
+    ma = df[mavalue].tolist()
+    # Compute final upper and lower bands, and the Pmax value.
+    # Both depend on their previous values - loop over plain floats.
+    final_ub = [0.00] * len(df)
+    final_lb = [0.00] * len(df)
+    pm_values = [0.00] * len(df)
     for i in range(period, len(df)):
-        df["final_ub"].iat[i] = (
-            df["basic_ub"].iat[i]
-            if (
-                df["basic_ub"].iat[i] < df["final_ub"].iat[i - 1]
-                or df[mavalue].iat[i - 1] > df["final_ub"].iat[i - 1]
-            )
-            else df["final_ub"].iat[i - 1]
+        final_ub[i] = (
+            basic_ub[i]
+            if basic_ub[i] < final_ub[i - 1] or ma[i - 1] > final_ub[i - 1]
+            else final_ub[i - 1]
         )
-        df["final_lb"].iat[i] = (
-            df["basic_lb"].iat[i]
-            if (
-                df["basic_lb"].iat[i] > df["final_lb"].iat[i - 1]
-                or df[mavalue].iat[i - 1] < df["final_lb"].iat[i - 1]
-            )
-            else df["final_lb"].iat[i - 1]
+        final_lb[i] = (
+            basic_lb[i]
+            if basic_lb[i] > final_lb[i - 1] or ma[i - 1] < final_lb[i - 1]
+            else final_lb[i - 1]
         )
-
-    # Set the Pmax value
-    df[pm] = 0.00
-    for i in range(period, len(df)):
-        df[pm].iat[i] = (
-            df["final_ub"].iat[i]
-            if (
-                df[pm].iat[i - 1] == df["final_ub"].iat[i - 1]
-                and df[mavalue].iat[i] <= df["final_ub"].iat[i]
-            )
-            else df["final_lb"].iat[i]
-            if (
-                df[pm].iat[i - 1] == df["final_ub"].iat[i - 1]
-                and df[mavalue].iat[i] > df["final_ub"].iat[i]
-            )
-            else df["final_lb"].iat[i]
-            if (
-                df[pm].iat[i - 1] == df["final_lb"].iat[i - 1]
-                and df[mavalue].iat[i] >= df["final_lb"].iat[i]
-            )
-            else df["final_ub"].iat[i]
-            if (
-                df[pm].iat[i - 1] == df["final_lb"].iat[i - 1]
-                and df[mavalue].iat[i] < df["final_lb"].iat[i]
-            )
+        pm_values[i] = (
+            final_ub[i]
+            if pm_values[i - 1] == final_ub[i - 1] and ma[i] <= final_ub[i]
+            else final_lb[i]
+            if pm_values[i - 1] == final_ub[i - 1] and ma[i] > final_ub[i]
+            else final_lb[i]
+            if pm_values[i - 1] == final_lb[i - 1] and ma[i] >= final_lb[i]
+            else final_ub[i]
+            if pm_values[i - 1] == final_lb[i - 1] and ma[i] < final_lb[i]
             else 0.00
         )
+    df[pm] = pm_values
 
     # Mark the trend direction up/down
-    df[pmx] = np.where((df[pm] > 0.00), np.where((df[mavalue] < df[pm]), "down", "up"), np.NaN)
-    # Remove basic and final bands from the columns
-    df.drop(["basic_ub", "basic_lb", "final_ub", "final_lb"], inplace=True, axis=1)
+    # (numpy < 2 converted the NaN default to the string "nan" - numpy 2 raises instead)
+    df[pmx] = np.where((df[pm] > 0.00), np.where((df[mavalue] < df[pm]), "down", "up"), "nan")
 
     cols = [pm, pmx, atr, mavalue]
     df.loc[:, cols] = df.loc[:, cols].fillna(0.0)
@@ -1217,6 +1122,21 @@ def PMAX(dataframe, period=10, multiplier=3, length=12, MAtype=1, src=1):  # noq
     return df
 
 
+def _tv_wma(series: Series, length: int) -> Series:
+    """
+    Weighted sum of the previous length - 2 values, as a single convolution.
+    """
+    weights = [(length - i) * length for i in range(1, length - 1)]
+    # Empty weights divide by zero - as the shift based calculation did.
+    norm = sum(weights)
+    values = series.to_numpy(dtype=float)
+    result = np.full(len(values), np.nan)
+    if weights and len(values) > len(weights):
+        # weights[j] applies to the value j + 1 candles ago
+        result[len(weights):] = np.convolve(values, weights)[len(weights) - 1:len(values) - 1]
+    return Series(result, index=series.index) / norm
+
+
 def tv_wma(dataframe: DataFrame, length: int = 9, field="close") -> DataFrame:
     """
     Source: Tradingview "Moving Average Weighted"
@@ -1231,15 +1151,7 @@ def tv_wma(dataframe: DataFrame, length: int = 9, field="close") -> DataFrame:
         dataframe : Pandas DataFrame with new columns 'tv_wma'
     """
 
-    norm = 0
-    sum = 0
-
-    for i in range(1, length - 1):
-        weight = (length - i) * length
-        norm = norm + weight
-        sum = sum + dataframe[field].shift(i) * weight
-
-    dataframe["tv_wma"] = sum / norm
+    dataframe["tv_wma"] = _tv_wma(dataframe[field], length)
     return dataframe
 
 
@@ -1257,11 +1169,7 @@ def tv_hma(dataframe: DataFrame, length: int = 9, field="close") -> DataFrame:
         dataframe : Pandas DataFrame with new columns 'tv_hma'
     """
 
-    dataframe["h"] = 2 * tv_wma(dataframe, math.floor(length / 2), field) - tv_wma(
-        dataframe, length, field=field
-    )
-
-    dataframe["tv_hma"] = tv_wma(dataframe, math.floor(math.sqrt(length)), field="h")
-    dataframe.drop("h", inplace=True, axis=1)
+    h = 2 * _tv_wma(dataframe[field], math.floor(length / 2)) - _tv_wma(dataframe[field], length)
+    dataframe["tv_hma"] = _tv_wma(h, math.floor(math.sqrt(length)))
 
     return dataframe
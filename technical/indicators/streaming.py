@@ -0,0 +1,513 @@
+"""
+Streaming (incremental) indicators
+
+Stateful versions of common indicators for live trading: seeded once from history,
+then updated in O(1) per candle instead of recalculating the whole dataframe.
+
+Usage:
+    rsi = StreamingRSI(14).seed(dataframe)
+    # New candle
+    value = rsi.update(candle)
+    # The last candle changed (e.g. the still forming candle was refreshed)
+    value = rsi.update(candle, new=False)
+
+candle is any mapping containing the required fields (a dict, or a dataframe row).
+After seeding, .value holds the value of the last candle - it matches the last value of
+the batch implementation within floating point tolerance.
+"""
+import math
+from collections import deque
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple
+
+from pandas import DataFrame
+
+
+_NAN = float("nan")
+
+
+########################################
+#
+# Rolling window primitives
+#
+class _RollingWindow:
+    """
+    Mean / standard deviation of the last `window` values.
+    Matches pandas rolling(window) (with min_periods=window): NaN until `window` values are
+    available, and while the window contains NaN.
+    Uses Welford's online mean / variance updates - pandas uses Kahan compensated sums for
+    the rolling mean, so results match within floating point tolerance only.
+    """
+
+    __slots__ = ("window", "_values", "_nans", "_n", "_mean", "_ssqdm", "_undo")
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self._values: Deque[float] = deque()
+        self._nans = 0
+        self._n = 0
+        self._mean = 0.0
+        self._ssqdm = 0.0
+        self._undo: Optional[Tuple] = None
+
+    def _add(self, x: float) -> None:
+        if x != x:
+            self._nans += 1
+            return
+        self._n += 1
+        delta = x - self._mean
+        self._mean += delta / self._n
+        self._ssqdm += delta * (x - self._mean)
+
+    def _remove(self, x: float) -> None:
+        if x != x:
+            self._nans -= 1
+            return
+        self._n -= 1
+        if self._n == 0:
+            self._mean = 0.0
+            self._ssqdm = 0.0
+            return
+        delta = x - self._mean
+        self._mean -= delta / self._n
+        self._ssqdm -= delta * (x - self._mean)
+
+    def push(self, x: float) -> None:
+        undo: Tuple = (self._nans, self._n, self._mean, self._ssqdm)
+        self._values.append(x)
+        self._add(x)
+        if len(self._values) > self.window:
+            evicted = self._values.popleft()
+            self._remove(evicted)
+            undo += (True, evicted)
+        else:
+            undo += (False, None)
+        self._undo = undo
+
+    def undo(self) -> None:
+        """
+        Revert the last push().
+        """
+        self._nans, self._n, self._mean, self._ssqdm, evicted, value = self._undo
+        self._values.pop()
+        if evicted:
+            self._values.appendleft(value)
+
+    @property
+    def ready(self) -> bool:
+        return len(self._values) == self.window and self._nans == 0
+
+    def mean(self) -> float:
+        return self._mean if self.ready else _NAN
+
+    def sum(self) -> float:
+        return self._mean * self._n if self.ready else _NAN
+
+    def std(self, ddof: int = 1) -> float:
+        if not self.ready or self._n <= ddof:
+            return _NAN
+        return math.sqrt(max(self._ssqdm / (self._n - ddof), 0.0))
+
+
+class _RollingExtreme:
+    """
+    Maximum (or minimum) of the last `window` values, using a monotonic queue.
+    Matches pandas rolling(window).max() / .min() (with min_periods=window).
+    """
+
+    __slots__ = ("window", "_sign", "_count", "_raw", "_nans", "_candidates", "_undo")
+
+    def __init__(self, window: int, maximum: bool = True) -> None:
+        self.window = window
+        self._sign = 1.0 if maximum else -1.0
+        self._count = 0
+        self._raw: Deque[float] = deque()
+        self._nans = 0
+        # (index, value) - values decreasing (maximum) / increasing (minimum)
+        self._candidates: Deque[Tuple[int, float]] = deque()
+        self._undo: Optional[Tuple] = None
+
+    def push(self, x: float) -> None:
+        idx = self._count
+        self._count += 1
+        self._raw.append(x)
+        evicted_raw: Tuple = ()
+        if len(self._raw) > self.window:
+            evicted_raw = (self._raw.popleft(),)
+            if evicted_raw[0] != evicted_raw[0]:
+                self._nans -= 1
+        popped: List[Tuple[int, float]] = []
+        if x != x:
+            self._nans += 1
+        else:
+            while self._candidates and self._candidates[-1][1] * self._sign <= x * self._sign:
+                popped.append(self._candidates.pop())
+            self._candidates.append((idx, x))
+        evicted: Tuple = ()
+        if self._candidates and self._candidates[0][0] <= idx - self.window:
+            evicted = (self._candidates.popleft(),)
+        self._undo = (x != x, popped, evicted, evicted_raw)
+
+    def undo(self) -> None:
+        """
+        Revert the last push().
+        """
+        was_nan, popped, evicted, evicted_raw = self._undo
+        self._count -= 1
+        self._raw.pop()
+        if evicted_raw:
+            self._raw.appendleft(evicted_raw[0])
+            if evicted_raw[0] != evicted_raw[0]:
+                self._nans += 1
+        if was_nan:
+            self._nans -= 1
+        else:
+            self._candidates.pop()
+            self._candidates.extend(reversed(popped))
+        if evicted:
+            self._candidates.appendleft(evicted[0])
+
+    def value(self) -> float:
+        if len(self._raw) < self.window or self._nans or not self._candidates:
+            return _NAN
+        return self._candidates[0][1]
+
+
+########################################
+#
+# Streaming indicators
+#
+class StreamingIndicator:
+    """
+    Base class of streaming indicators.
+    Subclasses define the candle fields they use, _push() to process one candle and
+    _undo() to revert the last _push().
+    """
+
+    fields: Tuple[str, ...] = ("close",)
+
+    def __init__(self) -> None:
+        self.value: Any = _NAN
+        self._pushed = 0
+
+    def seed(self, dataframe: DataFrame) -> "StreamingIndicator":
+        """
+        Process all candles of dataframe.
+        """
+        for values in zip(*(dataframe[field].tolist() for field in self.fields)):
+            self.value = self._push(*values)
+            self._pushed += 1
+        return self
+
+    def update(self, candle: Mapping[str, Any], new: bool = True) -> Any:
+        """
+        Process one candle.
+        :param candle: Mapping containing the candle fields
+        :param new: True for a new candle, False if the last candle changed
+        :return: Indicator value of this candle
+        """
+        if not new and self._pushed:
+            self._undo()
+            self._pushed -= 1
+        self.value = self._push(*(float(candle[field]) for field in self.fields))
+        self._pushed += 1
+        return self.value
+
+    def _push(self, *values: float) -> Any:
+        raise NotImplementedError()
+
+    def _undo(self) -> None:
+        raise NotImplementedError()
+
+
+class StreamingSMA(StreamingIndicator):
+    """
+    Simple moving average - as sma() / qtpylib.sma() / rolling(period).mean()
+    """
+
+    def __init__(self, period: int, field: str = "close") -> None:
+        super().__init__()
+        self.fields = (field,)
+        self._window = _RollingWindow(period)
+
+    def _push(self, x: float) -> float:
+        self._window.push(x)
+        return self._window.mean()
+
+    def _undo(self) -> None:
+        self._window.undo()
+
+
+class StreamingEMA(StreamingIndicator):
+    """
+    Exponential moving average - as ema() (TA-Lib EMA): seeded with the SMA of the first
+    `period` values, leading NaNs are skipped.
+    """
+
+    def __init__(self, period: int, field: str = "close") -> None:
+        super().__init__()
+        self.fields = (field,)
+        self.period = period
+        self._k = 2.0 / (period + 1)
+        self._count = 0
+        self._total = 0.0
+        self._ema = _NAN
+        self._undo_state: Tuple = ()
+
+    def _push(self, x: float) -> float:
+        self._undo_state = (self._count, self._total, self._ema)
+        if self._count == 0 and x != x:
+            # Leading NaNs are skipped
+            return _NAN
+        self._count += 1
+        if self._count < self.period:
+            self._total += x
+            return _NAN
+        if self._count == self.period:
+            self._ema = (self._total + x) / self.period
+        else:
+            self._ema = (x - self._ema) * self._k + self._ema
+        return self._ema
+
+    def _undo(self) -> None:
+        self._count, self._total, self._ema = self._undo_state
+
+
+class StreamingBollingerBands(StreamingIndicator):
+    """
+    Bollinger bands - as bollinger_bands() (population standard deviation).
+    Value: dict with lower, middle and upper band.
+    """
+
+    def __init__(self, period: int = 21, stdv: float = 2, field: str = "close") -> None:
+        super().__init__()
+        self.fields = (field,)
+        self.stdv = stdv
+        self._window = _RollingWindow(period)
+
+    def _push(self, x: float) -> Dict[str, float]:
+        self._window.push(x)
+        mean = self._window.mean()
+        std = self._window.std(ddof=0)
+        return {"lower": mean - std * self.stdv, "middle": mean, "upper": mean + std * self.stdv}
+
+    def _undo(self) -> None:
+        self._window.undo()
+
+
+class StreamingVWMA(StreamingIndicator):
+    """
+    Volume weighted moving average - as vwma()
+    """
+
+    def __init__(self, window: int, price: str = "close") -> None:
+        super().__init__()
+        self.fields = (price, "volume")
+        self._price_volume = _RollingWindow(window)
+        self._volume = _RollingWindow(window)
+
+    def _push(self, price: float, volume: float) -> float:
+        self._price_volume.push(price * volume)
+        self._volume.push(volume)
+        volume_sum = self._volume.sum()
+        return self._price_volume.sum() / volume_sum if volume_sum else _NAN
+
+    def _undo(self) -> None:
+        self._price_volume.undo()
+        self._volume.undo()
+
+
+class StreamingATR(StreamingIndicator):
+    """
+    Average true range - as atr() (qtpylib).
+    Simple moving average of the true range, or its exponentially weighted mean
+    (span=window) if exp is set.
+    """
+
+    fields = ("high", "low", "close")
+
+    def __init__(self, window: int = 14, exp: bool = False) -> None:
+        super().__init__()
+        self.exp = exp
+        self._window = _RollingWindow(window)
+        self._min_periods = window
+        self._decay = 1 - 2.0 / (window + 1)
+        self._prev_close = _NAN
+        self._count = 0
+        self._ewm_num = 0.0
+        self._ewm_den = 0.0
+        self._undo_state: Tuple = ()
+
+    def _push(self, high: float, low: float, close: float) -> float:
+        self._undo_state = (self._prev_close, self._count, self._ewm_num, self._ewm_den)
+        # Missing values are skipped, as DataFrame.max(axis=1) does.
+        ranges = [r for r in (high - low, abs(high - self._prev_close),
+                              abs(low - self._prev_close)) if r == r]
+        tr = max(ranges) if ranges else _NAN
+        self._prev_close = close
+        if not self.exp:
+            self._window.push(tr)
+            return self._window.mean()
+
+        # Adjusted exponentially weighted mean, as pandas ewm(span=window).mean()
+        self._ewm_num *= self._decay
+        self._ewm_den *= self._decay
+        if tr == tr:
+            self._count += 1
+            self._ewm_num += tr
+            self._ewm_den += 1.0
+        if self._count < self._min_periods or not self._ewm_den:
+            return _NAN
+        return self._ewm_num / self._ewm_den
+
+    def _undo(self) -> None:
+        self._prev_close, self._count, self._ewm_num, self._ewm_den = self._undo_state
+        if not self.exp:
+            self._window.undo()
+
+
+class StreamingRSI(StreamingIndicator):
+    """
+    Relative strength index - as rsi() (qtpylib), using wilder smoothing.
+    The batch version seeds the averages with the first window + 1 price changes, so values
+    are available from the candle after that (NaN before).
+    """
+
+    def __init__(self, window: int = 14, field: str = "close") -> None:
+        super().__init__()
+        self.fields = (field,)
+        self.window = window
+        self._closes: List[float] = []
+        self._ups = _NAN
+        self._downs = _NAN
+        self._undo_state: Tuple = ()
+
+    def _rsi(self) -> float:
+        try:
+            return 100. - 100. / (1. + self._ups / self._downs)
+        except ZeroDivisionError:
+            return 100. if self._ups else _NAN
+
+    def _wilder(self, delta: float) -> None:
+        if delta > 0:
+            upval, downval = delta, 0.0
+        else:
+            upval, downval = 0.0, -delta
+        self._ups = (self._ups * (self.window - 1) + upval) / self.window
+        self._downs = (self._downs * (self.window - 1.) + downval) / self.window
+
+    def _push(self, close: float) -> float:
+        seeding = len(self._closes) <= self.window + 1
+        self._undo_state = (self._ups, self._downs, seeding, self._closes[-1:])
+        if seeding:
+            self._closes.append(close)
+            if len(self._closes) < self.window + 2:
+                return _NAN
+            # Seed as the batch version does, then replay the changes since.
+            deltas = [b - a for a, b in zip(self._closes, self._closes[1:])]
+            self._ups = sum(d for d in deltas if d > 0) / self.window
+            self._downs = -sum(d for d in deltas if d < 0) / self.window
+            for delta in deltas[self.window - 1:]:
+                self._wilder(delta)
+        else:
+            self._wilder(close - self._closes[-1])
+            self._closes[-1] = close
+        return self._rsi()
+
+    def _undo(self) -> None:
+        self._ups, self._downs, seeding, last_close = self._undo_state
+        if seeding:
+            self._closes.pop()
+        else:
+            self._closes[-1:] = last_close
+
+
+class StreamingSSLChannels(StreamingIndicator):
+    """
+    SSL Channels - as SSLChannels().
+    Value: dict with sslDown and sslUp.
+    """
+
+    fields = ("high", "low", "close")
+
+    def __init__(self, length: int = 10) -> None:
+        super().__init__()
+        self._high = _RollingWindow(length)
+        self._low = _RollingWindow(length)
+        self._hlv = _NAN
+        self._undo_state = _NAN
+
+    def _push(self, high: float, low: float, close: float) -> Dict[str, float]:
+        self._undo_state = self._hlv
+        self._high.push(high)
+        self._low.push(low)
+        sma_high = self._high.mean()
+        sma_low = self._low.mean()
+        if close > sma_high:
+            self._hlv = 1.0
+        elif close < sma_low:
+            self._hlv = -1.0
+        if self._hlv < 0:
+            return {"sslDown": sma_high, "sslUp": sma_low}
+        return {"sslDown": sma_low, "sslUp": sma_high}
+
+    def _undo(self) -> None:
+        self._hlv = self._undo_state
+        self._high.undo()
+        self._low.undo()
+
+
+class StreamingIchimoku(StreamingIndicator):
+    """
+    Ichimoku cloud - as ichimoku().
+    Value: dict with the keys of ichimoku(), except chikou_span, which looks into the future.
+    """
+
+    fields = ("high", "low")
+
+    def __init__(self, conversion_line_period: int = 9, base_line_periods: int = 26,
+                 laggin_span: int = 52, displacement: int = 26) -> None:
+        super().__init__()
+        self._extremes = [
+            (_RollingExtreme(period, True), _RollingExtreme(period, False))
+            for period in (conversion_line_period, base_line_periods, laggin_span)
+        ]
+        # Leading spans of the last displacement candles
+        self._leading: Deque[Tuple[float, float]] = deque(maxlen=max(displacement, 1))
+        self._displacement = displacement
+        self._undo_state: Optional[Tuple[float, float]] = None
+
+    def _push(self, high: float, low: float) -> Dict[str, Any]:
+        midpoints = []
+        for highest, lowest in self._extremes:
+            highest.push(high)
+            lowest.push(low)
+            midpoints.append((highest.value() + lowest.value()) / 2)
+        tenkan_sen, kijun_sen, leading_senkou_span_b = midpoints
+        leading_senkou_span_a = (tenkan_sen + kijun_sen) / 2
+
+        full = len(self._leading) == self._leading.maxlen
+        self._undo_state = self._leading[0] if full else None
+        self._leading.append((leading_senkou_span_a, leading_senkou_span_b))
+        # Shifted by displacement - 1 candles
+        if len(self._leading) == self._displacement:
+            senkou_span_a, senkou_span_b = self._leading[0]
+        else:
+            senkou_span_a = senkou_span_b = _NAN
+        return {
+            "tenkan_sen": tenkan_sen,
+            "kijun_sen": kijun_sen,
+            "senkou_span_a": senkou_span_a,
+            "senkou_span_b": senkou_span_b,
+            "leading_senkou_span_a": leading_senkou_span_a,
+            "leading_senkou_span_b": leading_senkou_span_b,
+            "cloud_green": senkou_span_a > senkou_span_b,
+            "cloud_red": senkou_span_b > senkou_span_a,
+        }
+
+    def _undo(self) -> None:
+        for highest, lowest in self._extremes:
+            highest.undo()
+            lowest.undo()
+        self._leading.pop()
+        if self._undo_state is not None:
+            self._leading.appendleft(self._undo_state)
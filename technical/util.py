@@ -1,7 +1,11 @@
 """
     defines utility functions to be used
 """
-from pandas import DataFrame, DatetimeIndex, merge, to_datetime, to_timedelta
+from threading import Lock
+
+import numpy as np
+from pandas import DataFrame, DatetimeIndex, RangeIndex, concat, merge, to_datetime, to_timedelta
+from pandas.api.types import is_datetime64_any_dtype
 
 TICKER_INTERVAL_MINUTES = {
     "1m": 1,
@@ -18,6 +22,13 @@ TICKER_INTERVAL_MINUTES = {
     "1w": 10080,
 }
 
+OHLC_DICT = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+
+# (cache_key, interval) -> (candle dates, candle values, bin origin, resampled dataframe)
+_resample_cache = {}
+_resample_cache_lock = Lock()
+_RESAMPLE_CACHE_SIZE = 1024
+
 
 def ticker_history_to_dataframe(ticker: list) -> DataFrame:
     """
@@ -45,27 +56,104 @@ def ticker_history_to_dataframe(ticker: list) -> DataFrame:
     return frame
 
 
-def resample_to_interval(dataframe: DataFrame, interval):
+def _resample(dataframe: DataFrame, interval: int, origin="start_day") -> DataFrame:
+    df = dataframe.set_index(DatetimeIndex(dataframe["date"]))
+    # Resample to "left" border as dates are candle open dates
+    df = df.resample(str(interval) + "min", label="left", origin=origin).agg(OHLC_DICT).dropna()
+    df.reset_index(inplace=True)
+
+    return df
+
+
+def resample_to_interval(dataframe: DataFrame, interval, cache_key=None):
     """
     Resamples the given dataframe to the desired interval.
     Please be aware you need to use resampled_merge to merge to another dataframe to
     avoid lookahead bias
 
+    With a cache_key (e.g. the pair), the result is kept and reused on the next call with
+    the same key and interval: only the first resampled candle and the resampled candles
+    from the first new or changed candle onwards are computed again.
+    The result is identical to resampling without cache.
+
     :param dataframe: dataframe containing close/high/low/open/volume
     :param interval: to which ticker value in minutes would you like to resample it
+    :param cache_key: identifies the candles across calls (e.g. the pair)
     :return:
     """
     if isinstance(interval, str):
         interval = TICKER_INTERVAL_MINUTES[interval]
 
-    df = dataframe.copy()
-    df = df.set_index(DatetimeIndex(df["date"]))
-    ohlc_dict = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
-    # Resample to "left" border as dates are candle open dates
-    df = df.resample(str(interval) + "min", label="left").agg(ohlc_dict).dropna()
-    df.reset_index(inplace=True)
-
-    return df
+    if (
+        cache_key is None
+        or dataframe.empty
+        or not is_datetime64_any_dtype(dataframe["date"])
+        # Bins are computed on UTC timestamps
+        or str(dataframe["date"].dt.tz) not in ("None", "UTC")
+    ):
+        return _resample(dataframe, interval)
+
+    dates = dataframe["date"].values.astype("datetime64[ns]").view(np.int64)
+    if len(dates) > 1 and not (np.diff(dates) > 0).all():
+        return _resample(dataframe, interval)
+    values = dataframe[list(OHLC_DICT)].to_numpy(dtype=np.float64)
+
+    # Same bins as resampling with origin "start_day"
+    origin = DatetimeIndex(dataframe["date"].iloc[:1])[0].normalize()
+    interval_ns = interval * 60 * 10**9
+
+    def bin_start(date: int) -> int:
+        return date - (date - origin.value) % interval_ns
+
+    with _resample_cache_lock:
+        cached = _resample_cache.get((cache_key, interval))
+
+    result = None
+    if (
+        cached is not None
+        and (origin.value - cached[2]) % interval_ns == 0
+        # Same date dtype (timezone) - the cached candles are reused as they are
+        and cached[3]["date"].dtype == dataframe["date"].dtype
+    ):
+        cached_dates, cached_values, _, cached_result = cached
+        offset = int(np.searchsorted(cached_dates, dates[0]))
+        overlap = min(len(cached_dates) - offset, len(dates))
+        if overlap > 0:
+            unchanged = (cached_dates[offset : offset + overlap] == dates[:overlap]) & (
+                cached_values[offset : offset + overlap] == values[:overlap]
+            ).all(axis=1)
+            first_change = overlap if unchanged.all() else int(np.argmin(unchanged))
+            # First candle only in the new or only in the cached candles
+            changed = [dates[-1]]
+            if first_change < len(dates):
+                changed.append(dates[first_change])
+            if offset + first_change < len(cached_dates):
+                changed.append(cached_dates[offset + first_change])
+            tail_start = bin_start(min(changed))
+            # The first bin may have lost candles to the start of the dataframe
+            head_end = bin_start(dates[0]) + interval_ns
+            if tail_start >= head_end:
+                result_dates = cached_result["date"].values.astype("datetime64[ns]").view(np.int64)
+                head = dataframe.iloc[: np.searchsorted(dates, head_end)]
+                tail = dataframe.iloc[np.searchsorted(dates, tail_start) :]
+                reused_start = np.searchsorted(result_dates, head_end)
+                reused_end = np.searchsorted(result_dates, tail_start)
+                reused = cached_result.iloc[reused_start:reused_end]
+                result = concat(
+                    [_resample(head, interval, origin), reused, _resample(tail, interval, origin)],
+                    ignore_index=True,
+                )
+
+    if result is None:
+        result = _resample(dataframe, interval, origin)
+
+    with _resample_cache_lock:
+        if len(_resample_cache) >= _RESAMPLE_CACHE_SIZE:
+            _resample_cache.clear()
+        _resample_cache[(cache_key, interval)] = (dates, values, origin.value, result)
+
+    # resampled_merge() modifies the resampled dataframe
+    return result.copy()
 
 
 def resampled_merge(original: DataFrame, resampled: DataFrame, fill_na=True):
@@ -95,14 +183,31 @@ def resampled_merge(original: DataFrame, resampled: DataFrame, fill_na=True):
     # rename all the columns to the correct interval
     resampled.columns = [f"resample_{resampled_int}_{col}" for col in resampled.columns]
 
-    dataframe = merge(
-        original,
-        resampled,
-        how="left",
-        left_on="date",
-        right_on=f"resample_{resampled_int}_date_merge",
-    )
-    dataframe = dataframe.drop(f"resample_{resampled_int}_date_merge", axis=1)
+    merge_col = f"resample_{resampled_int}_date_merge"
+    keys = resampled[merge_col].values
+    if (
+        len(keys) > 0
+        and original["date"].dtype == resampled[merge_col].dtype
+        and resampled[merge_col].is_monotonic_increasing
+        and resampled[merge_col].is_unique
+        and len(original.columns.intersection(resampled.columns)) == 0
+    ):
+        # Sorted search for the resampled candle of each candle, same result as a left merge
+        dates = original["date"].values
+        pos = np.minimum(np.searchsorted(keys, dates), len(keys) - 1)
+        pos[keys[pos] != dates] = -1
+        matched = resampled.drop(merge_col, axis=1).reset_index(drop=True).reindex(pos)
+        matched.index = RangeIndex(len(original))
+        dataframe = concat([original.set_axis(matched.index), matched], axis=1)
+    else:
+        dataframe = merge(
+            original,
+            resampled,
+            how="left",
+            left_on="date",
+            right_on=merge_col,
+        )
+        dataframe = dataframe.drop(merge_col, axis=1)
 
     if fill_na:
         dataframe = dataframe.ffill()
@@ -0,0 +1,104 @@
+import numpy as np
+import pyarrow as pa
+import pyarrow.feather as pa_feather
+import pyarrow.parquet as pq
+import pytest
+from pandas import DataFrame, Timestamp, date_range
+from pandas.testing import assert_frame_equal
+
+from freqtrade.configuration import TimeRange
+from freqtrade.data.history.arrow_utils import read_feather_timerange, read_parquet_timerange
+from freqtrade.data.history.idatahandler import get_datahandler
+from freqtrade.enums import CandleType
+
+
+START = Timestamp('2023-01-01', tz='UTC')
+START_S = int(START.timestamp())
+PAIR = 'UNITTEST/USDT'
+
+
+def _candles(rows: int = 500, seed: int = 1) -> DataFrame:
+    rng = np.random.default_rng(seed)
+    df = DataFrame({'date': date_range(START, periods=rows, freq='5min')})
+    for col in ['open', 'high', 'low', 'close', 'volume']:
+        df[col] = rng.random(rows)
+    # Missing candles
+    return df.drop(df.index[200:230]).reset_index(drop=True)
+
+
+def _write(df: DataFrame, filename, file_format: str, int_dates: bool) -> None:
+    if int_dates:
+        df = df.assign(date=df['date'].astype('int64') // 1_000_000)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if file_format == 'feather':
+        # Small record batches, so only some of them are read.
+        with pa.ipc.new_file(str(filename), table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=37):
+                writer.write_batch(batch)
+    elif file_format == 'feather_v1':
+        pa_feather.write_feather(table, str(filename), version=1)
+    else:
+        pq.write_table(table, str(filename), row_group_size=37)
+
+
+def _expected(df: DataFrame, timerange: TimeRange) -> DataFrame:
+    """Full file, trimmed the way the pushed-down reads trim it."""
+    dates = df['date'].astype('int64').to_numpy()
+    if df['date'].dtype.kind == 'M':
+        dates = dates // 1_000_000
+    lo, hi = 0, len(df)
+    if timerange.starttype == 'date':
+        lo = max(int(np.searchsorted(dates, timerange.startts * 1000, side='right')) - 1, 0)
+    if timerange.stoptype == 'date':
+        hi = min(int(np.searchsorted(dates, timerange.stopts * 1000, side='right')) + 1, len(df))
+    return df.iloc[lo:max(hi, lo)].reset_index(drop=True)
+
+
+def _timeranges():
+    rng = np.random.default_rng(2)
+    ranges = [TimeRange(), TimeRange('date', None, START_S + 3000, 0),
+              TimeRange(None, 'date', 0, START_S + 30000),
+              # Before / after the data, and a range within a gap
+              TimeRange('date', 'date', START_S - 9000, START_S - 3000),
+              TimeRange('date', 'date', START_S + 10 ** 6, START_S + 2 * 10 ** 6),
+              TimeRange('date', 'date', START_S + 205 * 300, START_S + 210 * 300)]
+    for start, length in zip(rng.integers(-50, 600, 40) * 100, rng.integers(0, 300, 40) * 100):
+        # Unaligned (not at a candle open) in most cases
+        ranges.append(TimeRange('date', 'date', START_S + start, START_S + start + length))
+    return ranges
+
+
+@pytest.mark.parametrize('file_format', ['feather', 'feather_v1', 'parquet'])
+@pytest.mark.parametrize('int_dates', [False, True])
+def test_read_timerange_matches_full_read(tmp_path, file_format, int_dates):
+    filename = tmp_path / f'candles.{file_format}'
+    _write(_candles(), filename, file_format, int_dates)
+    read = read_parquet_timerange if file_format == 'parquet' else read_feather_timerange
+    full = read(filename, None)
+    assert len(full) == 470
+
+    for timerange in _timeranges():
+        for memory_map in (True, False):
+            assert_frame_equal(read(filename, timerange, memory_map=memory_map),
+                               _expected(full, timerange),
+                               obj=f'{timerange.startts}-{timerange.stopts}')
+
+
+@pytest.mark.parametrize('data_format', ['feather', 'parquet'])
+@pytest.mark.parametrize('startup_candles', [0, 30])
+@pytest.mark.parametrize('drop_incomplete', [False, True])
+def test_ohlcv_load_timerange_matches_json(tmp_path, data_format, startup_candles,
+                                           drop_incomplete):
+    handler = get_datahandler(tmp_path / data_format, data_format)
+    json_handler = get_datahandler(tmp_path / 'json', 'json')
+    candles = _candles()
+    for h in (handler, json_handler):
+        h._datadir.mkdir()
+        h.ohlcv_store(PAIR, '5m', candles, CandleType.SPOT)
+
+    for timerange in _timeranges():
+        kwargs = {'timerange': timerange, 'startup_candles': startup_candles,
+                  'drop_incomplete': drop_incomplete, 'warn_no_data': False}
+        assert_frame_equal(handler.ohlcv_load(PAIR, '5m', CandleType.SPOT, **kwargs),
+                           json_handler.ohlcv_load(PAIR, '5m', CandleType.SPOT, **kwargs),
+                           obj=f'{timerange.startts}-{timerange.stopts}')
@@ -0,0 +1,54 @@
+from pandas import DataFrame, date_range
+
+from freqtrade.data.dataprovider import DataProvider
+
+
+def _candles(rows: int) -> DataFrame:
+    return DataFrame({
+        'date': date_range('2023-01-01', periods=rows, freq='1h', tz='UTC'),
+        'open': range(rows),
+        'high': range(1, rows + 1),
+        'low': range(rows),
+        'close': [float(c) for c in range(rows)],
+        'volume': [10.0] * rows,
+    })
+
+
+def test_get_informative_dataframe_cache_key(monkeypatch):
+    candles = {'df': _candles(10)}
+    dp = DataProvider({}, None)
+    monkeypatch.setattr(dp, 'get_pair_dataframe',
+                        lambda pair, timeframe, candle_type: candles['df'])
+    calls = []
+
+    def add_sma(period):
+        # Closures created from one definition, with different captured parameters
+        def func(df: DataFrame) -> DataFrame:
+            calls.append(period)
+            df = df.copy()
+            df['sma'] = df['close'].rolling(period).mean()
+            return df
+        return func
+
+    sma2 = dp.get_informative_dataframe('BTC/USDT', '1h', add_sma(2), cache_key=('sma', 2))
+    sma3 = dp.get_informative_dataframe('BTC/USDT', '1h', add_sma(3), cache_key=('sma', 3))
+    assert sma2['sma'].iloc[-1] == 8.5
+    assert sma3['sma'].iloc[-1] == 8.0
+    assert calls == [2, 3]
+
+    # Cached per cache_key - a re-created closure isn't called again
+    sma2['sma'] = 0.0
+    res = dp.get_informative_dataframe('BTC/USDT', '1h', add_sma(2), cache_key=('sma', 2))
+    assert res['sma'].iloc[-1] == 8.5
+    res = dp.get_informative_dataframe('ETH/USDT', '1h', add_sma(2), cache_key=('sma', 2))
+    assert calls == [2, 3, 2]
+
+    # A new candle invalidates the cached result
+    candles['df'] = _candles(11)
+    res = dp.get_informative_dataframe('BTC/USDT', '1h', add_sma(3), cache_key=('sma', 3))
+    assert res['sma'].iloc[-1] == 9.0
+    assert calls == [2, 3, 2, 3]
+
+    dp.clear_cache()
+    dp.get_informative_dataframe('BTC/USDT', '1h', add_sma(3), cache_key=('sma', 3))
+    assert calls == [2, 3, 2, 3, 3]
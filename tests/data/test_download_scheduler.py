@@ -0,0 +1,122 @@
+import time
+
+import pytest
+
+from freqtrade.data.history import download_scheduler
+from freqtrade.data.history.download_scheduler import DownloadJob, DownloadScheduler
+from freqtrade.data.history.idatahandler import get_datahandler
+from freqtrade.enums import CandleType, RunMode
+from freqtrade.exchange import Exchange
+
+
+PAIRS = ['ETH/USDT', 'XRP/USDT', 'LTC/USDT', 'ADA/USDT', 'DOT/USDT', 'SOL/USDT']
+
+
+@pytest.fixture
+def exchange():
+    config = {
+        'runmode': RunMode.UTIL_EXCHANGE,
+        'dry_run': True,
+        'trading_mode': 'spot',
+        'margin_mode': '',
+        'candle_type_def': CandleType.SPOT,
+        'stake_currency': 'USDT',
+        'exchange': {
+            'name': 'binance',
+            'pair_whitelist': PAIRS,
+            # 20 requests/s, no burst
+            'simulator': {'seed': 1, 'latency': 0.2, 'rate_limit': 50, 'rate_limit_burst': 1},
+        },
+    }
+    exchange = Exchange(config, validate=False)
+    yield exchange
+    exchange.close()
+
+
+def _track_requests(exchange, monkeypatch) -> dict:
+    """Record the requests in flight and the start of every ohlcv request."""
+    backend = exchange._api_async.backend
+    tracked = {'in_flight': 0, 'max_in_flight': 0, 'since': {}}
+    before_request = backend.before_request
+    fetch_ohlcv = backend.fetch_ohlcv
+
+    def tracking_before_request(endpoint):
+        tracked['in_flight'] += 1
+        tracked['max_in_flight'] = max(tracked['max_in_flight'], tracked['in_flight'])
+        return before_request(endpoint)
+
+    def tracking_fetch_ohlcv(symbol, timeframe='1m', since=None, limit=None, params={}):
+        tracked['in_flight'] -= 1
+        tracked['since'].setdefault(symbol, []).append(since)
+        return fetch_ohlcv(symbol, timeframe, since, limit, params)
+
+    monkeypatch.setattr(backend, 'before_request', tracking_before_request)
+    monkeypatch.setattr(backend, 'fetch_ohlcv', tracking_fetch_ohlcv)
+    return tracked
+
+
+def _scheduler(exchange, tmp_path, workers: int) -> DownloadScheduler:
+    return DownloadScheduler(exchange, get_datahandler(tmp_path, 'feather'), datadir=tmp_path,
+                             workers=workers, new_pairs_days=1)
+
+
+def test_download_scheduler_concurrency_rate_limit(exchange, tmp_path, monkeypatch):
+    tracked = _track_requests(exchange, monkeypatch)
+    jobs = [DownloadJob(pair, '5m', CandleType.SPOT) for pair in PAIRS]
+    exchange._api_async.enableRateLimit = True
+
+    start = time.monotonic()
+    assert _scheduler(exchange, tmp_path, workers=3).run(jobs) == []
+    duration = time.monotonic() - start
+
+    stats = exchange._api_async.backend.stats
+    # One request per job (1 day of 5m candles), none rejected by the exchange.
+    assert stats['requests'] == len(PAIRS)
+    assert stats['rate_limited'] == 0
+    # Requests overlap, but never more than the number of workers.
+    assert tracked['max_in_flight'] == 3
+    # 20 requests/s - and latency overlaps instead of adding up.
+    assert (len(PAIRS) - 1) * 0.05 <= duration < len(PAIRS) * 0.2
+    # ccxt's throttle is only disabled while the scheduler runs.
+    assert exchange._api_async.enableRateLimit is True
+
+    handler = get_datahandler(tmp_path, 'feather')
+    for pair in PAIRS:
+        data = handler.ohlcv_load(pair, '5m', CandleType.SPOT)
+        assert len(data) >= 287
+        assert data['date'].diff().iloc[1:].nunique() == 1
+
+
+def test_download_scheduler_resume(exchange, tmp_path, monkeypatch):
+    store_pair_download = download_scheduler._store_pair_download
+
+    def interrupted_store(pair, **kwargs):
+        if pair in ('LTC/USDT', 'SOL/USDT'):
+            raise OSError('No space left on device')
+        store_pair_download(pair, **kwargs)
+
+    jobs = [DownloadJob(pair, '5m', CandleType.SPOT) for pair in PAIRS]
+    monkeypatch.setattr(download_scheduler, '_store_pair_download', interrupted_store)
+    failed = _scheduler(exchange, tmp_path, workers=4).run(jobs)
+    assert [job.pair for job in failed] == ['LTC/USDT', 'SOL/USDT']
+    monkeypatch.setattr(download_scheduler, '_store_pair_download', store_pair_download)
+
+    # Finished jobs were stored - the next run only downloads the missing candles for them.
+    handler = get_datahandler(tmp_path, 'feather')
+    stored = {pair: handler.ohlcv_load(pair, '5m', CandleType.SPOT) for pair in PAIRS}
+    assert stored['LTC/USDT'].empty and stored['SOL/USDT'].empty
+    tracked = _track_requests(exchange, monkeypatch)
+    assert _scheduler(exchange, tmp_path, workers=4).run(jobs) == []
+
+    for pair in PAIRS:
+        data = handler.ohlcv_load(pair, '5m', CandleType.SPOT)
+        assert len(data) >= 287
+        assert not data['date'].duplicated().any()
+        assert data['date'].diff().iloc[1:].nunique() == 1
+        [since] = tracked['since'][pair]
+        if stored[pair].empty:
+            assert since < data.iloc[0]['date'].timestamp() * 1000
+        else:
+            # Resumed from the last complete stored candle.
+            assert data.iloc[0]['date'] == stored[pair].iloc[0]['date']
+            assert since == stored[pair].iloc[-2]['date'].timestamp() * 1000
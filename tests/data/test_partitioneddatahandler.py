@@ -0,0 +1,159 @@
+import pytest
+from pandas import DataFrame, concat, date_range
+from pandas.testing import assert_frame_equal
+
+from freqtrade.configuration import TimeRange
+from freqtrade.data.converter import trades_convert_types
+from freqtrade.data.history.idatahandler import get_datahandler
+from freqtrade.enums import CandleType
+
+
+PAIR = 'UNITTEST/USDT'
+
+
+@pytest.fixture(params=['feather', 'parquet', 'json'])
+def handler(request, tmp_path):
+    return get_datahandler(tmp_path, request.param)
+
+
+def _candles(rows: int) -> DataFrame:
+    return DataFrame({
+        'date': date_range('2023-01-01', periods=rows, freq='5min', tz='UTC'),
+        'open': [1.0 + i / 7 for i in range(rows)],
+        'high': [2.0 + i / 7 for i in range(rows)],
+        'low': [0.5 + i / 7 for i in range(rows)],
+        'close': [1.5 + i / 7 for i in range(rows)],
+        'volume': [10.0 + i for i in range(rows)],
+    })
+
+
+def _trades(rows: int) -> DataFrame:
+    return DataFrame({
+        'timestamp': [1672531200000 + i * 1000 for i in range(rows)],
+        'id': [str(i) for i in range(rows)],
+        'type': [None] * rows,
+        'side': ['buy' if i % 3 else 'sell' for i in range(rows)],
+        'price': [1.0 + i / 7 for i in range(rows)],
+        'amount': [0.1 + i / 9 for i in range(rows)],
+        'cost': [(1.0 + i / 7) * (0.1 + i / 9) for i in range(rows)],
+    })
+
+
+def _record_reads(monkeypatch, handler, method: str) -> list:
+    reads = []
+    load_file = getattr(handler, method)
+
+    def recording_load_file(filename, timerange=None):
+        reads.append(filename)
+        return load_file(filename, timerange)
+    monkeypatch.setattr(handler, method, recording_load_file)
+    return reads
+
+
+def test_ohlcv_append_load(handler):
+    candles = _candles(300)
+    handler.ohlcv_store(PAIR, '5m', candles.iloc[:100], CandleType.SPOT)
+    for start in range(100, 300, 50):
+        handler.ohlcv_append(PAIR, '5m', candles.iloc[start:start + 50], CandleType.SPOT)
+    filename = handler._pair_data_filename(handler._datadir, PAIR, '5m', CandleType.SPOT)
+    assert len(handler._load_manifest(filename)) == 4
+
+    loaded = handler._ohlcv_load(PAIR, '5m', None, CandleType.SPOT)
+    assert_frame_equal(loaded, candles)
+
+    timerange = TimeRange('date', 'date', int(candles.iloc[120]['date'].timestamp()),
+                          int(candles.iloc[220]['date'].timestamp()))
+    loaded = handler.ohlcv_load(PAIR, '5m', timerange=timerange, candle_type=CandleType.SPOT)
+    assert_frame_equal(loaded, candles.iloc[120:221].reset_index(drop=True))
+
+
+def test_ohlcv_append_compaction(handler):
+    candles = _candles(100)
+    handler._max_partitions = 3
+    handler.ohlcv_store(PAIR, '5m', candles.iloc[:20], CandleType.SPOT)
+    filename = handler._pair_data_filename(handler._datadir, PAIR, '5m', CandleType.SPOT)
+    for start in range(20, 80, 20):
+        handler.ohlcv_append(PAIR, '5m', candles.iloc[start:start + 20], CandleType.SPOT)
+    assert len(handler._load_manifest(filename)) == 3
+
+    # Partitions are merged into the data file once _max_partitions exist.
+    handler.ohlcv_append(PAIR, '5m', candles.iloc[80:], CandleType.SPOT)
+    assert not handler._partition_dir(filename).exists()
+    assert_frame_equal(handler._ohlcv_load_file(filename, None), candles)
+    assert_frame_equal(handler._ohlcv_load(PAIR, '5m', None, CandleType.SPOT), candles)
+
+
+def test_ohlcv_load_edges(handler, monkeypatch):
+    candles = _candles(300)
+    expected = concat([candles.iloc[:1], candles.iloc[-2:]], ignore_index=True)
+    handler.ohlcv_store(PAIR, '5m', candles.iloc[:200], CandleType.SPOT)
+    filename = handler._pair_data_filename(handler._datadir, PAIR, '5m', CandleType.SPOT)
+
+    reads = _record_reads(monkeypatch, handler, '_ohlcv_load_file')
+    edges = handler.ohlcv_load_edges(PAIR, '5m', CandleType.SPOT)
+    assert_frame_equal(edges, concat([candles.iloc[:1], candles.iloc[198:200]], ignore_index=True))
+    # Formats without timerange pushdown parse the file once.
+    assert len(reads) == (3 if handler._timerange_pushdown else 1)
+
+    for start in range(200, 300, 25):
+        handler.ohlcv_append(PAIR, '5m', candles.iloc[start:start + 25], CandleType.SPOT)
+    reads.clear()
+    edges = handler.ohlcv_load_edges(PAIR, '5m', CandleType.SPOT)
+    assert_frame_equal(edges, expected)
+    # Edges of the data file come from the manifest - only the last partition is read.
+    assert reads == [handler._partition_dir(filename) / f'00004.{handler._get_file_extension()}']
+
+    # The candle before the last one is in the previous partition.
+    handler.ohlcv_append(PAIR, '5m', _candles(301).iloc[300:], CandleType.SPOT)
+    reads.clear()
+    edges = handler.ohlcv_load_edges(PAIR, '5m', CandleType.SPOT)
+    assert_frame_equal(edges, concat([candles.iloc[:1], _candles(301).iloc[-2:]],
+                                     ignore_index=True))
+    assert len(reads) == 2
+
+
+def test_trades_append_load(handler):
+    trades = _trades(300)
+    handler.trades_store(PAIR, trades.iloc[:100])
+    for start in range(100, 300, 50):
+        handler.trades_append(PAIR, trades.iloc[start:start + 50])
+    assert len(handler._load_manifest(handler._pair_trades_filename(handler._datadir, PAIR))) == 4
+
+    assert_frame_equal(handler.trades_load(PAIR), trades_convert_types(trades))
+
+
+def test_trades_append_compaction(handler):
+    trades = _trades(100)
+    handler._max_partitions = 2
+    handler.trades_store(PAIR, trades.iloc[:40])
+    filename = handler._pair_trades_filename(handler._datadir, PAIR)
+    handler.trades_append(PAIR, trades.iloc[40:60])
+    handler.trades_append(PAIR, trades.iloc[60:80])
+    assert len(handler._load_manifest(filename)) == 2
+
+    handler.trades_append(PAIR, trades.iloc[80:])
+    assert not handler._partition_dir(filename).exists()
+    assert_frame_equal(handler.trades_load(PAIR), trades_convert_types(trades))
+
+
+def test_trades_load_edges(handler, monkeypatch):
+    trades = _trades(300)
+    handler.trades_store(PAIR, trades.iloc[:200])
+    for start in range(200, 300, 25):
+        handler.trades_append(PAIR, trades.iloc[start:start + 25])
+    filename = handler._pair_trades_filename(handler._datadir, PAIR)
+
+    reads = _record_reads(monkeypatch, handler, '_trades_load_file')
+    edges = handler.trades_load_edges(PAIR, tail_ms=5 * 1000)
+    # First trade, the trades of the last 5 seconds and the trade before them.
+    expected = trades_convert_types(concat([trades.iloc[:1], trades.iloc[-7:]],
+                                           ignore_index=True))
+    assert_frame_equal(edges, expected)
+    assert reads == [handler._partition_dir(filename) / f'00004.{handler._get_file_extension()}']
+
+    # Tail spanning partitions and the data file.
+    reads.clear()
+    edges = handler.trades_load_edges(PAIR, tail_ms=120 * 1000)
+    assert_frame_equal(edges, trades_convert_types(concat([trades.iloc[:1], trades.iloc[-122:]],
+                                                    ignore_index=True)))
+    assert len(reads) == 5
@@ -0,0 +1,148 @@
+import random
+
+import ccxt
+import numpy as np
+import pytest
+
+from freqtrade.enums import CandleType, RunMode
+from freqtrade.exceptions import TemporaryError
+from freqtrade.exchange import Exchange
+
+
+PAIRS = [f'COIN{i}/USDT' for i in range(40)]
+START_MS = 1_700_000_000_000
+
+
+def _exchange(**exchange_conf) -> Exchange:
+    config = {
+        'runmode': RunMode.DRY_RUN,
+        'dry_run': True,
+        'trading_mode': 'spot',
+        'margin_mode': '',
+        'candle_type_def': CandleType.SPOT,
+        'stake_currency': 'USDT',
+        'timeframe': '5m',
+        'exchange': {
+            'name': 'binance',
+            'pair_whitelist': PAIRS,
+            'simulator': {'seed': 1, 'rate_limit': 1, 'rate_limit_burst': 10000},
+            **exchange_conf,
+        },
+    }
+    return Exchange(config, validate=False)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the simulator clock - order books only change when the clock is moved."""
+    now = [START_MS]
+    monkeypatch.setattr(ccxt.Exchange, 'milliseconds', staticmethod(lambda: now[0]))
+    return now
+
+
+def _fetch_direct(exchange: Exchange, monkeypatch):
+    """Dry-run fills as they were - every check fetches its own order book."""
+    fetched = []
+
+    def get_dry_order_book(pair):
+        fetched.append(pair)
+        return exchange.fetch_l2_order_book(pair, 20)
+    monkeypatch.setattr(exchange, 'get_dry_order_book', get_dry_order_book)
+    return fetched
+
+
+def _run_dry_orders(exchange: Exchange, clock, rounds: int = 5):
+    """
+    Create random limit and market orders, moving the clock between rounds and checking
+    all open orders for fills.
+    :return: List of order snapshots (without ids / dates) after every step
+    """
+    rng = random.Random(7)
+    snapshots = []
+    order_ids = []
+
+    def snapshot(order):
+        snapshots.append({k: v for k, v in order.items()
+                          if k not in ('id', 'datetime', 'timestamp')})
+
+    for _ in range(rounds):
+        for pair in rng.sample(PAIRS, 15):
+            mid = exchange._api.backend._mid_prices(pair, np.array([clock[0]]))[0]
+            side = rng.choice(['buy', 'sell'])
+            ordertype = rng.choice(['limit', 'limit', 'market'])
+            # Limit prices around the spread - some cross it, some fill with the next rounds.
+            rate = exchange.price_to_precision(pair, mid * (1 + rng.uniform(-0.02, 0.02)))
+            order = exchange.create_dry_run_order(pair, ordertype, side, rng.uniform(1, 500),
+                                                  rate, leverage=1.0)
+            order_ids.append(order['id'])
+            snapshot(order)
+        clock[0] += rng.randint(1, 30) * 60 * 1000
+        exchange._dry_order_book_cache.clear()
+        for order_id in order_ids:
+            snapshot(exchange.fetch_dry_run_order(order_id))
+    return snapshots
+
+
+def test_dry_run_fills_match_direct_order_book_fetches(clock, monkeypatch):
+    exchange = _exchange()
+    reference = _exchange()
+    fetched = _fetch_direct(reference, monkeypatch)
+
+    result = _run_dry_orders(exchange, clock)
+    clock[0] = START_MS
+    expected = _run_dry_orders(reference, clock)
+
+    assert result == expected
+    statuses = [order['status'] for order in expected]
+    assert 'open' in statuses and 'closed' in statuses
+    assert {order['type'] for order in expected} == {'limit', 'market'}
+    # Open limit orders share one order book per pair and round.
+    stats = exchange.dry_order_book_stats
+    assert stats['hits'] + stats['misses'] == len(fetched)
+    assert stats['hits'] > 0
+    assert stats['fetched'] < len(fetched)
+
+
+def test_get_dry_order_book_matches_fetch_l2_order_book(clock):
+    exchange = _exchange()
+    for pair in PAIRS[:5]:
+        assert exchange.get_dry_order_book(pair) == exchange.fetch_l2_order_book(pair, 20)
+    assert exchange.dry_order_book_stats == {'hits': 0, 'misses': 5, 'fetched': 5}
+
+    # Cached - the book doesn't move with the clock until the entry expires.
+    book = exchange.get_dry_order_book(PAIRS[0])
+    clock[0] += 60 * 60 * 1000
+    assert exchange.get_dry_order_book(PAIRS[0]) is book
+    assert exchange.dry_order_book_stats['hits'] == 2
+
+    exchange._dry_order_book_cache.expire(exchange._dry_order_book_cache.timer() + 10)
+    new_book = exchange.get_dry_order_book(PAIRS[0])
+    assert new_book != book
+    assert new_book == exchange.fetch_l2_order_book(PAIRS[0], 20)
+
+
+def test_get_dry_order_book_refreshes_open_order_pairs(clock, monkeypatch):
+    exchange = _exchange()
+    # Limit orders far below the spread stay open.
+    for pair in PAIRS[:10]:
+        mid = exchange._api.backend._mid_prices(pair, np.array([clock[0]]))[0]
+        exchange.create_dry_run_order(pair, 'limit', 'buy', 10, mid * 0.5, leverage=1.0)
+    exchange._dry_order_book_cache.clear()
+    exchange.dry_order_book_stats.update({'hits': 0, 'misses': 0, 'fetched': 0})
+
+    # One pair fails in the batch - it's fetched on its own when it's needed.
+    async_fetch = exchange._async_fetch_l2_order_book
+
+    async def fetch_order_book(pair, limit=100):
+        if pair == PAIRS[3]:
+            raise TemporaryError('Order book not available')
+        return await async_fetch(pair, limit)
+    monkeypatch.setattr(exchange, '_async_fetch_l2_order_book', fetch_order_book)
+
+    assert exchange.get_dry_order_book(PAIRS[20]) == exchange.fetch_l2_order_book(PAIRS[20], 20)
+    assert set(exchange._dry_order_book_cache) == set(PAIRS[:10]) - {PAIRS[3]} | {PAIRS[20]}
+    assert exchange.dry_order_book_stats == {'hits': 0, 'misses': 1, 'fetched': 10}
+
+    for pair in PAIRS[:10]:
+        assert exchange.get_dry_order_book(pair) == exchange.fetch_l2_order_book(pair, 20)
+    assert exchange.dry_order_book_stats == {'hits': 9, 'misses': 2, 'fetched': 11}
@@ -0,0 +1,124 @@
+import time
+
+import ccxt
+import pytest
+
+from freqtrade.enums import CandleType, RunMode
+from freqtrade.exceptions import TemporaryError
+from freqtrade.exchange import Exchange
+from freqtrade.exchange.common import API_RETRY_COUNT
+from freqtrade.exchange.exchange_utils import timeframe_to_msecs
+
+
+PAIRS = ['ETH/USDT', 'XRP/USDT', 'LTC/USDT', 'ADA/USDT', 'DOT/USDT']
+
+
+def _simulated_exchange(dry_run: bool = True, **sim_config) -> Exchange:
+    config = {
+        'runmode': RunMode.DRY_RUN if dry_run else RunMode.LIVE,
+        'dry_run': dry_run,
+        'trading_mode': 'spot',
+        'margin_mode': '',
+        'candle_type_def': CandleType.SPOT,
+        'stake_currency': 'USDT',
+        'timeframe': '5m',
+        'exchange': {
+            'name': 'binance',
+            'pair_whitelist': PAIRS,
+            'simulator': {'seed': 1, 'rate_limit': 1, 'rate_limit_burst': 1000, **sim_config},
+        },
+    }
+    return Exchange(config, validate=False)
+
+
+def test_simulator_ohlcv():
+    exchange = _simulated_exchange()
+    assert set(exchange.markets) == set(PAIRS)
+
+    jobs = [(pair, '5m', CandleType.SPOT) for pair in PAIRS]
+    result = exchange.refresh_latest_ohlcv(jobs)
+    assert set(result) == set(jobs)
+    for df in result.values():
+        assert len(df) > 100
+        assert (df['date'].diff().iloc[1:] == df['date'].iloc[1] - df['date'].iloc[0]).all()
+        assert (df['high'] >= df[['open', 'close']].max(axis=1)).all()
+        assert (df['low'] <= df[['open', 'close']].min(axis=1)).all()
+
+    # Prices are deterministic - historic data matches the refreshed candles.
+    df = result[jobs[0]]
+    since_ms = int(df.iloc[0]['date'].timestamp() * 1000)
+    historic = exchange.get_historic_ohlcv(PAIRS[0], '5m', since_ms, CandleType.SPOT)
+    assert historic[0][0] == since_ms
+    assert historic[1][1:5] == pytest.approx(df.iloc[1][['open', 'high', 'low', 'close']].tolist())
+    assert [c[0] for c in historic] == list(range(since_ms, historic[-1][0] + 1,
+                                                  timeframe_to_msecs('5m')))
+
+
+def test_simulator_ticker_order_book():
+    exchange = _simulated_exchange()
+    ticker = exchange.fetch_ticker('ETH/USDT')
+    assert ticker['bid'] < ticker['last'] < ticker['ask']
+
+    order_book = exchange.fetch_l2_order_book('ETH/USDT', 20)
+    assert len(order_book['bids']) == len(order_book['asks']) == 20
+    bids = [price for price, _ in order_book['bids']]
+    asks = [price for price, _ in order_book['asks']]
+    assert bids == sorted(bids, reverse=True)
+    assert asks == sorted(asks)
+    assert bids[0] < asks[0]
+
+    with pytest.raises(ccxt.BadSymbol, match='does not have market symbol'):
+        exchange._api.fetch_ticker('NOPE/USDT')
+
+
+def test_simulator_orders():
+    exchange = _simulated_exchange(dry_run=False, fee=0.001)
+    price = exchange.fetch_ticker('ETH/USDT')['last']
+
+    order = exchange.create_order(pair='ETH/USDT', ordertype='limit', side='buy', amount=1.0,
+                                  rate=price * 0.5, leverage=1.0)
+    assert order['status'] == 'open'
+    assert exchange.fetch_order(order['id'], 'ETH/USDT')['status'] == 'open'
+    assert [o['id'] for o in exchange._api.fetch_open_orders('ETH/USDT')] == [order['id']]
+    assert exchange.cancel_order(order['id'], 'ETH/USDT')['status'] == 'canceled'
+    assert exchange.fetch_order(order['id'], 'ETH/USDT')['status'] == 'canceled'
+
+    order = exchange.create_order(pair='ETH/USDT', ordertype='market', side='buy', amount=2.0,
+                                  rate=price, leverage=1.0)
+    order = exchange.fetch_order(order['id'], 'ETH/USDT')
+    assert order['status'] == 'closed'
+    assert order['filled'] == 2.0
+    assert order['average'] == pytest.approx(price, rel=0.01)
+    assert order['fee']['cost'] == pytest.approx(order['cost'] * 0.001)
+    assert [t['order'] for t in exchange._api.fetch_my_trades('ETH/USDT')] == [order['id']]
+
+
+def test_simulator_latency():
+    exchange = _simulated_exchange(latency=0.05)
+    start = time.monotonic()
+    exchange.fetch_ticker('ETH/USDT')
+    assert time.monotonic() - start >= 0.05
+
+    # Async requests overlap - refreshing all pairs takes about the latency of one request.
+    start = time.monotonic()
+    exchange.refresh_latest_ohlcv([(pair, '5m', CandleType.SPOT) for pair in PAIRS])
+    assert time.monotonic() - start < 0.05 * len(PAIRS)
+    assert exchange._api.backend.stats['requests'] == 1 + len(PAIRS)
+
+
+def test_simulator_error_injection(mocker):
+    mocker.patch('freqtrade.exchange.common.time.sleep')
+    exchange = _simulated_exchange(error_rate=1.0, errors=['ExchangeNotAvailable'])
+    with pytest.raises(TemporaryError, match='injected error on fetch_ticker'):
+        exchange.fetch_ticker('ETH/USDT')
+    # The request is retried, every attempt fails.
+    assert exchange._api.backend.stats['errors'] == API_RETRY_COUNT + 1
+
+
+def test_simulator_rate_limit():
+    exchange = _simulated_exchange(rate_limit=10_000, rate_limit_burst=3)
+    for _ in range(3):
+        exchange._api.fetch_ticker('ETH/USDT')
+    with pytest.raises(ccxt.DDoSProtection):
+        exchange._api.fetch_ticker('ETH/USDT')
+    assert exchange._api.backend.stats['rate_limited'] == 1
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from pandas import DataFrame, Timedelta, Timestamp, concat, date_range
+from pandas.testing import assert_frame_equal
+
+from freqtrade.data.converter import clean_ohlcv_dataframe
+from freqtrade.exchange.kline_buffer import KlineBuffer
+
+
+PAIR = 'ETH/USDT'
+TIMEFRAME = '5m'
+TD = Timedelta(minutes=5)
+
+
+def _new_candles(rng, start: Timestamp, rows: int) -> DataFrame:
+    """Candles as returned by ohlcv_to_dataframe - sorted, without gaps."""
+    df = DataFrame({'date': date_range(start, periods=rows, freq='5min')})
+    df['open'] = rng.uniform(90, 110, rows)
+    df['close'] = rng.uniform(90, 110, rows)
+    df['high'] = df[['open', 'close']].max(axis=1) + rng.uniform(0, 5, rows)
+    df['low'] = df[['open', 'close']].min(axis=1) - rng.uniform(0, 5, rows)
+    df['volume'] = rng.uniform(0, 1000, rows)
+    return df[['date', 'open', 'high', 'low', 'close', 'volume']]
+
+
+@pytest.mark.parametrize('max_rows', [20, 300])
+def test_kline_buffer_matches_concat_clean(max_rows):
+    rng = np.random.default_rng(4)
+    initial = _new_candles(rng, Timestamp('2023-01-01', tz='UTC'), 50)
+    buffer = KlineBuffer(initial)
+    expected = initial
+    assert_frame_equal(buffer.to_dataframe(), expected)
+
+    for step in range(150):
+        last = expected['date'].iloc[-1]
+        kind = rng.random()
+        if kind < 0.05:
+            new = initial.iloc[:0]
+        elif kind < 0.1:
+            # Starts before the buffered candles
+            new = _new_candles(rng, expected['date'].iloc[0] - TD * int(rng.integers(1, 10)),
+                               int(rng.integers(1, 30)))
+        else:
+            # Updates of the last candles, next candles, or candles after a gap
+            new = _new_candles(rng, last + TD * int(rng.integers(-5, 6)),
+                               int(rng.integers(1, 20)))
+
+        buffer.merge(new, TIMEFRAME, PAIR, max_rows)
+        expected = clean_ohlcv_dataframe(concat([expected, new], axis=0), TIMEFRAME, PAIR,
+                                         fill_missing=True, drop_incomplete=False)
+        expected = expected.tail(max_rows).reset_index(drop=True)
+        assert len(buffer) == len(expected)
+        assert_frame_equal(buffer.to_dataframe(), expected, obj=f'step {step}')
+
+
+def test_kline_buffer_dataframe_cached():
+    rng = np.random.default_rng(5)
+    buffer = KlineBuffer(_new_candles(rng, Timestamp('2023-01-01', tz='UTC'), 10))
+    df = buffer.to_dataframe()
+    assert buffer.to_dataframe() is df
+    # No new candles, nothing aged out - the same dataframe.
+    buffer.merge(df.iloc[:0], TIMEFRAME, PAIR, 100)
+    assert buffer.to_dataframe() is df
+
+    buffer.merge(_new_candles(rng, df['date'].iloc[-1], 2), TIMEFRAME, PAIR, 100)
+    updated = buffer.to_dataframe()
+    assert updated is not df
+    assert len(df) == 10 and len(updated) == 11
@@ -0,0 +1,107 @@
+import asyncio
+import random
+
+import pytest
+from pandas.testing import assert_frame_equal
+
+from freqtrade.enums import CandleType, RunMode
+from freqtrade.exceptions import TemporaryError
+from freqtrade.exchange import Exchange
+from freqtrade.misc import chunks
+
+
+PAIRS = [f'COIN{i}/USDT' for i in range(250)]
+
+
+def _exchange(**exchange_conf) -> Exchange:
+    config = {
+        'runmode': RunMode.DRY_RUN,
+        'dry_run': True,
+        'trading_mode': 'spot',
+        'margin_mode': '',
+        'candle_type_def': CandleType.SPOT,
+        'stake_currency': 'USDT',
+        'timeframe': '1h',
+        'exchange': {
+            'name': 'binance',
+            'pair_whitelist': PAIRS,
+            'simulator': {'seed': 1, 'rate_limit': 1, 'rate_limit_burst': 10000,
+                          'latency': 0.01, 'latency_jitter': 0.01},
+            **exchange_conf,
+        },
+    }
+    return Exchange(config, validate=False)
+
+
+def _refresh_chunked(exchange: Exchange, pair_list):
+    """refresh_latest_ohlcv() as it was - requests gathered in chunks of 100."""
+    input_coroutines, _ = exchange._build_ohlcv_dl_jobs(pair_list, None, False)
+    results = []
+    for input_coro in chunks(input_coroutines, 100):
+        async def gather_stuff():
+            return await asyncio.gather(*input_coro, return_exceptions=True)
+        results.extend(exchange.loop.run_until_complete(gather_stuff()))
+    return {(pair, timeframe, c_type): exchange._process_ohlcv_df(
+                pair, timeframe, c_type, ticks, False, drop_hint)
+            for pair, timeframe, c_type, ticks, drop_hint in results}
+
+
+def test_refresh_latest_ohlcv_matches_chunked_gather():
+    exchange = _exchange(ohlcv_refresh_concurrency=30)
+    pair_list = [(pair, '1h', CandleType.SPOT) for pair in PAIRS]
+
+    expected = _refresh_chunked(exchange, pair_list)
+    result = exchange.refresh_latest_ohlcv(pair_list, cache=False)
+
+    assert list(result) == list(expected)
+    for key, df in expected.items():
+        assert len(df) > 100
+        assert_frame_equal(result[key], df)
+    assert exchange.ohlcv_refresh_stats['requests'] == len(PAIRS)
+    assert exchange.ohlcv_refresh_stats['timeouts'] == 0
+
+
+def test_gather_ohlcv_jobs_bounded():
+    exchange = _exchange(ohlcv_refresh_concurrency=5)
+    rng = random.Random(3)
+    in_flight = []
+    running = 0
+
+    async def job(i: int):
+        nonlocal running
+        running += 1
+        in_flight.append(running)
+        await asyncio.sleep(rng.random() * 0.02)
+        running -= 1
+        if i % 7 == 3:
+            raise ValueError(i)
+        return i
+
+    results = exchange.loop.run_until_complete(
+        exchange._gather_ohlcv_jobs([job(i) for i in range(50)]))
+
+    # Same order and results as asyncio.gather(..., return_exceptions=True)
+    for i, res in enumerate(results):
+        if i % 7 == 3:
+            assert isinstance(res, ValueError) and res.args == (i, )
+        else:
+            assert res == i
+    assert max(in_flight) == 5
+    assert exchange.ohlcv_refresh_stats['requests'] == 50
+
+
+def test_gather_ohlcv_jobs_timeout():
+    exchange = _exchange(ohlcv_request_timeout=0.05)
+
+    async def job(delay: float):
+        await asyncio.sleep(delay)
+        return delay
+
+    results = exchange.loop.run_until_complete(
+        exchange._gather_ohlcv_jobs([job(0.01), job(5), job(0.02)]))
+
+    assert results[0] == 0.01 and results[2] == 0.02
+    assert isinstance(results[1], TemporaryError)
+    assert exchange.ohlcv_refresh_stats['timeouts'] == 1
+    assert exchange.ohlcv_refresh_stats['duration'] < 1
+    assert exchange.ohlcv_refresh_stats['latency_max'] == pytest.approx(0.05, abs=0.04)
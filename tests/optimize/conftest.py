@@ -0,0 +1,142 @@
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from freqtrade.data import history
+from freqtrade.data.converter import trim_dataframes
+from freqtrade.data.history.idatahandler import get_datahandler
+from freqtrade.enums import CandleType, RunMode
+from freqtrade.optimize.backtesting import Backtesting
+
+
+START = pd.Timestamp('2022-01-01', tz='UTC')
+CANDLES = 3000
+
+
+def _ohlcv(seed: int, start: pd.Timestamp, periods: int, freq: str) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, periods)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.003, periods)) * close
+    return pd.DataFrame({
+        'date': pd.date_range(start, periods=periods, freq=freq),
+        'open': open_,
+        'high': np.maximum(open_, close) + spread,
+        'low': np.minimum(open_, close) - spread,
+        'close': close,
+        'volume': rng.random(periods) * 1000,
+    })
+
+
+def _detail(candles: pd.DataFrame, seed: int) -> pd.DataFrame:
+    """1m candles consistent with the 5m candles - a random walk from open to close."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for candle in candles.itertuples():
+        path = np.linspace(candle.open, candle.close, 6)
+        path[1:5] += rng.normal(0, 0.3, 4) * (candle.high - candle.low)
+        path = path.clip(candle.low, candle.high)
+        for minute in range(5):
+            o, c = path[minute], path[minute + 1]
+            # The 5m high is reached in the 2nd minute, the 5m low in the 4th.
+            high = candle.high if minute == 1 else max(o, c)
+            low = candle.low if minute == 3 else min(o, c)
+            rows.append((candle.date + pd.Timedelta(minutes=minute), o, high, low, c,
+                         candle.volume / 5))
+    return pd.DataFrame(rows, columns=['date', 'open', 'high', 'low', 'close', 'volume'])
+
+
+def _store_data(datadir: Path, pairs, trading_mode: str) -> None:
+    handler = get_datahandler(datadir, 'feather')
+    candle_type = CandleType.get_default(trading_mode)
+    for i, pair in enumerate(pairs):
+        # Later pairs start later and miss a few candles - pairs aren't aligned.
+        offset = 150 * i
+        candles = _ohlcv(i, START + pd.Timedelta(minutes=5 * offset), CANDLES - offset, '5min')
+        if i:
+            candles = candles.drop(candles.index[500:510 + i]).reset_index(drop=True)
+        handler.ohlcv_store(pair, '5m', candles, candle_type)
+        handler.ohlcv_store(pair, '1m', _detail(candles, 100 + i), candle_type)
+        if trading_mode == 'futures':
+            periods = CANDLES // 96 + 2
+            funding = _ohlcv(200 + i, START, periods, '8h')
+            funding[['open', 'high', 'low', 'close']] = 0.0001 * (1 + i)
+            # Funding fees missing for a while.
+            funding = funding.drop(funding.index[3:5])
+            handler.ohlcv_store(pair, '8h', funding, CandleType.FUNDING_RATE)
+            handler.ohlcv_store(pair, '4h', _ohlcv(300 + i, START, periods * 2, '4h'),
+                                CandleType.MARK)
+
+
+@pytest.fixture
+def backtest_config(tmp_path):
+    """
+    Configuration for an offline end-to-end backtest - synthetic candles in tmp_path,
+    markets served by the exchange simulator.
+    :return: function returning the configuration for a trading mode
+    """
+    def make_config(trading_mode: str = 'spot') -> dict:
+        futures = trading_mode == 'futures'
+        pairs = (['ETH/USDT:USDT', 'XRP/USDT:USDT', 'LTC/USDT:USDT'] if futures
+                 else ['ETH/USDT', 'XRP/USDT', 'LTC/USDT'])
+        datadir = tmp_path / trading_mode
+        datadir.mkdir()
+        _store_data(datadir, pairs, trading_mode)
+        return {
+            'runmode': RunMode.BACKTEST,
+            'dry_run': True,
+            'trading_mode': trading_mode,
+            'candle_type_def': CandleType.get_default(trading_mode),
+            'margin_mode': 'isolated' if futures else '',
+            'strategy': 'BacktestTestStrategyShort' if futures else 'BacktestTestStrategy',
+            'strategy_path': str(Path(__file__).parent / 'strats'),
+            'user_data_dir': tmp_path,
+            'datadir': datadir,
+            'dataformat_ohlcv': 'feather',
+            'timeframe': '5m',
+            'stake_currency': 'USDT',
+            'stake_amount': 100,
+            'dry_run_wallet': 1000,
+            'tradable_balance_ratio': 0.99,
+            'max_open_trades': 2,
+            'fee': 0.001,
+            'export': 'none',
+            'exchange': {
+                'name': 'okx',
+                'pair_whitelist': pairs,
+                'pair_blacklist': [],
+                'simulator': {'seed': 1},
+            },
+            'pairlists': [{'method': 'StaticPairList'}],
+            'entry_pricing': {'price_side': 'same', 'use_order_book': False},
+            'exit_pricing': {'price_side': 'same', 'use_order_book': False},
+            'unfilledtimeout': {'entry': 10, 'exit': 10, 'unit': 'minutes'},
+        }
+    return make_config
+
+
+def run_backtest(config: dict) -> Dict[str, Any]:
+    """Backtest the configured strategy.
+    :return: Backtest results - 'results' holds the trades, sorted like the backtest results"""
+    backtesting = Backtesting(deepcopy(config))
+    try:
+        backtesting._set_strategy(backtesting.strategylist[0])
+        data, timerange = backtesting.load_bt_data()
+        backtesting.load_bt_data_detail()
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = history.get_timerange(
+            trim_dataframes(processed, timerange, backtesting.required_startup))
+        result = backtesting.backtest(processed=processed, start_date=min_date,
+                                      end_date=max_date)
+    finally:
+        Backtesting.cleanup()
+    return result
+
+
+@pytest.fixture
+def backtest_runner():
+    return run_backtest
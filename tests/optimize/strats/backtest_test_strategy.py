@@ -0,0 +1,50 @@
+# pragma pylint: disable=missing-docstring, invalid-name, pointless-string-statement
+from pandas import DataFrame
+
+from freqtrade.strategy import IStrategy
+
+
+class BacktestTestStrategy(IStrategy):
+    """
+    Moving average crossover strategy used to compare backtest engines and loop variants.
+    Signals are sparse, so most candles are idle.
+    """
+    INTERFACE_VERSION = 3
+
+    minimal_roi = {"0": 0.03, "60": 0.01}
+    stoploss = -0.02
+    timeframe = '5m'
+    startup_candle_count = 20
+
+    @property
+    def protections(self):
+        return [
+            {"method": "CooldownPeriod", "stop_duration_candles": 3},
+            {"method": "StoplossGuard", "lookback_period_candles": 60, "trade_limit": 2,
+             "stop_duration_candles": 24, "only_per_pair": True},
+        ]
+
+    def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe['sma_fast'] = dataframe['close'].rolling(5).mean()
+        dataframe['sma_slow'] = dataframe['close'].rolling(20).mean()
+        return dataframe
+
+    def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        cross_up = ((dataframe['sma_fast'] > dataframe['sma_slow'])
+                    & (dataframe['sma_fast'].shift(1) <= dataframe['sma_slow'].shift(1)))
+        cross_down = ((dataframe['sma_fast'] < dataframe['sma_slow'])
+                      & (dataframe['sma_fast'].shift(1) >= dataframe['sma_slow'].shift(1)))
+        dataframe.loc[cross_up, ['enter_long', 'enter_tag']] = (1, 'cross_up')
+        dataframe.loc[cross_down, ['enter_short', 'enter_tag']] = (1, 'cross_down')
+        return dataframe
+
+    def populate_exit_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe.loc[dataframe['close'] < dataframe['sma_slow'] * 0.99,
+                      ['exit_long', 'exit_tag']] = (1, 'below_sma')
+        dataframe.loc[dataframe['close'] > dataframe['sma_slow'] * 1.01,
+                      ['exit_short', 'exit_tag']] = (1, 'above_sma')
+        return dataframe
+
+
+class BacktestTestStrategyShort(BacktestTestStrategy):
+    can_short = True
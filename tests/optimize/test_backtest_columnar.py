@@ -0,0 +1,137 @@
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from freqtrade.enums import CandleType, RunMode
+from freqtrade.exchange import Exchange
+from freqtrade.optimize.backtest_columnar import (PRICE_SIGNAL_COLUMNS, ROW_BLOCK_SIZE,
+                                                  TAG_COLUMNS, ColumnarPairData,
+                                                  DetailPairData, FundingFeeIndex,
+                                                  get_row_dates)
+from freqtrade.optimize.backtesting import HEADERS
+
+
+def _backtest_df(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({'date': pd.date_range('2022-01-01', periods=rows, freq='5min', tz='UTC')})
+    for col in PRICE_SIGNAL_COLUMNS[:4]:
+        df[col] = rng.random(rows)
+    for col in PRICE_SIGNAL_COLUMNS[4:]:
+        df[col] = (rng.random(rows) < 0.05).astype(float)
+    df['enter_tag'] = np.where(df['enter_long'] == 1, 'tag', None)
+    df['exit_tag'] = None
+    return df
+
+
+def test_columnar_pair_data_rows_match_lists():
+    df = _backtest_df(ROW_BLOCK_SIZE * 2 + 17)
+    expected = df[['date', *PRICE_SIGNAL_COLUMNS, *TAG_COLUMNS]].values.tolist()
+    data = ColumnarPairData(df)
+
+    assert len(data) == len(expected)
+    assert [data[idx] for idx in range(len(data))] == expected
+    # Random access - including negative indexes and jumps between blocks
+    for idx in (-1, 0, ROW_BLOCK_SIZE, 3, -len(expected), ROW_BLOCK_SIZE * 2 + 16):
+        assert data[idx] == expected[idx]
+
+    with pytest.raises(IndexError):
+        data[len(expected)]
+    with pytest.raises(IndexError):
+        data[-len(expected) - 1]
+
+
+def _detail_rows(detail: pd.DataFrame, candle_date, timeframe: pd.Timedelta, signals):
+    """Detail rows of one candle - the dataframe filter DetailPairData replaces."""
+    detail = detail.loc[(detail['date'] >= candle_date)
+                        & (detail['date'] < candle_date + timeframe)].copy()
+    if detail.empty:
+        return []
+    for col, value in zip(HEADERS[5:], signals):
+        detail.loc[:, col] = value
+    return detail[HEADERS].values.tolist()
+
+
+def test_detail_pair_data_matches_filter():
+    timeframe = pd.Timedelta(minutes=5)
+    candles = _backtest_df(400)
+    # Candles missing in the backtest timeframe, and in the detail timeframe.
+    candles = candles.drop(candles.index[100:110]).reset_index(drop=True)
+    rng = np.random.default_rng(3)
+    detail = pd.DataFrame({'date': pd.date_range('2021-12-31 23:00', '2022-01-02 12:00',
+                                                 freq='1min', tz='UTC')})
+    for col in ['open', 'high', 'low', 'close', 'volume']:
+        detail[col] = rng.random(len(detail))
+    # Starts after the first candles, has gaps - some candles have no or partial detail rows.
+    detail = detail[(detail['date'] >= '2022-01-01 00:32') & (rng.random(len(detail)) > 0.2)
+                    & ~detail['date'].between('2022-01-01 10:00', '2022-01-01 10:30')
+                    ].reset_index(drop=True)
+
+    data = DetailPairData(detail)
+    data.build_offsets(get_row_dates(ColumnarPairData(candles)), timeframe.value)
+
+    empty = 0
+    for idx, candle in enumerate(candles[['date', *PRICE_SIGNAL_COLUMNS, *TAG_COLUMNS]]
+                                 .values.tolist()):
+        signals = candle[5:]
+        expected = _detail_rows(detail, candle[0], timeframe, signals)
+        assert data.get_rows(idx, signals) == expected, idx
+        empty += not expected
+    assert 0 < empty < len(candles)
+
+
+@pytest.mark.parametrize('futures_funding_rate', [None, 0.0005])
+def test_funding_fee_index_matches_exchange(futures_funding_rate):
+    exchange = Exchange({
+        'runmode': RunMode.BACKTEST, 'dry_run': True, 'trading_mode': 'spot', 'margin_mode': '',
+        'candle_type_def': CandleType.SPOT, 'stake_currency': 'USDT',
+        'exchange': {'name': 'binance', 'pair_whitelist': ['ETH/USDT'], 'simulator': {'seed': 1}},
+    }, validate=False)
+    rng = np.random.default_rng(5)
+    start = pd.Timestamp('2022-01-01', tz='UTC')
+    funding = pd.DataFrame({'date': pd.date_range(start, periods=90, freq='8h')})
+    funding['open'] = rng.normal(0.0001, 0.0002, len(funding))
+    funding.loc[20:22, 'open'] = np.nan
+    mark = pd.DataFrame({'date': pd.date_range(start, periods=180, freq='4h')})
+    mark['open'] = rng.uniform(90, 110, len(mark))
+    # Missing funding and mark candles - NaN rates after an outer merge.
+    df = exchange.combine_funding_and_mark(funding.drop(funding.index[40:43]),
+                                           mark.drop(mark.index[150:155]),
+                                           futures_funding_rate)
+    # Unsorted, as returned by the outer merge
+    df = df.sample(frac=1, random_state=1)
+    index = FundingFeeIndex(df)
+
+    dates = [start + timedelta(hours=hours) for hours in range(-24, 800, 4)]
+    windows = [(dates[i], dates[j]) for i, j in rng.integers(0, len(dates), (400, 2)) if i <= j]
+    windows += [(start, start), (start, start + timedelta(minutes=1)),
+                (start - timedelta(days=3), start - timedelta(days=1)),
+                (start + timedelta(days=50), start + timedelta(days=60))]
+    nans = 0
+    for open_date, close_date in windows:
+        for is_short in (False, True):
+            expected = exchange.calculate_funding_fees(df, 2.5, is_short, open_date, close_date)
+            fees = index.calculate_funding_fees(2.5, is_short, open_date, close_date)
+            assert fees == pytest.approx(expected, rel=1e-9, abs=1e-15, nan_ok=True), (
+                open_date, close_date)
+            nans += np.isnan(expected)
+    assert 0 < nans < len(windows)
+    assert index.calculate_funding_fees(1, False, start, start) == pytest.approx(
+        -funding['open'].iloc[0] * mark['open'].iloc[0])
+
+
+@pytest.mark.parametrize('trading_mode', ['spot', 'futures'])
+@pytest.mark.parametrize('timeframe_detail', [None, '1m'])
+def test_backtest_columnar_engine_trades(backtest_config, backtest_runner, trading_mode,
+                                         timeframe_detail):
+    config = {**backtest_config(trading_mode), 'enable_protections': True}
+    if timeframe_detail:
+        config['timeframe_detail'] = timeframe_detail
+
+    expected = backtest_runner({**config, 'backtest_engine': 'lists'})['results']
+    result = backtest_runner({**config, 'backtest_engine': 'columnar'})['results']
+
+    assert len(expected) > 20
+    assert (expected['exit_reason'] == 'force_exit').any()
+    pd.testing.assert_frame_equal(result, expected)
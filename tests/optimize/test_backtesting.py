@@ -0,0 +1,37 @@
+import pandas as pd
+import pytest
+
+
+def _locks(result):
+    return [(lock.pair, lock.side, lock.lock_time, lock.lock_end_time, lock.reason)
+            for lock in result['locks']]
+
+
+@pytest.mark.parametrize('trading_mode,timeframe_detail,engine', [
+    ('spot', None, 'lists'),
+    ('spot', '1m', 'lists'),
+    ('futures', None, 'lists'),
+    ('futures', '1m', 'lists'),
+    ('futures', '1m', 'columnar'),
+])
+def test_backtest_skip_idle_candles(backtest_config, backtest_runner, trading_mode,
+                                    timeframe_detail, engine):
+    config = {**backtest_config(trading_mode), 'enable_protections': True,
+              'backtest_engine': engine}
+    if timeframe_detail:
+        config['timeframe_detail'] = timeframe_detail
+
+    expected = backtest_runner(config)
+    result = backtest_runner({**config, 'backtest_skip_idle_candles': True})
+
+    assert expected['skipped_candles'] == 0
+    assert result['skipped_candles'] > 500
+    trades = expected['results']
+    assert len(trades) > 20
+    # Trades still open at the end of the backtest
+    assert (trades['exit_reason'] == 'force_exit').any()
+    pd.testing.assert_frame_equal(result['results'], trades)
+    # Pairs locked by protections
+    assert len(expected['locks']) > 0
+    assert _locks(result) == _locks(expected)
+    assert result['rejected_signals'] == expected['rejected_signals']
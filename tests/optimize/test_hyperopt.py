@@ -0,0 +1,117 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from joblib.externals import cloudpickle
+from skopt import Optimizer
+from skopt.space import Integer, Real
+
+from freqtrade.data.converter import trim_dataframes
+from freqtrade.data.history import get_timerange
+from freqtrade.optimize import hyperopt as hyperopt_module
+from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.hyperopt import BACKTESTING_DATA_ATTRS, Hyperopt
+
+
+def _run_async_hyperopt(monkeypatch, random_state: int, jobs: int, epochs: int):
+    # Threads instead of processes - the stub below doesn't need to be pickled.
+    monkeypatch.setattr(hyperopt_module, 'get_reusable_executor',
+                        lambda max_workers: ThreadPoolExecutor(max_workers=max_workers))
+    runtimes = random.Random()
+
+    def generate_optimizer(raw_params):
+        # Runtimes vary (and differ between runs) - epochs finish out of order.
+        time.sleep(runtimes.random() * 0.02)
+        x, y = raw_params
+        return {'loss': (x - 0.3) ** 2 + (y - 4) ** 2, 'params_dict': {'x': x, 'y': y}}
+
+    hyperopt = Hyperopt.__new__(Hyperopt)
+    hyperopt.total_epochs = epochs
+    hyperopt.analyze_per_epoch = False
+    hyperopt.current_best_loss = 100
+    hyperopt.current_best_epoch = None
+    hyperopt.opt = Optimizer([Real(0, 1, name='x'), Integer(1, 10, name='y')],
+                             base_estimator='ET', acq_optimizer='sampling',
+                             n_initial_points=5, random_state=random_state)
+    results = []
+    monkeypatch.setattr(hyperopt, 'generate_optimizer', generate_optimizer, raising=False)
+    monkeypatch.setattr(hyperopt, 'print_results', lambda val: None, raising=False)
+    monkeypatch.setattr(hyperopt, '_save_result', results.append, raising=False)
+
+    hyperopt._run_epochs_async(jobs)
+    return hyperopt, results
+
+
+def test_run_epochs_async_reproducible(monkeypatch):
+    hyperopt, results = _run_async_hyperopt(monkeypatch, random_state=42, jobs=3, epochs=10)
+    hyperopt2, results2 = _run_async_hyperopt(monkeypatch, random_state=42, jobs=3, epochs=10)
+
+    assert [r['current_epoch'] for r in results] == list(range(1, 11))
+    # Same points asked and told in the same order, same losses and best epoch.
+    assert hyperopt.opt.Xi == hyperopt2.opt.Xi
+    assert hyperopt.opt.yi == hyperopt2.opt.yi
+    assert [(r['params_dict'], r['loss'], r['is_best']) for r in results] == \
+        [(r['params_dict'], r['loss'], r['is_best']) for r in results2]
+    assert hyperopt.current_best_epoch['current_epoch'] == \
+        hyperopt2.current_best_epoch['current_epoch']
+    # All asked points are distinct - running epochs are excluded when asking.
+    assert len({tuple(x) for x in hyperopt.opt.Xi}) == 10
+
+
+def test_hyperopt_pickle_leaves_out_backtesting_data(backtest_config, tmp_path):
+    config = backtest_config('futures')
+    config['timeframe_detail'] = '1m'
+    backtesting = Backtesting(config)
+    try:
+        backtesting._set_strategy(backtesting.strategylist[0])
+        data, timerange = backtesting.load_bt_data()
+        backtesting.load_bt_data_detail()
+        # Informative pair - cached by the dataprovider.
+        informative = backtesting.dataprovider.historic_ohlcv('ETH/USDT:USDT', '1m')
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(
+            trim_dataframes(processed, timerange, backtesting.required_startup))
+
+        hyperopt = Hyperopt.__new__(Hyperopt)
+        hyperopt.backtesting = backtesting
+        hyperopt.data_pickle_file = tmp_path / 'hyperopt_tickerdata.pkl'
+        hyperopt._dump_hyperopt_data(processed)
+
+        # Same as Hyperopt.start() before starting the workers.
+        exchange = backtesting.exchange
+        exchange.close()
+        exchange._api = exchange._api_async = exchange.loop = None
+        exchange._loop_lock = exchange._cache_lock = None
+        backtesting.pairlists = None
+
+        state = cloudpickle.dumps(hyperopt)
+        assert backtesting.detail_data and backtesting.funding_fee_index
+        assert len(state) < hyperopt.data_pickle_file.stat().st_size / 10
+
+        hyperopt_module._worker_data.clear()
+        worker = cloudpickle.loads(state)
+        for attr in BACKTESTING_DATA_ATTRS:
+            assert getattr(worker.backtesting, attr) == {}
+        assert worker.backtesting.dataprovider._get_historic_data() == {}
+
+        worker._attach_backtesting_data()
+        assert worker.backtesting.detail_data.keys() == backtesting.detail_data.keys()
+        for pair, detail in backtesting.detail_data.items():
+            np.testing.assert_array_equal(worker.backtesting.detail_data[pair].ohlc, detail.ohlc)
+        for pair, futures in backtesting.futures_data.items():
+            pd.testing.assert_frame_equal(worker.backtesting.futures_data[pair], futures)
+        pd.testing.assert_frame_equal(
+            worker.backtesting.dataprovider.historic_ohlcv('ETH/USDT:USDT', '1m'), informative)
+
+        results = [
+            bt.backtest(processed=data, start_date=min_date, end_date=max_date)['results']
+            for bt, data in ((backtesting, processed),
+                             (worker.backtesting, worker._load_processed_data()))
+        ]
+    finally:
+        Backtesting.cleanup()
+        hyperopt_module._worker_data.clear()
+    assert len(results[0]) > 20
+    pd.testing.assert_frame_equal(results[1], results[0])
@@ -0,0 +1,142 @@
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+from sqlalchemy import String, create_engine, select, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
+
+from freqtrade.persistence.commit_scope import commit_session, grouped_commits, rollback_session
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Entry(_Base):
+    __tablename__ = 'orm_entries'
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(20), unique=True)
+
+
+# Writes 3 blocks of grouped commits with the "performance" profile, and crashes
+# (no cleanup, no rollback) within the 3rd block.
+CRASH_SCRIPT = """
+import os
+import sys
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from freqtrade.persistence.commit_scope import commit_session, grouped_commits
+from freqtrade.persistence.models import DB_PROFILES, _sqlite_pragma_listener
+
+engine = create_engine(sys.argv[1])
+event.listen(engine, 'connect', _sqlite_pragma_listener(DB_PROFILES['performance']['pragmas']))
+session = sessionmaker(bind=engine)()
+session.execute(text('CREATE TABLE entries (id INTEGER PRIMARY KEY, block INTEGER)'))
+session.commit()
+for block in range(3):
+    with grouped_commits(enabled=True):
+        for entry in range(10):
+            session.execute(text('INSERT INTO entries (block) VALUES (:block)'), {'block': block})
+            commit_session(session)
+            if block == 2 and entry == 5:
+                os._exit(3)
+"""
+
+
+def test_grouped_commits_crash_safety(tmp_path):
+    db_file = tmp_path / 'crash.sqlite'
+    res = subprocess.run([sys.executable, '-c', CRASH_SCRIPT, f'sqlite:///{db_file}'],
+                         capture_output=True, text=True)
+    assert res.returncode == 3, res.stderr
+
+    with sqlite3.connect(db_file) as conn:
+        assert conn.execute('PRAGMA integrity_check').fetchone() == ('ok', )
+        assert conn.execute('PRAGMA journal_mode').fetchone() == ('wal', )
+        # Completed blocks are committed entirely - the interrupted block is lost entirely.
+        rows = conn.execute('SELECT block, count(*) FROM entries GROUP BY block').fetchall()
+    assert rows == [(0, 10), (1, 10)]
+
+
+def test_grouped_commits(tmp_path):
+    engine = create_engine(f'sqlite:///{tmp_path / "grouped.sqlite"}')
+    session = sessionmaker(bind=engine)()
+    session.execute(text('CREATE TABLE entries (id INTEGER PRIMARY KEY, block INTEGER)'))
+    session.commit()
+
+    def committed() -> int:
+        with engine.connect() as conn:
+            return conn.execute(text('SELECT count(*) FROM entries')).scalar_one()
+
+    with grouped_commits(enabled=True):
+        # Commit point without changes - its SAVEPOINT must not start the transaction
+        commit_session(session)
+        for _ in range(3):
+            session.execute(text('INSERT INTO entries (block) VALUES (1)'))
+            commit_session(session)
+            # Nested blocks join the outer block
+            with grouped_commits(enabled=True):
+                commit_session(session)
+        assert committed() == 0
+    assert committed() == 3
+
+    # Without a block (or with grouping disabled), every call commits.
+    with grouped_commits(enabled=False):
+        session.execute(text('INSERT INTO entries (block) VALUES (2)'))
+        commit_session(session)
+        assert committed() == 4
+    engine.dispose()
+
+
+def test_rollback_session_grouped(tmp_path):
+    engine = create_engine(f'sqlite:///{tmp_path / "rollback.sqlite"}')
+    _Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, autoflush=False)()
+    session.add_all([_Entry(id=1, name='a'), _Entry(id=2, name='b')])
+    session.commit()
+
+    def names(sess) -> list:
+        return sess.scalars(select(_Entry.name).order_by(_Entry.id)).all()
+
+    with grouped_commits(enabled=True):
+        session.add(_Entry(id=3, name='c'))
+        commit_session(session)
+
+        # Insert, attribute change and delete since the last commit point are rolled back
+        session.add(_Entry(id=4, name='d'))
+        session.get(_Entry, 1).name = 'x'
+        session.delete(session.get(_Entry, 2))
+        rollback_session(session)
+        assert not session.new and not session.dirty and not session.deleted
+        assert names(session) == ['a', 'b', 'c']
+
+        # The same, with the changes flushed already
+        session.add(_Entry(id=4, name='d'))
+        session.get(_Entry, 1).name = 'x'
+        session.delete(session.get(_Entry, 2))
+        session.flush()
+        rollback_session(session)
+        assert names(session) == ['a', 'b', 'c']
+
+        # A failed flush only discards the changes since the last commit point
+        session.get(_Entry, 3).name = 'y'
+        commit_session(session)
+        session.add(_Entry(id=5, name='a'))
+        with pytest.raises(IntegrityError):
+            commit_session(session)
+        rollback_session(session)
+        session.add(_Entry(id=6, name='f'))
+        commit_session(session)
+
+        # Nothing is committed before the end of the block
+        with sessionmaker(bind=engine)() as other:
+            assert names(other) == ['a', 'b']
+
+    with sessionmaker(bind=engine)() as other:
+        assert names(other) == ['a', 'b', 'y', 'f']
+    session.close()
+    engine.dispose()
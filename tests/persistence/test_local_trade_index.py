@@ -0,0 +1,69 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from freqtrade.persistence import LocalTrade
+
+
+PAIRS = ['ETH/USDT', 'XRP/USDT', 'LTC/USDT']
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def _scan(pair=None, open_date=None, close_date=None):
+    """Closed trade query as a scan over all trades - what the index replaces."""
+    return [trade for trade in LocalTrade.trades
+            if (not pair or trade.pair == pair)
+            and (not open_date or trade.open_date > open_date)
+            and trade.close_date and trade.close_date > close_date]
+
+
+@pytest.fixture
+def bt_trades():
+    LocalTrade.reset_trades()
+    rng = random.Random(11)
+    now = START
+    for i in range(300):
+        now += timedelta(minutes=5 * rng.randint(0, 3))
+        trade = LocalTrade(pair=rng.choice(PAIRS), open_rate=10, amount=1, stake_amount=10,
+                           fee_open=0.001, fee_close=0.001, exchange='binance',
+                           open_date=now - timedelta(minutes=5 * rng.randint(1, 50)),
+                           is_open=True)
+        if i % 25 == 0:
+            # Added closed - with a close date out of order, or without close date.
+            trade.is_open = False
+            trade.close_date = now - timedelta(hours=rng.randint(1, 10)) if i % 50 else None
+            LocalTrade.add_bt_trade(trade)
+            continue
+        LocalTrade.add_bt_trade(trade)
+        if rng.random() < 0.8:
+            # Same close dates for several trades
+            trade.close_date = now
+            trade.close_profit_abs = rng.uniform(-1, 1)
+            trade.is_open = False
+            LocalTrade.close_bt_trade(trade)
+    yield
+    LocalTrade.reset_trades()
+
+
+def test_closed_trade_index_matches_scan(bt_trades):
+    dates = [START + timedelta(minutes=5 * minutes) for minutes in range(-24, 800, 7)]
+    queried = 0
+    for close_date in dates:
+        for pair in [None, *PAIRS, 'ADA/USDT']:
+            for open_date in [None, close_date - timedelta(hours=2)]:
+                result = LocalTrade.get_trades_proxy(pair=pair, is_open=False,
+                                                     open_date=open_date, close_date=close_date)
+                assert result == _scan(pair, open_date, close_date), (close_date, pair)
+                queried += bool(result)
+    assert queried > 100
+    assert len(LocalTrade.bt_trades_closed) == sum(bool(t.close_date) for t in LocalTrade.trades)
+
+
+def test_closed_trade_index_unchanged_queries(bt_trades):
+    # Queries without close date don't use the index.
+    open_trades = LocalTrade.get_trades_proxy(is_open=True)
+    assert open_trades == LocalTrade.trades_open and open_trades
+    assert LocalTrade.get_trades_proxy(is_open=False) == LocalTrade.trades
+    assert LocalTrade.get_trades_proxy(pair='ETH/USDT', is_open=False) == [
+        trade for trade in LocalTrade.trades if trade.pair == 'ETH/USDT']
@@ -0,0 +1,61 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from freqtrade.persistence import PairLocks
+
+
+PAIRS = ['ETH/USDT', 'XRP/USDT', 'LTC/USDT', '*']
+SIDES = ['long', 'short', '*']
+REASONS = ['cooldown', 'stoploss', 'drawdown']
+
+
+def _scan(pair, now, side):
+    """Active locks as a scan over all locks - what the index replaces."""
+    return [lock for lock in PairLocks.locks if (
+        lock.lock_end_time >= now
+        and lock.active is True
+        and (pair is None or lock.pair == pair)
+        and (lock.side == '*' or lock.side == side)
+    )]
+
+
+@pytest.fixture
+def bt_locks():
+    PairLocks.use_db = False
+    PairLocks.timeframe = '5m'
+    PairLocks.reset_locks()
+    yield
+    PairLocks.reset_locks()
+    PairLocks.use_db = True
+    PairLocks.timeframe = ''
+
+
+def test_pairlock_index_matches_scan(bt_locks):
+    rng = random.Random(3)
+    now = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    active = 0
+    for _ in range(400):
+        now += timedelta(minutes=5)
+        for _ in range(rng.choice([0, 0, 1, 2])):
+            # Locks of different lengths - later locks may expire first.
+            PairLocks.lock_pair(rng.choice(PAIRS), now + timedelta(minutes=rng.randint(1, 120)),
+                                rng.choice(REASONS), now=now, side=rng.choice(SIDES))
+        if rng.random() < 0.05:
+            PairLocks.unlock_pair(rng.choice(PAIRS), now, side=rng.choice(SIDES))
+        if rng.random() < 0.05:
+            PairLocks.unlock_reason(rng.choice(REASONS), now)
+
+        for pair in [None, *PAIRS, 'ADA/USDT']:
+            for side in SIDES:
+                locks = PairLocks.get_pair_locks(pair, now, side)
+                assert locks == _scan(pair, now, side), (now, pair, side)
+                active += len(locks)
+        for pair in PAIRS[:-1]:
+            assert PairLocks.is_pair_locked(pair, now, 'long') == bool(
+                _scan(pair, now, 'long') or _scan('*', now, 'long'))
+    assert active > 1000
+    # Expired and released locks are kept for the backtest results.
+    assert len(PairLocks.get_all_locks()) > len(_scan(None, now, '*'))
+    assert any(not lock.active for lock in PairLocks.get_all_locks())
@@ -0,0 +1,190 @@
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import pytest
+from sqlalchemy import Float, create_engine, event, func, select
+from sqlalchemy.orm import (DeclarativeBase, Mapped, mapped_column, scoped_session,
+                            sessionmaker)
+
+from freqtrade.persistence import Trade, init_db
+from freqtrade.persistence.performance_cache import PerformanceCache
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _CacheTrade(_Base):
+    __tablename__ = 'trades'
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    close_profit: Mapped[Optional[float]] = mapped_column(Float())
+
+
+@pytest.fixture
+def cache_session(tmp_path):
+    cache = PerformanceCache()
+    engine = create_engine(f'sqlite:///{tmp_path / "perf.sqlite"}')
+    _Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    listeners = [
+        (session_factory, 'after_commit', cache.transaction_end),
+        (session_factory, 'after_rollback', cache.transaction_end),
+        (_CacheTrade.close_profit, 'set', cache.attribute_set),
+        (_CacheTrade, 'after_insert', cache.mapper_event),
+    ]
+    for target, identifier, fn in listeners:
+        event.listen(target, identifier, fn)
+    scope = {'id': 'a'}
+    session = scoped_session(session_factory, scopefunc=lambda: scope['id'])
+
+    yield cache, session, scope
+
+    session.remove()
+    scope['id'] = 'b'
+    session.remove()
+    for target, identifier, fn in listeners:
+        event.remove(target, identifier, fn)
+    engine.dispose()
+
+
+def test_performance_cache_invalidates_per_session(cache_session):
+    cache, session, scope = cache_session
+    calls = []
+
+    def compute():
+        calls.append(scope['id'])
+        return [{'profit': session.execute(select(func.sum(_CacheTrade.close_profit))).scalar()}]
+
+    def use(scope_id):
+        scope['id'] = scope_id
+        return session()
+
+    use('a').add(_CacheTrade(id=1, close_profit=0.1))
+    session.commit()
+    assert cache.get('profit', compute) == [{'profit': 0.1}]
+    assert len(calls) == 1
+
+    # Session "a" changes a trade - results are recomputed, the change isn't committed yet.
+    use('a').get(_CacheTrade, 1).close_profit = 0.3
+    use('b')
+    assert cache.get('profit', compute) == [{'profit': 0.1}]
+    assert len(calls) == 2
+
+    # Commit / rollback of the unchanged session "b" keeps the cached result.
+    session.commit()
+    session.rollback()
+    assert cache.get('profit', compute) == [{'profit': 0.1}]
+    assert len(calls) == 2
+
+    # Commit of session "a" invalidates it.
+    use('a').commit()
+    assert cache.get('profit', compute) == [{'profit': 0.3}]
+    assert len(calls) == 3
+
+    # So does a rollback after a change - but only once.
+    session.get(_CacheTrade, 1).close_profit = 0.5
+    session.rollback()
+    assert cache.get('profit', compute) == [{'profit': 0.3}]
+    assert len(calls) == 4
+    session.rollback()
+    assert cache.get('profit', compute) == [{'profit': 0.3}]
+    assert len(calls) == 4
+
+
+TAGS = [None, 'tag_a', 'tag_b', 'Other']
+PAIRS = ['ETH/USDT', 'XRP/USDT']
+
+
+@pytest.fixture
+def trades_db():
+    init_db('sqlite://')
+    rng = random.Random(7)
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    for i in range(60):
+        closed = i % 10 != 0
+        profit = rng.uniform(-0.05, 0.05)
+        Trade.session.add(Trade(
+            pair=PAIRS[i % 2], stake_amount=100, amount=10, amount_requested=10,
+            open_rate=10, fee_open=0.001, fee_close=0.001, exchange='binance',
+            open_date=start + timedelta(hours=i), is_open=not closed,
+            close_date=start + timedelta(hours=i + 1) if closed else None,
+            close_rate=10 * (1 + profit) if closed else None,
+            close_profit=profit if closed else None,
+            close_profit_abs=profit * 100 if closed else None,
+            enter_tag=rng.choice(TAGS), exit_reason=rng.choice(TAGS) if closed else None,
+        ))
+    Trade.commit()
+    yield
+    Trade.session.remove()
+
+
+def _expected_performance(key, pair=None):
+    """Performance by key, computed from the closed trades one by one."""
+    groups = defaultdict(lambda: [0.0, 0.0, 0])
+    for trade in Trade.get_trades([Trade.is_open.is_(False)]).all():
+        if pair is None or trade.pair == pair:
+            group = groups[key(trade)]
+            group[0] += trade.close_profit
+            group[1] += trade.close_profit_abs
+            group[2] += 1
+    return sorted(groups.items(), key=lambda item: item[1][1], reverse=True)
+
+
+def _assert_performance(result, expected, label):
+    assert [row[label] for row in result] == [_tag(name) for name, _ in expected]
+    for row, (_, (profit, profit_abs, count)) in zip(result, expected):
+        assert row['profit_ratio'] == pytest.approx(profit)
+        assert row['profit_pct'] == round(row['profit_ratio'] * 100, 2)
+        assert row['profit_abs'] == pytest.approx(profit_abs)
+        assert row['count'] == count
+
+
+def _tag(tag):
+    return tag if tag is not None else 'Other'
+
+
+@pytest.mark.parametrize('pair', [None, 'ETH/USDT'])
+def test_tag_performance_matches_trades(trades_db, pair):
+    # Missing tags and the "Other" tag are separate groups with the same name.
+    _assert_performance(Trade.get_enter_tag_performance(pair),
+                        _expected_performance(lambda t: t.enter_tag, pair), 'enter_tag')
+    _assert_performance(Trade.get_exit_reason_performance(pair),
+                        _expected_performance(lambda t: t.exit_reason, pair), 'exit_reason')
+    assert [row['enter_tag'] for row in Trade.get_enter_tag_performance(pair)].count(
+        'Other') == 2
+    # Mixed tags are merged by name.
+    expected = _expected_performance(
+        lambda t: f"{_tag(t.enter_tag)} {_tag(t.exit_reason)}", pair)
+    assert len(expected) == 9
+    _assert_performance(Trade.get_mix_tag_performance(pair), expected, 'mix_tag')
+
+
+def test_mix_tag_performance_invalidated_on_commit(trades_db, mocker):
+    compute = mocker.spy(Trade, '_get_mix_tag_performance')
+
+    def expected():
+        return _expected_performance(
+            lambda t: f"{_tag(t.enter_tag)} {_tag(t.exit_reason)}")
+
+    first = Trade.get_mix_tag_performance(None)
+    assert Trade.get_mix_tag_performance(None) == first
+    assert compute.call_count == 1
+
+    trade = Trade.get_trades([Trade.is_open.is_(True)]).first()
+    trade.enter_tag = 'tag_new'
+    trade.exit_reason = 'roi'
+    trade.close_profit = 0.5
+    trade.close_profit_abs = 50
+    trade.close_date = trade.open_date + timedelta(hours=1)
+    trade.is_open = False
+    Trade.commit()
+
+    result = Trade.get_mix_tag_performance(None)
+    assert compute.call_count == 2
+    assert result[0]['mix_tag'] == 'tag_new roi'
+    _assert_performance(result, expected(), 'mix_tag')
+    assert Trade.get_mix_tag_performance(None) == result
+    assert compute.call_count == 2
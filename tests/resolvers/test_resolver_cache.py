@@ -0,0 +1,162 @@
+import os
+
+import pytest
+import rapidjson
+
+from freqtrade.commands import start_list_strategies
+from freqtrade.commands.arguments import Arguments
+from freqtrade.resolvers import iresolver
+from freqtrade.resolvers.resolver_cache import CACHE_FILENAME, ResolverCache
+from freqtrade.resolvers.strategy_resolver import StrategyResolver
+
+
+STRATEGY = """
+from freqtrade.strategy import IntParameter, IStrategy
+
+
+class {name}(IStrategy):
+    buy_rsi = IntParameter(10, 40, default=30, space='buy')
+{params}
+"""
+
+
+def _write_strategy(directory, filename, name, params=''):
+    (directory / filename).write_text(STRATEGY.format(name=name, params=params))
+
+
+@pytest.fixture
+def strategy_dir(tmp_path):
+    directory = tmp_path / 'strategies'
+    directory.mkdir()
+    _write_strategy(directory, 'strat_a.py', 'StrategyA')
+    _write_strategy(directory, 'strat_b.py', 'StrategyB',
+                    "    sell_rsi = IntParameter(60, 90, default=70, space='sell')\n"
+                    "    sell_adx = IntParameter(20, 40, default=25, space='sell')\n")
+    return directory
+
+
+@pytest.fixture
+def executed(mocker):
+    """
+    New (empty) in-memory cache, as in a new process - returns the names of the modules
+    executed by the resolver.
+    """
+    def new_process():
+        mocker.patch.object(iresolver, 'resolver_cache', ResolverCache())
+        spy.reset_mock()
+
+    spy = mocker.spy(StrategyResolver, '_get_valid_object')
+    new_process()
+
+    def modules():
+        return sorted(call.args[0].name for call in spy.call_args_list)
+    modules.new_process = new_process
+    return modules
+
+
+def _cache_entries(directory):
+    with (directory / '__pycache__' / CACHE_FILENAME).open() as fp:
+        return rapidjson.load(fp)['modules']
+
+
+def test_search_object_skips_other_modules(strategy_dir, executed):
+    # Executes (and caches) all modules.
+    assert StrategyResolver._search_object(strategy_dir, object_name='Missing') == (None, None)
+    assert executed() == ['strat_a.py', 'strat_b.py']
+
+    executed.new_process()
+    obj, _ = StrategyResolver._search_object(strategy_dir, object_name='StrategyB')
+    assert obj.__name__ == 'StrategyB'
+    assert executed() == ['strat_b.py']
+
+    executed.new_process()
+    assert StrategyResolver._search_object(strategy_dir, object_name='Missing') == (None, None)
+    assert executed() == []
+
+
+def test_search_object_module_edited(strategy_dir, executed):
+    StrategyResolver._search_object(strategy_dir, object_name='Missing')
+
+    # strat_a.py now defines another class - the cached names are stale.
+    module = strategy_dir / 'strat_a.py'
+    stat = module.stat()
+    _write_strategy(strategy_dir, 'strat_a.py', 'StrategyC')
+    os.utime(module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    executed.new_process()
+    obj, _ = StrategyResolver._search_object(strategy_dir, object_name='StrategyC')
+    assert obj.__name__ == 'StrategyC'
+    assert 'strat_a.py' in executed()
+    assert list(_cache_entries(strategy_dir)['strat_a.py']['objects']['IStrategy']) == [
+        'StrategyC']
+
+
+def test_search_object_module_touched(strategy_dir, executed, mocker):
+    StrategyResolver._search_object(strategy_dir, object_name='Missing')
+
+    # Modification time changed, content didn't (e.g. git checkout).
+    module = strategy_dir / 'strat_a.py'
+    stat = module.stat()
+    os.utime(module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    executed.new_process()
+    hash_spy = mocker.spy(ResolverCache, '_hash')
+    StrategyResolver._search_object(strategy_dir, object_name='Missing')
+    assert executed() == []
+    assert [call.args[0].name for call in hash_spy.call_args_list] == ['strat_a.py']
+    # The new modification time is stored - the module isn't hashed again.
+    assert _cache_entries(strategy_dir)['strat_a.py']['mtime_ns'] == stat.st_mtime_ns + 10 ** 9
+    executed.new_process()
+    hash_spy.reset_mock()
+    StrategyResolver._search_object(strategy_dir, object_name='Missing')
+    assert hash_spy.call_count == 0
+
+
+def test_search_object_import_failure_not_cached(strategy_dir, executed):
+    (strategy_dir / 'broken.py').write_text(
+        'import freqtrade_module_missing\n' + STRATEGY.format(name='StrategyBroken', params=''))
+
+    StrategyResolver._search_object(strategy_dir, object_name='Missing')
+    assert executed() == ['broken.py', 'strat_a.py', 'strat_b.py']
+    assert 'broken.py' not in _cache_entries(strategy_dir)
+
+    # Executed again - the import might work now.
+    executed.new_process()
+    StrategyResolver._search_object(strategy_dir, object_name='Missing')
+    assert executed() == ['broken.py']
+
+
+def test_search_all_objects_without_load(strategy_dir, executed):
+    loaded = StrategyResolver._search_all_objects(strategy_dir, enum_failed=True)
+    assert executed() == ['strat_a.py', 'strat_b.py']
+
+    executed.new_process()
+    cached = StrategyResolver._search_all_objects(strategy_dir, enum_failed=True, load=False)
+    assert executed() == []
+
+    def key(obj):
+        return obj['name']
+    assert [obj['name'] for obj in sorted(cached, key=key)] == ['StrategyA', 'StrategyB']
+    assert all(obj['class'] is None for obj in cached)
+    for obj, expected in zip(sorted(cached, key=key), sorted(loaded, key=key)):
+        assert obj['location'] == expected['location']
+        assert obj['hyperoptable'] == expected['hyperoptable']
+    assert sorted(cached, key=key)[1]['hyperoptable'] == {
+        'buy': 1, 'sell': 2, 'protection': 0, 'count': 3}
+
+
+def test_list_strategies_from_cache(strategy_dir, executed, tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'user_data').mkdir()
+    args = Arguments(['list-strategies', '--strategy-path', str(strategy_dir),
+                      '--no-color']).get_parsed_arg()
+    start_list_strategies(args)
+    output = capsys.readouterr().out
+    assert executed() == ['strat_a.py', 'strat_b.py']
+
+    executed.new_process()
+    start_list_strategies(args)
+    assert capsys.readouterr().out == output
+    assert executed() == []
+    assert 'LOAD FAILED' not in output
+    assert 'StrategyB' in output and 'Yes' in output
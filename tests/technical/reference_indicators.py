@@ -0,0 +1,910 @@
+"""
+Row-wise implementations of indicators, as they were before being vectorized.
+Used as reference to verify the vectorized implementations return the same results.
+"""
+import math
+
+import numpy as np
+import pandas as pd
+import talib.abstract as ta
+from pandas import DataFrame
+
+from technical.indicators import vwma
+
+
+def laguerre(dataframe, gamma=0.75, smooth=1, debug=bool):
+    """
+    laguerre RSI
+    Author Creslin
+    Original Author: John Ehlers 1979
+
+    :param dataframe: df
+    :param gamma: Between 0 and 1, default 0.75
+    :param smooth: 1 is off. Valid values over 1 are alook back smooth for an ema
+    :param debug: Bool, prints to console
+    :return: Laguerre RSI:values 0 to +1
+    """
+    """
+    Laguerra RSI
+    How to trade lrsi:  (TL, DR) buy on the flat 0, sell on the drop from top,
+    not when touch the top
+    http://systemtradersuccess.com/testing-laguerre-rsi/
+
+    http://www.davenewberg.com/Trading/TS_Code/Ehlers_Indicators/Laguerre_RSI.html
+    """
+
+    df = dataframe
+    g = gamma
+    smooth = smooth
+    debug = debug
+    if debug:
+        from pandas import set_option
+
+        set_option("display.max_rows", 2000)
+        set_option("display.max_columns", 8)
+
+    """
+    Vectorised pandas or numpy calculations are not used
+    in Laguerre as L0 is self referencing.
+    Therefore we use an intertuples loop as next best option.
+    """
+    lrsi_l = []
+    L0, L1, L2, L3 = 0.0, 0.0, 0.0, 0.0
+    for row in df.itertuples(index=True, name="lrsi"):
+        """
+        Original Pine Logic  Block1
+        p = close
+        L0 = ((1 - g)*p)+(g*nz(L0[1]))
+        L1 = (-g*L0)+nz(L0[1])+(g*nz(L1[1]))
+        L2 = (-g*L1)+nz(L1[1])+(g*nz(L2[1]))
+        L3 = (-g*L2)+nz(L2[1])+(g*nz(L3[1]))
+        """
+        # Feed back loop
+        L0_1, L1_1, L2_1, L3_1 = L0, L1, L2, L3
+
+        L0 = (1 - g) * row.close + g * L0_1
+        L1 = -g * L0 + L0_1 + g * L1_1
+        L2 = -g * L1 + L1_1 + g * L2_1
+        L3 = -g * L2 + L2_1 + g * L3_1
+
+        """ Original Pinescript Block 2
+        cu=(L0 > L1? L0 - L1: 0) + (L1 > L2? L1 - L2: 0) + (L2 > L3? L2 - L3: 0)
+        cd=(L0 < L1? L1 - L0: 0) + (L1 < L2? L2 - L1: 0) + (L2 < L3? L3 - L2: 0)
+        """
+        cu = 0.0
+        cd = 0.0
+        if L0 >= L1:
+            cu = L0 - L1
+        else:
+            cd = L1 - L0
+
+        if L1 >= L2:
+            cu = cu + L1 - L2
+        else:
+            cd = cd + L2 - L1
+
+        if L2 >= L3:
+            cu = cu + L2 - L3
+        else:
+            cd = cd + L3 - L2
+
+        """Original Pinescript  Block 3
+        lrsi=ema((cu+cd==0? -1: cu+cd)==-1? 0: (cu/(cu+cd==0? -1: cu+cd)), smooth)
+        """
+        if (cu + cd) != 0:
+            lrsi_l.append(cu / (cu + cd))
+        else:
+            lrsi_l.append(0)
+
+    return lrsi_l
+
+
+def VIDYA(dataframe, length=9, select=True):
+    """
+    Source: https://www.tradingview.com/script/64ynXU2e/
+    Author: Tushar Chande
+    Pinescript Author: KivancOzbilgic
+
+    Variable Index Dynamic Average VIDYA
+
+    To achieve the goals, the indicator filters out the market fluctuations (noises)
+    by averaging the price values of the periods, over which it is calculated.
+    In the process, some extra value (weight) is added to the average prices,
+    as it is done during calculations of all weighted indicators, such as EMA , LWMA, and SMMA.
+    But during the VIDIYA indicator's calculation, every period's price
+    receives a weight increment adapted to the current market's volatility .
+
+    select: True = CMO, False= StDev as volatility index
+    usage:
+      dataframe['VIDYA'] = VIDYA(dataframe)
+    """
+    df = dataframe.copy()
+    alpha = 2 / (length + 1)
+    df["momm"] = df["close"].diff()
+    df["m1"] = np.where(df["momm"] >= 0, df["momm"], 0.0)
+    df["m2"] = np.where(df["momm"] >= 0, 0.0, -df["momm"])
+
+    df["sm1"] = df["m1"].rolling(length).sum()
+    df["sm2"] = df["m2"].rolling(length).sum()
+
+    df["chandeMO"] = 100 * (df["sm1"] - df["sm2"]) / (df["sm1"] + df["sm2"])
+    if select:
+        df["k"] = abs(df["chandeMO"]) / 100
+    else:
+        df["k"] = df["close"].rolling(length).std()
+
+    cols = ["momm", "m1", "m2", "sm1", "sm2", "chandeMO", "k"]
+    df.loc[:, cols] = df.loc[:, cols].fillna(0.0)
+
+    df["VIDYA"] = 0.0
+    for i in range(length, len(df)):
+        df["VIDYA"].iat[i] = (
+            alpha * df["k"].iat[i] * df["close"].iat[i]
+            + (1 - alpha * df["k"].iat[i]) * df["VIDYA"].iat[i - 1]
+        )
+
+    return df["VIDYA"]
+
+
+def PMAX(dataframe, period=10, multiplier=3, length=12, MAtype=1, src=1):  # noqa: C901
+    """
+    Function to compute PMAX
+    Source: https://www.tradingview.com/script/sU9molfV/
+    Pinescript Author: KivancOzbilgic
+
+    Args :
+        df : Pandas DataFrame with the columns ['date', 'open', 'high', 'low', 'close', 'volume']
+        period : Integer indicates the period of computation in terms of number of candles
+        multiplier : Integer indicates value to multiply the ATR
+        length: moving averages length
+        MAtype: type of the moving average
+
+    Returns :
+        df : Pandas DataFrame with new columns added for
+            True Range (TR), ATR (ATR_$period)
+            PMAX (pm_$period_$multiplier_$length_$Matypeint)
+            PMAX Direction (pmX_$period_$multiplier_$length_$Matypeint)
+    """
+    import talib.abstract as ta
+
+    df = dataframe.copy()
+    mavalue = "MA_" + str(MAtype) + "_" + str(length)
+    atr = "ATR_" + str(period)
+    df[atr] = ta.ATR(df, timeperiod=period)
+    pm = "pm_" + str(period) + "_" + str(multiplier) + "_" + str(length) + "_" + str(MAtype)
+    pmx = "pmX_" + str(period) + "_" + str(multiplier) + "_" + str(length) + "_" + str(MAtype)
+    # MAtype==1 --> EMA
+    # MAtype==2 --> DEMA
+    # MAtype==3 --> T3
+    # MAtype==4 --> SMA
+    # MAtype==5 --> VIDYA
+    # MAtype==6 --> TEMA
+    # MAtype==7 --> WMA
+    # MAtype==8 --> VWMA
+    if src == 1:
+        masrc = df["close"]
+    elif src == 2:
+        masrc = (df["high"] + df["low"]) / 2
+    elif src == 3:
+        masrc = (df["high"] + df["low"] + df["close"] + df["open"]) / 4
+    if MAtype == 1:
+        df[mavalue] = ta.EMA(masrc, timeperiod=length)
+    elif MAtype == 2:
+        df[mavalue] = ta.DEMA(masrc, timeperiod=length)
+    elif MAtype == 3:
+        df[mavalue] = ta.T3(masrc, timeperiod=length)
+    elif MAtype == 4:
+        df[mavalue] = ta.SMA(masrc, timeperiod=length)
+    elif MAtype == 5:
+        df[mavalue] = VIDYA(df, length=length)
+    elif MAtype == 6:
+        df[mavalue] = ta.TEMA(masrc, timeperiod=length)
+    elif MAtype == 7:
+        df[mavalue] = ta.WMA(df, timeperiod=length)
+    elif MAtype == 8:
+        df[mavalue] = vwma(df, length)
+    # Compute basic upper and lower bands
+    df["basic_ub"] = df[mavalue] + (multiplier * df[atr])
+    df["basic_lb"] = df[mavalue] - (multiplier * df[atr])
+    # Compute final upper and lower bands
+    df["final_ub"] = 0.00
+    df["final_lb"] = 0.00
+    for i in range(period, len(df)):
+        df["final_ub"].iat[i] = (
+            df["basic_ub"].iat[i]
+            if (
+                df["basic_ub"].iat[i] < df["final_ub"].iat[i - 1]
+                or df[mavalue].iat[i - 1] > df["final_ub"].iat[i - 1]
+            )
+            else df["final_ub"].iat[i - 1]
+        )
+        df["final_lb"].iat[i] = (
+            df["basic_lb"].iat[i]
+            if (
+                df["basic_lb"].iat[i] > df["final_lb"].iat[i - 1]
+                or df[mavalue].iat[i - 1] < df["final_lb"].iat[i - 1]
+            )
+            else df["final_lb"].iat[i - 1]
+        )
+
+    # Set the Pmax value
+    df[pm] = 0.00
+    for i in range(period, len(df)):
+        df[pm].iat[i] = (
+            df["final_ub"].iat[i]
+            if (
+                df[pm].iat[i - 1] == df["final_ub"].iat[i - 1]
+                and df[mavalue].iat[i] <= df["final_ub"].iat[i]
+            )
+            else df["final_lb"].iat[i]
+            if (
+                df[pm].iat[i - 1] == df["final_ub"].iat[i - 1]
+                and df[mavalue].iat[i] > df["final_ub"].iat[i]
+            )
+            else df["final_lb"].iat[i]
+            if (
+                df[pm].iat[i - 1] == df["final_lb"].iat[i - 1]
+                and df[mavalue].iat[i] >= df["final_lb"].iat[i]
+            )
+            else df["final_ub"].iat[i]
+            if (
+                df[pm].iat[i - 1] == df["final_lb"].iat[i - 1]
+                and df[mavalue].iat[i] < df["final_lb"].iat[i]
+            )
+            else 0.00
+        )
+
+    # Mark the trend direction up/down
+    df[pmx] = np.where((df[pm] > 0.00), np.where((df[mavalue] < df[pm]), "down", "up"), "nan")
+    # Remove basic and final bands from the columns
+    df.drop(["basic_ub", "basic_lb", "final_ub", "final_lb"], inplace=True, axis=1)
+
+    cols = [pm, pmx, atr, mavalue]
+    df.loc[:, cols] = df.loc[:, cols].fillna(0.0)
+
+    return df
+
+
+def tv_wma(dataframe: DataFrame, length: int = 9, field="close") -> DataFrame:
+    """
+    Source: Tradingview "Moving Average Weighted"
+    Pinescript Author: Unknown
+
+    Args :
+        dataframe : Pandas Dataframe
+        length : WMA length
+        field : Field to use for the calculation
+
+    Returns :
+        dataframe : Pandas DataFrame with new columns 'tv_wma'
+    """
+
+    norm = 0
+    sum = 0
+
+    for i in range(1, length - 1):
+        weight = (length - i) * length
+        norm = norm + weight
+        sum = sum + dataframe[field].shift(i) * weight
+
+    dataframe["tv_wma"] = sum / norm
+    return dataframe
+
+
+
+def heikinashi(bars):
+    bars = bars.copy()
+    bars['ha_close'] = (bars['open'] + bars['high'] +
+                        bars['low'] + bars['close']) / 4
+
+    # ha open
+    bars.at[0, 'ha_open'] = (bars.at[0, 'open'] + bars.at[0, 'close']) / 2
+    for i in range(1, len(bars)):
+        bars.at[i, 'ha_open'] = (bars.at[i - 1, 'ha_open'] + bars.at[i - 1, 'ha_close']) / 2
+
+    bars['ha_high'] = bars.loc[:, ['high', 'ha_open', 'ha_close']].max(axis=1)
+    bars['ha_low'] = bars.loc[:, ['low', 'ha_open', 'ha_close']].min(axis=1)
+
+    return pd.DataFrame(index=bars.index,
+                        data={'open': bars['ha_open'],
+                              'high': bars['ha_high'],
+                              'low': bars['ha_low'],
+                              'close': bars['ha_close']})
+
+
+def rsi(series, window=14):
+    """
+    compute the n period relative strength indicator
+    """
+
+    # 100-(100/relative_strength)
+    deltas = np.diff(series)
+    seed = deltas[:window + 1]
+
+    # default values
+    ups = seed[seed > 0].sum() / window
+    downs = -seed[seed < 0].sum() / window
+    rsival = np.zeros_like(series)
+    rsival[:window] = 100. - 100. / (1. + ups / downs)
+
+    # period values
+    for i in range(window, len(series)):
+        delta = deltas[i - 1]
+        if delta > 0:
+            upval = delta
+            downval = 0
+        else:
+            upval = 0
+            downval = -delta
+
+        ups = (ups * (window - 1) + upval) / window
+        downs = (downs * (window - 1.) + downval) / window
+        rsival[i] = 100. - 100. / (1. + ups / downs)
+
+    # return rsival
+    return pd.Series(index=series.index, data=rsival)
+
+
+
+def mmar(dataframe, matype="EMA", src="close", debug=False):  # noqa: C901
+    """
+    Madrid Moving Average Ribbon
+
+    Returns: MMAR
+    """
+    """
+    Author(Freqtrade): Creslinux
+    Original Author(TrdingView): "Madrid"
+
+    Pinescript from TV Source Code and Description
+    //
+    // Madrid : 17/OCT/2014 22:51M: Moving Average Ribbon : 2.0 : MMAR
+    // http://madridjourneyonws.blogspot.com/
+    //
+    // This plots a moving average ribbon, either exponential or standard.
+    // This study is best viewed with a dark background.  It provides an easy
+    // and fast way to determine the trend direction and possible reversals.
+    //
+    // Lime : Uptrend. Long trading
+    // Green : Reentry (buy the dip) or downtrend reversal warning
+    // Red : Downtrend. Short trading
+    // Maroon : Short Reentry (sell the peak) or uptrend reversal warning
+    //
+    // To best determine if this is a reentry point or a trend reversal
+    // the MMARB (Madrid Moving Average Ribbon Bar) study is used.
+    // This is the bar located at the bottom.  This bar signals when a
+    // current trend reentry is found (partially filled with opposite dark color)
+    // or when a trend reversal is ahead (completely filled with opposite dark color).
+    //
+
+    study(title="Madrid Moving Average Ribbon", shorttitle="MMAR", overlay=true)
+    exponential = input(true, title="Exponential MA")
+
+    src = close
+
+    ma05 = exponential ? ema(src, 05) : sma(src, 05)
+    ma10 = exponential ? ema(src, 10) : sma(src, 10)
+    ma15 = exponential ? ema(src, 15) : sma(src, 15)
+    ma20 = exponential ? ema(src, 20) : sma(src, 20)
+    ma25 = exponential ? ema(src, 25) : sma(src, 25)
+    ma30 = exponential ? ema(src, 30) : sma(src, 30)
+    ma35 = exponential ? ema(src, 35) : sma(src, 35)
+    ma40 = exponential ? ema(src, 40) : sma(src, 40)
+    ma45 = exponential ? ema(src, 45) : sma(src, 45)
+    ma50 = exponential ? ema(src, 50) : sma(src, 50)
+    ma55 = exponential ? ema(src, 55) : sma(src, 55)
+    ma60 = exponential ? ema(src, 60) : sma(src, 60)
+    ma65 = exponential ? ema(src, 65) : sma(src, 65)
+    ma70 = exponential ? ema(src, 70) : sma(src, 70)
+    ma75 = exponential ? ema(src, 75) : sma(src, 75)
+    ma80 = exponential ? ema(src, 80) : sma(src, 80)
+    ma85 = exponential ? ema(src, 85) : sma(src, 85)
+    ma90 = exponential ? ema(src, 90) : sma(src, 90)
+    ma100 = exponential ? ema(src, 100) : sma(src, 100)
+
+    leadMAColor = change(ma05)>=0 and ma05>ma100 ? lime
+                : change(ma05)<0  and ma05>ma100 ? maroon
+                : change(ma05)<=0 and ma05<ma100 ? red
+                : change(ma05)>=0 and ma05<ma100 ? green
+                : gray
+    maColor(ma, maRef) =>
+                  change(ma)>=0 and ma05>maRef ? lime
+                : change(ma)<0  and ma05>maRef ? maroon
+                : change(ma)<=0 and ma05<maRef ? red
+                : change(ma)>=0 and ma05<maRef ? green
+                : gray
+
+    plot( ma05, color=leadMAColor, style=line, title="MMA05", linewidth=3)
+    plot( ma10, color=maColor(ma10,ma100), style=line, title="MMA10", linewidth=1)
+    plot( ma15, color=maColor(ma15,ma100), style=line, title="MMA15", linewidth=1)
+    plot( ma20, color=maColor(ma20,ma100), style=line, title="MMA20", linewidth=1)
+    plot( ma25, color=maColor(ma25,ma100), style=line, title="MMA25", linewidth=1)
+    plot( ma30, color=maColor(ma30,ma100), style=line, title="MMA30", linewidth=1)
+    plot( ma35, color=maColor(ma35,ma100), style=line, title="MMA35", linewidth=1)
+    plot( ma40, color=maColor(ma40,ma100), style=line, title="MMA40", linewidth=1)
+    plot( ma45, color=maColor(ma45,ma100), style=line, title="MMA45", linewidth=1)
+    plot( ma50, color=maColor(ma50,ma100), style=line, title="MMA50", linewidth=1)
+    plot( ma55, color=maColor(ma55,ma100), style=line, title="MMA55", linewidth=1)
+    plot( ma60, color=maColor(ma60,ma100), style=line, title="MMA60", linewidth=1)
+    plot( ma65, color=maColor(ma65,ma100), style=line, title="MMA65", linewidth=1)
+    plot( ma70, color=maColor(ma70,ma100), style=line, title="MMA70", linewidth=1)
+    plot( ma75, color=maColor(ma75,ma100), style=line, title="MMA75", linewidth=1)
+    plot( ma80, color=maColor(ma80,ma100), style=line, title="MMA80", linewidth=1)
+    plot( ma85, color=maColor(ma85,ma100), style=line, title="MMA85", linewidth=1)
+    plot( ma90, color=maColor(ma90,ma100), style=line, title="MMA90", linewidth=3)
+    :return:
+    """
+    import talib as ta
+
+    matype = matype
+    src = src
+    df = dataframe
+    debug = debug
+
+    # Default to EMA, allow SMA if passed to def.
+    if matype == "EMA" or matype == "ema":
+        ma = ta.EMA
+    elif matype == "SMA" or matype == "sma":
+        ma = ta.SMA
+    else:
+        ma = ta.EMA
+
+    # Get MAs, also last MA in own column to pass to def later
+    df["ma05"] = ma(df[src], 5)
+    df["ma05l"] = df["ma05"].shift(+1)
+    df["ma10"] = ma(df[src], 10)
+    df["ma10l"] = df["ma10"].shift(+1)
+    df["ma20"] = ma(df[src], 20)
+    df["ma20l"] = df["ma20"].shift(+1)
+    df["ma30"] = ma(df[src], 30)
+    df["ma30l"] = df["ma30"].shift(+1)
+    df["ma40"] = ma(df[src], 40)
+    df["ma40l"] = df["ma40"].shift(+1)
+    df["ma50"] = ma(df[src], 50)
+    df["ma50l"] = df["ma50"].shift(+1)
+    df["ma60"] = ma(df[src], 60)
+    df["ma60l"] = df["ma60"].shift(+1)
+    df["ma70"] = ma(df[src], 70)
+    df["ma70l"] = df["ma70"].shift(+1)
+    df["ma80"] = ma(df[src], 80)
+    df["ma80l"] = df["ma80"].shift(+1)
+    df["ma90"] = ma(df[src], 90)
+    df["ma90l"] = df["ma90"].shift(+1)
+    df["ma100"] = ma(df[src], 100)
+    df["ma100l"] = df["ma100"].shift(+1)
+
+    """ logic for LeadMA
+    : change(ma05)>=0 and ma05>ma100 ? lime    +2
+    : change(ma05)<0  and ma05>ma100 ? maroon  -1
+    : change(ma05)<=0 and ma05<ma100 ? red     -2
+    : change(ma05)>=0 and ma05<ma100 ? green   +1
+    : gray
+    """
+
+    def leadMAc(x):
+        if (x["ma05"] - x["ma05l"]) >= 0 and (x["ma05"] > x["ma100"]):
+            # Lime: Uptrend.Long trading
+            x["leadMA"] = "lime"
+            return x["leadMA"]
+        elif (x["ma05"] - x["ma05l"]) < 0 and (x["ma05"] > x["ma100"]):
+            # Maroon : Short Reentry (sell the peak) or uptrend reversal warning
+            x["leadMA"] = "maroon"
+            return x["leadMA"]
+        elif (x["ma05"] - x["ma05l"]) <= 0 and (x["ma05"] < x["ma100"]):
+            # Red : Downtrend. Short trading
+            x["leadMA"] = "red"
+            return x["leadMA"]
+        elif (x["ma05"] - x["ma05l"]) >= 0 and (x["ma05"] < x["ma100"]):
+            # Green: Reentry(buy the dip) or downtrend reversal warning
+            x["leadMA"] = "green"
+            return x["leadMA"]
+        else:
+            # If its great it means not enough ticker data for lookback
+            x["leadMA"] = "grey"
+            return x["leadMA"]
+
+    df["leadMA"] = df.apply(leadMAc, axis=1)
+
+    """   Logic for MAs
+    : change(ma)>=0 and ma05>ma100 ? lime
+    : change(ma)<0  and ma05>ma100 ? maroon
+    : change(ma)<=0 and ma05<ma100 ? red
+    : change(ma)>=0 and ma05<ma100 ? green
+    : gray
+    """
+
+    def maColor(x, ma):
+        col_label = "_".join([ma, "c"])
+        col_lable_l = "".join([ma, "l"])
+
+        if (x[ma] - x[col_lable_l]) >= 0 and (x[ma] > x["ma100"]):
+            # Lime: Uptrend.Long trading
+            x[col_label] = "lime"
+            return x[col_label]
+        elif (x[ma] - x[col_lable_l]) < 0 and (x[ma] > x["ma100"]):
+            # Maroon : Short Reentry (sell the peak) or uptrend reversal warning
+            x[col_label] = "maroon"
+            return x[col_label]
+
+        elif (x[ma] - x[col_lable_l]) <= 0 and (x[ma] < x["ma100"]):
+            # Red : Downtrend. Short trading
+            x[col_label] = "red"
+            return x[col_label]
+
+        elif (x[ma] - x[col_lable_l]) >= 0 and (x[ma] < x["ma100"]):
+            # Green: Reentry(buy the dip) or downtrend reversal warning
+            x[col_label] = "green"
+            return x[col_label]
+        else:
+            # If its great it means not enough ticker data for lookback
+            x[col_label] = "grey"
+            return x[col_label]
+
+    df["ma05_c"] = df.apply(maColor, ma="ma05", axis=1)
+    df["ma10_c"] = df.apply(maColor, ma="ma10", axis=1)
+    df["ma20_c"] = df.apply(maColor, ma="ma20", axis=1)
+    df["ma30_c"] = df.apply(maColor, ma="ma30", axis=1)
+    df["ma40_c"] = df.apply(maColor, ma="ma40", axis=1)
+    df["ma50_c"] = df.apply(maColor, ma="ma50", axis=1)
+    df["ma60_c"] = df.apply(maColor, ma="ma60", axis=1)
+    df["ma70_c"] = df.apply(maColor, ma="ma70", axis=1)
+    df["ma80_c"] = df.apply(maColor, ma="ma80", axis=1)
+    df["ma90_c"] = df.apply(maColor, ma="ma90", axis=1)
+
+    if debug:
+        from pandas import set_option
+
+        set_option("display.max_rows", 10)
+        print(
+            df[
+                [
+                    "date",
+                    "leadMA",
+                    "ma05",
+                    "ma05l",
+                    "ma05_c",
+                    "ma10",
+                    "ma10l",
+                    "ma10_c",
+                    # "ma20", "ma20l", "ma20_c",
+                    # "ma30", "ma30l", "ma30_c",
+                    # "ma40", "ma40l", "ma40_c",
+                    # "ma50", "ma50l", "ma50_c",
+                    # "ma60", "ma60l", "ma60_c",
+                    # "ma70", "ma70l", "ma70_c",
+                    # "ma80", "ma80l", "ma80_c",
+                    "ma90",
+                    "ma90l",
+                    "ma90_c",
+                    "ma100",
+                    "leadMA",
+                ]
+            ].tail(200)
+        )
+
+        print(
+            df[
+                [
+                    "date",
+                    "close",
+                    "leadMA",
+                    "ma10_c",
+                    "ma20_c",
+                    "ma30_c",
+                    "ma40_c",
+                    "ma50_c",
+                    "ma60_c",
+                    "ma70_c",
+                    "ma80_c",
+                    "ma90_c",
+                ]
+            ].tail(684)
+        )
+
+    return (
+        df["leadMA"],
+        df["ma10_c"],
+        df["ma20_c"],
+        df["ma30_c"],
+        df["ma40_c"],
+        df["ma50_c"],
+        df["ma60_c"],
+        df["ma70_c"],
+        df["ma80_c"],
+        df["ma90_c"],
+    )
+
+
+def madrid_sqz(datafame, length=34, src="close", ref=13, sqzLen=5):
+    """
+    Squeeze Madrid Indicator
+
+    Author: Creslinux
+    Original Author: Madrid - Tradingview
+    https://www.tradingview.com/script/9bUUSzM3-Madrid-Trend-Squeeze/
+
+    :param datafame:
+    :param lenght: min 14 - default 34
+    :param src: default close
+    :param ref: default 13
+    :param sqzLen: default 5
+    :return: df['sqz_cma_c'], df['sqz_rma_c'], df['sqz_sma_c']
+
+
+    There are seven colors used for the study
+
+    Green : Uptrend in general
+    Lime : Spots the current uptrend leg
+    Aqua : The maximum profitability of the leg in a long trade
+    The Squeeze happens when Green+Lime+Aqua are aligned (the larger the values the better)
+
+    Maroon : Downtrend in general
+    Red : Spots the current downtrend leg
+    Fuchsia: The maximum profitability of the leg in a short trade
+    The Squeeze happens when Maroon+Red+Fuchsia are aligned (the larger the values the better)
+
+    Yellow : The trend has come to a pause and it is either a reversal warning or a continuation.
+    These are the entry, re-entry or closing position points.
+    """
+
+    """
+    Original Pinescript source code
+
+    ma = ema(src, len)
+    closema = close - ma
+    refma = ema(src, ref) - ma
+    sqzma = ema(src, sqzLen) - ma
+
+    hline(0)
+    plotcandle(0, closema, 0, closema, color=closema >= 0?aqua: fuchsia)
+    plotcandle(0, sqzma, 0, sqzma, color=sqzma >= 0?lime: red)
+    plotcandle(0, refma, 0, refma, color=(refma >= 0 and closema < refma) or (
+                refma < 0 and closema > refma) ? yellow: refma >= 0 ? green: maroon)
+    """
+    import talib as ta
+
+    len = length
+    src = src
+    ref = ref
+    sqzLen = sqzLen
+    df = datafame
+    ema = ta.EMA
+
+    """ Original code logic
+    ma = ema(src, len)
+    closema = close - ma
+    refma = ema(src, ref) - ma
+    sqzma = ema(src, sqzLen) - ma
+    """
+    df["sqz_ma"] = ema(df[src], len)
+    df["sqz_cma"] = df["close"] - df["sqz_ma"]
+    df["sqz_rma"] = ema(df[src], ref) - df["sqz_ma"]
+    df["sqz_sma"] = ema(df[src], sqzLen) - df["sqz_ma"]
+
+    """ Original code logic
+    plotcandle(0, closema, 0, closema, color=closema >= 0?aqua: fuchsia)
+    plotcandle(0, sqzma, 0, sqzma, color=sqzma >= 0?lime: red)
+
+    plotcandle(0, refma, 0, refma, color=
+    (refma >= 0 and closema < refma) or (refma < 0 and closema > refma) ? yellow:
+    refma >= 0 ? green: maroon)
+    """
+
+    # print(df[['sqz_cma', 'sqz_rma', 'sqz_sma']])
+
+    def sqz_cma_c(x):
+        if x["sqz_cma"] >= 0:
+            x["sqz_cma_c"] = "aqua"
+            return x["sqz_cma_c"]
+        else:
+            x["sqz_cma_c"] = "fuchsia"
+            return x["sqz_cma_c"]
+
+    df["sqz_cma_c"] = df.apply(sqz_cma_c, axis=1)
+
+    def sqz_sma_c(x):
+        if x["sqz_sma"] >= 0:
+            x["sqz_sma_c"] = "lime"
+            return x["sqz_sma_c"]
+        else:
+            x["sqz_sma_c"] = "red"
+            return x["sqz_sma_c"]
+
+    df["sqz_sma_c"] = df.apply(sqz_sma_c, axis=1)
+
+    def sqz_rma_c(x):
+        if x["sqz_rma"] >= 0 and x["sqz_cma"] < x["sqz_rma"]:
+            x["sqz_rma_c"] = "yellow"
+            return x["sqz_rma_c"]
+        elif x["sqz_rma"] < 0 and x["sqz_cma"] > x["sqz_rma"]:
+            x["sqz_rma_c"] = "yellow"
+            return x["sqz_rma_c"]
+        elif x["sqz_rma"] >= 0:
+            x["sqz_rma_c"] = "green"
+            return x["sqz_rma_c"]
+        else:
+            x["sqz_rma_c"] = "maroon"
+            return x["sqz_rma_c"]
+
+    df["sqz_rma_c"] = df.apply(sqz_rma_c, axis=1)
+
+    # print(df[['sqz_cma_c', 'sqz_rma_c', 'sqz_sma_c']])
+    return df["sqz_cma_c"], df["sqz_rma_c"], df["sqz_sma_c"]
+
+
+def vfi(dataframe, length=130, coef=0.2, vcoef=2.5, signalLength=5, smoothVFI=False):
+    """
+    Volume Flow Indicator conversion
+
+    Author: creslinux, June 2018 - Python
+    Original Author: Chris Moody, TradingView - Pinescript
+    To return vfi, vfima and histogram
+
+    A simplified interpretation of the VFI is:
+    * Values above zero indicate a bullish state and the crossing of the zero line is the trigger
+        or buy signal.
+    * The strongest signal with all money flow indicators is of course divergence.
+    * A crossover of vfi > vfima is uptrend
+    * A crossunder of vfima > vfi is downtrend
+    * smoothVFI can be set to smooth for a cleaner plot to ease false signals
+    * histogram can be used against self -1 to check if upward or downward momentum
+
+
+    Call from strategy to populate vfi, vfima, vfi_hist into dataframe
+
+    Example how to call:
+    # Volume Flow Index: Add VFI, VFIMA, Histogram to DF
+    dataframe['vfi'], dataframe['vfima'], dataframe['vfi_hist'] =  \
+        vfi(dataframe, length=130, coef=0.2, vcoef=2.5, signalLength=5, smoothVFI=False)
+
+    :param dataframe:
+    :param length: - VFI Length - 130 default
+    :param coef:  - price coef  - 0.2 default
+    :param vcoef: - volume coef  - 2.5 default
+    :param signalLength: - 5 default
+    :param smoothVFI:  bool - False detault
+    :return: vfi, vfima, vfi_hist
+    """
+
+    """"
+    Original Pinescript
+    From: https://www.tradingview.com/script/MhlDpfdS-Volume-Flow-Indicator-LazyBear/
+
+    length = input(130, title="VFI length")
+    coef = input(0.2)
+    vcoef = input(2.5, title="Max. vol. cutoff")
+    signalLength=input(5)
+    smoothVFI=input(false, type=bool)
+
+    #### Conversion summary to python
+      - ma(x,y) => smoothVFI ? sma(x,y) : x // Added as smoothVFI test on vfi
+
+      - typical = hlc3  // Added to DF as HLC
+      - inter = log(typical) - log(typical[1]) // Added to DF as inter
+      - vinter = stdev(inter, 30) // Added to DF as vinter
+      - cutoff = coef * vinter * close // Added to DF as cutoff
+      - vave = sma(volume, length)[1] // Added to DF as vave
+      - vmax = vave * vcoef // Added to Df as vmax
+      - vc = iff(volume < vmax, volume, vmax) // Added np.where test, result in DF as vc
+      - mf = typical - typical[1] // Added into DF as mf - typical is hlc3
+      - vcp = iff(mf > cutoff, vc, iff(mf < -cutoff, -vc, 0)) // added in def vcp, in DF as vcp
+
+      - vfi = ma(sum(vcp, length) / vave, 3) // Added as DF vfi.
+            Will sma vfi 3 if smoothVFI flag set
+      - vfima = ema(vfi, signalLength) // added to DF as vfima
+      - d = vfi-vfima // Added to df as histogram
+
+    ### Pinscript plotout - nothing to do here for freqtrade.
+    plot(0, color=gray, style=3)
+    showHisto=input(false, type=bool)
+    plot(showHisto ? d : na, style=histogram, color=gray, linewidth=3, transp=50)
+    plot( vfima , title="EMA of vfi", color=orange)
+    plot( vfi, title="vfi", color=green,linewidth=2)
+    """
+
+    import talib as ta
+    from numpy import where
+
+    length = length
+    coef = coef
+    vcoef = vcoef
+    signalLength = signalLength
+    smoothVFI = smoothVFI
+    df = dataframe
+    # Add hlc3 and populate inter to the dataframe
+    df["hlc"] = ((df["high"] + df["low"] + df["close"]) / 3).astype(float)
+    df["inter"] = df["hlc"].map(math.log) - df["hlc"].shift(+1).map(math.log)
+    df["vinter"] = df["inter"].rolling(30).std(ddof=0)
+    df["cutoff"] = coef * df["vinter"] * df["close"]
+    # Vave is to be calculated on volume of the past bar
+    df["vave"] = ta.SMA(df["volume"].shift(+1), timeperiod=length)
+    df["vmax"] = df["vave"] * vcoef
+    df["vc"] = where((df["volume"] < df["vmax"]), df["volume"], df["vmax"])
+    df["mf"] = df["hlc"] - df["hlc"].shift(+1)
+
+    # more logic for vcp, so create a def and df.apply it
+    def vcp(x):
+        if x["mf"] > x["cutoff"]:
+            return x["vc"]
+        elif x["mf"] < -(x["cutoff"]):
+            return -(x["vc"])
+        else:
+            return 0
+
+    df["vcp"] = df.apply(vcp, axis=1)
+    # vfi has a smooth option passed over def call, sma if set
+    df["vfi"] = (df["vcp"].rolling(length).sum()) / df["vave"]
+    if smoothVFI is True:
+        df["vfi"] = ta.SMA(df["vfi"], timeperiod=3)
+    df["vfima"] = ta.EMA(df["vfi"], signalLength)
+    df["vfi_hist"] = df["vfi"] - df["vfima"]
+
+    # clean up columns used vfi calculation but not needed for strat
+    df.drop("hlc", axis=1, inplace=True)
+    df.drop("inter", axis=1, inplace=True)
+    df.drop("vinter", axis=1, inplace=True)
+    df.drop("cutoff", axis=1, inplace=True)
+    df.drop("vave", axis=1, inplace=True)
+    df.drop("vmax", axis=1, inplace=True)
+    df.drop("vc", axis=1, inplace=True)
+    df.drop("mf", axis=1, inplace=True)
+    df.drop("vcp", axis=1, inplace=True)
+
+    return df["vfi"], df["vfima"], df["vfi_hist"]
+
+
+def td_sequential(dataframe):
+    """
+    TD Sequential
+    Author(Freqtrade): MichealReed
+    Original Author: Tom Demark
+
+
+    :param dataframe: dataframe
+    :return: TD Sequential:values -9 to +9
+    """
+    """
+    TD Sequential
+    """
+
+    # Copy DF
+    df = dataframe.copy()
+
+    condv = df["volume"] > 0
+    cond1 = df["close"] > df["close"].shift(4)
+    cond2 = df["close"] < df["close"].shift(4)
+
+    df["cond_tdb_a"] = (df.groupby((((cond1)[condv])).cumsum()).cumcount() % 10 == 0).cumsum()
+    df["cond_tds_a"] = (df.groupby((((cond2)[condv])).cumsum()).cumcount() % 10 == 0).cumsum()
+    df["cond_tdb_b"] = (df.groupby((((cond1)[condv])).cumsum()).cumcount() % 10 != 0).cumsum()
+    df["cond_tds_b"] = (df.groupby((((cond2)[condv])).cumsum()).cumcount() % 10 != 0).cumsum()
+
+    df["tdb_a"] = df.groupby(df["cond_tdb_a"]).cumcount()
+    df["tds_a"] = df.groupby(df["cond_tds_a"]).cumcount()
+
+    df["tdb_b"] = df.groupby(df["cond_tdb_b"]).cumcount()
+    df["tds_b"] = df.groupby(df["cond_tds_b"]).cumcount()
+
+    df["tdc"] = df["tds_a"] - df["tdb_a"]
+    df["tdc"] = df.apply((lambda x: x["tdb_b"] % 9 if x["tdb_b"] > 9 else x["tdc"]), axis=1)
+    df["tdc"] = df.apply((lambda x: (x["tds_b"] % 9) * -1 if x["tds_b"] > 9 else x["tdc"]), axis=1)
+
+    return DataFrame(index=df.index, data={"TD_count": df["tdc"]})
+
+
+
+def doji(dataframe, exact=False):
+    """
+    computes the dojis (near by default) or absolute
+    :param dataframe:
+    :param exact:
+    :return:
+    """
+    if exact:
+        result = dataframe["open"] == dataframe["close"]
+    else:
+        result = (dataframe["open"] - dataframe["close"]).abs() <= (
+            (dataframe["high"] - dataframe["close"]) * 0.1
+        )
+
+    return result.apply(lambda x: 1 if x else 0)
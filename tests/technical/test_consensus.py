@@ -0,0 +1,15 @@
+import pandas as pd
+
+from technical.consensus import Consensus
+
+
+def test_consensus_ema_shared_between_evaluations(ohlcv):
+    consensus = Consensus(ohlcv)
+    consensus.evaluate_ema(period=13)
+    consensus.evaluate_bbp(period=13)
+
+    ema_keys = [key for key in consensus._cache if key[0] == "EMA"]
+    assert ema_keys == [("EMA", 13, "close")]
+    pd.testing.assert_series_equal(
+        consensus.dataframe["ema_close_13"], consensus.dataframe["bbp_13_ema"], check_names=False
+    )
@@ -0,0 +1,93 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+import reference_indicators as ref
+
+from technical.candles import doji
+from technical.indicators import (PMAX, VIDYA, laguerre, madrid_sqz, mmar, td_sequential,
+                                  tv_hma, tv_wma, vfi)
+from technical.vendor.qtpylib import indicators as qtpylib
+
+
+def test_laguerre(ohlcv):
+    np.testing.assert_array_equal(laguerre(ohlcv), ref.laguerre(ohlcv))
+
+
+@pytest.mark.parametrize("select", [True, False])
+def test_VIDYA(ohlcv, select):
+    pd.testing.assert_series_equal(
+        VIDYA(ohlcv, length=9, select=select), ref.VIDYA(ohlcv, length=9, select=select)
+    )
+
+
+@pytest.mark.parametrize("matype", ["EMA", "SMA"])
+def test_mmar(ohlcv, matype):
+    for result, expected in zip(mmar(ohlcv, matype=matype), ref.mmar(ohlcv, matype=matype)):
+        pd.testing.assert_series_equal(result, expected)
+
+
+def test_madrid_sqz(ohlcv):
+    for result, expected in zip(madrid_sqz(ohlcv), ref.madrid_sqz(ohlcv)):
+        pd.testing.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("smoothVFI", [False, True])
+def test_vfi(ohlcv, smoothVFI):
+    for result, expected in zip(vfi(ohlcv, smoothVFI=smoothVFI),
+                                ref.vfi(ohlcv, smoothVFI=smoothVFI)):
+        pd.testing.assert_series_equal(result, expected)
+
+
+def test_td_sequential(ohlcv):
+    pd.testing.assert_frame_equal(td_sequential(ohlcv), ref.td_sequential(ohlcv))
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_doji(ohlcv, exact):
+    ohlcv.loc[::7, "close"] = ohlcv.loc[::7, "open"]
+    pd.testing.assert_series_equal(doji(ohlcv, exact), ref.doji(ohlcv, exact))
+
+
+@pytest.mark.parametrize("MAtype", range(1, 9))
+def test_PMAX(ohlcv, MAtype):
+    pd.testing.assert_frame_equal(PMAX(ohlcv, MAtype=MAtype), ref.PMAX(ohlcv, MAtype=MAtype))
+
+
+@pytest.mark.parametrize("length", [3, 9, 20])
+def test_tv_wma(ohlcv, length):
+    # The convolution sums in a different order - results differ by rounding only.
+    pd.testing.assert_series_equal(
+        tv_wma(ohlcv.copy(), length)["tv_wma"],
+        ref.tv_wma(ohlcv.copy(), length)["tv_wma"],
+        check_exact=False,
+        rtol=1e-12,
+    )
+
+
+@pytest.mark.parametrize("length", [9, 16, 20])
+def test_tv_hma(ohlcv, length):
+    # The row-wise implementation failed for every input (tv_wma returns the whole dataframe),
+    # so the expected values are built from the row-wise tv_wma.
+    h = (
+        2 * ref.tv_wma(ohlcv.copy(), math.floor(length / 2))["tv_wma"]
+        - ref.tv_wma(ohlcv.copy(), length)["tv_wma"]
+    )
+    expected = ref.tv_wma(pd.DataFrame({"h": h}), math.floor(math.sqrt(length)), field="h")
+
+    result = tv_hma(ohlcv.copy(), length)
+    assert list(result.columns) == list(ohlcv.columns) + ["tv_hma"]
+    pd.testing.assert_series_equal(
+        result["tv_hma"], expected["tv_wma"], check_exact=False, rtol=1e-12, check_names=False
+    )
+
+
+def test_qtpylib_rsi(ohlcv):
+    pd.testing.assert_series_equal(
+        qtpylib.rsi(ohlcv["close"]), ref.rsi(ohlcv["close"]), check_exact=False, rtol=1e-12
+    )
+
+
+def test_qtpylib_heikinashi(ohlcv):
+    pd.testing.assert_frame_equal(qtpylib.heikinashi(ohlcv), ref.heikinashi(ohlcv))
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from technical.indicators import (SSLChannels, StreamingATR, StreamingEMA, StreamingIchimoku,
+                                  StreamingRSI, StreamingSMA, StreamingSSLChannels, ema,
+                                  ichimoku, sma)
+from technical.vendor.qtpylib import indicators as qtpylib
+
+
+def assert_streaming_matches(indicator, dataframe, expected, seed_rows):
+    """
+    Seed indicator with the first seed_rows candles, then stream the remaining candles.
+    Each streamed candle first arrives with different prices, and is then replaced
+    by the final candle (new=False) - values must match the batch results.
+    :param expected: DataFrame with the batch results - one column per value key,
+                     a single column for scalar values
+    """
+    def expected_at(i):
+        row = expected.iloc[i]
+        return row.iloc[0] if expected.shape[1] == 1 else row.to_dict()
+
+    prices = ["open", "high", "low", "close"]
+    indicator.seed(dataframe.iloc[:seed_rows])
+    if seed_rows:
+        assert indicator.value == pytest.approx(expected_at(seed_rows - 1), nan_ok=True)
+
+    for i in range(seed_rows, len(dataframe)):
+        candle = dataframe.iloc[i]
+        forming = candle.copy()
+        forming[prices] *= 1.02 if i % 2 else 0.98
+        indicator.update(forming)
+        # Replaced twice - undo only reverts the last update.
+        forming[prices] *= 0.99
+        indicator.update(forming, new=False)
+        value = indicator.update(candle, new=False)
+        assert value == pytest.approx(expected_at(i), nan_ok=True), i
+        assert indicator.value is value
+
+
+@pytest.mark.parametrize("seed_rows", [0, 5, 300])
+def test_streaming_sma(ohlcv, seed_rows):
+    expected = sma(ohlcv, 20).to_frame()
+    assert_streaming_matches(StreamingSMA(20), ohlcv, expected, seed_rows)
+
+
+@pytest.mark.parametrize("seed_rows", [0, 5, 300])
+def test_streaming_ema(ohlcv, seed_rows):
+    expected = ema(ohlcv, 20).to_frame()
+    assert_streaming_matches(StreamingEMA(20), ohlcv, expected, seed_rows)
+
+
+@pytest.mark.parametrize("seed_rows", [0, 5, 300])
+@pytest.mark.parametrize("exp", [False, True])
+def test_streaming_atr(ohlcv, seed_rows, exp):
+    expected = qtpylib.atr(ohlcv, 14, exp=exp).to_frame()
+    assert_streaming_matches(StreamingATR(14, exp=exp), ohlcv, expected, seed_rows)
+
+
+@pytest.mark.parametrize("seed_rows", [0, 5, 300])
+def test_streaming_rsi(ohlcv, seed_rows):
+    expected = qtpylib.rsi(ohlcv["close"], 14).to_frame()
+    # The first values of the batch version use later price changes.
+    expected.iloc[:15] = np.nan
+    assert_streaming_matches(StreamingRSI(14), ohlcv, expected, seed_rows)
+
+
+@pytest.mark.parametrize("seed_rows", [0, 5, 300])
+def test_streaming_ssl_channels(ohlcv, seed_rows):
+    ssl_down, ssl_up = SSLChannels(ohlcv, 10)
+    expected = pd.DataFrame({"sslDown": ssl_down, "sslUp": ssl_up})
+    assert_streaming_matches(StreamingSSLChannels(10), ohlcv, expected, seed_rows)
+
+
+@pytest.mark.parametrize("seed_rows", [0, 5, 300])
+def test_streaming_ichimoku(ohlcv, seed_rows):
+    expected = pd.DataFrame(ichimoku(ohlcv)).drop(columns="chikou_span")
+    assert_streaming_matches(StreamingIchimoku(), ohlcv, expected, seed_rows)
@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import make_ohlcv
+
+from technical import util
+from technical.util import resample_to_interval, resampled_merge
+
+
+@pytest.fixture(autouse=True)
+def resample_calls(monkeypatch):
+    """Clear the resample cache and count the candles resampled by each call."""
+    monkeypatch.setattr(util, "_resample_cache", {})
+    rows = []
+    resample = util._resample
+
+    def counting_resample(dataframe, interval, origin="start_day"):
+        rows.append(len(dataframe))
+        return resample(dataframe, interval, origin)
+
+    monkeypatch.setattr(util, "_resample", counting_resample)
+    return rows
+
+
+def _windows(candles: pd.DataFrame, window: int, rng):
+    """
+    Dataframes as seen by a strategy: a moving window over the candles, with a forming
+    last candle that changes before it's closed, and now and then a gap or changed history.
+    """
+    for end in range(window, len(candles)):
+        df = candles.iloc[max(end - window, 0) : end].reset_index(drop=True)
+        forming = candles.iloc[[end]].reset_index(drop=True)
+        forming[["high", "close"]] *= 1 + rng.uniform(0, 0.01)
+        yield pd.concat([df, forming], ignore_index=True)
+        if rng.random() < 0.05:
+            df = df.copy()
+            df.loc[rng.integers(len(df)), "close"] *= 1.01
+        elif rng.random() < 0.05:
+            df = df.drop(index=rng.integers(len(df))).reset_index(drop=True)
+        yield df
+
+
+@pytest.mark.parametrize("interval", ["4h", 360, "1d"])
+def test_resample_to_interval_cache_matches_resample(resample_calls, interval):
+    candles = make_ohlcv(350)
+    rng = np.random.default_rng(3)
+    resampled_rows = 0
+    for df in _windows(candles, 200, rng):
+        result = resample_to_interval(df, interval, cache_key="BTC/USDT")
+        calls = len(resample_calls)
+        expected = resample_to_interval(df, interval)
+        resample_calls.pop()
+        resampled_rows += len(df)
+
+        pd.testing.assert_frame_equal(result, expected)
+        assert len(resample_calls) == calls
+        # The cached result is unchanged by modifications of the returned dataframe.
+        result.loc[:, "close"] = 0
+
+    # Only the candles of the first and the last few resampled candles are resampled again.
+    assert sum(resample_calls) < resampled_rows / 3
+
+
+def test_resample_to_interval_cache_keys(resample_calls):
+    candles = make_ohlcv(300)
+    other = make_ohlcv(300, seed=7)
+    for end in range(200, 300):
+        for key, df in (("BTC/USDT", candles), ("ETH/USDT", other)):
+            df = df.iloc[end - 200 : end].reset_index(drop=True)
+            pd.testing.assert_frame_equal(
+                resample_to_interval(df, "4h", cache_key=key), resample_to_interval(df, "4h")
+            )
+            # Same key, another interval - cached separately.
+            pd.testing.assert_frame_equal(
+                resample_to_interval(df, "1d", cache_key=key), resample_to_interval(df, "1d")
+            )
+    assert set(util._resample_cache) == {
+        ("BTC/USDT", 240),
+        ("ETH/USDT", 240),
+        ("BTC/USDT", 1440),
+        ("ETH/USDT", 1440),
+    }
+
+
+@pytest.mark.parametrize(
+    "modify",
+    [
+        # Unsorted dates, dates without timezone, other timezone, no candles
+        lambda df: df.iloc[::-1].reset_index(drop=True),
+        lambda df: df.assign(date=df["date"].dt.tz_localize(None)),
+        lambda df: df.assign(date=df["date"].dt.tz_convert("America/New_York")),
+        lambda df: df.iloc[:0],
+    ],
+)
+def test_resample_to_interval_cache_fallback(modify):
+    candles = make_ohlcv(300)
+    resample_to_interval(candles.iloc[:200], "4h", cache_key="BTC/USDT")
+    df = modify(candles.iloc[1:201].reset_index(drop=True))
+    pd.testing.assert_frame_equal(
+        resample_to_interval(df, "4h", cache_key="BTC/USDT"), resample_to_interval(df, "4h")
+    )
+
+
+def test_resampled_merge_matches_merge(ohlcv):
+    ohlcv = ohlcv.drop(index=[3, 50, 51, 52, 200]).reset_index(drop=True)
+    resampled = resample_to_interval(ohlcv, "4h")
+    result = resampled_merge(ohlcv, resampled.copy())
+
+    resampled.columns = [f"resample_240_{col}" for col in resampled.columns]
+    resampled["date_merge"] = resampled["resample_240_date"] + pd.Timedelta(hours=3)
+    expected = (
+        pd.merge(ohlcv, resampled, how="left", left_on="date", right_on="date_merge")
+        .drop("date_merge", axis=1)
+        .ffill()
+    )
+    pd.testing.assert_frame_equal(result, expected)
+    assert result["resample_240_close"].notna().sum() > 400